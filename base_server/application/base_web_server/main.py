@@ -37,6 +37,7 @@ from service.cache.cache_service import CacheService
 from service.cache.redis_cache_client_pool import RedisCacheClientPool
 from service.cache.cache_config import CacheConfig
 from service.external.external_service import ExternalService
+from service.external.yahoo_finance_client import YahooFinanceClient
 from service.storage.storage_service import StorageService
 from service.search.search_service import SearchService
 from service.vectordb.vectordb_service import VectorDbService
@@ -173,7 +174,9 @@ async def lifespan(app: FastAPI):
                     db=app_config.cacheConfig.db,
                     password=app_config.cacheConfig.password,
                     max_retries=app_config.cacheConfig.max_retries,
-                    connection_timeout=app_config.cacheConfig.connection_timeout
+                    connection_timeout=app_config.cacheConfig.connection_timeout,
+                    max_connections=app_config.cacheConfig.connection_pool.max_connections,
+                    blocking_max_connections=app_config.cacheConfig.connection_pool.blocking_max_connections
                 )
                 CacheService.Init(cache_client_pool)
                 
@@ -894,7 +897,7 @@ async def lifespan(app: FastAPI):
         
         # QueueService 초기화 (메시지큐/이벤트큐 통합)
         try:
-            if await initialize_queue_service(database_service):
+            if await initialize_queue_service(database_service, app_config.queueConfig):
                 Logger.info("QueueService 초기화 완료")
                 ServiceContainer.set_queue_service_initialized(True)
                 
@@ -941,7 +944,7 @@ async def lifespan(app: FastAPI):
         # SignalMonitoringService 초기화
         try:
             from service.signal.signal_monitoring_service import SignalMonitoringService
-            await SignalMonitoringService.init()
+            await SignalMonitoringService.init(app_config.signalConfig)
             Logger.info("✅ SignalMonitoringService 초기화 완료")
             
             # 일일 시그널 성과 업데이트 스케줄러 작업 등록
@@ -1550,6 +1553,12 @@ async def lifespan(app: FastAPI):
             Logger.info("✅ External 서비스 종료 완료")
     except Exception as e:
         Logger.error(f"❌ External 서비스 종료 오류: {e}")
+    
+    # Yahoo Finance 공유 HTTP 세션 종료
+    try:
+        await YahooFinanceClient.close_shared_session()
+    except Exception as e:
+        Logger.error(f"❌ Yahoo Finance 세션 종료 오류: {e}")
         
     # 캐시 서비스 종료 (Redis 연결) - CacheService 의존 서비스들 이후 종료
     try:
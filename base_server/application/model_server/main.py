@@ -87,7 +87,9 @@ async def lifespan(app: FastAPI):
                 db=app_config.cacheConfig.db,
                 password=app_config.cacheConfig.password,
                 max_retries=app_config.cacheConfig.max_retries,
-                connection_timeout=app_config.cacheConfig.connection_timeout
+                connection_timeout=app_config.cacheConfig.connection_timeout,
+                max_connections=app_config.cacheConfig.connection_pool.max_connections,
+                blocking_max_connections=app_config.cacheConfig.connection_pool.blocking_max_connections
             )
             CacheService.Init(cache_client_pool)
             Logger.info("✅ CacheService 초기화 완료")
@@ -0,0 +1,161 @@
+"""
+ChatPersistenceConsumer 방 단위 저장 처리량 벤치마크
+
+같은 메시지 묶음을 두 방식으로 저장하고 방당 초당 저장 메시지 수를 비교합니다.
+- legacy : 메시지마다 fp_chat_message_batch_save 프로시저 1회 + SENT 상태 전이 Lua 1회
+- batch  : ChatPersistenceConsumer._process_room_messages (multi-row INSERT 트랜잭션 1개 + 파이프라인 상태 전이 1회)
+
+준비: 로컬 MySQL 샤드 DB에 db_scripts/chat_tables_extension.sql 적용, 로컬 Redis 실행
+실행 (base_server 디렉터리에서):
+    python -m benchmarks.bench_chat_persistence --mysql-database finance_shard_1 --mysql-password ****
+    python -m benchmarks.bench_chat_persistence --rooms 20 --messages 50 --rounds 5
+
+벤치마크가 만든 행(room_id 'bench-room-%', account_db_key --account-db-key)은 종료 시 삭제합니다 (--keep으로 유지).
+"""
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from typing import Dict, List
+
+from service.cache.cache_service import CacheService
+from service.cache.redis_cache_client_pool import RedisCacheClientPool
+from service.db.database_config import DatabaseConfig
+from service.db.database_service import DatabaseService
+from service.db.mysql_client import MySQLClient
+from service.lock.lock_service import LockService
+from service.service_container import ServiceContainer
+from template.chat.chat_persistence_consumer import ChatPersistenceConsumer
+from template.chat.chat_state_machine import ChatStateMachine, MessageState, get_chat_state_machine
+
+SHARD_ID = 1
+
+
+def make_messages(run_id: str, room_index: int, count: int, account_db_key: int) -> List[Dict]:
+    room_id = f"bench-room-{run_id}-{room_index}"
+    return [{
+        "message_id": f"bench-{run_id}-{room_index}-{seq}",
+        "room_id": room_id,
+        "account_db_key": account_db_key,
+        "message_type": "USER" if seq % 2 == 0 else "AI",
+        "content": f"benchmark message {seq} " + "x" * 120,
+        "metadata": json.dumps({"sequence": seq}),
+        "parent_message_id": None,
+    } for seq in range(count)]
+
+
+async def mark_processing(rooms: List[List[Dict]]):
+    """저장 대상 메시지 상태를 PROCESSING으로 준비 (컨슈머 버퍼 적재 직후 상태)"""
+    async with CacheService.get_client() as client:
+        pipe = client.pipeline()
+        for messages in rooms:
+            for msg in messages:
+                pipe.set_string(f"msg_state:{msg['message_id']}", MessageState.PROCESSING.value, expire=600)
+        await pipe.execute()
+
+
+async def legacy_room_save(database_service: DatabaseService, room_id: str, messages: List[Dict]) -> int:
+    """기존 방식: 방 Lock 안에서 메시지마다 프로시저 + 상태 전이"""
+    state_machine = get_chat_state_machine()
+    token = await LockService.acquire(f"chat_db_save:{room_id}", ttl=30, timeout=10)
+    saved = 0
+    try:
+        for msg in messages:
+            row = ChatPersistenceConsumer._to_message_row(msg)
+            result = await database_service.call_shard_procedure(SHARD_ID, 'fp_chat_message_batch_save', row)
+            if result and result[0].get('result') == 'SUCCESS':
+                await state_machine.transition_message(msg['message_id'], MessageState.SENT, MessageState.PROCESSING)
+                saved += 1
+    finally:
+        await LockService.release(f"chat_db_save:{room_id}", token)
+    return saved
+
+
+async def run_mode(mode: str, database_service: DatabaseService, consumer: ChatPersistenceConsumer, args) -> Dict[str, float]:
+    total_saved = 0
+    total_elapsed = 0.0
+    room_rates = []
+    for round_index in range(args.rounds):
+        run_id = f"{mode}{round_index}-{uuid.uuid4().hex[:6]}"
+        rooms = [make_messages(run_id, r, args.messages, args.account_db_key) for r in range(args.rooms)]
+        await mark_processing(rooms)
+
+        async def save_room(messages: List[Dict]) -> int:
+            started = time.perf_counter()
+            if mode == "legacy":
+                saved = await legacy_room_save(database_service, messages[0]["room_id"], messages)
+            else:
+                saved = await consumer._process_room_messages(SHARD_ID, messages[0]["room_id"], messages)
+            room_rates.append(saved / (time.perf_counter() - started))
+            return saved
+
+        started = time.perf_counter()
+        saved_counts = await asyncio.gather(*[save_room(messages) for messages in rooms])
+        total_elapsed += time.perf_counter() - started
+        total_saved += sum(saved_counts)
+
+    room_rates.sort()
+    return {
+        "saved": total_saved,
+        "expected": args.rooms * args.messages * args.rounds,
+        "total_per_sec": total_saved / total_elapsed if total_elapsed else 0.0,
+        "room_p50_per_sec": room_rates[len(room_rates) // 2] if room_rates else 0.0,
+    }
+
+
+async def cleanup(database_service: DatabaseService, account_db_key: int):
+    await database_service.execute_shard_many(SHARD_ID, "DELETE FROM table_chat_messages WHERE room_id LIKE %s", [("bench-room-%",)])
+    await database_service.execute_shard_many(SHARD_ID, "DELETE FROM table_chat_statistics WHERE account_db_key = %s", [(account_db_key,)])
+
+
+async def run(args):
+    pool = RedisCacheClientPool(args.redis_host, args.redis_port, 60, "bench", "chat", max_connections=args.rooms + 8)
+    CacheService.Init(pool)
+    LockService.init(CacheService)
+    ServiceContainer.set_lock_service_initialized(True)
+    await ChatStateMachine.init()
+
+    shard_config = DatabaseConfig(type="mysql", host=args.mysql_host, port=args.mysql_port, database=args.mysql_database,
+                                  user=args.mysql_user, password=args.mysql_password, pool_size=args.rooms + 2)
+    database_service = DatabaseService(shard_config)
+    shard_client = MySQLClient(shard_config)
+    await shard_client.init_pool()
+    database_service.shard_clients[SHARD_ID] = shard_client
+    ServiceContainer()._database_service = database_service
+
+    consumer = ChatPersistenceConsumer()
+    try:
+        print(f"rooms x messages x rounds: {args.rooms} x {args.messages} x {args.rounds}")
+        for mode in ("legacy", "batch"):
+            result = await run_mode(mode, database_service, consumer, args)
+            print(f"{mode:<7} saved={result['saved']}/{result['expected']} "
+                  f"total={result['total_per_sec']:,.0f} msg/s  room p50={result['room_p50_per_sec']:,.0f} msg/s")
+        stats = consumer.get_stats()
+        print(f"batch room latency ms: p50={stats['room_batch_latency_ms']['p50_ms']} "
+              f"p99={stats['room_batch_latency_ms']['p99_ms']} fallback_batches={stats['fallback_batches']}")
+    finally:
+        if not args.keep:
+            await cleanup(database_service, args.account_db_key)
+        await shard_client.close_pool()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ChatPersistenceConsumer 방 단위 저장 처리량 벤치마크")
+    parser.add_argument("--mysql-host", default="localhost")
+    parser.add_argument("--mysql-port", type=int, default=3306)
+    parser.add_argument("--mysql-user", default="root")
+    parser.add_argument("--mysql-password", default="")
+    parser.add_argument("--mysql-database", default="finance_shard_1")
+    parser.add_argument("--redis-host", default="localhost")
+    parser.add_argument("--redis-port", type=int, default=6379)
+    parser.add_argument("--rooms", type=int, default=10, help="동시에 저장할 채팅방 수")
+    parser.add_argument("--messages", type=int, default=50, help="방당 메시지 수 (컨슈머 batch_size 기본값 50)")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--account-db-key", type=int, default=990000001, help="벤치마크 전용 계정 키 (통계 행 정리용)")
+    parser.add_argument("--keep", action="store_true", help="벤치마크 행 삭제하지 않음")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+분산락 경합 벤치마크
+
+같은 키 하나를 워커 N개가 반복 획득/보유/해제하며 두 방식을 비교합니다.
+- legacy : 기존 구현 (SET NX 실패 시 100ms sleep 후 재시도)
+- queue  : CacheServiceDistributedLock (FIFO 대기열 + 해제 신호 대기)
+출력: 초당 획득 수, 획득 대기시간 p50/p99/max, 획득 1회당 Redis 명령 수, 타임아웃 수
+
+실행 (base_server 디렉터리에서, 로컬 Redis 필요):
+    python -m benchmarks.bench_distributed_lock
+    python -m benchmarks.bench_distributed_lock --workers 50 --iterations 20 --hold-ms 5
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from typing import Dict, Optional
+
+from service.cache.cache_service import CacheService
+from service.cache.redis_cache_client_pool import RedisCacheClientPool
+from service.core.latency_histogram import LatencyHistogram
+from service.lock.distributed_lock import CacheServiceDistributedLock
+
+RELEASE_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+else
+    return 0
+end
+"""
+
+
+class LegacyPollingLock:
+    """변경 전 CacheServiceDistributedLock.acquire/release 동작 재현"""
+    def __init__(self):
+        self.lock_prefix = "lock:"
+
+    async def acquire(self, key: str, ttl: int = 30, timeout: int = 10) -> Optional[str]:
+        lock_key = f"{self.lock_prefix}{key}"
+        token = str(uuid.uuid4())
+        start_time = time.time()
+        while time.time() - start_time < timeout:
+            async with CacheService.get_client() as client:
+                if await client.set_string(lock_key, token, expire=ttl, nx=True):
+                    return token
+            await asyncio.sleep(0.1)
+        return None
+
+    async def release(self, key: str, token: str) -> bool:
+        async with CacheService.get_client() as client:
+            return await client.eval(RELEASE_SCRIPT, 1, client._get_key(f"{self.lock_prefix}{key}"), token) == 1
+
+
+async def run_mode(lock, pool: RedisCacheClientPool, args) -> Dict[str, float]:
+    key = f"bench:{uuid.uuid4().hex[:8]}"
+    wait = LatencyHistogram()
+    timeouts = 0
+    acquired = 0
+    ops_before = pool.metrics.total_operations
+
+    async def worker():
+        nonlocal timeouts, acquired
+        for _ in range(args.iterations):
+            started = time.perf_counter()
+            token = await lock.acquire(key, ttl=args.ttl, timeout=args.timeout)
+            if token is None:
+                timeouts += 1
+                continue
+            wait.record((time.perf_counter() - started) * 1000.0)
+            acquired += 1
+            await asyncio.sleep(args.hold_ms / 1000.0)
+            await lock.release(key, token)
+            await asyncio.sleep(random.uniform(0, args.think_ms) / 1000.0)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(args.workers)])
+    elapsed = time.perf_counter() - started
+    ops = pool.metrics.total_operations - ops_before
+
+    stats = wait.to_dict()
+    return {
+        "acquired": acquired,
+        "timeouts": timeouts,
+        "per_sec": acquired / elapsed if elapsed else 0.0,
+        "p50_ms": stats["p50_ms"],
+        "p99_ms": stats["p99_ms"],
+        "max_ms": stats["max_ms"],
+        "ops_per_acquire": ops / acquired if acquired else 0.0,
+    }
+
+
+async def run(args):
+    pool = RedisCacheClientPool(args.host, args.port, 60, "bench", f"lock{random.randint(0, 1_000_000)}",
+                                max_connections=args.workers + 8)
+    CacheService.Init(pool)
+    random.seed(args.seed)
+
+    queue_lock = CacheServiceDistributedLock(CacheService)
+    print(f"workers x iterations : {args.workers} x {args.iterations} (hold {args.hold_ms}ms, think <= {args.think_ms}ms)")
+    try:
+        for name, lock in (("legacy", LegacyPollingLock()), ("queue", queue_lock)):
+            r = await run_mode(lock, pool, args)
+            print(f"{name:<7} acquired={r['acquired']} timeouts={r['timeouts']} {r['per_sec']:,.0f} acq/s  "
+                  f"wait p50={r['p50_ms']}ms p99={r['p99_ms']}ms max={r['max_ms']:.0f}ms  "
+                  f"redis ops/acquire={r['ops_per_acquire']:.1f}")
+        m = queue_lock.get_metrics()
+        print(f"queue metrics: contended={m['contended']} wakeups={m['wakeups']} timeouts={m['timeouts']}")
+    finally:
+        await queue_lock.close()
+        await pool.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="분산락 경합 벤치마크 (폴링 vs 대기열)")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=6379)
+    parser.add_argument("--workers", type=int, default=20, help="같은 키를 경합하는 워커 수")
+    parser.add_argument("--iterations", type=int, default=10, help="워커당 획득 횟수")
+    parser.add_argument("--hold-ms", type=float, default=5.0, help="락 보유 시간")
+    parser.add_argument("--think-ms", type=float, default=5.0, help="해제 후 다음 획득까지 최대 대기")
+    parser.add_argument("--ttl", type=int, default=10)
+    parser.add_argument("--timeout", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+FileLogger 마이크로 벤치마크
+
+기존 방식(줄마다 파일 open + getsize)과 배치 FileLogger의 초당 기록 줄 수를 비교합니다.
+
+실행 (base_server 디렉터리에서):
+    python -m benchmarks.bench_file_logger --lines 100000
+"""
+import argparse
+import datetime
+import os
+import shutil
+import tempfile
+import time
+
+from service.core.logger import FileLogger, LogLevel
+
+
+def run_legacy(folder: str, lines: int) -> float:
+    """기존 FileLogger._run 과 동일한 줄 단위 기록 (open/getsize/strftime 매 줄)"""
+    path = os.path.join(folder, "legacy.log")
+    start = time.perf_counter()
+    for i in range(lines):
+        now = datetime.datetime.utcnow() + datetime.timedelta(hours=9)
+        log = f"{now.strftime('[%Y/%m/%d-%H:%M:%S KST]')} [INFO] : benchmark line {i}"
+        if os.path.exists(path):
+            os.path.getsize(path)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(log + "\n")
+    return time.perf_counter() - start
+
+
+def run_batched(folder: str, lines: int) -> float:
+    """배치 FileLogger - close()까지 포함해 디스크 기록 완료 시점으로 측정"""
+    logger = FileLogger(
+        log_level=LogLevel.INFO,
+        use_console=False,
+        prefix="batched",
+        folder=folder,
+        timezone="KST",
+        max_file_size_kb=1024 * 1024
+    )
+    start = time.perf_counter()
+    for i in range(lines):
+        logger.info(f"benchmark line {i}")
+    logger.close()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FileLogger lines/sec 벤치마크")
+    parser.add_argument("--lines", type=int, default=100000)
+    args = parser.parse_args()
+
+    folder = tempfile.mkdtemp(prefix="bench_logger_")
+    try:
+        legacy = run_legacy(folder, args.lines)
+        batched = run_batched(folder, args.lines)
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+    print(f"lines           : {args.lines}")
+    print(f"legacy  (lines/s): {args.lines / legacy:,.0f}")
+    print(f"batched (lines/s): {args.lines / batched:,.0f}")
+    print(f"speedup          : {legacy / batched:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+모델 서버 마이크로 배치 추론 처리량 벤치마크
+
+동시 클라이언트 N개가 전처리된 시퀀스(1, 60, F)로 추론을 반복 요청하며 두 방식을 비교합니다.
+- per_request : 요청마다 model.predict 1회 (기존 api_server 경로)
+- batcher     : InferenceBatcher (max_wait_ms/max_batch_size 단위로 묶어 forward 1회)
+출력: 초당 추론 수, 요청 지연 p50/p99, 배치 크기/큐 대기/forward 시간 분포
+
+모델 가중치는 무작위 초기화 (CPU, 실제 체크포인트 불필요). 실행 (base_server 디렉터리에서):
+    python -m benchmarks.bench_inference_batcher
+    python -m benchmarks.bench_inference_batcher --clients 64 --requests 20 --hidden-size 512 --max-wait-ms 5
+"""
+import argparse
+import asyncio
+import time
+from typing import Dict
+
+import numpy as np
+import torch
+
+from service.core.latency_histogram import LatencyHistogram
+from template.model.inference_batcher import InferenceBatcher
+from template.model.pytorch_lstm_model import PyTorchStockLSTM
+
+
+async def run_mode(name: str, model: PyTorchStockLSTM, batcher: InferenceBatcher, sequences: np.ndarray, args) -> Dict[str, float]:
+    latency = LatencyHistogram()
+
+    async def client(index: int):
+        for n in range(args.requests):
+            sequence = sequences[(index + n) % len(sequences)][np.newaxis, ...]
+            started = time.perf_counter()
+            if name == "batcher":
+                await batcher.predict(sequence)
+            else:
+                model.predict(sequence)
+                await asyncio.sleep(0)
+            latency.record((time.perf_counter() - started) * 1000.0)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[client(i) for i in range(args.clients)])
+    elapsed = time.perf_counter() - started
+    stats = latency.to_dict()
+    total = args.clients * args.requests
+    return {"per_sec": total / elapsed, "p50": stats["p50_ms"], "p99": stats["p99_ms"], "max": stats["max_ms"]}
+
+
+async def run(args):
+    torch.manual_seed(args.seed)
+    if args.threads:
+        torch.set_num_threads(args.threads)
+
+    model = PyTorchStockLSTM(sequence_length=60, prediction_length=5, num_features=args.features, num_targets=3, device="cpu")
+    model.build_model(hidden_size=args.hidden_size)
+    sequences = np.random.default_rng(args.seed).random((64, 60, args.features), dtype=np.float32)
+
+    # 워밍업 (첫 forward의 메모리 할당 제외)
+    model.predict(sequences[:1])
+    model.predict(sequences[:args.max_batch_size])
+
+    batcher = InferenceBatcher(model, max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms)
+    await batcher.start()
+    try:
+        print(f"clients x requests : {args.clients} x {args.requests} (hidden_size={args.hidden_size}, "
+              f"features={args.features}, torch threads={torch.get_num_threads()})")
+        for name in ("per_request", "batcher"):
+            r = await run_mode(name, model, batcher, sequences, args)
+            print(f"{name:<12} {r['per_sec']:,.0f} inferences/s  latency p50={r['p50']}ms p99={r['p99']}ms max={r['max']:.0f}ms")
+        m = batcher.get_metrics()
+        print(f"batch size   : avg={m['batch_size']['avg']:.1f} p50={m['batch_size']['p50']} max={m['batch_size']['max']:.0f} "
+              f"({m['batches']} forwards)")
+        print(f"queue wait ms: p50={m['queue_wait_ms']['p50']} p99={m['queue_wait_ms']['p99']}")
+        print(f"forward ms   : p50={m['forward_ms']['p50']} p99={m['forward_ms']['p99']}")
+    finally:
+        await batcher.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모델 서버 마이크로 배치 추론 처리량 벤치마크")
+    parser.add_argument("--clients", type=int, default=32, help="동시 요청 클라이언트 수")
+    parser.add_argument("--requests", type=int, default=10, help="클라이언트당 요청 수")
+    parser.add_argument("--hidden-size", type=int, default=128, help="LSTM hidden size (서버 체크포인트는 512)")
+    parser.add_argument("--features", type=int, default=18)
+    parser.add_argument("--max-batch-size", type=int, default=32)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    parser.add_argument("--threads", type=int, default=0, help="torch 연산 스레드 수 (0이면 기본값)")
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
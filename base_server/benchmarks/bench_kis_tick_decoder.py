@@ -0,0 +1,165 @@
+"""
+한국투자증권 실시간 틱 디코더 벤치마크
+
+캡처한 WebSocket 프레임 파일(한 줄에 프레임 1개)을 반복 재생하며
+기존 방식(전체 분할 + 문자열 dict + 하위 단계 float() 재파싱)과 KisTickDecoder의 초당 처리 틱 수를 비교합니다.
+
+실행 (base_server 디렉터리에서):
+    python -m benchmarks.bench_kis_tick_decoder --repeat 2000
+    python -m benchmarks.bench_kis_tick_decoder --frames captured_frames.txt --repeat 200
+
+샘플 프레임 파일 재생성:
+    python -m benchmarks.bench_kis_tick_decoder --write-sample benchmarks/data/kis_ws_frames_sample.txt
+"""
+import argparse
+import json
+import os
+import random
+import time
+from typing import List
+
+from service.external.kis_tick_decoder import KisTickDecoder, TICK_FIELD_MAPS
+
+DEFAULT_FRAMES = os.path.join(os.path.dirname(__file__), "data", "kis_ws_frames_sample.txt")
+
+# 기존 파서가 만드는 필드명 (HDFSCNT0 기준, 다른 TR은 번호로 채움)
+OVERSEAS_FIELDS = ["RSYM", "SYMB", "ZDIV", "TYMD", "XYMD", "XHMS", "KYMD", "KHMS", "OPEN", "HIGH", "LOW", "LAST",
+                   "SIGN", "DIFF", "RATE", "PBID", "PASK", "VBID", "VASK", "EVOL", "TVOL", "TAMT", "BIVL", "ASVL",
+                   "STRN", "MTYP"]
+
+
+def load_frames(path: str) -> List[str]:
+    with open(path, encoding="utf-8") as f:
+        return [line.rstrip("\n") for line in f if line.strip()]
+
+
+def write_sample(path: str, count: int = 200, seed: int = 7):
+    """HDFSCNT0 단건/다건, H0STCNT0, H0UPCNT0, PINGPONG 제어 메시지가 섞인 샘플 프레임 생성"""
+    rng = random.Random(seed)
+    symbols = ["AAPL", "MSFT", "NVDA", "TSLA", "AMZN", "META", "GOOGL", "AMD"]
+    frames = []
+
+    def overseas(symbol: str) -> List[str]:
+        last = rng.uniform(50, 900)
+        open_ = last * rng.uniform(0.98, 1.02)
+        fields = [f"DNAS{symbol}", symbol, "4", "20250101", "20250101", "093000", "20250101", "233000",
+                  f"{open_:.4f}", f"{max(last, open_) * 1.01:.4f}", f"{min(last, open_) * 0.99:.4f}", f"{last:.4f}",
+                  "2", f"{last - open_:.4f}", f"{(last - open_) / open_ * 100:.2f}", f"{last - 0.01:.4f}",
+                  f"{last + 0.01:.4f}", str(rng.randint(1, 900)), str(rng.randint(1, 900)), str(rng.randint(1, 500)),
+                  str(rng.randint(10000, 9000000)), str(rng.randint(10000, 90000000)), "0", "0", "101.5", "1"]
+        assert len(fields) == TICK_FIELD_MAPS["HDFSCNT0"].field_count
+        return fields
+
+    def numbered(tr_id: str, code: str) -> List[str]:
+        width = TICK_FIELD_MAPS[tr_id].field_count
+        fields = [str(rng.randint(1, 100000)) for _ in range(width)]
+        fields[0] = code
+        fields[1] = "093000"
+        return fields
+
+    for i in range(count):
+        kind = i % 10
+        if kind < 6:
+            frames.append("0|HDFSCNT0|001|" + "^".join(overseas(rng.choice(symbols))))
+        elif kind < 8:
+            records = [overseas(rng.choice(symbols)) for _ in range(3)]
+            frames.append("0|HDFSCNT0|003|" + "^".join(f for r in records for f in r))
+        elif kind == 8:
+            frames.append("0|H0STCNT0|001|" + "^".join(numbered("H0STCNT0", "005930")))
+        else:
+            frames.append("0|H0UPCNT0|001|" + "^".join(numbered("H0UPCNT0", "0001")))
+    frames.insert(count // 2, json.dumps({"header": {"tr_id": "PINGPONG", "datetime": "20250101093000"}}))
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(frames) + "\n")
+
+
+def run_legacy(frames: List[str], repeat: int) -> int:
+    """기존 경로: JSON 시도 → '|'/'^' 전체 분할 → 문자열 dict → 하위 단계에서 float() 재파싱 2회"""
+    ticks = 0
+    for _ in range(repeat):
+        for frame in frames:
+            try:
+                json.loads(frame)
+                continue
+            except json.JSONDecodeError:
+                pass
+            parts = frame.split("|")
+            if len(parts) < 4:
+                continue
+            payload = parts[3].split("^")
+            width = TICK_FIELD_MAPS.get(parts[1], TICK_FIELD_MAPS["HDFSCNT0"]).field_count
+            for base in range(0, len(payload) - width + 1, width):
+                names = OVERSEAS_FIELDS if parts[1] == "HDFSCNT0" else [str(n) for n in range(width)]
+                data = dict(zip(names, payload[base:base + width]))
+                # 콜백 변환 + 메일박스 처리 단계에서 각각 float/int 변환
+                for _pass in range(2):
+                    float(data.get("LAST", 0) or 0)
+                    float(data.get("HIGH", 0) or 0)
+                    float(data.get("LOW", 0) or 0)
+                    float(data.get("OPEN", 0) or 0)
+                    int(data.get("TVOL", 0) or 0)
+                ticks += 1
+    return ticks
+
+
+def run_decoder(frames: List[str], repeat: int) -> int:
+    decoder = KisTickDecoder()
+    ticks = 0
+    for _ in range(repeat):
+        for frame in frames:
+            records = decoder.decode(frame)
+            if records:
+                for record in records:
+                    record.price, record.high, record.low, record.open, record.volume
+                ticks += len(records)
+    return ticks
+
+
+def run_decoder_array(frames: List[str], repeat: int) -> int:
+    """다건 프레임만 구조화 배열로 디코딩"""
+    decoder = KisTickDecoder()
+    multi = [frame for frame in frames if KisTickDecoder.is_realtime_frame(frame) and frame.split("|", 3)[2] != "001"]
+    ticks = 0
+    for _ in range(repeat):
+        for frame in multi:
+            array = decoder.decode_array(frame)
+            if array is not None:
+                ticks += len(array)
+    return ticks
+
+
+def measure(fn, frames: List[str], repeat: int):
+    start = time.perf_counter()
+    ticks = fn(frames, repeat)
+    return ticks, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KIS 실시간 틱 디코더 ticks/sec 벤치마크")
+    parser.add_argument("--frames", default=DEFAULT_FRAMES, help="캡처 프레임 파일 (한 줄에 프레임 1개)")
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--write-sample", metavar="PATH", help="샘플 프레임 파일 생성 후 종료")
+    args = parser.parse_args()
+
+    if args.write_sample:
+        write_sample(args.write_sample)
+        print(f"sample written: {args.write_sample}")
+        return
+
+    frames = load_frames(args.frames)
+    legacy_ticks, legacy = measure(run_legacy, frames, args.repeat)
+    decoder_ticks, decoded = measure(run_decoder, frames, args.repeat)
+    array_ticks, arrayed = measure(run_decoder_array, frames, args.repeat)
+
+    print(f"frames               : {len(frames)} x {args.repeat}")
+    print(f"legacy      (ticks/s): {legacy_ticks / legacy:,.0f}")
+    print(f"decoder     (ticks/s): {decoder_ticks / decoded:,.0f}")
+    if array_ticks:
+        print(f"numpy multi (ticks/s): {array_ticks / arrayed:,.0f}  (다건 프레임만, 건수가 많을수록 유리)")
+    print(f"speedup              : {(decoder_ticks / decoded) / (legacy_ticks / legacy):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
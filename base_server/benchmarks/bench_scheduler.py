@@ -0,0 +1,97 @@
+"""
+스케줄러 코어 벤치마크 (1초 전체 스캔 vs 타이머 힙)
+
+INTERVAL 작업 N개(주기 1~interval_max초, 빈 콜백)를 등록하고 일정 시간 실행하며
+- 작업 실행 지연(lateness) p50/p99/max
+- 스케줄러 프로세스 CPU 시간
+을 비교합니다. 외부 의존성(Redis/DB) 없이 실행됩니다.
+
+실행 (base_server 디렉터리에서):
+    python -m benchmarks.bench_scheduler
+    python -m benchmarks.bench_scheduler --jobs 5000 --seconds 10
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime
+from typing import Dict
+
+from service.core.latency_histogram import LatencyHistogram
+from service.scheduler.base_scheduler import BaseScheduler, ScheduleJob, ScheduleType
+
+
+class LegacyScanScheduler(BaseScheduler):
+    """변경 전 _scheduler_loop 재현 (1초마다 전체 스캔, 실행 가능한 작업마다 태스크 생성)"""
+    async def _scheduler_loop(self):
+        try:
+            while self.running:
+                now = datetime.now()
+                ready_jobs = [
+                    job for job in self.jobs.values()
+                    if job.enabled and job.next_run and job.next_run <= now
+                ]
+                for job in ready_jobs:
+                    asyncio.create_task(self._execute_job(job))
+                await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            pass
+
+
+async def run_mode(scheduler: BaseScheduler, args) -> Dict[str, float]:
+    rng = random.Random(args.seed)
+    lateness = LatencyHistogram()
+    fired = 0
+
+    def make_callback(job: ScheduleJob):
+        async def callback():
+            nonlocal fired
+            fired += 1
+            due = getattr(job, "_bench_due", None)
+            if due is not None:
+                lateness.record(max(datetime.now().timestamp() - due, 0.0) * 1000.0)
+        return callback
+
+    for n in range(args.jobs):
+        job = ScheduleJob(f"bench{n}", f"bench{n}", ScheduleType.INTERVAL, rng.randint(1, args.interval_max), None)
+        job.callback = make_callback(job)
+        await scheduler.add_job(job)
+
+    # 실행 예정 시각 기록 (콜백에서 지연 계산)
+    original = scheduler._execute_job
+
+    async def execute_with_due(job: ScheduleJob):
+        job._bench_due = job.next_run.timestamp()
+        await original(job)
+    scheduler._execute_job = execute_with_due
+
+    cpu_started = time.process_time()
+    await scheduler.start()
+    await asyncio.sleep(args.seconds)
+    await scheduler.stop()
+    cpu = time.process_time() - cpu_started
+    await asyncio.sleep(0.1)
+
+    stats = lateness.to_dict()
+    return {"fired": fired, "cpu": cpu, "p50": stats["p50_ms"], "p99": stats["p99_ms"], "max": stats["max_ms"]}
+
+
+async def run(args):
+    print(f"jobs: {args.jobs} (interval 1~{args.interval_max}s), duration: {args.seconds}s")
+    for name, scheduler in (("scan", LegacyScanScheduler()), ("heap", BaseScheduler())):
+        r = await run_mode(scheduler, args)
+        print(f"{name:<5} fired={r['fired']:,} cpu={r['cpu']:.2f}s  "
+              f"lateness p50={r['p50']}ms p99={r['p99']}ms max={r['max']:.0f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스케줄러 코어 벤치마크 (1초 스캔 vs 타이머 힙)")
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--interval-max", type=int, default=5, help="작업 주기 최대값 (초)")
+    parser.add_argument("--seconds", type=float, default=8.0)
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+WebSocket Redis 브리지 다중 인스턴스 부하 테스트
+
+한 프로세스 안에 서버 인스턴스 N개(WebSocketClientManager + WebSocketRedisBridge, 노드마다 다른 node_id)를 띄우고
+로컬 Redis를 통해 채널 메시지를 교차 발행합니다. 가짜 WebSocket 클라이언트가 수신 시각을 기록해
+- 전달 누락/중복 (기대 전달 수 = 메시지별 전체 노드의 채널 구독자 수, 자기 에코는 중복 전달되면 안 됨)
+- 발행 → 클라이언트 수신 end-to-end 지연시간 (p50/p95/p99)
+- 초당 전달 수
+를 출력합니다.
+
+실행 (base_server 디렉터리에서, 로컬 Redis 필요):
+    python -m benchmarks.bench_websocket_redis_bridge
+    python -m benchmarks.bench_websocket_redis_bridge --nodes 4 --clients 500 --channels 20 --messages 5000
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Dict, List
+
+from service.cache.cache_service import CacheService
+from service.cache.redis_cache_client_pool import RedisCacheClientPool
+from service.core.latency_histogram import LatencyHistogram
+from service.websocket.websocket_client import WebSocketClientManager
+from service.websocket.websocket_redis_bridge import WebSocketRedisBridge
+
+
+class FakeWebSocket:
+    """수신 메시지의 발행 시각으로 end-to-end 지연시간을 기록하는 가짜 클라이언트"""
+    def __init__(self, latency: LatencyHistogram, received: Dict[int, int]):
+        self._latency = latency
+        self._received = received
+
+    async def accept(self):
+        pass
+
+    async def close(self, code: int = 1000):
+        pass
+
+    async def send_text(self, text: str):
+        message = json.loads(text)
+        seq = message.get("seq")
+        if seq is None:
+            return  # connection_established 등
+        self._latency.record((time.perf_counter() - message["sent_at"]) * 1000.0)
+        self._received[seq] = self._received.get(seq, 0) + 1
+
+
+async def run(args):
+    pool = RedisCacheClientPool(args.host, args.port, 60, "bench", f"ws{random.randint(0, 1_000_000)}",
+                                max_connections=args.nodes * 2 + 8)
+    CacheService.Init(pool)
+
+    rng = random.Random(args.seed)
+    channels = [f"room{n}" for n in range(args.channels)]
+    latency = LatencyHistogram()
+    received: Dict[int, int] = {}
+    subscribers = {channel: 0 for channel in channels}
+
+    nodes: List[WebSocketRedisBridge] = []
+    managers: List[WebSocketClientManager] = []
+    for n in range(args.nodes):
+        manager = WebSocketClientManager(outbound_queue_size=args.queue_size)
+        bridge = WebSocketRedisBridge(manager, channel_prefix="bench", node_id=f"node{n}")
+        await bridge.start(wait_subscribed=5.0)
+        for c in range(args.clients):
+            client_id = f"n{n}c{c}"
+            await manager.connect(client_id, FakeWebSocket(latency, received))
+            for channel in rng.sample(channels, min(args.subscriptions, len(channels))):
+                await manager.subscribe_to_channel(client_id, channel)
+                subscribers[channel] += 1
+        nodes.append(bridge)
+        managers.append(manager)
+
+    expected_by_seq: Dict[int, int] = {}
+    interval = 1.0 / args.rate if args.rate > 0 else 0.0
+    start = time.perf_counter()
+    for seq in range(args.messages):
+        channel = rng.choice(channels)
+        expected_by_seq[seq] = subscribers[channel]
+        bridge = nodes[seq % len(nodes)]
+        await bridge.publish(channel, {"type": "bench", "seq": seq, "sent_at": time.perf_counter()})
+        if interval:
+            await asyncio.sleep(interval)
+    publish_elapsed = time.perf_counter() - start
+
+    # 잔여 전달 대기
+    expected = sum(expected_by_seq.values())
+    deadline = time.perf_counter() + args.drain_seconds
+    while sum(received.values()) < expected and time.perf_counter() < deadline:
+        await asyncio.sleep(0.05)
+    elapsed = time.perf_counter() - start
+
+    delivered = sum(received.values())
+    duplicated = sum(1 for seq, count in received.items() if count > expected_by_seq[seq])
+    for bridge, manager in zip(nodes, managers):
+        await bridge.stop()
+        for client_id in list(manager.active_connections):
+            await manager.disconnect(client_id, "bench_done")
+
+    stats = latency.to_dict()
+    print(f"nodes x clients      : {args.nodes} x {args.clients} (구독 {args.subscriptions}/{args.channels} 채널)")
+    print(f"messages published   : {args.messages} in {publish_elapsed:.2f}s")
+    print(f"deliveries           : {delivered:,} / expected {expected:,} (중복 전달 메시지: {duplicated})")
+    print(f"deliveries/sec       : {delivered / elapsed:,.0f}")
+    print(f"e2e latency ms       : p50={stats['p50_ms']} p95={stats['p95_ms']} p99={stats['p99_ms']} max={stats['max_ms']:.1f}")
+    for bridge in nodes:
+        m = bridge.get_metrics()
+        print(f"  {m['node_id']}: published={m['published']} received={m['received']} "
+              f"echoes_skipped={m['echoes_skipped']} no_subscribers={m['no_subscribers']} errors={m['errors']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WebSocket Redis 브리지 다중 인스턴스 부하 테스트")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=6379)
+    parser.add_argument("--nodes", type=int, default=3, help="프로세스 내 서버 인스턴스 수")
+    parser.add_argument("--clients", type=int, default=200, help="인스턴스당 WebSocket 클라이언트 수")
+    parser.add_argument("--channels", type=int, default=10)
+    parser.add_argument("--subscriptions", type=int, default=2, help="클라이언트당 구독 채널 수")
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--rate", type=float, default=0, help="초당 발행 수 (0이면 최대 속도)")
+    parser.add_argument("--queue-size", type=int, default=1000, help="클라이언트 송신 큐 크기")
+    parser.add_argument("--drain-seconds", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
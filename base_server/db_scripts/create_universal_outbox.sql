@@ -15,16 +15,19 @@ CREATE TABLE IF NOT EXISTS `universal_outbox` (
   `event_type` varchar(100) NOT NULL COMMENT '이벤트 타입',
   `aggregate_id` varchar(128) NOT NULL COMMENT '집계 ID (room_id, message_id)',
   `event_data` json NOT NULL COMMENT '이벤트 데이터',
-  `status` enum('pending','published','failed','dead_letter') NOT NULL DEFAULT 'pending' COMMENT '이벤트 상태',
+  `status` enum('pending','processing','published','failed','dead_letter') NOT NULL DEFAULT 'pending' COMMENT '이벤트 상태',
   `retry_count` int NOT NULL DEFAULT 0 COMMENT '재시도 횟수',
   `max_retries` int NOT NULL DEFAULT 3 COMMENT '최대 재시도 횟수',
   `created_at` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성 시간',
   `updated_at` datetime DEFAULT NULL ON UPDATE CURRENT_TIMESTAMP COMMENT '수정 시간',
   `published_at` datetime DEFAULT NULL COMMENT '발행 시간',
   `error_message` text DEFAULT NULL COMMENT '에러 메시지',
+  `lease_owner` varchar(64) DEFAULT NULL COMMENT '처리 중인 릴레이 인스턴스',
+  `lease_until` datetime DEFAULT NULL COMMENT '처리 리스 만료 시각 (만료 시 재클레임)',
   PRIMARY KEY (`id`),
   UNIQUE KEY `uk_domain_partition_sequence` (`domain`, `partition_key`, `sequence_no`),
   INDEX `idx_status_created` (`status`, `created_at`),
+  INDEX `idx_status_lease` (`status`, `lease_until`),
   INDEX `idx_domain_partition` (`domain`, `partition_key`),
   INDEX `idx_published_cleanup` (`status`, `published_at`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci 
@@ -366,16 +369,19 @@ CREATE TABLE IF NOT EXISTS `universal_outbox` (
   `event_type` varchar(100) NOT NULL COMMENT '이벤트 타입',
   `aggregate_id` varchar(128) NOT NULL COMMENT '집계 ID (room_id, message_id)',
   `event_data` json NOT NULL COMMENT '이벤트 데이터',
-  `status` enum('pending','published','failed','dead_letter') NOT NULL DEFAULT 'pending' COMMENT '이벤트 상태',
+  `status` enum('pending','processing','published','failed','dead_letter') NOT NULL DEFAULT 'pending' COMMENT '이벤트 상태',
   `retry_count` int NOT NULL DEFAULT 0 COMMENT '재시도 횟수',
   `max_retries` int NOT NULL DEFAULT 3 COMMENT '최대 재시도 횟수',
   `created_at` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성 시간',
   `updated_at` datetime DEFAULT NULL ON UPDATE CURRENT_TIMESTAMP COMMENT '수정 시간',
   `published_at` datetime DEFAULT NULL COMMENT '발행 시간',
   `error_message` text DEFAULT NULL COMMENT '에러 메시지',
+  `lease_owner` varchar(64) DEFAULT NULL COMMENT '처리 중인 릴레이 인스턴스',
+  `lease_until` datetime DEFAULT NULL COMMENT '처리 리스 만료 시각 (만료 시 재클레임)',
   PRIMARY KEY (`id`),
   UNIQUE KEY `uk_domain_partition_sequence` (`domain`, `partition_key`, `sequence_no`),
   INDEX `idx_status_created` (`status`, `created_at`),
+  INDEX `idx_status_lease` (`status`, `lease_until`),
   INDEX `idx_domain_partition` (`domain`, `partition_key`),
   INDEX `idx_published_cleanup` (`status`, `published_at`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci 
@@ -673,4 +679,13 @@ END ;;
 DELIMITER ;
 
 SELECT 'Finance Shard 2 Universal Outbox 생성 완료' as status;
-SELECT 'Universal Outbox Pattern with SchedulerService Cleanup 생성 완료!' as final_status;
\ No newline at end of file
+SELECT 'Universal Outbox Pattern with SchedulerService Cleanup 생성 완료!' as final_status;
+
+-- =====================================
+-- 기존 테이블 마이그레이션 (리스 기반 릴레이 클레임) - 샤드별로 1회 실행
+-- =====================================
+-- ALTER TABLE `universal_outbox`
+--   MODIFY `status` enum('pending','processing','published','failed','dead_letter') NOT NULL DEFAULT 'pending' COMMENT '이벤트 상태',
+--   ADD COLUMN `lease_owner` varchar(64) DEFAULT NULL COMMENT '처리 중인 릴레이 인스턴스' AFTER `error_message`,
+--   ADD COLUMN `lease_until` datetime DEFAULT NULL COMMENT '처리 리스 만료 시각 (만료 시 재클레임)' AFTER `lease_owner`,
+--   ADD INDEX `idx_status_lease` (`status`, `lease_until`);
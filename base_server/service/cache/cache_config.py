@@ -7,9 +7,20 @@ class ECacheType(IntEnum):
     REDIS = 1
 
 class ConnectionPoolConfig(BaseModel):
+    # 일반 명령용 공유 풀 (명령 1회 동안만 연결 점유)
     max_connections: int = 20
+    # 장기 점유 전용 풀 - BLPOP/XREADGROUP 블로킹 대기와 Pub/Sub 구독이 연결을 계속 붙잡으므로 일반 풀과 분리
+    # 프로세스당 필요 수 = 상시 구독 4 (캐시 무효화, 지연 큐 스케줄러, WebSocket 브리지, 분산락 해제 신호)
+    #                   + block_timeout > 0 인 배치 컨슈머 수 + Stream 구독 수 + 파티션 코디네이터 수
+    # 부족하면 블로킹 소비자만 connection_timeout 대기 후 재시도하고 일반 캐시 명령에는 영향 없음
+    blocking_max_connections: int = 16
     retry_on_timeout: bool = True
 
+class LocalCacheConfig(BaseModel):
+    enabled: bool = True
+    max_size: int = 10000
+    ttl_seconds: int = 30
+
 class CacheConfig(BaseModel):
     type: str = "redis"
     host: str = "localhost"
@@ -19,4 +30,5 @@ class CacheConfig(BaseModel):
     session_expire_seconds: int = 3600
     connection_pool: ConnectionPoolConfig = ConnectionPoolConfig()
     max_retries: int = 3
-    connection_timeout: int = 5
\ No newline at end of file
+    connection_timeout: int = 5
+    session_local_cache: LocalCacheConfig = LocalCacheConfig()
\ No newline at end of file
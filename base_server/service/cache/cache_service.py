@@ -1,8 +1,10 @@
 import json
+import asyncio
 from enum import IntEnum
 from typing import Optional, Dict, Any
 from service.core.logger import Logger
 from .redis_cache_client_pool import RedisCacheClientPool
+from .local_cache import LocalCache
 from .cache_config import CacheConfig, ECacheType
 
 class CacheService:
@@ -11,10 +13,17 @@ class CacheService:
     - Init()으로 풀을 주입받아야 함
     - 세션 관리 메서드 직접 제공
     - UserHash, Ranking 등 캐시 객체 제공
+    - 프로세스 내 L1 캐시(LocalCache) 등록 및 Pub/Sub 기반 인스턴스 간 무효화
     """
     _client_pool: Optional[RedisCacheClientPool] = None
     UserHash = None
     Ranking = None
+    
+    # L1 캐시 무효화 채널 (app_id:env 네임스페이스 적용)
+    INVALIDATION_CHANNEL = "cache:invalidate"
+    INVALIDATE_ALL = "*"  # key로 전달 시 해당 L1 캐시 전체 비움
+    _local_caches: Dict[str, LocalCache] = {}
+    _invalidation_task: Optional[asyncio.Task] = None
 
     @classmethod
     def Init(cls, client_pool: RedisCacheClientPool) -> bool:
@@ -37,6 +46,13 @@ class CacheService:
             raise RuntimeError("CacheService is not initialized. Call Init() first.")
         return cls._client_pool.new()
     
+    @classmethod
+    def get_blocking_client(cls):
+        """블로킹 대기(BLPOP/XREADGROUP)·Pub/Sub 구독용 클라이언트 - 일반 풀과 분리된 전용 풀 사용"""
+        if cls._client_pool is None:
+            raise RuntimeError("CacheService is not initialized. Call Init() first.")
+        return cls._client_pool.new_blocking()
+    
     @classmethod
     def get_redis_client(cls):
         """Redis 클라이언트 반환 (큐 서비스용)"""
@@ -57,12 +73,103 @@ class CacheService:
     @classmethod
     async def shutdown(cls):
         """서비스 종료"""
-        # Redis 클라이언트는 컨텍스트 매니저로 관리되므로 별도 종료 불필요
+        # 무효화 리스너 중지
+        if cls._invalidation_task and not cls._invalidation_task.done():
+            cls._invalidation_task.cancel()
+            try:
+                await cls._invalidation_task
+            except asyncio.CancelledError:
+                pass
+        cls._invalidation_task = None
+        for local_cache in cls._local_caches.values():
+            local_cache.clear()
+        
+        # 클라이언트는 컨텍스트 매니저로 관리되지만 공유 커넥션 풀은 여기서 닫음
+        if cls._client_pool is not None:
+            await cls._client_pool.close()
         cls._client_pool = None
         cls.UserHash = None
         cls.Ranking = None
         Logger.info("Cache service shutdown")
     
+    # === 로컬(L1) 캐시 및 무효화 ===
+    
+    @classmethod
+    def register_local_cache(cls, name: str, local_cache: LocalCache):
+        """L1 캐시 등록 - 메트릭 노출 및 무효화 채널 수신 대상"""
+        cls._local_caches[name] = local_cache
+        cls.ensure_invalidation_listener()
+    
+    @classmethod
+    def ensure_invalidation_listener(cls):
+        """무효화 채널 리스너 태스크 시작 (이벤트 루프 실행 중일 때만)"""
+        if cls._client_pool is None or not cls._local_caches:
+            return
+        if cls._invalidation_task and not cls._invalidation_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        cls._invalidation_task = loop.create_task(cls._invalidation_listener_loop())
+    
+    @classmethod
+    def _invalidate_local(cls, cache_name: str, key: str):
+        local_cache = cls._local_caches.get(cache_name)
+        if not local_cache:
+            return
+        if key == cls.INVALIDATE_ALL:
+            local_cache.clear()
+        else:
+            local_cache.invalidate(key)
+    
+    @classmethod
+    async def publish_invalidation(cls, cache_name: str, key: str):
+        """로컬 L1 항목 제거 후 다른 인스턴스에 무효화 메시지 발행"""
+        cls._invalidate_local(cache_name, key)
+        
+        try:
+            async with cls.get_client() as client:
+                await client.publish(cls.INVALIDATION_CHANNEL, json.dumps({"cache": cache_name, "key": key}))
+        except Exception as e:
+            Logger.error(f"Cache invalidation publish error: {e}")
+    
+    @classmethod
+    async def _invalidation_listener_loop(cls):
+        """무효화 채널 구독 루프 (연결 끊김 시 백오프 재연결)"""
+        retry_delay = 1.0
+        while cls._client_pool is not None:
+            pubsub = None
+            try:
+                async with cls.get_blocking_client() as client:
+                    pubsub = await client.subscribe(cls.INVALIDATION_CHANNEL)
+                    # 구독이 끊긴 동안 놓친 메시지가 있을 수 있으므로 L1 전체 비움
+                    for local_cache in cls._local_caches.values():
+                        local_cache.clear()
+                    retry_delay = 1.0
+                    
+                    while cls._client_pool is not None:
+                        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                        if not message:
+                            continue
+                        try:
+                            data = json.loads(message["data"])
+                            cls._invalidate_local(data.get("cache"), data.get("key", ""))
+                        except (ValueError, TypeError, AttributeError) as e:
+                            Logger.warn(f"Invalid cache invalidation message: {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                Logger.warn(f"Cache invalidation listener error (retry in {retry_delay:.0f}s): {e}")
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, 30.0)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
+    
     # === 세션 관리 메서드들 ===
     
     @classmethod
@@ -147,7 +254,9 @@ class CacheService:
                     "cache_key": client.cache_key,
                     "session_expire_time": client.session_expire_time
                 },
-                "client_metrics": client_metrics
+                "client_metrics": client_metrics,
+                "pool_metrics": cls._client_pool.get_pool_stats(),
+                "local_cache_metrics": {name: local_cache.get_metrics() for name, local_cache in cls._local_caches.items()}
             }
         except Exception as e:
             return {"error": str(e)}
@@ -162,6 +271,8 @@ class CacheService:
         try:
             client = cls.get_client()
             client.reset_metrics()
+            for local_cache in cls._local_caches.values():
+                local_cache.reset_metrics()
             Logger.info("Cache service metrics reset")
         except Exception as e:
             Logger.error(f"Failed to reset cache metrics: {e}")
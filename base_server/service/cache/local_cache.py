@@ -0,0 +1,87 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+@dataclass
+class LocalCacheMetrics:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+class LocalCache:
+    """
+    프로세스 내 L1 캐시 (LRU + TTL)
+    - Redis(L2) 앞단에서 파싱된 객체를 보관
+    - max_size 초과 시 가장 오래 사용되지 않은 항목부터 제거
+    - 다른 인스턴스의 변경은 CacheService 무효화 채널로 전달받아 invalidate()
+    """
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 30.0):
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.metrics = LocalCacheMetrics()
+
+    def configure(self, max_size: int, ttl_seconds: float):
+        """크기/TTL 재설정 (기존 항목은 비움)"""
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._entries.clear()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.metrics.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.metrics.expirations += 1
+            self.metrics.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.metrics.hits += 1
+        return value
+
+    def set(self, key: str, value: Any):
+        if self._max_size <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.metrics.evictions += 1
+
+    def invalidate(self, key: str) -> bool:
+        if self._entries.pop(key, None) is None:
+            return False
+        self.metrics.invalidations += 1
+        return True
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        total = self.metrics.hits + self.metrics.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self._max_size,
+            "ttl_seconds": self._ttl_seconds,
+            "hits": self.metrics.hits,
+            "misses": self.metrics.misses,
+            "hit_rate": self.metrics.hits / total if total > 0 else 0.0,
+            "evictions": self.metrics.evictions,
+            "expirations": self.metrics.expirations,
+            "invalidations": self.metrics.invalidations
+        }
+
+    def reset_metrics(self):
+        self.metrics = LocalCacheMetrics()
@@ -1,11 +1,13 @@
 import redis.asyncio as redis
 import asyncio
+import hashlib
 import time
 import random
 import json
 from typing import List, Dict, Tuple, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
+from redis.exceptions import NoScriptError
 from service.core.logger import Logger
 from .cache_client import AbstractCacheClient
 
@@ -26,6 +28,8 @@ class CacheMetrics:
     connection_failures: int = 0
     timeout_errors: int = 0
     redis_errors: int = 0
+    pipeline_executions: int = 0
+    pipelined_commands: int = 0
 
 class RedisCacheClient(AbstractCacheClient):
     """
@@ -34,8 +38,10 @@ class RedisCacheClient(AbstractCacheClient):
     - context manager 지원 (async with)
     - app_id, env 기반 네임스페이스 키 사용
     - 향상된 연결 관리 및 모니터링
+    - connection_pool이 주어지면 공유 풀을 사용하는 경량 파사드로 동작 (연결/PING 없음)
     """
-    def __init__(self, host: str, port: int, session_expire_time: int, app_id: str, env: str, db: int = 0, password: str = "", max_retries: int = 3, connection_timeout: int = 5):
+    def __init__(self, host: str, port: int, session_expire_time: int, app_id: str, env: str, db: int = 0, password: str = "", max_retries: int = 3, connection_timeout: int = 5,
+                 connection_pool: Optional[redis.ConnectionPool] = None, metrics: Optional[CacheMetrics] = None):
         self._host = host
         self._port = port
         self._db = db
@@ -43,7 +49,8 @@ class RedisCacheClient(AbstractCacheClient):
         self.session_expire_time = session_expire_time
         self.cache_key = f"{app_id}:{env}"
         self._client: Optional[redis.Redis] = None
-        self.metrics = CacheMetrics()
+        self._connection_pool = connection_pool
+        self.metrics = metrics if metrics is not None else CacheMetrics()
         self.connection_state = ConnectionState.HEALTHY
         self._last_health_check = 0
         self._max_retries = max_retries
@@ -62,7 +69,10 @@ class RedisCacheClient(AbstractCacheClient):
         """Redis 연결 생성 (Enhanced connection management with retry)"""
         for attempt in range(self._max_retries):
             try:
-                if self._client is None:
+                if self._client is None and self._connection_pool is not None:
+                    # 공유 풀 사용 - 커맨드 실행 시 풀에서 연결을 빌려오므로 연결 테스트 불필요
+                    self._client = redis.Redis(connection_pool=self._connection_pool)
+                elif self._client is None:
                     # Redis 연결 설정
                     self._client = redis.Redis(
                         host=self._host,
@@ -173,6 +183,7 @@ class RedisCacheClient(AbstractCacheClient):
     async def close(self):
         if self._client:
             try:
+                # 공유 풀을 사용하는 경우 풀은 닫지 않고 (auto_close_connection_pool=False) 참조만 해제
                 await self._client.close()
             except:
                 pass
@@ -442,16 +453,40 @@ class RedisCacheClient(AbstractCacheClient):
             "connection_failures": self.metrics.connection_failures,
             "timeout_errors": self.metrics.timeout_errors,
             "redis_errors": self.metrics.redis_errors,
+            "pipeline_executions": self.metrics.pipeline_executions,
+            "pipelined_commands": self.metrics.pipelined_commands,
             "last_operation_time": self.metrics.last_operation_time,
             "connection_state": self.connection_state.value,
             "last_health_check": self._last_health_check
         }
     
     def reset_metrics(self):
-        """메트릭 초기화"""
-        self.metrics = CacheMetrics()
+        """메트릭 초기화 (풀과 공유하는 메트릭 객체를 제자리에서 초기화)"""
+        self.metrics.__dict__.update(vars(CacheMetrics()))
         Logger.info("Redis cache client metrics reset")
     
+    # === 파이프라인 (여러 명령을 1회 왕복으로 전송) ===
+
+    def pipeline(self, transaction: bool = False) -> 'RedisCachePipeline':
+        """
+        파이프라인 빌더 반환 - 명령을 모아두었다가 execute() 시 한 번에 전송
+        - transaction=True면 MULTI/EXEC로 원자적 실행
+        사용 예시:
+            token, session = await client.pipeline().get_string(a).get_string(b).execute()
+        """
+        return RedisCachePipeline(self, transaction)
+
+    @staticmethod
+    def _stringify_mapping(mapping: Dict[str, Any]) -> Dict[str, str]:
+        """해시 저장용으로 모든 값을 문자열로 변환"""
+        string_mapping = {}
+        for field, value in mapping.items():
+            if isinstance(value, (dict, list)):
+                string_mapping[str(field)] = json.dumps(value)
+            else:
+                string_mapping[str(field)] = str(value)
+        return string_mapping
+
     # === 메시지큐/이벤트큐용 추가 메서드들 ===
     
     async def set_hash_all(self, key: str, mapping: Dict[str, str]) -> bool:
@@ -462,12 +497,7 @@ class RedisCacheClient(AbstractCacheClient):
             # Logger.debug(f"set_hash_all mapping types: {[(k, type(v).__name__) for k, v in mapping.items()]}")
             
             # 모든 값을 문자열로 변환하여 Redis 호환성 보장
-            string_mapping = {}
-            for field, value in mapping.items():
-                if isinstance(value, (dict, list)):
-                    string_mapping[str(field)] = json.dumps(value)
-                else:
-                    string_mapping[str(field)] = str(value)
+            string_mapping = self._stringify_mapping(mapping)
             
             # aioredis hset 호출 - 하나씩 설정하는 안전한 방식
             # mapping이 비어있지 않은 경우만 실행
@@ -562,6 +592,19 @@ class RedisCacheClient(AbstractCacheClient):
         except Exception:
             return False
     
+    async def list_block_pop_left(self, keys: List[str], timeout: float) -> Optional[Tuple[str, str]]:
+        """
+        여러 리스트 중 첫 번째 비어있지 않은 리스트에서 왼쪽 값 꺼내기 (BLPOP, 서버 측 대기)
+        - timeout(초) 동안 값이 없으면 None, 반환 키는 네임스페이스가 제거된 이름
+        - 대기 중에는 커넥션을 점유하므로 timeout은 socket_timeout보다 작아야 함
+        """
+        namespaced = [self._get_key(key) for key in keys]
+        result = await self._execute_with_retry("list_block_pop_left", self._client.blpop, namespaced, timeout)
+        if not result:
+            return None
+        key, value = result
+        return key[len(self.cache_key) + 1:], value
+    
     async def list_index(self, key: str, index: int) -> Optional[str]:
         """리스트 특정 인덱스 값 조회"""
         k = self._get_key(key)
@@ -602,27 +645,142 @@ class RedisCacheClient(AbstractCacheClient):
         """Sorted Set 길이 조회 (sorted_set_count와 동일)"""
         return await self.sorted_set_count(key)
     
-    # Redis Stream 메서드들 (이벤트큐용) - 기본 구현
-    async def stream_add(self, key: str, fields: Dict[str, str], message_id: str = "*") -> str:
-        """Redis Stream에 메시지 추가 (향후 구현)"""
-        # 현재는 리스트로 대체
-        k = self._get_key(f"stream:{key}")
-        message_data = json.dumps({"id": message_id, "fields": fields, "timestamp": time.time()})
-        await self.list_push_right(k, message_data)
-        return f"{int(time.time() * 1000)}-0"  # 임시 메시지 ID
-    
-    async def stream_create_group(self, key: str, group_name: str, start_id: str = "$", mkstream: bool = False):
-        """Redis Stream Consumer Group 생성 (향후 구현)"""
-        # 현재는 패스
-        pass
-    
-    # Pub/Sub 메서드들 (이벤트큐용) - 기본 구현
+    # Redis Stream 메서드들 (이벤트큐용) - 키와 반환 스트림명 모두 네임스페이스 적용/제거
+    def _strip_key(self, namespaced_key: str) -> str:
+        return namespaced_key[len(self.cache_key) + 1:]
+    
+    async def stream_add(self, key: str, fields: Dict[str, str], message_id: str = "*",
+                         maxlen: Optional[int] = None, approximate: bool = True) -> str:
+        """Stream에 엔트리 추가 (XADD, maxlen 지정 시 트리밍) - 엔트리 ID 반환"""
+        k = self._get_key(key)
+        return await self._execute_with_retry("stream_add", self._client.xadd, k, fields, id=message_id,
+                                              maxlen=maxlen, approximate=approximate)
+    
+    async def stream_create_group(self, key: str, group_name: str, start_id: str = "$", mkstream: bool = False) -> bool:
+        """Consumer Group 생성 - 이미 존재하면 False"""
+        k = self._get_key(key)
+        try:
+            await self._client.xgroup_create(k, group_name, id=start_id, mkstream=mkstream)
+            return True
+        except redis.ResponseError as e:
+            if "BUSYGROUP" in str(e):
+                return False
+            raise
+    
+    async def stream_set_group_id(self, key: str, group_name: str, last_id: str) -> bool:
+        """Consumer Group 읽기 위치 변경 (XGROUP SETID) - 리플레이용"""
+        k = self._get_key(key)
+        return await self._execute_with_retry("stream_set_group_id", self._client.xgroup_setid, k, group_name, last_id)
+    
+    async def stream_read_group(self, group_name: str, consumer_name: str, streams: Dict[str, str],
+                                count: Optional[int] = None, block_ms: Optional[int] = None) -> List[Tuple[str, List[Tuple[str, Dict[str, str]]]]]:
+        """
+        Consumer Group으로 읽기 (XREADGROUP, block_ms 지정 시 서버 측 대기)
+        - streams: {stream_key: ">" 또는 엔트리 ID}
+        - 반환: [(stream_key, [(entry_id, fields), ...]), ...] (네임스페이스 제거)
+        """
+        namespaced = {self._get_key(key): entry_id for key, entry_id in streams.items()}
+        result = await self._execute_with_retry("stream_read_group", self._client.xreadgroup, group_name, consumer_name,
+                                                namespaced, count=count, block=block_ms)
+        return [(self._strip_key(stream), entries) for stream, entries in (result or [])]
+    
+    async def stream_ack(self, key: str, group_name: str, *entry_ids: str) -> int:
+        """엔트리 처리 완료 (XACK)"""
+        if not entry_ids:
+            return 0
+        k = self._get_key(key)
+        return await self._execute_with_retry("stream_ack", self._client.xack, k, group_name, *entry_ids) or 0
+    
+    async def stream_pending(self, key: str, group_name: str, count: int, min_idle_ms: int = 0) -> List[Dict[str, Any]]:
+        """미확인(pending) 엔트리 조회 (XPENDING IDLE) - message_id, consumer, time_since_delivered, times_delivered"""
+        k = self._get_key(key)
+        return await self._execute_with_retry("stream_pending", self._client.xpending_range, k, group_name,
+                                              "-", "+", count, idle=min_idle_ms or None) or []
+    
+    async def stream_claim(self, key: str, group_name: str, consumer_name: str, min_idle_ms: int,
+                           entry_ids: List[str]) -> List[Tuple[str, Dict[str, str]]]:
+        """다른 컨슈머의 오래된 pending 엔트리 가져오기 (XCLAIM)"""
+        if not entry_ids:
+            return []
+        k = self._get_key(key)
+        return await self._execute_with_retry("stream_claim", self._client.xclaim, k, group_name, consumer_name,
+                                              min_idle_ms, entry_ids) or []
+    
+    async def stream_group_info(self, key: str) -> List[Dict[str, Any]]:
+        """Consumer Group 정보 (XINFO GROUPS) - name, consumers, pending, last-delivered-id, lag(Redis 7+)"""
+        k = self._get_key(key)
+        try:
+            return await self._client.xinfo_groups(k)
+        except redis.ResponseError:
+            return []  # 스트림 없음
+    
+    async def stream_consumer_info(self, key: str, group_name: str) -> List[Dict[str, Any]]:
+        """Consumer Group 내 컨슈머 정보 (XINFO CONSUMERS) - name, pending, idle, inactive(Redis 7.2+)"""
+        k = self._get_key(key)
+        try:
+            return await self._client.xinfo_consumers(k, group_name)
+        except redis.ResponseError:
+            return []  # 스트림/그룹 없음
+
+    # pending 확인과 삭제를 원자적으로 - DELCONSUMER는 해당 컨슈머의 pending 엔트리를 버리므로
+    _DELETE_IDLE_CONSUMER_SCRIPT = """
+if #redis.call('XPENDING', KEYS[1], ARGV[1], '-', '+', 1, ARGV[2]) > 0 then
+    return -1
+end
+return redis.call('XGROUP', 'DELCONSUMER', KEYS[1], ARGV[1], ARGV[2])
+"""
+
+    async def stream_delete_consumer(self, key: str, group_name: str, consumer_name: str) -> bool:
+        """
+        pending 엔트리가 없는 컨슈머만 삭제 (XGROUP DELCONSUMER)
+        - pending이 남아 있으면 삭제하지 않고 False (XCLAIM으로 회수된 뒤 다시 시도)
+        """
+        k = self._get_key(key)
+        try:
+            result = await self._client.eval(self._DELETE_IDLE_CONSUMER_SCRIPT, 1, k, group_name, consumer_name)
+        except redis.ResponseError:
+            return False  # 스트림/그룹 없음
+        return result is not None and int(result) >= 0
+
+    async def stream_length(self, key: str) -> int:
+        """Stream 길이 (XLEN)"""
+        k = self._get_key(key)
+        return await self._execute_with_retry("stream_length", self._client.xlen, k) or 0
+    
+    async def stream_range_desc(self, key: str, count: int, max_id: str = "+", min_id: str = "-") -> List[Tuple[str, Dict[str, str]]]:
+        """최신 엔트리부터 조회 (XREVRANGE)"""
+        k = self._get_key(key)
+        return await self._execute_with_retry("stream_range_desc", self._client.xrevrange, k, max_id, min_id, count) or []
+    
+    # Pub/Sub 메서드들 (채널명에도 app_id:env 네임스페이스 적용)
     async def publish(self, channel: str, message: str) -> int:
-        """채널에 메시지 발행 (향후 구현)"""
-        # 현재는 리스트로 대체
-        k = self._get_key(f"pubsub:{channel}")
-        await self.list_push_right(k, message)
-        return 1
+        """채널에 메시지 발행 - 수신한 구독자 수 반환"""
+        k = self._get_key(channel)
+        return await self._execute_with_retry("publish", self._client.publish, k, message) or 0
+    
+    async def subscribe(self, *channels: str):
+        """
+        채널 구독 - 전용 연결을 점유하는 redis PubSub 객체 반환
+        - 수신 메시지의 channel은 네임스페이스가 적용된 이름
+        - 사용 후 반드시 pubsub.close() 호출 (연결 반환)
+        """
+        if self._client is None:
+            await self.connect()
+        pubsub = self._client.pubsub()
+        await pubsub.subscribe(*[self._get_key(channel) for channel in channels])
+        return pubsub
+    
+    async def psubscribe(self, *patterns: str):
+        """
+        패턴 구독 (PSUBSCRIBE) - subscribe와 동일하게 전용 연결을 점유하는 PubSub 객체 반환
+        - 패턴에도 네임스페이스 적용, 수신 메시지 type은 'pmessage'
+        - 사용 후 반드시 pubsub.close() 호출 (연결 반환)
+        """
+        if self._client is None:
+            await self.connect()
+        pubsub = self._client.pubsub()
+        await pubsub.psubscribe(*[self._get_key(pattern) for pattern in patterns])
+        return pubsub
     
     # Lua 스크립트 실행 (분산락용)
     async def eval_script(self, script: str, keys: List[str], args: List[str]) -> Any:
@@ -634,3 +792,150 @@ class RedisCacheClient(AbstractCacheClient):
     async def eval(self, script: str, numkeys: int, *args) -> Any:
         """Lua 스크립트 실행 (호환성)"""
         return await self._execute_with_retry("eval", self._client.eval, script, numkeys, *args)
+    
+    _script_shas: Dict[str, str] = {}  # 스크립트 본문 → SHA1 (프로세스 전역)
+    
+    async def eval_sha(self, script: str, numkeys: int, *args) -> Any:
+        """
+        EVALSHA로 Lua 스크립트 실행 (스크립트 본문 대신 SHA1만 전송, 1회 왕복)
+        - 서버 스크립트 캐시에 없으면(NOSCRIPT) EVAL로 실행하며 캐시에 적재
+        - 키는 eval과 동일하게 호출자가 네임스페이스 적용
+        """
+        sha = self._script_shas.get(script)
+        if sha is None:
+            sha = hashlib.sha1(script.encode("utf-8")).hexdigest()
+            self._script_shas[script] = sha
+        
+        async def _evalsha_operation():
+            try:
+                return await self._client.evalsha(sha, numkeys, *args)
+            except NoScriptError:
+                return await self._client.eval(script, numkeys, *args)
+        
+        return await self._execute_with_retry("evalsha", _evalsha_operation)
+
+
+class RedisCachePipeline:
+    """
+    RedisCacheClient 파이프라인 빌더
+    - 모든 키에 app_id:env 네임스페이스 적용
+    - 명령은 메서드 체이닝으로 누적하고 execute()에서 1회 왕복으로 전송
+    - execute()는 클라이언트의 재시도/메트릭 로직을 그대로 사용
+    - 결과는 redis-py 원본 응답 리스트 (명령 추가 순서)
+    """
+    def __init__(self, client: RedisCacheClient, transaction: bool = False):
+        self._owner = client
+        self._transaction = transaction
+        self._commands: List[Tuple[str, tuple, Dict[str, Any]]] = []
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def _add(self, command: str, *args, **kwargs) -> 'RedisCachePipeline':
+        self._commands.append((command, args, kwargs))
+        return self
+
+    def set_string(self, key: str, val: str, expire: Optional[int] = None, nx: bool = False) -> 'RedisCachePipeline':
+        kwargs = {}
+        if expire:
+            kwargs['ex'] = expire
+        if nx:
+            kwargs['nx'] = True
+        return self._add("set", self._owner._get_key(key), val, **kwargs)
+
+    def get_string(self, key: str) -> 'RedisCachePipeline':
+        return self._add("get", self._owner._get_key(key))
+
+    def exists(self, key: str) -> 'RedisCachePipeline':
+        return self._add("exists", self._owner._get_key(key))
+
+    def expire(self, key: str, seconds: int) -> 'RedisCachePipeline':
+        return self._add("expire", self._owner._get_key(key), seconds)
+
+    def delete(self, *keys: str) -> 'RedisCachePipeline':
+        return self._add("delete", *[self._owner._get_key(key) for key in keys])
+
+    def incre(self, key: str) -> 'RedisCachePipeline':
+        return self._add("incr", self._owner._get_key(key))
+
+    def set_hash_all(self, key: str, mapping: Dict[str, Any]) -> 'RedisCachePipeline':
+        if not mapping:
+            return self
+        return self._add("hset", self._owner._get_key(key), mapping=self._owner._stringify_mapping(mapping))
+
+    def set_hash_field(self, key: str, field: str, value: str) -> 'RedisCachePipeline':
+        return self._add("hset", self._owner._get_key(key), field, value)
+
+    def get_hash_all(self, key: str) -> 'RedisCachePipeline':
+        return self._add("hgetall", self._owner._get_key(key))
+
+    def hash_get(self, key: str, field: str) -> 'RedisCachePipeline':
+        return self._add("hget", self._owner._get_key(key), field)
+
+    def hash_delete(self, key: str, *fields: str) -> 'RedisCachePipeline':
+        if not fields:
+            return self
+        return self._add("hdel", self._owner._get_key(key), *fields)
+
+    def set_add(self, key: str, *members: str) -> 'RedisCachePipeline':
+        if not members:
+            return self
+        return self._add("sadd", self._owner._get_key(key), *members)
+
+    def set_remove(self, key: str, *members: str) -> 'RedisCachePipeline':
+        if not members:
+            return self
+        return self._add("srem", self._owner._get_key(key), *members)
+
+    def set_members(self, key: str) -> 'RedisCachePipeline':
+        return self._add("smembers", self._owner._get_key(key))
+
+    def list_push_right(self, key: str, value: str) -> 'RedisCachePipeline':
+        return self._add("rpush", self._owner._get_key(key), value)
+
+    def list_push_left(self, key: str, value: str) -> 'RedisCachePipeline':
+        return self._add("lpush", self._owner._get_key(key), value)
+
+    def list_trim(self, key: str, start: int, end: int) -> 'RedisCachePipeline':
+        return self._add("ltrim", self._owner._get_key(key), start, end)
+
+    def list_length(self, key: str) -> 'RedisCachePipeline':
+        return self._add("llen", self._owner._get_key(key))
+
+    def list_index(self, key: str, index: int) -> 'RedisCachePipeline':
+        return self._add("lindex", self._owner._get_key(key), index)
+
+    def list_remove(self, key: str, value: str, count: int = 1) -> 'RedisCachePipeline':
+        return self._add("lrem", self._owner._get_key(key), count, value)
+
+    def sorted_set_add(self, key: str, score: float, member: str) -> 'RedisCachePipeline':
+        return self._add("zadd", self._owner._get_key(key), {member: score})
+
+    def sorted_set_remove(self, key: str, member: str) -> 'RedisCachePipeline':
+        return self._add("zrem", self._owner._get_key(key), member)
+
+    def publish(self, channel: str, message: str) -> 'RedisCachePipeline':
+        return self._add("publish", self._owner._get_key(channel), message)
+
+    def eval(self, script: str, numkeys: int, *args) -> 'RedisCachePipeline':
+        """Lua 스크립트 실행 (client.eval과 동일하게 키는 호출자가 네임스페이스 적용)"""
+        return self._add("eval", script, numkeys, *args)
+
+    async def execute(self) -> List[Any]:
+        """누적된 명령을 한 번에 전송하고 결과 리스트 반환"""
+        if not self._commands:
+            return []
+
+        commands = self._commands
+        self._commands = []
+
+        async def _pipeline_operation():
+            pipe = self._owner._client.pipeline(transaction=self._transaction)
+            for command, args, kwargs in commands:
+                getattr(pipe, command)(*args, **kwargs)
+            return await pipe.execute()
+
+        result = await self._owner._execute_with_retry("pipeline", _pipeline_operation)
+        self._owner.metrics.pipeline_executions += 1
+        self._owner.metrics.pipelined_commands += len(commands)
+        return result
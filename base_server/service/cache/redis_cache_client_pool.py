@@ -1,12 +1,17 @@
-from .redis_cache_client import RedisCacheClient
+import redis.asyncio as redis
+from typing import Dict, Any
+from .redis_cache_client import RedisCacheClient, CacheMetrics
 
 class RedisCacheClientPool:
     """
     RedisCacheClient 인스턴스를 생성하는 풀 클래스.
     - app_id, env 등 네이밍 파라미터 사용
-    - new() 메서드로 RedisCacheClient 인스턴스 반환
+    - 프로세스 당 하나의 redis ConnectionPool을 소유하고 모든 클라이언트가 공유
+    - new() 메서드로 공유 풀을 사용하는 경량 RedisCacheClient 인스턴스 반환
+    - new_blocking()은 블로킹 대기/Pub/Sub 전용 풀을 사용 (장기 점유가 일반 풀을 고갈시키지 않도록 분리)
     """
-    def __init__(self, host: str, port: int, session_expire_time: int, app_id: str, env: str, db: int = 0, password: str = "", max_retries: int = 3, connection_timeout: int = 5):
+    def __init__(self, host: str, port: int, session_expire_time: int, app_id: str, env: str, db: int = 0, password: str = "", max_retries: int = 3, connection_timeout: int = 5, max_connections: int = 20,
+                 blocking_max_connections: int = 16):
         self._host = host
         self._port = port
         self._session_expire_time = session_expire_time
@@ -16,14 +21,50 @@ class RedisCacheClientPool:
         self._password = password
         self._max_retries = max_retries
         self._connection_timeout = connection_timeout
+        self._max_connections = max_connections
+        self._blocking_max_connections = blocking_max_connections
+
+        # 모든 클라이언트가 공유하는 메트릭 (클라이언트별로 흩어지지 않도록)
+        self.metrics = CacheMetrics()
+
+        # 프로세스 전역 커넥션 풀 - 풀이 고갈되면 connection_timeout 동안 대기
+        self._connection_pool = self._create_connection_pool(max_connections)
+        # BLPOP/XREADGROUP/Pub/Sub 전용 풀 (블로킹 대기 시간은 모두 socket_timeout 30초보다 짧게 설정됨)
+        self._blocking_connection_pool = self._create_connection_pool(blocking_max_connections)
+
+    def _create_connection_pool(self, max_connections: int) -> redis.BlockingConnectionPool:
+        return redis.BlockingConnectionPool(
+            host=self._host,
+            port=self._port,
+            db=self._db,
+            password=self._password if self._password else None,
+            decode_responses=True,
+            socket_connect_timeout=self._connection_timeout,
+            socket_timeout=30,
+            retry_on_timeout=True,
+            health_check_interval=30,
+            max_connections=max_connections,
+            timeout=self._connection_timeout
+        )
 
     def new(self) -> RedisCacheClient:
         """
-        새로운 RedisCacheClient 인스턴스를 반환합니다.
+        공유 커넥션 풀을 사용하는 RedisCacheClient 인스턴스를 반환합니다.
+        클라이언트 생성/종료 시 TCP 연결이나 PING이 발생하지 않습니다.
         사용 예시:
             async with pool.new() as client:
                 await client.set_string(...)
         """
+        return self._new_client(self._connection_pool)
+
+    def new_blocking(self) -> RedisCacheClient:
+        """
+        블로킹 전용 풀을 사용하는 RedisCacheClient 인스턴스를 반환합니다.
+        BLPOP/XREADGROUP 대기, subscribe/psubscribe처럼 연결을 오래 점유하는 작업에 사용합니다.
+        """
+        return self._new_client(self._blocking_connection_pool)
+
+    def _new_client(self, connection_pool: redis.BlockingConnectionPool) -> RedisCacheClient:
         return RedisCacheClient(
             self._host,
             self._port,
@@ -33,5 +74,35 @@ class RedisCacheClientPool:
             self._db,
             self._password,
             self._max_retries,
-            self._connection_timeout
+            self._connection_timeout,
+            connection_pool=connection_pool,
+            metrics=self.metrics
         )
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """커넥션 풀 사용률 조회 (blocking: 블로킹/Pub/Sub 전용 풀)"""
+        return {
+            **self._get_stats(self._connection_pool),
+            "blocking": self._get_stats(self._blocking_connection_pool)
+        }
+
+    @staticmethod
+    def _get_stats(pool: redis.BlockingConnectionPool) -> Dict[str, Any]:
+        created = len(pool._connections)
+        # 대기 큐에는 유휴 커넥션 + 아직 생성되지 않은 슬롯(None)이 들어있음
+        in_use = max(0, pool.max_connections - pool.pool.qsize())
+        return {
+            "max_connections": pool.max_connections,
+            "created_connections": created,
+            "in_use_connections": in_use,
+            "idle_connections": max(0, created - in_use),
+            "utilization": in_use / pool.max_connections if pool.max_connections else 0.0
+        }
+
+    async def close(self):
+        """공유/블로킹 커넥션 풀의 모든 연결 종료"""
+        for pool in (self._connection_pool, self._blocking_connection_pool):
+            try:
+                await pool.disconnect()
+            except Exception:
+                pass
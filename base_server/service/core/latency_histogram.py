@@ -0,0 +1,56 @@
+import bisect
+from typing import Any, Dict, Optional, Sequence
+
+# 기본 버킷 상한 (ms) - 마지막 버킷은 상한 없음
+DEFAULT_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+class LatencyHistogram:
+    """
+    고정 버킷 지연시간 히스토그램 (ms 단위)
+    - record()는 O(log B), 메모리는 버킷 수에 비례
+    - percentile()은 버킷 상한 기준 근사값
+    """
+    def __init__(self, buckets_ms: Optional[Sequence[float]] = None):
+        self._bounds = tuple(buckets_ms or DEFAULT_BUCKETS_MS)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, latency_ms: float):
+        self._counts[bisect.bisect_left(self._bounds, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        if latency_ms > self.max_ms:
+            self.max_ms = latency_ms
+
+    def percentile(self, p: float) -> float:
+        """p(0~100) 백분위 근사값 - 해당 버킷 상한 (초과 버킷은 max)"""
+        if self.count == 0:
+            return 0.0
+        target = max(1, int(round(self.count * p / 100.0)))
+        seen = 0
+        for i, c in enumerate(self._counts):
+            seen += c
+            if seen >= target:
+                return float(self._bounds[i]) if i < len(self._bounds) else self.max_ms
+        return self.max_ms
+
+    def reset(self):
+        self._counts = [0] * (len(self._bounds) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        buckets = {f"le_{b}": c for b, c in zip(self._bounds, self._counts)}
+        buckets["le_inf"] = self._counts[-1]
+        return {
+            "count": self.count,
+            "avg_ms": self.total_ms / self.count if self.count else 0.0,
+            "max_ms": self.max_ms,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "buckets": buckets
+        }
@@ -2,7 +2,10 @@ import enum
 import datetime
 import threading
 import os
-from typing import Optional
+import sys
+import time
+import json
+from typing import Any, Callable, Optional, Union
 from queue import Queue, Empty
 
 class LogLevel(enum.IntEnum):
@@ -17,6 +20,9 @@ class LogLevel(enum.IntEnum):
 class LoggerInterface:
     def set_level(self, level: LogLevel):
         raise NotImplementedError
+    def is_enabled(self, level: LogLevel) -> bool:
+        """해당 레벨 로그가 기록되는지 여부 (포맷팅 전 short-circuit 용)"""
+        return True
     def info(self, text: str):
         raise NotImplementedError
     def fatal(self, text: str):
@@ -52,6 +58,8 @@ class ConsoleLogger(LoggerInterface):
     
     def set_level(self, level: LogLevel):
         self._log_level = level
+    def is_enabled(self, level: LogLevel) -> bool:
+        return self._log_level == LogLevel.ALL or level <= self._log_level
     def info(self, log: str):
         if self._log_level != LogLevel.ALL and self._log_level < LogLevel.INFO:
             return
@@ -81,8 +89,48 @@ class ConsoleLogger(LoggerInterface):
         """ConsoleLogger는 정리할 것 없음"""
         pass
 
+class _TimestampFormatter:
+    """타임스탬프 문자열 캐시 - 같은 초 안에서는 strftime을 다시 호출하지 않음"""
+    def __init__(self, timezone: str):
+        if timezone == "KST" or timezone == "Asia/Seoul":
+            # 한국 시간 (UTC+9)
+            self._offset = datetime.timedelta(hours=9)
+            self._suffix = "KST"
+        else:
+            # 기본값은 UTC
+            self._offset = datetime.timedelta(0)
+            self._suffix = "UTC"
+        self._cached_second = -1
+        self._cached_prefix = ""
+        self._cached_date = ""
+
+    def _refresh(self, second: int):
+        now = datetime.datetime.fromtimestamp(second, datetime.timezone.utc) + self._offset
+        self._cached_second = second
+        self._cached_prefix = now.strftime(f"[%Y/%m/%d-%H:%M:%S {self._suffix}]")
+        self._cached_date = now.strftime('%Y-%m-%d')
+
+    def prefix(self, timestamp: float) -> str:
+        second = int(timestamp)
+        if second != self._cached_second:
+            self._refresh(second)
+        return self._cached_prefix
+
+    def date(self, timestamp: float) -> str:
+        second = int(timestamp)
+        if second != self._cached_second:
+            self._refresh(second)
+        return self._cached_date
+
 class FileLogger(LoggerInterface):
-    def __init__(self, log_level: LogLevel = LogLevel.INFO, use_console: bool = True, prefix: str = "App", folder: str = "log", crash_report_url: Optional[str] = None, timezone: str = "UTC", max_file_size_kb: int = 1024):
+    """
+    비동기 배치 파일 로거
+    - log()는 (시각, 레벨, 메시지)만 큐에 넣고 즉시 반환 (포맷팅/IO는 백그라운드 스레드)
+    - 파일 핸들을 열어둔 채 큐를 배치 단위로 비워 writelines 한 번으로 기록
+    - 로테이션용 파일 크기는 메모리에서 추적 (매 줄 getsize 호출 없음)
+    - 콘솔 출력은 별도 큐/스레드를 가진 선택적 싱크
+    """
+    def __init__(self, log_level: LogLevel = LogLevel.INFO, use_console: bool = True, prefix: str = "App", folder: str = "log", crash_report_url: Optional[str] = None, timezone: str = "UTC", max_file_size_kb: int = 1024, batch_size: int = 512, flush_interval: float = 0.2):
         self._log_level = log_level
         self._use_console = use_console
         self._prefix = prefix
@@ -90,13 +138,17 @@ class FileLogger(LoggerInterface):
         self._crash_report_url = crash_report_url
         self._timezone = timezone
         self._max_file_size_bytes = max_file_size_kb * 1024  # KB to bytes
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
         self._log_queue = Queue()
+        self._console_queue: Optional[Queue] = Queue() if use_console else None
         self._running = True
         self._current_date = None
         self._file_counter = 0
+        self._file = None
+        self._file_size = 0
+        self._formatter = _TimestampFormatter(timezone)
         self._log_file_path = self._make_log_file_path()
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
         self._color_codes = {
             LogLevel.FATAL: "\033[41;97m",  # 빨간색 배경 + 흰색 글자
             LogLevel.ERROR: "\033[91m",     # 빨간색
@@ -106,26 +158,19 @@ class FileLogger(LoggerInterface):
             LogLevel.TRACE: "\033[95m"      # 자주색
         }
         self._reset = "\033[0m"
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._console_thread: Optional[threading.Thread] = None
+        if self._console_queue is not None:
+            self._console_thread = threading.Thread(target=self._run_console, daemon=True)
+            self._console_thread.start()
 
     def _make_log_file_path(self):
         os.makedirs(self._folder, exist_ok=True)
         
-        # 시간대에 따른 현재 시간 구하기
-        if self._timezone == "KST" or self._timezone == "Asia/Seoul":
-            # 한국 시간 (UTC+9)
-            import datetime as dt
-            now = dt.datetime.utcnow() + dt.timedelta(hours=9)
-            tz_suffix = "_KST"
-        elif self._timezone == "UTC":
-            now = datetime.datetime.utcnow()
-            tz_suffix = "_UTC"
-        else:
-            # 기본값은 UTC
-            now = datetime.datetime.utcnow()
-            tz_suffix = "_UTC"
-        
-        # 현재 날짜 저장
-        current_date_str = now.strftime('%Y-%m-%d')
+        # 시간대에 따른 현재 날짜
+        tz_suffix = "_KST" if self._timezone == "KST" or self._timezone == "Asia/Seoul" else "_UTC"
+        current_date_str = self._formatter.date(time.time())
         
         # 날짜가 변경되었으면 카운터 리셋
         if self._current_date != current_date_str:
@@ -140,22 +185,17 @@ class FileLogger(LoggerInterface):
     def set_level(self, level: LogLevel):
         self._log_level = level
 
+    def is_enabled(self, level: LogLevel) -> bool:
+        return self._log_level == LogLevel.ALL or level <= self._log_level
+
     def log(self, level: LogLevel, msg: str):
         if self._log_level != LogLevel.ALL and level > self._log_level:
             return
         
-        # 시간대에 따른 현재 시간 구하기
-        if self._timezone == "KST" or self._timezone == "Asia/Seoul":
-            # 한국 시간 (UTC+9)
-            now = (datetime.datetime.utcnow() + datetime.timedelta(hours=9)).strftime("[%Y/%m/%d-%H:%M:%S KST]")
-        else:
-            # UTC
-            now = datetime.datetime.utcnow().strftime("[%Y/%m/%d-%H:%M:%S UTC]")
-            
-        log_line = f"{now} [{level.name}] : {msg}"
-        self._log_queue.put(log_line)
-        if self._use_console:
-            self._print_console(level, log_line)
+        record = (time.time(), level, msg)
+        self._log_queue.put(record)
+        if self._console_queue is not None:
+            self._console_queue.put(record)
         if level == LogLevel.FATAL:
             raise Exception(msg)
 
@@ -180,48 +220,88 @@ class FileLogger(LoggerInterface):
         # 로그 레벨별 색상 적용
         print(self._colorize_log(level, log))
 
-    def _check_and_rotate_file(self):
-        """파일 크기와 날짜를 체크하여 필요시 새 파일로 전환"""
-        # 현재 날짜 체크 (시간대 반영)
-        if self._timezone == "KST" or self._timezone == "Asia/Seoul":
-            now = datetime.datetime.utcnow() + datetime.timedelta(hours=9)
-        else:
-            now = datetime.datetime.utcnow()
-        
-        current_date_str = now.strftime('%Y-%m-%d')
-        
-        # 날짜가 변경되었거나 파일이 없으면 새 파일 생성
-        if self._current_date != current_date_str or not os.path.exists(self._log_file_path):
+    def _drain(self, queue: Queue) -> list:
+        """큐에서 첫 레코드를 기다린 뒤 batch_size까지 대기 없이 가져옴"""
+        try:
+            batch = [queue.get(timeout=self._flush_interval)]
+        except Empty:
+            return []
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(queue.get_nowait())
+            except Empty:
+                break
+        return batch
+
+    def _open_file(self):
+        self._file = open(self._log_file_path, "ab")
+        try:
+            self._file_size = os.path.getsize(self._log_file_path)
+        except OSError:
+            self._file_size = 0
+
+    def _close_file(self):
+        if self._file:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+
+    def _check_and_rotate_file(self, timestamp: float):
+        """날짜 변경/메모리상 파일 크기를 체크하여 필요시 새 파일로 전환"""
+        if self._current_date != self._formatter.date(timestamp):
+            self._close_file()
             self._log_file_path = self._make_log_file_path()
-            return
-            
-        # 파일 크기 체크
+        elif self._file_size >= self._max_file_size_bytes:
+            self._close_file()
+            self._file_counter += 1
+            self._log_file_path = self._make_log_file_path()
+
+        if self._file is None:
+            self._open_file()
+
+    def _write_batch(self, batch: list):
+        formatter = self._formatter
+        lines = [f"{formatter.prefix(ts)} [{level.name}] : {msg}\n".encode("utf-8") for ts, level, msg in batch]
         try:
-            file_size = os.path.getsize(self._log_file_path)
-            if file_size >= self._max_file_size_bytes:
-                self._file_counter += 1
-                self._log_file_path = self._make_log_file_path()
+            self._check_and_rotate_file(batch[-1][0])
+            self._file.writelines(lines)
+            self._file.flush()
+            self._file_size += sum(len(line) for line in lines)
         except OSError:
-            # 파일 접근 오류시 그대로 진행
-            pass
+            # 파일 접근 오류시 다음 배치에서 다시 열기
+            self._close_file()
     
     def _run(self):
-        while self._running:
-            try:
-                log_line = self._log_queue.get(timeout=1)
-                
-                # 파일 로테이션 체크
-                self._check_and_rotate_file()
-                
-                with open(self._log_file_path, "a", encoding="utf-8") as f:
-                    f.write(log_line + "\n")
-            except Empty:
+        while self._running or not self._log_queue.empty():
+            batch = self._drain(self._log_queue)
+            if batch:
+                self._write_batch(batch)
+        self._close_file()
+
+    def _run_console(self):
+        formatter = _TimestampFormatter(self._timezone)
+        while self._running or not self._console_queue.empty():
+            batch = self._drain(self._console_queue)
+            if not batch:
                 continue
+            out = "".join(
+                f"{self._color_codes.get(level, '')}{formatter.prefix(ts)} [{level.name}] : {msg}{self._reset}\n"
+                for ts, level, msg in batch
+            )
+            try:
+                sys.stdout.write(out)
+                sys.stdout.flush()
+            except (OSError, ValueError):
+                pass
 
     def close(self):
         """파일 로거 정리 - 큐에 있는 로그를 파일에 쓰고 스레드 종료"""
         self._running = False
         self._thread.join(timeout=2)
+        if self._console_thread:
+            self._console_thread.join(timeout=2)
 
     def write_exception_log(self, exc: Exception, folder: str = "exception"):
         os.makedirs(folder, exist_ok=True)
@@ -256,29 +336,75 @@ class Logger:
         if cls._logger:
             cls._logger.set_level(level)
     @classmethod
-    def info(cls, log: str):
-        if cls._logger:
-            cls._logger.info(log)
+    def is_enabled(cls, level: LogLevel) -> bool:
+        """해당 레벨이 기록되는지 여부 - 비싼 로그 인자를 만들기 전에 확인"""
+        return cls._logger is not None and cls._logger.is_enabled(level)
+
+    @staticmethod
+    def _render(log: Union[str, Callable[[], str]], args: tuple) -> str:
+        """
+        지연 포맷팅
+        - callable이면 호출 결과를 사용
+        - args가 있으면 printf 스타일(log % args)로 포맷
+        """
+        if callable(log):
+            log = log()
+        if args:
+            log = log % args
+        return log
+
     @classmethod
-    def fatal(cls, log: str):
-        if cls._logger:
-            cls._logger.fatal(log)
+    def _emit(cls, level: LogLevel, log: Union[str, Callable[[], str]], args: tuple):
+        logger = cls._logger
+        if logger is None or not logger.is_enabled(level):
+            return
+        msg = cls._render(log, args)
+        if level == LogLevel.INFO:
+            logger.info(msg)
+        elif level == LogLevel.FATAL:
+            logger.fatal(msg)
+        elif level == LogLevel.ERROR:
+            logger.error(msg)
+        elif level == LogLevel.WARN:
+            logger.warn(msg)
+        elif level == LogLevel.DEBUG:
+            logger.debug(msg)
+        else:
+            logger.trace(msg)
+
     @classmethod
-    def error(cls, log: str):
-        if cls._logger:
-            cls._logger.error(log)
+    def info(cls, log: Union[str, Callable[[], str]], *args: Any):
+        cls._emit(LogLevel.INFO, log, args)
     @classmethod
-    def warn(cls, log: str):
-        if cls._logger:
-            cls._logger.warn(log)
+    def fatal(cls, log: Union[str, Callable[[], str]], *args: Any):
+        cls._emit(LogLevel.FATAL, log, args)
     @classmethod
-    def debug(cls, log: str):
-        if cls._logger:
-            cls._logger.debug(log)
+    def error(cls, log: Union[str, Callable[[], str]], *args: Any):
+        cls._emit(LogLevel.ERROR, log, args)
     @classmethod
-    def trace(cls, log: str):
-        if cls._logger:
-            cls._logger.trace(log) 
+    def warn(cls, log: Union[str, Callable[[], str]], *args: Any):
+        cls._emit(LogLevel.WARN, log, args)
+    @classmethod
+    def debug(cls, log: Union[str, Callable[[], str]], *args: Any):
+        cls._emit(LogLevel.DEBUG, log, args)
+    @classmethod
+    def trace(cls, log: Union[str, Callable[[], str]], *args: Any):
+        cls._emit(LogLevel.TRACE, log, args)
+
+    @classmethod
+    def event(cls, level: LogLevel, event: str, **fields: Any):
+        """
+        구조화 로그 - {"event": ..., key: value ...} 형태의 JSON 한 줄로 기록
+        레벨이 꺼져 있으면 dict/JSON 직렬화 모두 생략
+        값이 callable이면 기록 시점에만 호출 (비싼 값 지연 계산)
+        """
+        logger = cls._logger
+        if logger is None or not logger.is_enabled(level):
+            return
+        record = {"event": event}
+        for key, value in fields.items():
+            record[key] = value() if callable(value) else value
+        cls._emit(level, json.dumps(record, ensure_ascii=False, default=str), ())
 
 # 로그 레벨 파싱 함수
 def parse_log_level(args):
@@ -14,4 +14,7 @@ class DatabaseConfig(BaseModel):
     password: str
     charset: str = "utf8mb4"
     pool_size: int = 10
-    max_overflow: int = 20
\ No newline at end of file
+    max_overflow: int = 20
+    # 전 샤드 동시 조회(scatter_gather) 기본값 - 글로벌 설정만 사용
+    shard_query_timeout: float = 10.0  # 샤드별 타임아웃 (초, 0이면 무제한)
+    shard_max_concurrency: int = 8     # 동시에 실행할 최대 샤드 수
@@ -1,8 +1,23 @@
-from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 from .database_config import DatabaseConfig
 from .mysql_client import MySQLClient
 from service.core.logger import Logger
 
+@dataclass
+class ShardGatherResult:
+    """전 샤드 동시 실행 결과 - 성공/실패가 샤드별로 분리되어 반환"""
+    results: Dict[int, Any] = field(default_factory=dict)             # shard_id -> 반환값
+    errors: Dict[int, BaseException] = field(default_factory=dict)    # shard_id -> 예외 (타임아웃 포함)
+    elapsed_ms: Dict[int, float] = field(default_factory=dict)        # shard_id -> 소요시간
+    total_ms: float = 0.0                                             # 전체 소요시간 (≈ 가장 느린 샤드)
+    
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
 class DatabaseService:
     def __init__(self, global_config: DatabaseConfig):
         self.global_config = global_config
@@ -125,6 +140,91 @@ class DatabaseService:
             raise RuntimeError(f"Shard {shard_id} not available")
         return await shard_client.execute_query(query, params)
     
+    async def execute_shard_many(self, shard_id: int, query: str, params_list: List[Tuple]) -> int:
+        """특정 샤드 DB에 동일 쿼리 일괄 실행 (커넥션 1개, 단일 트랜잭션)"""
+        shard_client = self.get_shard_client(shard_id)
+        if not shard_client:
+            raise RuntimeError(f"Shard {shard_id} not available")
+        return await shard_client.execute_many(query, params_list)
+    
+    def shard_transaction(self, shard_id: int):
+        """
+        특정 샤드 트랜잭션 컨텍스트 (async with ... as tx: tx.query/execute/execute_many)
+        - SELECT ... FOR UPDATE SKIP LOCKED 등 잠금이 커밋까지 유지되어야 하는 작업용
+        """
+        shard_client = self.get_shard_client(shard_id)
+        if not shard_client:
+            raise RuntimeError(f"Shard {shard_id} not available")
+        return shard_client.transaction()
+    
+    async def bulk_insert_shard(self, shard_id: int, table: str, columns: Sequence[str], rows: List[Tuple]) -> int:
+        """
+        특정 샤드 테이블에 multi-row INSERT (affected rows 반환)
+        - table/columns는 코드 상수만 사용 (식별자는 바인딩되지 않음)
+        """
+        if not rows:
+            return 0
+        column_list = ", ".join(f"`{column}`" for column in columns)
+        placeholders = ", ".join(["%s"] * len(columns))
+        query = f"INSERT INTO `{table}` ({column_list}) VALUES ({placeholders})"
+        return await self.execute_shard_many(shard_id, query, rows)
+    
+    # === 전 샤드 동시 실행 (scatter-gather) ===
+    async def scatter_gather(self, func: Callable[[int], Awaitable[Any]], shard_ids: Optional[Sequence[int]] = None,
+                             timeout: Optional[float] = None, max_concurrency: Optional[int] = None) -> ShardGatherResult:
+        """
+        func(shard_id)를 여러 샤드에서 동시에 실행하고 샤드별 결과/에러를 수집
+        - shard_ids 미지정 시 활성 샤드 전체
+        - timeout: 샤드별 타임아웃 (초, 기본 global_config.shard_query_timeout)
+        - max_concurrency: 동시 실행 샤드 수 제한 (기본 global_config.shard_max_concurrency)
+        - 한 샤드의 실패/타임아웃은 다른 샤드 결과에 영향을 주지 않음
+        """
+        if shard_ids is None:
+            shard_ids = await self.get_active_shard_ids()
+        if timeout is None:
+            timeout = self.global_config.shard_query_timeout
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or self.global_config.shard_max_concurrency))
+        gathered = ShardGatherResult()
+        started = time.perf_counter()
+        
+        async def _run(shard_id: int):
+            async with semaphore:
+                shard_started = time.perf_counter()
+                try:
+                    if timeout and timeout > 0:
+                        gathered.results[shard_id] = await asyncio.wait_for(func(shard_id), timeout)
+                    else:
+                        gathered.results[shard_id] = await func(shard_id)
+                except asyncio.TimeoutError:
+                    gathered.errors[shard_id] = TimeoutError(f"Shard {shard_id} timed out after {timeout}s")
+                except Exception as e:
+                    gathered.errors[shard_id] = e
+                finally:
+                    gathered.elapsed_ms[shard_id] = (time.perf_counter() - shard_started) * 1000.0
+        
+        await asyncio.gather(*[_run(shard_id) for shard_id in dict.fromkeys(shard_ids)])
+        gathered.total_ms = (time.perf_counter() - started) * 1000.0
+        
+        for shard_id, error in gathered.errors.items():
+            Logger.warn(f"Shard {shard_id} scatter-gather failed: {error}")
+        return gathered
+    
+    async def gather_shard_procedure(self, procedure_name: str, params: Tuple = (), shard_ids: Optional[Sequence[int]] = None,
+                                     timeout: Optional[float] = None, max_concurrency: Optional[int] = None) -> ShardGatherResult:
+        """여러 샤드에서 동일 스토어드 프로시저 동시 호출"""
+        return await self.scatter_gather(
+            lambda shard_id: self.call_shard_procedure(shard_id, procedure_name, params),
+            shard_ids, timeout, max_concurrency
+        )
+    
+    async def gather_shard_query(self, query: str, params: Tuple = (), shard_ids: Optional[Sequence[int]] = None,
+                                 timeout: Optional[float] = None, max_concurrency: Optional[int] = None) -> ShardGatherResult:
+        """여러 샤드에서 동일 쿼리 동시 실행"""
+        return await self.scatter_gather(
+            lambda shard_id: self.execute_shard_query(shard_id, query, params),
+            shard_ids, timeout, max_concurrency
+        )
+    
     # === 세션 기반 메서드 (자동 라우팅) ===
     async def call_procedure_by_session(self, client_session, procedure_name: str, params: Tuple = ()) -> List[Dict[str, Any]]:
         """세션 정보를 기반으로 적절한 DB에 스토어드 프로시저 호출"""
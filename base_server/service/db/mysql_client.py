@@ -1,9 +1,34 @@
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from contextlib import asynccontextmanager
 import asyncio
 import aiomysql
 from aiomysql import Pool
 from .database_config import DatabaseConfig
 
+class MySQLTransaction:
+    """트랜잭션 범위 커넥션 래퍼 (MySQLClient.transaction()에서 생성)"""
+    def __init__(self, conn):
+        self._conn = conn
+    
+    async def query(self, query: str, params: Tuple = ()) -> List[Dict[str, Any]]:
+        """SELECT 실행 (FOR UPDATE 잠금은 커밋/롤백까지 유지)"""
+        async with self._conn.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.execute(query, params)
+            results = await cursor.fetchall()
+            return results if results else []
+    
+    async def execute(self, query: str, params: Tuple = ()) -> int:
+        """INSERT/UPDATE/DELETE 실행 - affected rows 반환"""
+        async with self._conn.cursor() as cursor:
+            return await cursor.execute(query, params)
+    
+    async def execute_many(self, query: str, params_list: List[Tuple]) -> int:
+        """동일 쿼리 일괄 실행 - affected rows 합계 반환"""
+        if not params_list:
+            return 0
+        async with self._conn.cursor() as cursor:
+            return await cursor.executemany(query, params_list) or 0
+
 class MySQLClient:
     def __init__(self, config: DatabaseConfig):
         self.config = config
@@ -115,6 +140,53 @@ class MySQLClient:
             else:
                 raise
     
+    async def execute_many(self, query: str, params_list: List[Tuple]) -> int:
+        """
+        동일 쿼리를 여러 파라미터로 실행 (풀 커넥션 1개 사용, affected rows 합계 반환)
+        - INSERT ... VALUES (%s, ...) 형태는 aiomysql이 multi-row INSERT로 묶어서 전송
+        - 한 트랜잭션으로 커밋하여 부분 저장 방지
+        """
+        if not params_list:
+            return 0
+        await self._ensure_connection()
+        
+        async def _run() -> int:
+            async with self.pool.acquire() as conn:
+                await conn.begin()
+                try:
+                    async with conn.cursor() as cursor:
+                        affected_rows = await cursor.executemany(query, params_list)
+                    await conn.commit()
+                    return affected_rows or 0
+                except Exception:
+                    await conn.rollback()
+                    raise
+        
+        try:
+            return await _run()
+        except Exception as e:
+            if self._is_connection_error(e):
+                await self._reconnect()
+                return await _run()
+            else:
+                raise
+    
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[MySQLTransaction]:
+        """
+        풀 커넥션 1개로 트랜잭션 실행 - 정상 종료 시 커밋, 예외 시 롤백
+        - 연결 오류는 재시도하지 않음 (트랜잭션 중간 재실행은 호출자가 판단)
+        """
+        await self._ensure_connection()
+        async with self.pool.acquire() as conn:
+            await conn.begin()
+            try:
+                yield MySQLTransaction(conn)
+                await conn.commit()
+            except BaseException:
+                await conn.rollback()
+                raise
+    
     async def get_last_insert_id(self) -> int:
         """Get the last inserted ID"""
         await self._ensure_connection()
@@ -436,17 +436,9 @@ class IOCPWebSocket:
         """수신 데이터 처리"""
         try:
             data = event.data["message"]
-            Logger.info(f"📨 데이터 수신: {self.connection_id}")
             
-            # 🔍 실제 수신 데이터 내용 로깅 (디버깅용)
-            if isinstance(data, dict):
-                # JSON 데이터인 경우 구조 확인
-                data_keys = list(data.keys()) if data else []
-                Logger.info(f"🔍 수신 데이터 구조: {data_keys}")
-                Logger.info(f"🔍 수신 데이터 내용: {data}")
-            else:
-                # 문자열 데이터인 경우
-                Logger.info(f"🔍 수신 RAW 데이터: {data}")
+            # 🔍 수신 데이터 내용 로깅 (디버깅용 - 실시간 프레임마다 호출되므로 DEBUG)
+            Logger.debug("📨 데이터 수신 (%s): %s", self.connection_id, data)
             
             # 메시지 인터셉터 호출
             for interceptor in self._message_interceptors:
@@ -638,10 +630,13 @@ class IOCPWebSocket:
                     # 메시지 수신 대기
                     message_str = await self.websocket.recv()
                     
-                    # JSON 파싱
-                    try:
-                        message_data = json.loads(message_str)
-                    except json.JSONDecodeError:
+                    # JSON 파싱 (실시간 시세 프레임은 '0|TR_ID|...' 형식이라 파싱 시도 생략)
+                    if isinstance(message_str, str) and message_str[:1] == "{":
+                        try:
+                            message_data = json.loads(message_str)
+                        except json.JSONDecodeError:
+                            message_data = {"raw": message_str}
+                    else:
                         message_data = {"raw": message_str}
                     
                     # 수신 이벤트 생성
@@ -0,0 +1,218 @@
+"""
+한국투자증권 실시간 WebSocket 틱 디코더
+
+실시간 프레임 형식: "{암호화여부}|{TR_ID}|{건수}|{필드1}^{필드2}^...^{필드N}[^{다음 건 필드}...]"
+- 프레임은 '|' 3회, '^' 1회만 분할
+- TR ID별로 미리 계산한 필드 인덱스 표로 필요한 필드만 타입 변환
+- 단건은 __slots__ 기반 TickRecord, 다건 프레임은 NumPy 구조화 배열로도 변환 가능
+"""
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+
+class TickFieldMap(NamedTuple):
+    """TR별 필드 인덱스 표"""
+    field_count: int      # 레코드 1건의 필드 수
+    symbol: int
+    time: int
+    price: int
+    open: int
+    high: int
+    low: int
+    change: int
+    change_rate: int
+    volume: int           # 누적 거래량
+    trade_volume: int     # 체결 거래량
+
+
+# 한국투자증권 실시간 TR 필드 순서 (Open API 실시간 시세 명세 기준)
+TICK_FIELD_MAPS: Dict[str, TickFieldMap] = {
+    # 국내주식 실시간체결가: MKSC_SHRN_ISCD, STCK_CNTG_HOUR, STCK_PRPR, PRDY_VRSS_SIGN, PRDY_VRSS, PRDY_CTRT,
+    # WGHN_AVRG_STCK_PRC, STCK_OPRC, STCK_HGPR, STCK_LWPR, ASKP1, BIDP1, CNTG_VOL, ACML_VOL, ... (46개)
+    "H0STCNT0": TickFieldMap(field_count=46, symbol=0, time=1, price=2, open=7, high=8, low=9,
+                             change=4, change_rate=5, volume=13, trade_volume=12),
+    # 해외주식 실시간지연체결가: RSYM, SYMB, ZDIV, TYMD, XYMD, XHMS, KYMD, KHMS, OPEN, HIGH, LOW, LAST, SIGN, DIFF, RATE,
+    # PBID, PASK, VBID, VASK, EVOL, TVOL, TAMT, BIVL, ASVL, STRN, MTYP (26개)
+    "HDFSCNT0": TickFieldMap(field_count=26, symbol=1, time=7, price=11, open=8, high=9, low=10,
+                             change=13, change_rate=14, volume=20, trade_volume=19),
+    # 국내지수 실시간체결: BSTP_CLS_CODE, BSOP_HOUR, PRPR_NMIX, PRDY_VRSS_SIGN, BSTP_NMIX_PRDY_VRSS, ACML_VOL,
+    # ACML_TR_PBMN, PCAS_VOL, PCAS_TR_PBMN, PRDY_CTRT, OPRC_NMIX, NMIX_HGPR, NMIX_LWPR, ... (30개)
+    "H0UPCNT0": TickFieldMap(field_count=30, symbol=0, time=1, price=2, open=10, high=11, low=12,
+                             change=4, change_rate=9, volume=5, trade_volume=7),
+}
+
+TICK_DTYPE = np.dtype([
+    ("symbol", "U16"),
+    ("time", "U8"),
+    ("price", "f8"),
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("change", "f8"),
+    ("change_rate", "f8"),
+    ("volume", "i8"),
+    ("trade_volume", "i8"),
+])
+
+
+def _to_float(value: str) -> float:
+    try:
+        return float(value) if value else 0.0
+    except ValueError:
+        return 0.0
+
+
+def _to_int(value: str) -> int:
+    try:
+        return int(value) if value else 0
+    except ValueError:
+        return int(_to_float(value))
+
+
+class TickRecord:
+    """실시간 체결 1건 (타입 변환 완료)"""
+    __slots__ = ("tr_id", "symbol", "time", "price", "open", "high", "low",
+                 "change", "change_rate", "volume", "trade_volume")
+
+    def __init__(self, tr_id: str, symbol: str, time: str, price: float, open: float, high: float, low: float,
+                 change: float, change_rate: float, volume: int, trade_volume: int):
+        self.tr_id = tr_id
+        self.symbol = symbol
+        self.time = time
+        self.price = price
+        self.open = open
+        self.high = high
+        self.low = low
+        self.change = change
+        self.change_rate = change_rate
+        self.volume = volume
+        self.trade_volume = trade_volume
+
+    # 기존 dict 기반 콜백 호환 (data.get('current_price') 형태)
+    _DICT_KEYS = {
+        "current_price": "price", "open_price": "open", "high_price": "high", "low_price": "low",
+        "change_amount": "change", "change_rate": "change_rate", "volume": "volume", "symbol": "symbol"
+    }
+
+    def get(self, key: str, default: Any = None) -> Any:
+        attr = self._DICT_KEYS.get(key)
+        return getattr(self, attr) if attr else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "symbol": self.symbol,
+            "time": self.time,
+            "current_price": self.price,
+            "open_price": self.open,
+            "high_price": self.high,
+            "low_price": self.low,
+            "change_amount": self.change,
+            "change_rate": self.change_rate,
+            "volume": self.volume,
+            "trade_volume": self.trade_volume
+        }
+
+    def __repr__(self) -> str:
+        return f"TickRecord({self.tr_id} {self.symbol} {self.price} vol={self.volume})"
+
+
+class KisTickDecoder:
+    """
+    실시간 프레임 디코더
+    - 같은 프레임 객체를 여러 인터셉터가 디코딩해도 분할/변환은 1회 (직전 프레임 결과 재사용)
+    - 암호화 프레임(첫 필드 '1')과 미등록 TR은 None
+    """
+    def __init__(self, field_maps: Optional[Dict[str, TickFieldMap]] = None):
+        self._field_maps = field_maps or TICK_FIELD_MAPS
+        self._last_frame: Optional[str] = None
+        self._last_records: Optional[List[TickRecord]] = None
+        self.decoded_frames = 0
+        self.decoded_ticks = 0
+        self.skipped_frames = 0
+
+    @staticmethod
+    def is_realtime_frame(frame: Any) -> bool:
+        return isinstance(frame, str) and len(frame) > 2 and frame[1] == "|" and frame[0] in "01"
+
+    def _split(self, frame: str) -> Optional[Tuple[str, TickFieldMap, int, List[str]]]:
+        parts = frame.split("|", 3)
+        if len(parts) != 4 or parts[0] != "0":
+            return None
+        field_map = self._field_maps.get(parts[1])
+        if field_map is None:
+            return None
+        fields = parts[3].split("^")
+        try:
+            count = int(parts[2])
+        except ValueError:
+            count = 1
+        count = min(count, len(fields) // field_map.field_count)
+        if count <= 0:
+            return None
+        return parts[1], field_map, count, fields
+
+    def decode(self, frame: str) -> Optional[List[TickRecord]]:
+        """프레임 → TickRecord 목록 (다건 프레임은 건수만큼)"""
+        if frame is self._last_frame:
+            return self._last_records
+
+        split = self._split(frame) if self.is_realtime_frame(frame) else None
+        if split is None:
+            self.skipped_frames += 1
+            return None
+
+        tr_id, m, count, fields = split
+        records = []
+        width = m.field_count
+        for n in range(count):
+            base = n * width
+            records.append(TickRecord(
+                tr_id,
+                fields[base + m.symbol],
+                fields[base + m.time],
+                _to_float(fields[base + m.price]),
+                _to_float(fields[base + m.open]),
+                _to_float(fields[base + m.high]),
+                _to_float(fields[base + m.low]),
+                _to_float(fields[base + m.change]),
+                _to_float(fields[base + m.change_rate]),
+                _to_int(fields[base + m.volume]),
+                _to_int(fields[base + m.trade_volume]),
+            ))
+
+        self.decoded_frames += 1
+        self.decoded_ticks += len(records)
+        self._last_frame = frame
+        self._last_records = records
+        return records
+
+    def decode_array(self, frame: str) -> Optional[np.ndarray]:
+        """프레임 → TICK_DTYPE 구조화 배열 (다건 프레임 일괄 처리용)"""
+        split = self._split(frame) if self.is_realtime_frame(frame) else None
+        if split is None:
+            self.skipped_frames += 1
+            return None
+
+        _, m, count, fields = split
+        rows = np.array(fields[:count * m.field_count], dtype=object).reshape(count, m.field_count)
+        out = np.empty(count, dtype=TICK_DTYPE)
+        out["symbol"] = rows[:, m.symbol]
+        out["time"] = rows[:, m.time]
+        for name in ("price", "open", "high", "low", "change", "change_rate"):
+            column = rows[:, getattr(m, name)]
+            out[name] = np.where(column == "", "0", column).astype("f8")
+        for name in ("volume", "trade_volume"):
+            column = rows[:, getattr(m, name)]
+            out[name] = np.where(column == "", "0", column).astype("f8").astype("i8")
+
+        self.decoded_frames += 1
+        self.decoded_ticks += count
+        return out
+
+    def get_metrics(self) -> Dict[str, int]:
+        return {
+            "decoded_frames": self.decoded_frames,
+            "decoded_ticks": self.decoded_ticks,
+            "skipped_frames": self.skipped_frames
+        }
@@ -1,9 +1,11 @@
 import aiohttp
 import asyncio
 import json
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 from service.core.logger import Logger
+from service.external.token_bucket import TokenBucket
 
 class KoreaInvestmentService:
     """한국투자증권 API 서비스 (정적 클래스)"""
@@ -20,6 +22,17 @@ class KoreaInvestmentService:
     _REDIS_APPROVAL_KEY = "korea_investment:approval_key"
     _REDIS_APPROVAL_EXPIRES_KEY = "korea_investment:approval_expires_at"
     
+    # REST 호출 제한 - 실전 계좌 appkey당 초당 20건 (rate 15 + burst 5 → 임의 1초 구간 최대 20건)
+    REQUESTS_PER_SECOND = 15
+    RATE_LIMIT_BURST = 5
+    BATCH_CONCURRENCY = 10          # 다종목 조회 동시 요청 수
+    TOKEN_VALIDATE_INTERVAL = 300   # 검증된 토큰 재사용 시간 (초), 만료 응답 시 즉시 재발급
+    
+    _rate_limiter = TokenBucket(REQUESTS_PER_SECOND, RATE_LIMIT_BURST)
+    _token_lock: Optional[asyncio.Lock] = None
+    _validated_token: Optional[str] = None
+    _validated_at: float = 0.0
+    
     @classmethod
     async def init(cls, app_key: str, app_secret: str) -> bool:
         """서비스 초기화 및 인증"""
@@ -286,6 +299,7 @@ class KoreaInvestmentService:
             }
             
             # 3초 타임아웃으로 빠른 검증
+            await cls._rate_limiter.acquire()
             async with cls._session.get(url, headers=headers, params=params, timeout=aiohttp.ClientTimeout(total=3)) as response:
                 if response.status == 200:
                     return True
@@ -308,9 +322,52 @@ class KoreaInvestmentService:
             Logger.warn(f"🔍 토큰 검증 예외 - 유효하다고 가정: {e}")
             return True
 
+    @classmethod
+    def _get_token_lock(cls) -> asyncio.Lock:
+        if cls._token_lock is None:
+            cls._token_lock = asyncio.Lock()
+        return cls._token_lock
+    
     @classmethod
     async def _get_current_token(cls) -> Optional[str]:
-        """현재 유효한 토큰 반환 (실제 검증 후 사용)"""
+        """
+        현재 유효한 토큰 반환
+        - 검증된 토큰은 TOKEN_VALIDATE_INTERVAL 동안 재검증 없이 사용 (만료 응답은 _refresh_expired_token이 처리)
+        - 동시 호출은 락으로 묶어 검증/발급 1회만 수행
+        """
+        if cls._validated_token and time.monotonic() - cls._validated_at < cls.TOKEN_VALIDATE_INTERVAL:
+            return cls._validated_token
+        
+        async with cls._get_token_lock():
+            if cls._validated_token and time.monotonic() - cls._validated_at < cls.TOKEN_VALIDATE_INTERVAL:
+                return cls._validated_token
+            token = await cls._load_current_token()
+            if token:
+                cls._validated_token = token
+                cls._validated_at = time.monotonic()
+            return token
+    
+    @classmethod
+    async def _refresh_expired_token(cls, expired_token: str) -> bool:
+        """
+        만료 응답을 받은 토큰 재발급 (동시 요청 중 1회만 발급)
+        - 다른 요청이 이미 새 토큰으로 교체했으면 발급 없이 True
+        """
+        async with cls._get_token_lock():
+            if cls._validated_token and cls._validated_token != expired_token:
+                return True
+            cls._validated_token = None
+            auth_success = await cls._authenticate(force_new_token=True)
+            if auth_success:
+                new_token, _ = await cls._load_token_from_redis()
+                if new_token:
+                    cls._validated_token = new_token
+                    cls._validated_at = time.monotonic()
+            return auth_success
+    
+    @classmethod
+    async def _load_current_token(cls) -> Optional[str]:
+        """Redis 토큰을 실제 API로 검증 후 반환 (만료 시 새로 발급)"""
         try:
             # 1. Redis에서 기존 토큰 조회
             token, expires_at = await cls._load_token_from_redis()
@@ -396,14 +453,13 @@ class KoreaInvestmentService:
                 'FID_INPUT_ISCD': symbol
             }
             
-            Logger.info(f"주식 조회 파라미터: {params}")
-            Logger.info(f"주식 조회 URL: {url}")
-            Logger.info(f"주식 조회 헤더: {headers}")
+            Logger.debug("주식 조회 파라미터: %s", params)
             
+            await cls._rate_limiter.acquire()
             async with cls._session.get(url, headers=headers, params=params) as response:
                 if response.status == 200:
                     result = await response.json()
-                    Logger.info(f"주식 가격 조회 성공: {result}")
+                    Logger.debug("주식 가격 조회 성공: %s", symbol)
                     return result.get('output', {})
                 else:
                     error_text = await response.text()
@@ -418,7 +474,7 @@ class KoreaInvestmentService:
                         if retry_count < 1:
                             Logger.info("🔄 강제 재인증 시작...")
                             # 강제 재인증 (Redis 토큰 무시)
-                            auth_success = await cls._authenticate(force_new_token=True)
+                            auth_success = await cls._refresh_expired_token(access_token)
                             Logger.info(f"📊 재인증 결과: {auth_success}")
                             
                             if auth_success:
@@ -468,10 +524,9 @@ class KoreaInvestmentService:
                 'FID_INPUT_ISCD': index_code
             }
             
-            Logger.info(f"지수 조회 파라미터: {params}")
-            Logger.info(f"지수 조회 URL: {url}")
-            Logger.info(f"지수 조회 헤더: {headers}")
+            Logger.debug("지수 조회 파라미터: %s", params)
             
+            await cls._rate_limiter.acquire()
             async with cls._session.get(url, headers=headers, params=params) as response:
                 if response.status == 200:
                     result = await response.json()
@@ -486,8 +541,8 @@ class KoreaInvestmentService:
                         
                         # 최대 1회 재시도
                         if retry_count < 1:
-                            # 강제 재인증 (Redis 토큰 무시)
-                            auth_success = await cls._authenticate(force_new_token=True)
+                            # 강제 재인증 (Redis 토큰 무시, 동시 요청 중 1회만 발급)
+                            auth_success = await cls._refresh_expired_token(access_token)
                             if auth_success:
                                 Logger.info("✅ 토큰 재인증 성공 - 지수 API 재시도")
                                 return await cls.get_market_index(index_code, retry_count + 1)
@@ -505,15 +560,42 @@ class KoreaInvestmentService:
             Logger.error(f"시장 지수 조회 에러: {e}")
             return None
     
+    @classmethod
+    async def _fetch_concurrently(cls, keys: Iterable[Any], fetch: Callable[[Any], Awaitable[Optional[Dict]]]) -> Dict[Any, Optional[Dict]]:
+        """
+        여러 건 동시 조회 - BATCH_CONCURRENCY개씩 동시 요청, 실제 호출 속도는 토큰 버킷이 제한
+        토큰 만료 응답은 각 조회 함수의 재인증/재시도 로직이 처리 (재발급은 1회로 합쳐짐)
+        """
+        semaphore = asyncio.Semaphore(cls.BATCH_CONCURRENCY)
+        
+        async def _fetch_one(key):
+            async with semaphore:
+                try:
+                    return key, await fetch(key)
+                except Exception as e:
+                    Logger.error(f"다종목 조회 에러 ({key}): {e}")
+                    return key, None
+        
+        return dict(await asyncio.gather(*[_fetch_one(key) for key in dict.fromkeys(keys)]))
+    
+    @classmethod
+    async def get_stock_prices(cls, symbols: List[str]) -> Dict[str, Optional[Dict]]:
+        """국내주식 현재가 다종목 조회 (원본 output, 실패 종목은 None)"""
+        return await cls._fetch_concurrently(symbols, cls.get_stock_price)
+    
+    @classmethod
+    async def get_overseas_stock_prices(cls, items: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Optional[Dict]]:
+        """해외주식 현재가 다종목 조회 - items: [(거래소, 심볼)], 반환: {(거래소, 심볼): 원본 output}"""
+        return await cls._fetch_concurrently(items, lambda item: cls.get_overseas_stock_price(item[0], item[1]))
+    
     @classmethod
     async def get_real_time_data(cls, symbols: List[str]) -> Dict[str, Dict]:
-        """실시간 데이터 조회 (여러 종목)"""
+        """실시간 데이터 조회 (여러 종목, 동시 조회)"""
         results = {}
+        prices = await cls.get_stock_prices(symbols)
         
-        for symbol in symbols:
+        for symbol, price_data in prices.items():
             try:
-                # 주식 가격 조회
-                price_data = await cls.get_stock_price(symbol)
                 if price_data:
                     results[symbol] = {
                         'current_price': float(price_data.get('stck_prpr', 0)),
@@ -562,13 +644,13 @@ class KoreaInvestmentService:
                 'SYMB': symbol     # 심볼
             }
             
-            Logger.info(f"해외주식 조회 파라미터: {params}")
-            Logger.info(f"해외주식 조회 URL: {url}")
+            Logger.debug("해외주식 조회 파라미터: %s", params)
             
+            await cls._rate_limiter.acquire()
             async with cls._session.get(url, headers=headers, params=params) as response:
                 if response.status == 200:
                     result = await response.json()
-                    Logger.info(f"해외주식 가격 조회 성공: {result}")
+                    Logger.debug("해외주식 가격 조회 성공: %s^%s", exchange, symbol)
                     return result.get('output', {})
                 else:
                     error_text = await response.text()
@@ -579,8 +661,8 @@ class KoreaInvestmentService:
                         
                         # 최대 1회 재시도
                         if retry_count < 1:
-                            # 강제 재인증 (Redis 토큰 무시)
-                            auth_success = await cls._authenticate(force_new_token=True)
+                            # 강제 재인증 (Redis 토큰 무시, 동시 요청 중 1회만 발급)
+                            auth_success = await cls._refresh_expired_token(access_token)
                             if auth_success:
                                 Logger.info("✅ 토큰 재인증 성공 - 해외주식 API 재시도")
                                 return await cls.get_overseas_stock_price(exchange, symbol, retry_count + 1)
@@ -600,18 +682,17 @@ class KoreaInvestmentService:
     
     @classmethod
     async def get_overseas_real_time_data(cls, exchange: str, symbols: List[str]) -> Dict[str, Dict]:
-        """해외주식 실시간 데이터 조회 (여러 종목)
+        """해외주식 실시간 데이터 조회 (여러 종목, 동시 조회)
         
         Args:
             exchange: 거래소 코드
             symbols: 종목 심볼 리스트
         """
         results = {}
+        prices = await cls.get_overseas_stock_prices([(exchange, symbol) for symbol in symbols])
         
-        for symbol in symbols:
+        for (exchange, symbol), price_data in prices.items():
             try:
-                # 해외주식 가격 조회
-                price_data = await cls.get_overseas_stock_price(exchange, symbol)
                 if price_data:
                     results[f"{exchange}^{symbol}"] = {
                         'symbol': symbol,
@@ -639,6 +720,8 @@ class KoreaInvestmentService:
                 await cls._session.close()
                 cls._session = None
             
+            cls._validated_token = None
+            cls._token_lock = None
             cls._app_key = None
             cls._app_secret = None
             cls._initialized = False
@@ -648,6 +731,10 @@ class KoreaInvestmentService:
         except Exception as e:
             Logger.error(f"KoreaInvestmentService 종료 실패: {e}")
     
+    @classmethod
+    def get_rate_limit_metrics(cls) -> Dict[str, Any]:
+        return cls._rate_limiter.get_metrics()
+    
     @classmethod
     def is_initialized(cls) -> bool:
         """초기화 여부 확인"""
@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import Dict, Optional, Callable, Any
 from service.core.logger import Logger
 from .iocp_websocket import IOCPWebSocket, WebSocketState
+from .kis_tick_decoder import KisTickDecoder
 
 
 class KoreaInvestmentWebSocketIOCP:
@@ -28,6 +29,9 @@ class KoreaInvestmentWebSocketIOCP:
         # REST API 폴백 플래그
         self._use_rest_fallback = False
         
+        # 실시간 프레임 디코더 (인터셉터 간 프레임당 1회 디코딩)
+        self.tick_decoder = KisTickDecoder()
+        
         Logger.info("🚀 한국투자증권 IOCP WebSocket 생성")
     
     async def connect(self, app_key: str, app_secret: str, approval_key: Optional[str] = None) -> bool:
@@ -147,21 +151,18 @@ class KoreaInvestmentWebSocketIOCP:
             
             # 콜백이 있으면 메시지 인터셉터로 등록
             if callback:
+                symbol_set = set(symbols)
+                
                 async def overseas_interceptor(data):
                     try:
-                        # 해외주식 데이터인지 확인하고 콜백 호출
-                        if 'header' in data and 'body' in data:
-                            # 해외주식 데이터 변환 로직
-                            processed_data = {
-                                'current_price': data.get('body', {}).get('output', {}).get('last', 0),
-                                'high_price': data.get('body', {}).get('output', {}).get('high', 0),
-                                'low_price': data.get('body', {}).get('output', {}).get('low', 0),
-                                'open_price': data.get('body', {}).get('output', {}).get('open', 0),
-                                'volume': data.get('body', {}).get('output', {}).get('tvol', 0)
-                            }
-                            
-                            if callable(callback):
-                                callback(processed_data)
+                        # 실시간 프레임만 디코딩 - 구독한 종목의 체결만 TickRecord로 콜백 호출
+                        raw = data.get("raw") if isinstance(data, dict) else None
+                        records = self.tick_decoder.decode(raw) if raw else None
+                        if not records or not callable(callback):
+                            return
+                        for record in records:
+                            if record.symbol in symbol_set:
+                                callback(record)
                                 
                     except Exception as e:
                         Logger.error(f"❌ 해외주식 콜백 처리 에러: {e}")
@@ -205,20 +206,23 @@ class KoreaInvestmentWebSocketIOCP:
             
             # 콜백이 있으면 메시지 인터셉터로 등록
             if callback:
+                index_set = set(indices)
+                
                 async def index_interceptor(data):
                     try:
-                        # 시장 지수 데이터인지 확인하고 콜백 호출
-                        if 'header' in data and 'body' in data:
-                            # 시장 지수 데이터 변환 로직
-                            processed_data = {
-                                'index_code': data.get('body', {}).get('output', {}).get('mksc_shrn_iscd', ''),
-                                'current_value': data.get('body', {}).get('output', {}).get('bstp_nmix_prpr', 0),
-                                'change_amount': data.get('body', {}).get('output', {}).get('prdy_vrss_sign', 0),
-                                'change_rate': data.get('body', {}).get('output', {}).get('prdy_ctrt', 0)
-                            }
-                            
-                            if callable(callback):
-                                callback(processed_data)
+                        # 실시간 프레임만 디코딩 - 구독한 지수만 콜백 호출
+                        raw = data.get("raw") if isinstance(data, dict) else None
+                        records = self.tick_decoder.decode(raw) if raw else None
+                        if not records or not callable(callback):
+                            return
+                        for record in records:
+                            if record.symbol in index_set:
+                                callback({
+                                    'index_code': record.symbol,
+                                    'current_value': record.price,
+                                    'change_amount': record.change,
+                                    'change_rate': record.change_rate
+                                })
                                 
                     except Exception as e:
                         Logger.error(f"❌ 시장 지수 콜백 처리 에러: {e}")
@@ -308,8 +312,12 @@ class KoreaInvestmentWebSocketIOCP:
     async def _korea_message_interceptor(self, data: Dict[str, Any]) -> None:
         """한국투자증권 전용 메시지 인터셉터 (PINGPONG 처리 포함)"""
         try:
-            # 모든 메시지 로깅 (디버깅용)
-            Logger.debug(f"🔍 한투증권 인터셉터 수신 데이터: {data}")
+            # 실시간 시세 프레임은 PINGPONG 검사 대상 아님 (프레임마다 문자열 변환 생략)
+            if isinstance(data, dict) and KisTickDecoder.is_realtime_frame(data.get("raw")):
+                return
+            
+            # 제어 메시지 로깅 (디버깅용)
+            Logger.debug("🔍 한투증권 인터셉터 수신 데이터: %s", data)
             
             # PINGPONG 메시지 감지 - 다양한 형태 체크
             pingpong_detected = False
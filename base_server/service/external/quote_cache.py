@@ -0,0 +1,146 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from service.core.logger import Logger
+from service.cache.local_cache import LocalCache
+
+QuoteLoader = Callable[[str], Awaitable[Optional[Any]]]
+BatchQuoteLoader = Callable[[List[str]], Awaitable[Dict[str, Any]]]
+
+@dataclass
+class QuoteCacheMetrics:
+    coalesced: int = 0        # 진행 중 요청에 합류한 호출 수
+    upstream_calls: int = 0   # 단건 로더 호출 수
+    batch_calls: int = 0      # 배치 로더 호출 수
+    batch_symbols: int = 0    # 배치 로더로 요청한 심볼 수
+    errors: int = 0           # 로더 예외 수
+
+class QuoteCache:
+    """
+    외부 시세 핫키 캐시 (프로세스 내, 심볼 단위)
+    - 짧은 TTL의 LocalCache에 조회 결과 보관 (None 결과는 캐시하지 않음)
+    - single-flight: 같은 심볼의 동시 요청은 진행 중인 1회 업스트림 요청의 결과를 공유
+    - get_many: 캐시/진행 중 요청을 제외한 심볼만 모아 배치 로더 1회(청크 단위) 호출
+    """
+    def __init__(self, ttl_seconds: float = 2.0, max_size: int = 5000, batch_chunk_size: int = 20):
+        self._cache = LocalCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._batch_chunk_size = max(1, batch_chunk_size)
+        self.metrics = QuoteCacheMetrics()
+
+    @staticmethod
+    def _key(symbol: str) -> str:
+        return symbol.strip().upper()
+
+    async def get(self, symbol: str, loader: QuoteLoader) -> Optional[Any]:
+        """단건 조회 - 캐시 → 진행 중 요청 합류 → 로더 호출"""
+        key = self._key(symbol)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.metrics.coalesced += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        value = None
+        try:
+            self.metrics.upstream_calls += 1
+            value = await loader(symbol)
+            if value is not None:
+                self._cache.set(key, value)
+        except Exception as e:
+            self.metrics.errors += 1
+            Logger.error(f"시세 조회 실패: {symbol} - {e}")
+        finally:
+            # 취소된 경우에도 합류한 호출자가 대기하지 않도록 항상 완료
+            self._in_flight.pop(key, None)
+            if not future.done():
+                future.set_result(value)
+        return value
+
+    async def get_many(self, symbols: Iterable[str], batch_loader: BatchQuoteLoader) -> Dict[str, Any]:
+        """
+        다건 조회 - 반환: {요청 심볼: 값} (조회 실패 심볼은 제외)
+        배치 로더는 {심볼: 값}을 반환, 응답에 없는 심볼은 None으로 완료 처리
+        """
+        result: Dict[str, Any] = {}
+        waiting: Dict[str, asyncio.Future] = {}
+        owned: Dict[str, Tuple[str, asyncio.Future]] = {}
+
+        loop = asyncio.get_running_loop()
+        for symbol in dict.fromkeys(symbols):
+            key = self._key(symbol)
+            cached = self._cache.get(key)
+            if cached is not None:
+                result[symbol] = cached
+                continue
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.metrics.coalesced += 1
+            else:
+                future = loop.create_future()
+                self._in_flight[key] = future
+                owned[key] = (symbol, future)
+            waiting[symbol] = future
+
+        owned_symbols = [symbol for symbol, _ in owned.values()]
+        try:
+            for start in range(0, len(owned_symbols), self._batch_chunk_size):
+                chunk = owned_symbols[start:start + self._batch_chunk_size]
+                try:
+                    self.metrics.batch_calls += 1
+                    self.metrics.batch_symbols += len(chunk)
+                    loaded = await batch_loader(chunk) or {}
+                except Exception as e:
+                    self.metrics.errors += 1
+                    Logger.error(f"배치 시세 조회 실패: {chunk} - {e}")
+                    loaded = {}
+
+                loaded_by_key = {self._key(symbol): value for symbol, value in loaded.items()}
+                for symbol in chunk:
+                    key = self._key(symbol)
+                    value = loaded_by_key.get(key)
+                    if value is not None:
+                        self._cache.set(key, value)
+                    self._resolve(key, owned[key][1], value)
+        finally:
+            for key, (_, future) in owned.items():
+                self._resolve(key, future, None)
+
+        for symbol, future in waiting.items():
+            value = await asyncio.shield(future)
+            if value is not None:
+                result[symbol] = value
+        return result
+
+    def _resolve(self, key: str, future: asyncio.Future, value: Optional[Any]):
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.done():
+            future.set_result(value)
+
+    def invalidate(self, symbol: str):
+        self._cache.invalidate(self._key(symbol))
+
+    def clear(self):
+        self._cache.clear()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            **self._cache.get_metrics(),
+            "in_flight": len(self._in_flight),
+            "coalesced": self.metrics.coalesced,
+            "upstream_calls": self.metrics.upstream_calls,
+            "batch_calls": self.metrics.batch_calls,
+            "batch_symbols": self.metrics.batch_symbols,
+            "errors": self.metrics.errors
+        }
+
+    def reset_metrics(self):
+        self._cache.reset_metrics()
+        self.metrics = QuoteCacheMetrics()
@@ -0,0 +1,52 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+@dataclass
+class TokenBucketMetrics:
+    acquired: int = 0          # 발급한 토큰 수
+    waited: int = 0            # 토큰 부족으로 대기한 횟수
+    wait_seconds: float = 0.0  # 누적 대기 시간
+
+class TokenBucket:
+    """
+    비동기 토큰 버킷 레이트 리미터
+    - rate(초당 토큰)로 충전, 최대 capacity까지 버스트 허용
+    - 대기자는 FIFO로 1개씩 토큰을 받음 (락 안에서 부족분만큼 sleep)
+    """
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self._rate = max(rate, 0.001)
+        self._capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.metrics = TokenBucketMetrics()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+    async def acquire(self):
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1.0:
+                wait = (1.0 - self._tokens) / self._rate
+                self.metrics.waited += 1
+                self.metrics.wait_seconds += wait
+                await asyncio.sleep(wait)
+                self._refill()
+            self._tokens -= 1.0
+            self.metrics.acquired += 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        self._refill()
+        return {
+            "rate": self._rate,
+            "capacity": self._capacity,
+            "available": round(self._tokens, 2),
+            "acquired": self.metrics.acquired,
+            "waited": self.metrics.waited,
+            "wait_seconds": round(self.metrics.wait_seconds, 3)
+        }
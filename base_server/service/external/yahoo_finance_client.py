@@ -3,9 +3,10 @@ import re
 from typing import Dict, List, Optional
 import aiohttp
 from urllib.parse import quote
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from service.cache.cache_service import CacheService
 from service.core.logger import Logger
+from service.external.quote_cache import QuoteCache
 
 logger = Logger
 
@@ -36,7 +37,21 @@ class SearchResult:
     message: str = ""
 
 class YahooFinanceClient:
-    """Yahoo Finance API 클라이언트"""
+    """
+    Yahoo Finance API 클라이언트
+    - HTTP 세션은 프로세스 공유 (연결 수 제한 + keep-alive), async with는 공유 세션을 빌려 씀
+    - 시세 조회는 프로세스 공유 QuoteCache를 거침 (짧은 TTL + 심볼별 single-flight)
+    """
+    
+    # 공유 세션/시세 캐시 설정
+    MAX_CONNECTIONS = 20
+    MAX_CONNECTIONS_PER_HOST = 10
+    QUOTE_TTL_SECONDS = 2.0
+    BATCH_CHUNK_SIZE = 20  # spark 엔드포인트 1회 최대 심볼 수
+    
+    _shared_session: Optional[aiohttp.ClientSession] = None
+    _session_lock: Optional[asyncio.Lock] = None
+    _quote_cache = QuoteCache(ttl_seconds=QUOTE_TTL_SECONDS, batch_chunk_size=BATCH_CHUNK_SIZE)
     
     def __init__(self, cache_service: CacheService):
         self.cache_service = cache_service
@@ -58,17 +73,46 @@ class YahooFinanceClient:
         }
 
     async def __aenter__(self):
-        """비동기 컨텍스트 매니저 진입"""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.timeout),
-            headers=self.headers
-        )
+        """비동기 컨텍스트 매니저 진입 - 공유 세션 사용"""
+        self.session = await self._get_shared_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """비동기 컨텍스트 매니저 종료"""
-        if self.session:
-            await self.session.close()
+        """비동기 컨텍스트 매니저 종료 - 공유 세션은 닫지 않음 (close_shared_session에서 정리)"""
+        self.session = None
+
+    async def _get_shared_session(self) -> aiohttp.ClientSession:
+        cls = type(self)
+        if cls._shared_session is not None and not cls._shared_session.closed:
+            return cls._shared_session
+        if cls._session_lock is None:
+            cls._session_lock = asyncio.Lock()
+        async with cls._session_lock:
+            if cls._shared_session is None or cls._shared_session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=cls.MAX_CONNECTIONS,
+                    limit_per_host=cls.MAX_CONNECTIONS_PER_HOST,
+                    ttl_dns_cache=300
+                )
+                cls._shared_session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                    headers=self.headers
+                )
+                logger.info("Yahoo Finance 공유 HTTP 세션 생성")
+        return cls._shared_session
+
+    @classmethod
+    async def close_shared_session(cls):
+        """서버 종료 시 공유 세션 정리"""
+        if cls._shared_session is not None and not cls._shared_session.closed:
+            await cls._shared_session.close()
+        cls._shared_session = None
+        cls._session_lock = None
+
+    @classmethod
+    def get_quote_cache_metrics(cls) -> Dict:
+        return cls._quote_cache.get_metrics()
 
     async def _make_request(self, url: str, retries: int = 0) -> Optional[Dict]:
         """HTTP 요청 실행 (재시도 로직 및 속도 제한 포함)"""
@@ -81,7 +125,7 @@ class YahooFinanceClient:
 
             async with self.session.get(url) as response:
                 if response.status == 403:
-                    logger.warning(f"Rate limited for {url}")
+                    logger.warn(f"Rate limited for {url}")
                     if retries < self.max_retries:
                         await asyncio.sleep(2 ** retries)
                         return await self._make_request(url, retries + 1)
@@ -90,7 +134,7 @@ class YahooFinanceClient:
                 if response.status == 429:
                     retry_after = response.headers.get('Retry-After', '60')
                     wait_time = int(retry_after)
-                    logger.warning(f"Rate limited, waiting {wait_time} seconds")
+                    logger.warn(f"Rate limited, waiting {wait_time} seconds")
                     await asyncio.sleep(wait_time)
                     return await self._make_request(url, retries + 1)
 
@@ -113,7 +157,6 @@ class YahooFinanceClient:
 
     def _encode_symbol(self, symbol: str) -> str:
         """심볼을 URL 인코딩"""
-        print("DEBUG _encode_symbol type:", type(symbol), symbol)
         # 모든 가능한 타입을 str로 변환
         if symbol is None:
             return ""
@@ -125,9 +168,12 @@ class YahooFinanceClient:
 
     def _parse_quote_data(self, data: Dict) -> Optional[StockQuote]:
         """Yahoo Finance 인용 데이터 파싱"""
+        chart = data.get('chart', {})
+        return self._parse_chart_result((chart.get('result') or [{}])[0])
+
+    def _parse_chart_result(self, result: Dict) -> Optional[StockQuote]:
+        """chart/spark 결과 1건 파싱 (spark는 close만 있으므로 meta의 당일 값 우선 사용)"""
         try:
-            chart = data.get('chart', {})
-            result = chart.get('result', [{}])[0]
             meta = result.get('meta', {})
             indicators = result.get('indicators', {})
             quote = indicators.get('quote', [{}])[0]
@@ -143,7 +189,9 @@ class YahooFinanceClient:
                 return None
 
             current_price = float(close[-1]) if close[-1] else 0
-            open_price = float(open_prices[0]) if open_prices and open_prices[0] else current_price
+            # spark는 시가가 없으므로 첫 유효 종가를 시가로 사용 (chart와 같은 당일 등락 기준)
+            first_close = next((c for c in close if c), None)
+            open_price = float(open_prices[0]) if open_prices and open_prices[0] else float(first_close or current_price)
             # Fix: filter out None values for max/min
             high_filtered = [h for h in high if h is not None]
             low_filtered = [l for l in low if l is not None]
@@ -152,6 +200,12 @@ class YahooFinanceClient:
             change_amount = current_price - open_price
             change_percent = (change_amount / open_price * 100) if open_price > 0 else 0
             total_volume = sum(v for v in volume if v) if volume else 0
+            if not volume and meta.get('regularMarketVolume'):
+                total_volume = int(meta['regularMarketVolume'])
+            if not high and meta.get('regularMarketDayHigh'):
+                high_price = float(meta['regularMarketDayHigh'])
+            if not low and meta.get('regularMarketDayLow'):
+                low_price = float(meta['regularMarketDayLow'])
 
             return StockQuote(
                 symbol=meta.get('symbol', ''),
@@ -172,7 +226,7 @@ class YahooFinanceClient:
             return None
 
     async def get_stock_detail(self, symbol: str) -> Optional[StockQuote]:
-        """주식 상세 정보 조회"""
+        """주식 상세 정보 조회 (공유 시세 캐시 경유)"""
         # symbol 타입 강제 변환
         if symbol is None:
             return None
@@ -180,7 +234,72 @@ class YahooFinanceClient:
             symbol = symbol.decode('utf-8')
         elif not isinstance(symbol, str):
             symbol = str(symbol)
-    
+        if not symbol.strip():
+            return None
+        return await self._quote_cache.get(symbol, self._fetch_stock_detail)
+
+    async def get_stock_quotes(self, symbols: List[str]) -> Dict[str, StockQuote]:
+        """
+        여러 종목 시세 일괄 조회 (공유 시세 캐시 경유)
+        - 캐시에 없는 심볼만 spark 엔드포인트로 BATCH_CHUNK_SIZE개씩 요청
+        - 배치 응답에 없는 심볼은 단건 조회로 보충
+        반환: {심볼: StockQuote} (조회 실패 심볼은 제외)
+        """
+        valid = [s.strip() for s in symbols if isinstance(s, str) and s.strip()]
+        quotes = await self._quote_cache.get_many(valid, self._fetch_stock_quotes)
+        missing = [symbol for symbol in valid if symbol not in quotes]
+        if missing:
+            details = await asyncio.gather(*[self.get_stock_detail(symbol) for symbol in missing])
+            for symbol, detail in zip(missing, details):
+                if detail is not None:
+                    quotes[symbol] = detail
+        return quotes
+
+    async def _fetch_stock_quotes(self, symbols: List[str]) -> Dict[str, StockQuote]:
+        """spark 엔드포인트 1회로 여러 심볼 시세 조회 (v7: meta에 당일 거래량/고가/저가 포함)"""
+        joined = ",".join(self._encode_symbol(symbol) for symbol in symbols)
+        url = f"{self.base_url}/v7/finance/spark?symbols={joined}&range=1d&interval=1m"
+        data = await self._make_request(url)
+        if not data:
+            return {}
+
+        quotes = self._parse_spark_response(data)
+        if not quotes:
+            # 형식이 바뀌면 배치가 전부 단건 조회로 대체되므로 조용히 넘어가지 않음
+            logger.warn(f"spark 응답에서 시세를 찾지 못함 ({len(symbols)}개 심볼, keys={list(data.keys())[:5]})")
+        return quotes
+
+    def _parse_spark_response(self, data: Dict) -> Dict[str, StockQuote]:
+        """
+        spark 응답 파싱 - 두 형식 모두 지원
+        - v7: {"spark": {"result": [{"symbol", "response": [chart result]}]}}
+        - v8: {"AAPL": {"symbol", "timestamp", "close", "chartPreviousClose", ...}} (종가만, meta 없음)
+        """
+        quotes: Dict[str, StockQuote] = {}
+        if 'spark' in data:
+            for item in (data.get('spark') or {}).get('result') or []:
+                responses = item.get('response') or []
+                if not responses:
+                    continue
+                quote = self._parse_chart_result(responses[0])
+                if quote is not None:
+                    quotes[item.get('symbol') or quote.symbol] = quote
+            return quotes
+
+        for symbol, item in data.items():
+            if not isinstance(item, dict) or 'close' not in item:
+                continue
+            quote = self._parse_chart_result({
+                'meta': {'symbol': item.get('symbol') or symbol},
+                'timestamp': item.get('timestamp') or [],
+                'indicators': {'quote': [{'close': item.get('close') or []}]}
+            })
+            if quote is not None:
+                quotes[item.get('symbol') or symbol] = quote
+        return quotes
+
+    async def _fetch_stock_detail(self, symbol: str) -> Optional[StockQuote]:
+        """chart 엔드포인트로 단건 시세 조회 (캐시 미경유)"""
         try:
             encoded_symbol = self._encode_symbol(symbol)
             url = f"{self.base_url}/v8/finance/chart/{encoded_symbol}?range=1d&interval=1m&includePrePost=false"
@@ -241,15 +360,21 @@ class YahooFinanceClient:
                     message=f"No results found for '{query}'"
                 )
 
+            # symbol이 유효한 결과만 (유효하지 않은 symbol은 건너뛰기)
+            candidates = [
+                quote_data for quote_data in quotes[:10]
+                if isinstance(quote_data.get('symbol'), str) and quote_data.get('symbol').strip()
+            ]
+            details = await self.get_stock_quotes([quote_data['symbol'] for quote_data in candidates])
+            
             stocks = []
-            for quote_data in quotes[:10]:
+            for quote_data in candidates:
                 symbol = quote_data.get('symbol')
-                # symbol이 유효한지 확인
-                if not symbol or not isinstance(symbol, str) or not symbol.strip():
-                    continue  # 유효하지 않은 symbol은 건너뛰기
-                    
-                stock_detail = await self.get_stock_detail(symbol)
+                stock_detail = details.get(symbol.strip())
                 if stock_detail:
+                    if not stock_detail.name:
+                        # 캐시에 공유된 객체이므로 복사본에만 이름 채움
+                        stock_detail = replace(stock_detail, name=quote_data.get('longname', quote_data.get('shortname', symbol)))
                     stocks.append(stock_detail)
                 else:
                     stocks.append(StockQuote(
@@ -1,9 +1,12 @@
+import asyncio
 import time
 import uuid
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, asdict
 from service.core.logger import Logger
+from service.core.latency_histogram import LatencyHistogram
 
 class IDistributedLock(ABC):
     """분산락 인터페이스"""
@@ -28,111 +31,295 @@ class IDistributedLock(ABC):
         """락 상태 확인"""
         pass
 
+# 대기열 키: lock:{key}:queue (ZSET 티켓 순번, FIFO), lock:{key}:timeouts (ZSET 대기자 만료 시각 ms), lock:{key}:seq (티켓 발급)
+# 만료된 대기자(프로세스 종료 등)는 모든 스크립트 실행 시 정리
+
+# KEYS: lock, queue, timeouts, seq / ARGV: token, ttl_ms, now_ms, waiter_deadline_ms, release_channel
+# 반환: {1, 0} 획득 / {0, 락 잔여 ms} 대기열 등록 (락이 비었지만 선두가 아니면 선두를 깨우고 0)
+_ACQUIRE_SCRIPT = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[3], '-inf', ARGV[3])
+for _, waiter in ipairs(expired) do
+    redis.call('ZREM', KEYS[2], waiter)
+    redis.call('ZREM', KEYS[3], waiter)
+end
+local head = redis.call('ZRANGE', KEYS[2], 0, 0)[1]
+if redis.call('EXISTS', KEYS[1]) == 0 and (head == nil or head == ARGV[1]) then
+    redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+    if head ~= nil then
+        redis.call('ZREM', KEYS[2], ARGV[1])
+        redis.call('ZREM', KEYS[3], ARGV[1])
+    end
+    return {1, 0}
+end
+if not redis.call('ZSCORE', KEYS[2], ARGV[1]) then
+    redis.call('ZADD', KEYS[2], redis.call('INCR', KEYS[4]), ARGV[1])
+end
+redis.call('ZADD', KEYS[3], ARGV[4], ARGV[1])
+local keep = tonumber(ARGV[4]) - tonumber(ARGV[3]) + 60000
+for i = 2, 4 do
+    if redis.call('PTTL', KEYS[i]) < keep then
+        redis.call('PEXPIRE', KEYS[i], keep)
+    end
+end
+local pttl = redis.call('PTTL', KEYS[1])
+if pttl < 0 then
+    redis.call('PUBLISH', ARGV[5], head)
+    pttl = 0
+end
+return {0, pttl}
+"""
+
+# KEYS: lock, queue, timeouts / ARGV: token, now_ms, release_channel
+# 소유자 토큰일 때만 삭제하고 대기열 선두 1명에게만 해제 신호 발행
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+local expired = redis.call('ZRANGEBYSCORE', KEYS[3], '-inf', ARGV[2])
+for _, waiter in ipairs(expired) do
+    redis.call('ZREM', KEYS[2], waiter)
+    redis.call('ZREM', KEYS[3], waiter)
+end
+local head = redis.call('ZRANGE', KEYS[2], 0, 0)[1]
+if head ~= nil then
+    redis.call('PUBLISH', ARGV[3], head)
+end
+return 1
+"""
+
+# KEYS: lock, queue, timeouts / ARGV: token, release_channel
+# 타임아웃된 대기자 제거 - 락이 비어 있으면 다음 선두를 깨움
+_CANCEL_SCRIPT = """
+redis.call('ZREM', KEYS[2], ARGV[1])
+redis.call('ZREM', KEYS[3], ARGV[1])
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    local head = redis.call('ZRANGE', KEYS[2], 0, 0)[1]
+    if head ~= nil then
+        redis.call('PUBLISH', ARGV[2], head)
+    end
+end
+return 1
+"""
+
+# KEYS: lock / ARGV: token, ttl_ms
+_EXTEND_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+@dataclass
+class LockMetrics:
+    acquired: int = 0            # 획득 성공
+    contended: int = 0           # 대기열에 들어간 획득 시도
+    timeouts: int = 0            # 대기 타임아웃
+    errors: int = 0              # Redis 오류
+    released: int = 0
+    release_mismatches: int = 0  # 토큰 불일치/이미 만료된 해제
+    wakeups: int = 0             # 해제 신호로 깨어난 횟수
+    extended: int = 0
+    extend_failures: int = 0
+
 class CacheServiceDistributedLock(IDistributedLock):
-    """CacheService를 사용하는 Redis 분산락"""
+    """
+    CacheService를 사용하는 Redis 분산락 (공정 대기열)
+    - 획득/대기열 등록/대기자 정리를 Lua 1회(EVALSHA)로 처리, 대기열 선두만 획득 가능 (FIFO)
+    - 대기자는 폴링하지 않고 프로세스당 구독 연결 1개(release_channel)로 받은 해제 신호까지 대기
+    - 해제 신호 유실/소유자 장애(TTL 만료)에 대비해 락 잔여 TTL 또는 max_park_seconds 후 재시도
+    """
     
-    def __init__(self, cache_service):
+    release_channel = "lock:__release__"
+    
+    def __init__(self, cache_service, max_park_seconds: float = 5.0, waiter_grace_ms: int = 2000):
         self.cache_service = cache_service
         self.lock_prefix = "lock:"
+        self.max_park_seconds = max_park_seconds
+        self.waiter_grace_ms = waiter_grace_ms
+        
+        self._waiters: Dict[str, asyncio.Event] = {}  # 대기 토큰 -> 해제 신호
+        self._listener_task: Optional[asyncio.Task] = None
+        self._listener_ready: Optional[asyncio.Event] = None
+        self._closed = False
+        
+        self.metrics = LockMetrics()
+        self.wait_time = LatencyHistogram()  # 획득까지 걸린 시간 (비경합 포함)
     
-    async def _sleep(self, seconds: float):
-        """비동기 sleep"""
-        import asyncio
-        await asyncio.sleep(seconds)
+    def _queue_keys(self, client, lock_key: str) -> Tuple[str, str, str, str]:
+        """eval은 _get_key()를 자동 적용하지 않으므로 full key 구성"""
+        full_key = client._get_key(lock_key)
+        return full_key, f"{full_key}:queue", f"{full_key}:timeouts", f"{full_key}:seq"
+    
+    async def _ensure_listener(self, timeout: float):
+        """해제 신호 구독 루프 시작 (첫 경합 시 1회, 구독 완료를 잠시 기다림)"""
+        if self._listener_task is None or self._listener_task.done():
+            self._closed = False
+            self._listener_ready = asyncio.Event()
+            self._listener_task = asyncio.create_task(self._release_listener_loop())
+        if not self._listener_ready.is_set() and timeout > 0:
+            try:
+                await asyncio.wait_for(self._listener_ready.wait(), timeout=min(timeout, 1.0))
+            except asyncio.TimeoutError:
+                pass
+    
+    async def _release_listener_loop(self):
+        """해제 신호 구독 루프 (연결 끊김 시 백오프 재연결)"""
+        retry_delay = 1.0
+        while not self._closed:
+            pubsub = None
+            try:
+                async with self.cache_service.get_blocking_client() as client:
+                    pubsub = await client.subscribe(self.release_channel)
+                    self._listener_ready.set()
+                    retry_delay = 1.0
+                    # 구독 전 발행된 신호를 놓쳤을 수 있으므로 대기자 전원 재시도
+                    for waiter in self._waiters.values():
+                        waiter.set()
+                    
+                    while not self._closed:
+                        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                        if not message:
+                            continue
+                        waiter = self._waiters.get(message["data"])
+                        if waiter is not None:
+                            self.metrics.wakeups += 1
+                            waiter.set()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._listener_ready.clear()
+                Logger.warn(f"분산락 해제 신호 구독 오류 (retry in {retry_delay:.0f}s): {e}")
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, 30.0)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
+    
+    async def close(self):
+        """구독 루프 종료 (LockService.shutdown)"""
+        self._closed = True
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        for waiter in self._waiters.values():
+            waiter.set()
     
     async def acquire(self, key: str, ttl: int = 30, timeout: int = 10) -> Optional[str]:
-        """락 획득"""
-        import uuid
-        import time
-        
+        """락 획득 - 경합 시 대기열에 등록하고 해제 신호까지 대기"""
         lock_key = f"{self.lock_prefix}{key}"
         token = str(uuid.uuid4())
-        start_time = time.time()
+        started = time.monotonic()
+        deadline = started + timeout
+        wake = asyncio.Event()
+        queued = False
+        self._waiters[token] = wake
         
         try:
-            while time.time() - start_time < timeout:
-                # CacheService를 통한 안전한 Redis 작업
-                async with self.cache_service.get_client() as client:
-                    # SET key value EX ttl NX (존재하지 않을 때만 설정)
-                    # set_string은 자동으로 _get_key()를 적용하므로 lock_key를 그대로 사용
-                    result = await client.set_string(
-                        lock_key, 
-                        token, 
-                        expire=ttl,
-                        nx=True  # Not eXists
-                    )
-                    
-                    if result:
-                        Logger.info(f"분산락 획득 성공: {key}, token: {token[:8]}...")
-                        return token
-                
-                # 짧은 시간 대기 후 재시도
-                await self._sleep(0.1)
-            
-            Logger.warn(f"분산락 획득 타임아웃: {key}")
-            return None
+            async with self.cache_service.get_client() as client:
+                keys = self._queue_keys(client, lock_key)
+                channel = client._get_key(self.release_channel)
+                try:
+                    while True:
+                        remaining = deadline - time.monotonic()
+                        now_ms = int(time.time() * 1000)
+                        waiter_deadline_ms = now_ms + int(max(remaining, 0) * 1000) + self.waiter_grace_ms
+                        acquired, hint_ms = await client.eval_sha(
+                            _ACQUIRE_SCRIPT, 4, *keys, token, int(ttl * 1000), now_ms, waiter_deadline_ms, channel)
+                        
+                        if int(acquired) == 1:
+                            self.metrics.acquired += 1
+                            self.wait_time.record((time.monotonic() - started) * 1000.0)
+                            Logger.debug("분산락 획득 성공: %s, token: %s...", key, token[:8])
+                            return token
+                        
+                        if not queued:
+                            queued = True
+                            self.metrics.contended += 1
+                            await self._ensure_listener(remaining)
+                            remaining = deadline - time.monotonic()
+                        
+                        if remaining <= 0:
+                            await client.eval_sha(_CANCEL_SCRIPT, 3, *keys[:3], token, channel)
+                            self.metrics.timeouts += 1
+                            Logger.warn(f"분산락 획득 타임아웃: {key}")
+                            return None
+                        
+                        park = min(remaining, self.max_park_seconds)
+                        hint_ms = int(hint_ms)
+                        if hint_ms > 0:
+                            park = min(park, hint_ms / 1000.0 + 0.005)
+                        if not wake.is_set():
+                            try:
+                                await asyncio.wait_for(wake.wait(), timeout=park)
+                            except asyncio.TimeoutError:
+                                pass
+                        wake.clear()
+                except asyncio.CancelledError:
+                    if queued:
+                        await client.eval_sha(_CANCEL_SCRIPT, 3, *keys[:3], token, channel)
+                    raise
             
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
+            self.metrics.errors += 1
             Logger.error(f"분산락 획득 실패: {key} - {e}")
             return None
+        finally:
+            self._waiters.pop(token, None)
     
     async def release(self, key: str, token: str) -> bool:
-        """락 해제"""
+        """락 해제 (토큰 확인 후 삭제, 대기열 선두에 해제 신호)"""
         lock_key = f"{self.lock_prefix}{key}"
         
         try:
             async with self.cache_service.get_client() as client:
-                # Lua 스크립트로 원자적 해제 (토큰 확인 후 삭제)
-                lua_script = """
-                if redis.call("GET", KEYS[1]) == ARGV[1] then
-                    return redis.call("DEL", KEYS[1])
-                else
-                    return 0
-                end
-                """
-                
-                # eval()은 _get_key()를 자동 적용하지 않으므로 수동으로 full key 구성
-                full_key = client._get_key(lock_key)
-                result = await client.eval(lua_script, 1, full_key, token)
+                keys = self._queue_keys(client, lock_key)
+                result = await client.eval_sha(
+                    _RELEASE_SCRIPT, 3, *keys[:3], token, int(time.time() * 1000), client._get_key(self.release_channel))
                 
                 if result == 1:
-                    Logger.info(f"분산락 해제 성공: {key}")
+                    self.metrics.released += 1
+                    Logger.debug("분산락 해제 성공: %s", key)
                     return True
                 else:
+                    self.metrics.release_mismatches += 1
                     Logger.warn(f"분산락 해제 실패: {key} (토큰 불일치 또는 이미 해제됨)")
                     return False
                     
         except Exception as e:
+            self.metrics.errors += 1
             Logger.error(f"분산락 해제 실패: {key} - {e}")
             return False
     
     async def extend(self, key: str, token: str, ttl: int = 30) -> bool:
-        """락 연장"""
+        """락 연장 (토큰 확인 후 TTL 재설정)"""
         lock_key = f"{self.lock_prefix}{key}"
         
         try:
             async with self.cache_service.get_client() as client:
-                # Lua 스크립트로 원자적 연장 (토큰 확인 후 TTL 연장)
-                lua_script = """
-                if redis.call("GET", KEYS[1]) == ARGV[1] then
-                    return redis.call("EXPIRE", KEYS[1], ARGV[2])
-                else
-                    return 0
-                end
-                """
-                
-                # eval()은 _get_key()를 자동 적용하지 않으므로 수동으로 full key 구성
                 full_key = client._get_key(lock_key)
-                result = await client.eval(lua_script, 1, full_key, token, ttl)
+                result = await client.eval_sha(_EXTEND_SCRIPT, 1, full_key, token, int(ttl * 1000))
                 
                 if result == 1:
-                    Logger.info(f"분산락 연장 성공: {key}")
+                    self.metrics.extended += 1
+                    Logger.debug("분산락 연장 성공: %s", key)
                     return True
                 else:
+                    self.metrics.extend_failures += 1
                     Logger.warn(f"분산락 연장 실패: {key} (토큰 불일치)")
                     return False
                     
         except Exception as e:
+            self.metrics.extend_failures += 1
             Logger.error(f"분산락 연장 실패: {key} - {e}")
             return False
     
@@ -148,19 +335,45 @@ class CacheServiceDistributedLock(IDistributedLock):
         except Exception as e:
             Logger.error(f"분산락 상태 확인 실패: {key} - {e}")
             return False
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            **asdict(self.metrics),
+            "waiting": len(self._waiters),
+            "listener_running": self._listener_task is not None and not self._listener_task.done(),
+            "wait_time_ms": self.wait_time.to_dict()
+        }
+
+
+@dataclass
+class LeaseMetrics:
+    renewals: int = 0     # 자동 연장 성공
+    lost: int = 0         # 연장 실패 (TTL 만료/토큰 불일치로 소유권 상실)
+    active: int = 0       # 자동 연장 중인 락 수
 
+class LockLostError(RuntimeError):
+    """보유 중 리스를 잃어 락 블록이 중단됨 (이후 상호 배제 보장 없음)"""
 
 class DistributedLockManager:
-    """분산락 매니저 (컨텍스트 매니저 지원)"""
+    """분산락 매니저 (컨텍스트 매니저 지원, 보유 중 리스 자동 연장)"""
     
     def __init__(self, lock_impl: IDistributedLock):
         self.lock_impl = lock_impl
         self.active_locks: Dict[str, str] = {}  # key -> token
+        self._renew_tasks: Dict[str, asyncio.Task] = {}  # key -> 리스 연장 태스크
+        self._lost_keys: set = set()  # 보유 중 리스를 잃은 키
+        self.lease_metrics = LeaseMetrics()
     
     @asynccontextmanager
-    async def acquire_lock(self, key: str, ttl: int = 30, timeout: int = 10):
+    async def acquire_lock(self, key: str, ttl: int = 30, timeout: int = 10, auto_renew: bool = True,
+                           cancel_on_loss: bool = True):
         """
         컨텍스트 매니저로 분산락 사용
+        - auto_renew: 블록 실행 중 ttl/3 간격으로 TTL 연장 (작업이 ttl보다 길어도 락 유지)
+        - 상호 배제는 리스를 보유하는 동안만 보장됨. 연장이 실패하면(Redis 장애, 이벤트 루프 지연으로 TTL 만료)
+          다른 인스턴스가 락을 획득했을 수 있으므로 이후 블록 실행은 배타적이지 않음
+        - cancel_on_loss=True(기본): 리스 상실 시 블록을 실행 중인 태스크를 취소하고 LockLostError 발생
+        - cancel_on_loss=False: 블록은 계속 실행되며, 호출자가 is_lease_valid(key)로 확인해야 함
         
         Usage:
             async with lock_manager.acquire_lock("scheduler:create_table"):
@@ -168,6 +381,7 @@ class DistributedLockManager:
                 await create_daily_table()
         """
         token = None
+        owner = asyncio.current_task()
         try:
             token = await self.lock_impl.acquire(key, ttl, timeout)
             
@@ -175,15 +389,65 @@ class DistributedLockManager:
                 raise RuntimeError(f"분산락 획득 실패: {key}")
             
             self.active_locks[key] = token
-            yield token
+            self._lost_keys.discard(key)
+            if auto_renew:
+                self._renew_tasks[key] = asyncio.create_task(
+                    self._renew_lease(key, token, ttl, owner if cancel_on_loss else None)
+                )
+            try:
+                yield token
+            except asyncio.CancelledError:
+                # 리스 상실로 인한 취소만 LockLostError로 변환 (외부 취소는 그대로 전파)
+                if cancel_on_loss and key in self._lost_keys and owner is not None and hasattr(owner, "uncancel"):
+                    owner.uncancel()
+                    raise LockLostError(f"분산락 리스 상실로 작업 중단: {key}") from None
+                raise
             
         finally:
+            await self._stop_renewal(key)
+            self._lost_keys.discard(key)
             if token and key in self.active_locks:
                 await self.lock_impl.release(key, token)
                 del self.active_locks[key]
     
+    def is_lease_valid(self, key: str) -> bool:
+        """acquire_lock 블록 안에서 리스가 아직 유효한지 (연장 실패 이후 False)"""
+        return key in self.active_locks and key not in self._lost_keys
+    
+    async def _renew_lease(self, key: str, token: str, ttl: int, owner: Optional[asyncio.Task] = None):
+        """보유 중 리스 연장 루프 - 연장 실패 시 소유권 상실 기록, owner가 있으면 취소하고 종료"""
+        interval = max(ttl / 3.0, 0.1)
+        self.lease_metrics.active += 1
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                if await self.lock_impl.extend(key, token, ttl):
+                    self.lease_metrics.renewals += 1
+                else:
+                    self.lease_metrics.lost += 1
+                    self._lost_keys.add(key)
+                    Logger.error(f"분산락 리스 상실: {key} - 다른 인스턴스가 락을 획득했을 수 있음")
+                    if owner is not None and not owner.done():
+                        owner.cancel()
+                    return
+        finally:
+            self.lease_metrics.active -= 1
+    
+    async def _stop_renewal(self, key: str):
+        task = self._renew_tasks.pop(key, None)
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    
     async def force_release_all(self):
         """모든 활성 락 강제 해제 (종료 시 정리)"""
+        for key in list(self._renew_tasks):
+            await self._stop_renewal(key)
+        
         for key, token in list(self.active_locks.items()):
             try:
                 await self.lock_impl.release(key, token)
@@ -191,4 +455,10 @@ class DistributedLockManager:
             except Exception as e:
                 Logger.error(f"락 강제 해제 실패: {key} - {e}")
         
-        self.active_locks.clear()
\ No newline at end of file
+        self.active_locks.clear()
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        metrics = self.lock_impl.get_metrics() if hasattr(self.lock_impl, "get_metrics") else {}
+        metrics["lease"] = asdict(self.lease_metrics)
+        metrics["active_locks"] = len(self.active_locks)
+        return metrics
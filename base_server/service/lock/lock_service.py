@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Dict, Optional
 from .distributed_lock import DistributedLockManager, IDistributedLock, CacheServiceDistributedLock
 from service.core.logger import Logger
 
@@ -40,6 +40,8 @@ class LockService:
         try:
             if cls._lock_manager:
                 await cls._lock_manager.force_release_all()
+            if isinstance(cls._lock_impl, CacheServiceDistributedLock):
+                await cls._lock_impl.close()
             
             cls._lock_impl = None
             cls._lock_manager = None
@@ -93,4 +95,12 @@ class LockService:
         if not cls._initialized or cls._lock_impl is None:
             raise RuntimeError("LockService가 초기화되지 않았습니다")
         
-        return await cls._lock_impl.is_locked(key)
\ No newline at end of file
+        return await cls._lock_impl.is_locked(key)
+    
+    @classmethod
+    def get_metrics(cls) -> Dict[str, Any]:
+        """경합/대기시간/리스 상실 메트릭"""
+        if not cls._initialized or cls._lock_manager is None:
+            return {}
+        
+        return cls._lock_manager.get_metrics()
@@ -39,9 +39,10 @@ class NotificationConfig(BaseModel):
     # 채널별 활성화 여부
     enabled_channels: Optional[Dict[str, bool]] = None
     
-    # 배치 설정
+    # 배치 설정 (알림 발송 컨슈머: 1회 왕복 최대 수신 수 / 빈 큐 블로킹 대기 시간 / 동시 처리 수)
     batch_size: int = 100
     batch_timeout_seconds: float = 5.0
+    consumer_concurrency: int = 8
     
     # 중복 방지 설정
     dedup_window_hours: int = 24
@@ -12,7 +12,7 @@
 """
 import json
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 
@@ -111,7 +111,10 @@ class NotificationService:
                 await queue_service.register_message_consumer(
                     "notification_queue",
                     "notification_sender",
-                    cls._process_notification_queue
+                    cls._process_notification_queue,
+                    batch_size=config.batch_size,
+                    concurrency=config.consumer_concurrency,
+                    block_timeout=config.batch_timeout_seconds
                 )
                 Logger.info("Notification queue consumer registered")
             
@@ -209,6 +212,117 @@ class NotificationService:
             Logger.error(f"Send notification failed: {e}")
             return False
     
+    @classmethod
+    async def send_notifications(cls, items: List[Tuple[Notification, List[NotificationChannel]]]) -> int:
+        """
+        시그널 알림 일괄 발송
+        
+        중복 체크/Rate limit/큐 등록을 알림 수와 무관하게 Redis 몇 회 왕복으로 처리
+        
+        Args:
+            items: (알림 객체, 사용자 설정 채널 목록) 리스트 - config에서 비활성화된 채널은 제외
+            
+        Returns:
+            int: 큐에 등록(또는 직접 발송)된 알림 수
+        """
+        if not cls._initialized:
+            Logger.error("NotificationService not initialized")
+            return 0
+        if not items:
+            return 0
+        
+        try:
+            for notification, _ in items:
+                if notification.created_at is None:
+                    notification.created_at = datetime.utcnow()
+            
+            # 1. 중복 체크 + 2. Rate limit 체크
+            accepted = await cls._filter_batch([notification for notification, _ in items])
+            
+            # 3. 채널 결정 (사용자 설정 ∩ config 활성 채널)
+            targets = []
+            for (notification, channels), ok in zip(items, accepted):
+                if not ok:
+                    continue
+                enabled = [ch for ch in channels if cls._config.enabled_channels.get(ch.value, False)]
+                if enabled:
+                    targets.append((notification, enabled))
+            
+            if not targets:
+                return 0
+            
+            # 4. 큐 등록 (한 번의 파이프라인)
+            await cls._queue_notifications(targets)
+            
+            # 5. 이벤트 발행
+            if QueueService._initialized:
+                queue_service = QueueService.get_instance()
+                await asyncio.gather(*[
+                    queue_service.publish_event(
+                        EventType.NOTIFICATION_CREATED,
+                        "notification_service",
+                        notification.to_dict()
+                    )
+                    for notification, _ in targets
+                ], return_exceptions=True)
+            
+            return len(targets)
+            
+        except Exception as e:
+            Logger.error(f"Send notifications failed: {e}")
+            return 0
+    
+    @classmethod
+    async def _filter_batch(cls, notifications: List[Notification]) -> List[bool]:
+        """
+        일괄 중복 체크(SET NX) 및 Rate limit(INCR) - 각 1회 파이프라인
+        
+        Returns:
+            List[bool]: 알림별 발송 가능 여부
+        """
+        if not CacheService.is_initialized():
+            return [True] * len(notifications)
+        
+        try:
+            import hashlib
+            ttl = cls._config.dedup_window_hours * 3600
+            hour = datetime.utcnow().strftime('%Y%m%d%H')
+            
+            async with CacheService.get_client() as client:
+                pipe = client.pipeline()
+                for notification in notifications:
+                    data_hash = hashlib.md5(json.dumps(notification.data, sort_keys=True).encode()).hexdigest()[:8]
+                    pipe.set_string(f"notif:dedup:{notification.user_id}:{notification.type.value}:{data_hash}", "1", expire=ttl, nx=True)
+                fresh = [bool(created) for created in await pipe.execute()]
+                
+                rate_users = [n.user_id for n, ok in zip(notifications, fresh) if ok]
+                if not rate_users:
+                    return fresh
+                
+                pipe = client.pipeline()
+                for user_id in rate_users:
+                    rate_key = f"notif:rate:{user_id}:{hour}"
+                    pipe.incre(rate_key).expire(rate_key, 3600)
+                counts = (await pipe.execute())[0::2]
+            
+            limit = cls._config.rate_limit_per_user_per_hour
+            accepted = []
+            count_iter = iter(counts)
+            for notification, ok in zip(notifications, fresh):
+                if not ok:
+                    Logger.debug("Duplicate notification skipped: %s", notification.id)
+                    accepted.append(False)
+                    continue
+                within = next(count_iter) <= limit
+                if not within:
+                    Logger.warn(f"Rate limit exceeded for user {notification.user_id}")
+                accepted.append(within)
+            return accepted
+            
+        except Exception as e:
+            Logger.error(f"Batch duplicate/rate check failed: {e}")
+            return [True] * len(notifications)
+    
     @classmethod
     async def _is_duplicate(cls, notification: Notification) -> bool:
         """
@@ -310,6 +424,36 @@ class NotificationService:
                 priority
             )
     
+    @classmethod
+    async def _queue_notifications(cls, targets: List[Tuple[Notification, List[NotificationChannel]]]):
+        """
+        여러 알림을 큐에 일괄 추가 (채널별 메시지를 한 번의 파이프라인으로 전송)
+        
+        Args:
+            targets: (알림 객체, 발송할 채널 목록) 리스트
+        """
+        if not QueueService._initialized:
+            await asyncio.gather(*[
+                cls._send_notification_direct(notification, channels)
+                for notification, channels in targets
+            ], return_exceptions=True)
+            return
+        
+        from service.queue.message_queue import MessagePriority
+        items = []
+        for notification, channels in targets:
+            priority = MessagePriority.HIGH if notification.priority <= 2 else MessagePriority.NORMAL
+            for channel in channels:
+                message = {
+                    "notification": notification.to_dict(),
+                    "channel": channel.value,
+                    "account_db_key": int(notification.user_id),
+                    "shard_id": notification.shard_id
+                }
+                items.append((message, f"notification_{channel.value}", priority))
+        
+        await QueueService.get_instance().send_messages("notification_queue", items)
+    
     @classmethod
     async def _process_notification_queue(cls, message) -> bool:
         """
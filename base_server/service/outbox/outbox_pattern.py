@@ -114,8 +114,12 @@ class OutboxRepository:
             # 활성 샤드 목록 조회
             active_shards = await self.db_service.get_active_shard_ids()
             
-            for shard_id in active_shards:
-                events = await self.get_pending_events_from_shard(shard_id, limit_per_shard)
+            # 전 샤드 동시 조회 (샤드별 타임아웃, 실패 샤드는 제외)
+            gathered = await self.db_service.scatter_gather(
+                lambda shard_id: self.get_pending_events_from_shard(shard_id, limit_per_shard),
+                active_shards
+            )
+            for shard_id, events in gathered.results.items():
                 if events:
                     all_events[shard_id] = events
             
@@ -4,14 +4,18 @@ Universal Outbox 컨슈머 - SQL 프로시저 기반
 """
 import asyncio
 import json
+import os
+import socket
+import time
+import uuid
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
 from service.core.logger import Logger
+from service.core.latency_histogram import LatencyHistogram
 from service.service_container import ServiceContainer
-from service.lock.lock_service import LockService
 from service.scheduler.scheduler_service import SchedulerService
 from service.scheduler.base_scheduler import ScheduleJob, ScheduleType
 from service.queue.queue_service import QueueService
@@ -43,11 +47,74 @@ class UniversalOutboxConsumer:
     _consumer_tasks: List[asyncio.Task] = []
     _scheduler_job_ids: List[str] = []
     
+    # 릴레이 상태
+    _relay_tasks: Dict[int, asyncio.Task] = {}
+    _relay_wakeups: Dict[int, asyncio.Event] = {}
+    _relay_intervals: Dict[int, float] = {}
+    _relay_stats: Dict[str, Dict[str, int]] = {}
+    _relay_lag: Dict[str, LatencyHistogram] = {}
+    _shard_ids_cache: List[int] = []
+    _shard_ids_loaded_at: float = 0.0
+    
     # 설정값
     BATCH_SIZE = 50
     POLL_INTERVAL = 5  # 5초마다 폴링
     MAX_RETRIES = 3
     CLEANUP_RETENTION_DAYS = 7
+    RELAY_MIN_INTERVAL = 0.2       # 이벤트가 있을 때 다음 배치까지 대기 (초)
+    RELAY_MAX_INTERVAL = POLL_INTERVAL  # 비어 있을 때 최대 대기 (초)
+    SHARD_REFRESH_INTERVAL = 60    # 활성 샤드 목록 캐시 (초)
+    HANDLER_CONCURRENCY = 16       # 배치 내 동시 실행 파티션 수
+    HANDLER_TIMEOUT = 10           # 이벤트 1건 핸들러 실행 제한 (동기 핸들러 포함)
+    LEASE_SECONDS = 60             # 클레임 리스 - 만료되면 다음 패스에서 재클레임
+    LEASE_MARGIN_SECONDS = 5       # 리스 만료 전 상태 갱신 여유
+    RELAY_LAG_BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 300000)
+    
+    # 상태/생성시각 인덱스(idx_status_created)로 오래된 pending부터 클레임
+    _CLAIM_QUERY = """
+        SELECT `id`, `domain`, `partition_key`, `sequence_no`, `event_type`, `aggregate_id`,
+               `event_data`, `retry_count`, `max_retries`, `created_at`
+        FROM `universal_outbox`
+        WHERE `status` = 'pending' AND `retry_count` < `max_retries`
+        ORDER BY `created_at`
+        LIMIT %s
+        FOR UPDATE SKIP LOCKED
+    """
+    _LEASE_QUERY = """
+        UPDATE `universal_outbox`
+        SET `status` = 'processing', `lease_owner` = %s,
+            `lease_until` = CURRENT_TIMESTAMP + INTERVAL %s SECOND
+        WHERE `id` IN ({placeholders})
+    """
+    # 리스가 만료된 processing 행(릴레이 중단/지연)은 1회 시도로 보고 pending 또는 dead_letter로 복귀
+    _RECLAIM_QUERY = """
+        UPDATE `universal_outbox`
+        SET `retry_count` = `retry_count` + 1,
+            `status` = IF(`retry_count` >= `max_retries`, 'dead_letter', 'pending'),
+            `error_message` = 'Lease expired', `lease_owner` = NULL, `lease_until` = NULL
+        WHERE `status` = 'processing' AND `lease_until` < CURRENT_TIMESTAMP
+    """
+    # 이하 완료 쿼리는 모두 자기 리스(lease_owner)인 행만 갱신 → 만료 후 다른 릴레이가 가져간 행은 건드리지 않음
+    _PUBLISH_QUERY = """
+        UPDATE `universal_outbox`
+        SET `status` = 'published', `published_at` = CURRENT_TIMESTAMP, `error_message` = NULL,
+            `lease_owner` = NULL, `lease_until` = NULL
+        WHERE `id` IN ({placeholders}) AND `status` = 'processing' AND `lease_owner` = %s
+    """
+    # MySQL 단일 테이블 UPDATE는 SET을 왼쪽부터 적용 → status 판단에 증가된 retry_count 사용
+    _FAIL_QUERY = """
+        UPDATE `universal_outbox`
+        SET `retry_count` = `retry_count` + 1,
+            `status` = IF(`retry_count` >= `max_retries`, 'dead_letter', 'pending'),
+            `error_message` = %s, `lease_owner` = NULL, `lease_until` = NULL
+        WHERE `id` = %s AND `status` = 'processing' AND `lease_owner` = %s
+    """
+    # 실행하지 않은 행(파티션 선행 실패, 배치 마감) 반환 - 재시도 카운트 변화 없음
+    _RELEASE_QUERY = """
+        UPDATE `universal_outbox`
+        SET `status` = 'pending', `lease_owner` = NULL, `lease_until` = NULL
+        WHERE `id` IN ({placeholders}) AND `status` = 'processing' AND `lease_owner` = %s
+    """
     
     @classmethod
     async def init(cls):
@@ -60,16 +127,14 @@ class UniversalOutboxConsumer:
             # 기본 이벤트 핸들러 등록
             await cls._register_default_handlers()
             
-            # 각 도메인별 컨슈머 태스크 시작
-            for domain in EventDomain:
-                task = asyncio.create_task(cls._consume_domain_events(domain))
-                cls._consumer_tasks.append(task)
-                Logger.info(f"✅ {domain.value} 도메인 컨슈머 시작")
+            cls._initialized = True
+            
+            # 샤드별 릴레이 시작 (모든 도메인을 샤드 단위로 클레임)
+            cls._consumer_tasks.append(asyncio.create_task(cls._relay_supervisor()))
             
             # 정리 작업 스케줄러 등록
             await cls._register_cleanup_jobs()
             
-            cls._initialized = True
             Logger.info("✅ UniversalOutboxConsumer 초기화 완료")
             
         except Exception as e:
@@ -122,178 +187,237 @@ class UniversalOutboxConsumer:
         cls._event_handlers[domain.value][event_type] = handler
         Logger.info(f"이벤트 핸들러 등록: {domain.value}.{event_type}")
     
+    # ===========================================
+    # 아웃박스 릴레이 (샤드별 SKIP LOCKED 배치 클레임)
+    # ===========================================
+    
     @classmethod
-    async def _consume_domain_events(cls, domain: EventDomain):
-        """도메인별 이벤트 컨슘"""
-        domain_name = domain.value
-        
+    def notify_pending(cls, shard_id: Optional[int] = None):
+        """이벤트 기록 직후 호출 - 해당 샤드(미지정 시 전체) 릴레이를 즉시 깨움"""
+        if shard_id is not None and shard_id in cls._relay_wakeups:
+            cls._relay_wakeups[shard_id].set()
+            return
+        for wakeup in cls._relay_wakeups.values():
+            wakeup.set()
+    
+    @classmethod
+    async def _get_cached_shard_ids(cls, db_service, force: bool = False) -> List[int]:
+        """활성 샤드 목록 (SHARD_REFRESH_INTERVAL 동안 캐시, 조회 실패 시 이전 값 유지)"""
+        now = time.monotonic()
+        if force or not cls._shard_ids_cache or now - cls._shard_ids_loaded_at >= cls.SHARD_REFRESH_INTERVAL:
+            shard_ids = await cls._get_active_shard_ids(db_service)
+            if shard_ids:
+                cls._shard_ids_cache = shard_ids
+                cls._shard_ids_loaded_at = now
+        return list(cls._shard_ids_cache)
+    
+    @classmethod
+    async def _relay_supervisor(cls):
+        """샤드 토폴로지 변화에 맞춰 샤드별 릴레이 태스크 시작/중지"""
         while cls._initialized:
             try:
-                # 분산 락으로 중복 처리 방지
-                lock_key = f"outbox_consumer:{domain_name}"
-                lock_token = await LockService.acquire(lock_key, ttl=30, timeout=1)
+                db_service = ServiceContainer.get_database_service()
+                shard_ids = await cls._get_cached_shard_ids(db_service, force=True)
                 
-                if not lock_token:
-                    # 다른 인스턴스에서 처리 중
-                    await asyncio.sleep(cls.POLL_INTERVAL)
-                    continue
+                for shard_id in shard_ids:
+                    task = cls._relay_tasks.get(shard_id)
+                    if task is None or task.done():
+                        cls._relay_wakeups.setdefault(shard_id, asyncio.Event())
+                        cls._relay_tasks[shard_id] = asyncio.create_task(cls._relay_shard_loop(shard_id))
+                        Logger.info(f"✅ 샤드 {shard_id} 아웃박스 릴레이 시작")
                 
-                try:
-                    # 활성 샤드에서 pending 이벤트 조회
-                    processed_count = await cls._process_pending_events(domain_name)
-                    
-                    if processed_count > 0:
-                        Logger.info(f"✅ {domain_name} 도메인: {processed_count}개 이벤트 처리 완료")
-                    
-                finally:
-                    await LockService.release(lock_key, lock_token)
+                for shard_id in [s for s in cls._relay_tasks if s not in shard_ids]:
+                    cls._relay_tasks.pop(shard_id).cancel()
+                    cls._relay_wakeups.pop(shard_id, None)
+                    Logger.info(f"샤드 {shard_id} 아웃박스 릴레이 중지 (비활성 샤드)")
                 
-                # 다음 폴링까지 대기
-                await asyncio.sleep(cls.POLL_INTERVAL)
+                await asyncio.sleep(cls.SHARD_REFRESH_INTERVAL)
                 
             except asyncio.CancelledError:
-                Logger.info(f"{domain_name} 도메인 컨슈머 중지")
                 break
             except Exception as e:
-                Logger.error(f"{domain_name} 도메인 컨슈머 오류: {e}")
-                await asyncio.sleep(10)  # 오류 시 10초 대기
+                Logger.error(f"아웃박스 릴레이 관리 오류: {e}")
+                await asyncio.sleep(10)
     
     @classmethod
-    async def _process_pending_events(cls, domain: str) -> int:
-        """도메인별 pending 이벤트 처리"""
-        try:
-            db_service = ServiceContainer.get_database_service()
-            processed_count = 0
-            
-            # 활성 샤드 목록 조회
-            active_shards = await cls._get_active_shard_ids(db_service)
-            if not active_shards:
-                return 0
-            
-            # 각 샤드에서 pending 이벤트 조회 및 처리
-            for shard_id in active_shards:
-                try:
-                    # 샤드별 pending 이벤트 조회 (SQL 프로시저 사용)
-                    result = await db_service.call_shard_procedure(
-                        shard_id,
-                        "fp_universal_outbox_get_pending",
-                        (domain, cls.BATCH_SIZE)
-                    )
-                    
-                    if not result:
-                        continue
-                    
-                    # 이벤트 배치 처리
-                    for event_row in result:
-                        try:
-                            await cls._process_single_event(shard_id, event_row)
-                            processed_count += 1
-                            
-                        except Exception as e:
-                            Logger.error(f"이벤트 처리 실패: {event_row.get('id')} - {e}")
-                            await cls._mark_event_failed(db_service, shard_id, event_row, str(e))
+    async def _relay_shard_loop(cls, shard_id: int):
+        """
+        샤드 릴레이 루프 - 적응형 대기
+        - 배치가 가득 차면 즉시 다음 배치, 일부만 차면 RELAY_MIN_INTERVAL
+        - 비어 있으면 대기 시간을 2배씩 늘려 RELAY_MAX_INTERVAL까지 (notify_pending으로 즉시 기상)
+        """
+        interval = cls.RELAY_MIN_INTERVAL
+        wakeup = cls._relay_wakeups.setdefault(shard_id, asyncio.Event())
+        
+        while cls._initialized:
+            try:
+                db_service = ServiceContainer.get_database_service()
+                claimed = await cls._relay_batch(db_service, shard_id)
                 
-                except Exception as e:
-                    Logger.error(f"샤드 {shard_id} 이벤트 처리 실패: {e}")
-                    continue
-            
-            return processed_count
-            
-        except Exception as e:
-            Logger.error(f"도메인 {domain} 이벤트 처리 실패: {e}")
+                if claimed >= cls.BATCH_SIZE:
+                    interval = 0.0
+                elif claimed > 0:
+                    interval = cls.RELAY_MIN_INTERVAL
+                else:
+                    interval = min(max(interval * 2, cls.RELAY_MIN_INTERVAL), cls.RELAY_MAX_INTERVAL)
+                cls._relay_intervals[shard_id] = interval
+                
+                if interval > 0:
+                    try:
+                        await asyncio.wait_for(wakeup.wait(), timeout=interval)
+                        interval = cls.RELAY_MIN_INTERVAL
+                    except asyncio.TimeoutError:
+                        pass
+                wakeup.clear()
+                
+            except asyncio.CancelledError:
+                Logger.info(f"샤드 {shard_id} 아웃박스 릴레이 중지")
+                break
+            except Exception as e:
+                Logger.error(f"샤드 {shard_id} 아웃박스 릴레이 오류: {e}")
+                await asyncio.sleep(cls.RELAY_MAX_INTERVAL)
+    
+    @classmethod
+    async def _relay_batch(cls, db_service, shard_id: int) -> int:
+        """
+        한 샤드의 pending 이벤트 배치 처리 - 반환: 클레임한 건수
+        1. 짧은 트랜잭션: 만료 리스 회수 → SELECT ... FOR UPDATE SKIP LOCKED로 최대 BATCH_SIZE건 선택
+           → processing + lease_owner/lease_until 기록 후 커밋 (행 잠금은 여기서 해제)
+        2. 트랜잭션 밖에서 파티션별 순서를 지키며 핸들러 동시 실행 (리스 마감 전까지만 새 이벤트 시작)
+        3. 짧은 트랜잭션: 성공분 published, 실패분 재시도 카운트 증가, 미실행분 pending 반환을 일괄 갱신
+        처리 중 인스턴스가 죽으면 리스가 만료되어 다음 패스에서 회수됨
+        """
+        lease_owner = f"{socket.gethostname()[:32]}:{os.getpid()}:{uuid.uuid4().hex[:12]}"
+        
+        async with db_service.shard_transaction(shard_id) as tx:
+            reclaimed = await tx.execute(cls._RECLAIM_QUERY)
+            rows = await tx.query(cls._CLAIM_QUERY, (cls.BATCH_SIZE,))
+            if rows:
+                ids = [row['id'] for row in rows]
+                await tx.execute(cls._LEASE_QUERY.format(placeholders=", ".join(["%s"] * len(ids))),
+                                 (lease_owner, cls.LEASE_SECONDS, *ids))
+        
+        if reclaimed:
+            Logger.warn(f"⚠️ 샤드 {shard_id} 아웃박스: 리스 만료 {reclaimed}건 회수")
+        if not rows:
             return 0
+        
+        deadline = time.monotonic() + cls.LEASE_SECONDS - cls.HANDLER_TIMEOUT - cls.LEASE_MARGIN_SECONDS
+        published, failed = await cls._dispatch_batch(rows, deadline)
+        done = set(published) | {event_id for event_id, _ in failed}
+        released = [row['id'] for row in rows if row['id'] not in done]
+        
+        async with db_service.shard_transaction(shard_id) as tx:
+            if published:
+                placeholders = ", ".join(["%s"] * len(published))
+                await tx.execute(cls._PUBLISH_QUERY.format(placeholders=placeholders), (*published, lease_owner))
+            if failed:
+                await tx.execute_many(cls._FAIL_QUERY, [(error[:1000], event_id, lease_owner) for event_id, error in failed])
+            if released:
+                placeholders = ", ".join(["%s"] * len(released))
+                await tx.execute(cls._RELEASE_QUERY.format(placeholders=placeholders), (*released, lease_owner))
+        
+        cls._record_relay_metrics(shard_id, rows, set(published), dict(failed))
+        if published or failed:
+            Logger.info(f"✅ 샤드 {shard_id} 아웃박스: {len(published)}건 발행, {len(failed)}건 실패, {len(released)}건 반환")
+        return len(rows)
+    
+    @classmethod
+    async def _dispatch_batch(cls, rows: List[Dict[str, Any]], deadline: float) -> Tuple[List[str], List[Tuple[str, str]]]:
+        """
+        파티션(domain, partition_key)별로 sequence_no 순서대로 실행, 서로 다른 파티션은 동시 실행
+        - 파티션 내 실패 시 뒤 이벤트는 실행하지 않음 (pending 반환 → 다음 배치에서 순서대로 재시도)
+        - deadline(monotonic) 이후에는 새 이벤트를 시작하지 않음 (리스 만료 전 결과 기록)
+        반환: (published 이벤트 ID 목록, [(실패 이벤트 ID, 에러)])
+        """
+        partitions: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for row in rows:
+            partitions.setdefault((row.get('domain'), row.get('partition_key')), []).append(row)
+        
+        published: List[str] = []
+        failed: List[Tuple[str, str]] = []
+        semaphore = asyncio.Semaphore(cls.HANDLER_CONCURRENCY)
+        
+        async def _run_partition(events: List[Dict[str, Any]]):
+            async with semaphore:
+                for row in sorted(events, key=lambda r: r.get('sequence_no') or 0):
+                    if time.monotonic() >= deadline:
+                        break
+                    error = await cls._run_handler(row)
+                    if error is None:
+                        published.append(row['id'])
+                    else:
+                        failed.append((row['id'], error))
+                        break
+        
+        await asyncio.gather(*[_run_partition(events) for events in partitions.values()])
+        return published, failed
     
     @classmethod
-    async def _process_single_event(cls, shard_id: int, event_row: Dict[str, Any]):
-        """개별 이벤트 처리"""
+    async def _run_handler(cls, event_row: Dict[str, Any]) -> Optional[str]:
+        """이벤트 핸들러 실행 - 성공 시 None, 실패 시 에러 메시지"""
         event_id = event_row.get('id')
         domain = event_row.get('domain')
         event_type = event_row.get('event_type')
-        event_data = json.loads(event_row.get('event_data', '{}'))
         
-        Logger.info(f"이벤트 처리 시작: {domain}.{event_type} ({event_id})")
+        handler = cls._event_handlers.get(domain, {}).get(event_type)
+        if handler is None:
+            Logger.warn(f"⚠️ 등록되지 않은 이벤트 타입: {domain}.{event_type}")
+            return None  # 스킵하고 published 처리
         
         try:
-            # 등록된 핸들러로 이벤트 처리
-            if domain in cls._event_handlers and event_type in cls._event_handlers[domain]:
-                handler = cls._event_handlers[domain][event_type]
-                
-                # 핸들러 실행 (비동기/동기 모두 지원)
-                if asyncio.iscoroutinefunction(handler):
-                    success = await handler(event_data)
-                else:
-                    success = handler(event_data)
-                
-                if success:
-                    # 성공 시 published 상태로 변경
-                    await cls._mark_event_published(shard_id, event_id)
-                    Logger.info(f"✅ 이벤트 처리 성공: {event_id}")
-                else:
-                    # 실패 시 failed 상태로 변경
-                    await cls._mark_event_failed_simple(shard_id, event_id, "Handler returned False")
-                    Logger.warn(f"⚠️ 이벤트 처리 실패: {event_id} (핸들러 False 반환)")
+            raw = event_row.get('event_data') or '{}'
+            event_data = json.loads(raw) if isinstance(raw, (str, bytes)) else raw
+            
+            # 핸들러 실행 (비동기/동기 모두 지원) - 동기 핸들러는 스레드에서 실행해 같은 제한 적용
+            if asyncio.iscoroutinefunction(handler):
+                success = await asyncio.wait_for(handler(event_data), timeout=cls.HANDLER_TIMEOUT)
             else:
-                Logger.warn(f"⚠️ 등록되지 않은 이벤트 타입: {domain}.{event_type}")
-                await cls._mark_event_published(shard_id, event_id)  # 스킵하고 published 처리
-                
+                success = await asyncio.wait_for(asyncio.to_thread(handler, event_data), timeout=cls.HANDLER_TIMEOUT)
+            
+            if success:
+                return None
+            Logger.warn(f"⚠️ 이벤트 처리 실패: {event_id} (핸들러 False 반환)")
+            return "Handler returned False"
+        
+        except asyncio.TimeoutError:
+            Logger.error(f"❌ 이벤트 처리 타임아웃: {event_id} ({cls.HANDLER_TIMEOUT}초)")
+            return f"Handler timeout ({cls.HANDLER_TIMEOUT}s)"
         except Exception as e:
             Logger.error(f"❌ 이벤트 처리 오류: {event_id} - {e}")
-            await cls._mark_event_failed_simple(shard_id, event_id, str(e))
-            raise
-    
-    @classmethod
-    async def _mark_event_published(cls, shard_id: int, event_id: str):
-        """이벤트를 published 상태로 변경"""
-        try:
-            db_service = ServiceContainer.get_database_service()
-            await db_service.call_shard_procedure(
-                shard_id,
-                "fp_universal_outbox_update_status",
-                (event_id, "published", None)
-            )
-        except Exception as e:
-            Logger.error(f"이벤트 published 마킹 실패: {event_id} - {e}")
+            return str(e)
     
     @classmethod
-    async def _mark_event_failed_simple(cls, shard_id: int, event_id: str, error_msg: str):
-        """이벤트를 failed 상태로 변경 (간단 버전)"""
-        try:
-            db_service = ServiceContainer.get_database_service()
-            await db_service.call_shard_procedure(
-                shard_id,
-                "fp_universal_outbox_update_status",
-                (event_id, "failed", error_msg)
-            )
-        except Exception as e:
-            Logger.error(f"이벤트 failed 마킹 실패: {event_id} - {e}")
+    def _record_relay_metrics(cls, shard_id: int, rows: List[Dict[str, Any]], published: set, failed: Dict[str, str]):
+        """샤드/도메인별 처리 건수와 릴레이 지연(created_at → 발행) 기록"""
+        now = datetime.now()
+        for row in rows:
+            key = f"{shard_id}:{row.get('domain')}"
+            stats = cls._relay_stats.setdefault(key, {"claimed": 0, "published": 0, "failed": 0, "batches": 0})
+            stats["claimed"] += 1
+            event_id = row.get('id')
+            if event_id in published:
+                stats["published"] += 1
+                created_at = row.get('created_at')
+                if isinstance(created_at, datetime):
+                    histogram = cls._relay_lag.setdefault(key, LatencyHistogram(cls.RELAY_LAG_BUCKETS_MS))
+                    histogram.record(max((now - created_at).total_seconds() * 1000.0, 0.0))
+            elif event_id in failed:
+                stats["failed"] += 1
+        for domain in {row.get('domain') for row in rows}:
+            cls._relay_stats[f"{shard_id}:{domain}"]["batches"] += 1
     
     @classmethod
-    async def _mark_event_failed(cls, db_service, shard_id: int, event_row: Dict, error_msg: str):
-        """이벤트를 failed 상태로 변경 (재시도 고려)"""
-        try:
-            event_id = event_row.get('id')
-            retry_count = int(event_row.get('retry_count', 0))
-            max_retries = int(event_row.get('max_retries', cls.MAX_RETRIES))
-            
-            if retry_count < max_retries:
-                # 재시도 가능
-                await db_service.call_shard_procedure(
-                    shard_id,
-                    "fp_universal_outbox_update_status",
-                    (event_id, "pending", error_msg)  # pending으로 돌려서 재시도
-                )
-                Logger.info(f"이벤트 재시도 예약: {event_id} ({retry_count + 1}/{max_retries})")
-            else:
-                # 최대 재시도 초과 → dead_letter
-                await db_service.call_shard_procedure(
-                    shard_id,
-                    "fp_universal_outbox_update_status",
-                    (event_id, "dead_letter", error_msg)
-                )
-                Logger.error(f"이벤트 dead_letter 처리: {event_id}")
-                
-        except Exception as e:
-            Logger.error(f"이벤트 실패 마킹 실패: {event_row.get('id')} - {e}")
+    def get_relay_stats(cls) -> Dict[str, Any]:
+        """릴레이 지표 - 샤드별 현재 대기 간격, 샤드:도메인별 건수/지연"""
+        return {
+            "shards": list(cls._relay_tasks.keys()),
+            "intervals": dict(cls._relay_intervals),
+            "by_shard_domain": {
+                key: {**stats, "lag_ms": cls._relay_lag[key].to_dict() if key in cls._relay_lag else None}
+                for key, stats in cls._relay_stats.items()
+            }
+        }
     
     @classmethod
     async def _get_active_shard_ids(cls, db_service) -> List[int]:
@@ -380,21 +504,14 @@ class UniversalOutboxConsumer:
             db_service = ServiceContainer.get_database_service()
             active_shards = await cls._get_active_shard_ids(db_service)
             
+            gathered = await db_service.gather_shard_procedure("fp_universal_outbox_cleanup_published", (cls.CLEANUP_RETENTION_DAYS,), active_shards, timeout=0)
+            for shard_id, error in gathered.errors.items():
+                Logger.error(f"샤드 {shard_id} published 정리 실패: {error}")
+            
             total_deleted = 0
-            for shard_id in active_shards:
-                try:
-                    result = await db_service.call_shard_procedure(
-                        shard_id,
-                        "fp_universal_outbox_cleanup_published",
-                        (cls.CLEANUP_RETENTION_DAYS,)
-                    )
-                    
-                    if result and result[0].get('result') == 'SUCCESS':
-                        deleted_count = result[0].get('deleted_count', 0)
-                        total_deleted += deleted_count
-                        
-                except Exception as e:
-                    Logger.error(f"샤드 {shard_id} published 정리 실패: {e}")
+            for result in gathered.results.values():
+                if result and result[0].get('result') == 'SUCCESS':
+                    total_deleted += result[0].get('deleted_count', 0)
             
             Logger.info(f"✅ Published 이벤트 정리 완료: {total_deleted}개 삭제")
             
@@ -408,21 +525,14 @@ class UniversalOutboxConsumer:
             db_service = ServiceContainer.get_database_service()
             active_shards = await cls._get_active_shard_ids(db_service)
             
+            gathered = await db_service.gather_shard_procedure("fp_universal_outbox_cleanup_failed", (30,), active_shards, timeout=0)  # 30일 후 정리
+            for shard_id, error in gathered.errors.items():
+                Logger.error(f"샤드 {shard_id} failed 정리 실패: {error}")
+            
             total_deleted = 0
-            for shard_id in active_shards:
-                try:
-                    result = await db_service.call_shard_procedure(
-                        shard_id,
-                        "fp_universal_outbox_cleanup_failed",
-                        (30,)  # 30일 후 정리
-                    )
-                    
-                    if result and result[0].get('result') == 'SUCCESS':
-                        deleted_count = result[0].get('deleted_count', 0)
-                        total_deleted += deleted_count
-                        
-                except Exception as e:
-                    Logger.error(f"샤드 {shard_id} failed 정리 실패: {e}")
+            for result in gathered.results.values():
+                if result and result[0].get('result') == 'SUCCESS':
+                    total_deleted += result[0].get('deleted_count', 0)
             
             Logger.info(f"✅ Failed 이벤트 정리 완료: {total_deleted}개 삭제")
             
@@ -436,21 +546,14 @@ class UniversalOutboxConsumer:
             db_service = ServiceContainer.get_database_service()
             active_shards = await cls._get_active_shard_ids(db_service)
             
+            gathered = await db_service.gather_shard_procedure("fp_universal_outbox_cleanup_sequences", (90,), active_shards, timeout=0)  # 90일 후 정리
+            for shard_id, error in gathered.errors.items():
+                Logger.error(f"샤드 {shard_id} 시퀀스 정리 실패: {error}")
+            
             total_deleted = 0
-            for shard_id in active_shards:
-                try:
-                    result = await db_service.call_shard_procedure(
-                        shard_id,
-                        "fp_universal_outbox_cleanup_sequences",
-                        (90,)  # 90일 후 정리
-                    )
-                    
-                    if result and result[0].get('result') == 'SUCCESS':
-                        deleted_count = result[0].get('deleted_count', 0)
-                        total_deleted += deleted_count
-                        
-                except Exception as e:
-                    Logger.error(f"샤드 {shard_id} 시퀀스 정리 실패: {e}")
+            for result in gathered.results.values():
+                if result and result[0].get('result') == 'SUCCESS':
+                    total_deleted += result[0].get('deleted_count', 0)
             
             Logger.info(f"✅ 시퀀스 정리 완료: {total_deleted}개 삭제")
             
@@ -553,8 +656,8 @@ class UniversalOutboxConsumer:
         try:
             cls._initialized = False
             
-            # 컨슈머 태스크 종료
-            for task in cls._consumer_tasks:
+            # 컨슈머/릴레이 태스크 종료 (처리 중 배치는 롤백되어 pending 유지)
+            for task in cls._consumer_tasks + list(cls._relay_tasks.values()):
                 if not task.done():
                     task.cancel()
                     try:
@@ -562,6 +665,8 @@ class UniversalOutboxConsumer:
                     except asyncio.CancelledError:
                         pass
             cls._consumer_tasks.clear()
+            cls._relay_tasks.clear()
+            cls._relay_wakeups.clear()
             
             # 스케줄러 작업 제거
             for job_id in cls._scheduler_job_ids:
@@ -614,6 +719,7 @@ async def publish_outbox_event(
         if result and result[0].get('result') == 'SUCCESS':
             event_id = result[0].get('event_id')
             Logger.info(f"✅ Outbox 이벤트 발행: {event_id} ({domain.value}.{event_type})")
+            UniversalOutboxConsumer.notify_pending(shard_id)
             return True
         else:
             Logger.error(f"❌ Outbox 이벤트 발행 실패: {result}")
@@ -0,0 +1,145 @@
+"""
+지연 메시지 스케줄러 - 주기 스캔 대신 가장 이른 실행 시각까지 정확히 대기
+"""
+
+import time
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from service.core.logger import Logger
+from service.core.latency_histogram import LatencyHistogram
+
+
+@dataclass
+class DelayedSchedulerMetrics:
+    runs: int = 0          # 이동 Lua 호출 수
+    moved: int = 0         # 이동한 메시지 수 (이전 형식 포함)
+    nudges: int = 0        # 대기 중 더 이른 메시지 알림으로 깨어난 수
+    errors: int = 0
+
+
+class DelayedMessageScheduler:
+    """
+    이벤트 기반 지연 메시지 스케줄러
+    - Lua 1회로 실행 시각이 된 메시지를 목적지 리스트로 이동하고 다음 실행 시각을 함께 조회
+    - 다음 실행 시각까지 지연 알림 채널(pub/sub)을 대기, 더 이른 메시지가 등록되면 즉시 깨어나 재계산
+    - 대기열이 비어 있으면 max_idle_seconds마다 한 번만 확인 (알림 유실 대비)
+    - 여러 인스턴스가 동시에 실행해도 이동은 Lua로 원자적이라 중복 없음
+    - 예정 시각 대비 실제 이동 시각 차이를 schedule lag 히스토그램으로 기록
+    """
+
+    def __init__(self, message_queue, batch_size: int = 100, max_idle_seconds: float = 60.0):
+        self.message_queue = message_queue
+        self.batch_size = max(1, batch_size)
+        self.max_idle_seconds = max(1.0, max_idle_seconds)
+        self.running = False
+        self.task: Optional[asyncio.Task] = None
+
+        self.metrics = DelayedSchedulerMetrics()
+        self.schedule_lag = LatencyHistogram()
+        self._next_due: Optional[float] = None
+
+    async def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.task = asyncio.create_task(self._run())
+        Logger.info("지연 메시지 스케줄러 시작")
+
+    async def stop(self):
+        self.running = False
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+        Logger.info("지연 메시지 스케줄러 중지")
+
+    async def _run(self):
+        """알림 채널 구독을 유지하며 이동/대기 반복 (연결 끊김 시 백오프 재연결)"""
+        cache_service = self.message_queue.cache_service
+        retry_delay = 1.0
+        while self.running:
+            pubsub = None
+            try:
+                async with cache_service.get_blocking_client() as client:
+                    pubsub = await client.subscribe(self.message_queue.delayed_nudge_channel)
+                    retry_delay = 1.0
+                    while self.running:
+                        delay = await self._move_due()
+                        await self._wait(pubsub, delay)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.metrics.errors += 1
+                Logger.warn(f"지연 메시지 스케줄러 오류 (retry in {retry_delay:.0f}s): {e}")
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, 30.0)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
+
+    async def _move_due(self) -> float:
+        """실행 시각이 된 메시지 이동 후 다음 대기 시간(초) 반환"""
+        result = await self.message_queue.move_due_delayed(self.batch_size)
+        self.metrics.runs += 1
+        if result is None:
+            # Redis 오류 - 잠시 후 재시도
+            self.metrics.errors += 1
+            self._next_due = None
+            return 1.0
+
+        scores, legacy_count, next_due = result
+        now = time.time()
+        for score in scores:
+            self.schedule_lag.record(max(now - score, 0.0) * 1000.0)
+        moved = len(scores) + legacy_count
+        self.metrics.moved += moved
+        if moved:
+            Logger.debug("지연 메시지 %d건 이동", moved)
+
+        self._next_due = next_due
+        if moved >= self.batch_size:
+            return 0.0  # 배치가 가득 찼으면 남은 만기 메시지 즉시 처리
+        if next_due is None:
+            return self.max_idle_seconds
+        return min(max(next_due - now, 0.0), self.max_idle_seconds)
+
+    async def _wait(self, pubsub, delay: float):
+        """delay초 대기 - 현재 예정보다 이른 메시지 알림이 오면 즉시 반환"""
+        deadline = time.monotonic() + delay
+        while self.running:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=remaining)
+            if not message:
+                continue
+            try:
+                due = float(message["data"])
+            except (TypeError, ValueError):
+                continue
+            if self._next_due is None or due < self._next_due:
+                self.metrics.nudges += 1
+                return
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "runs": self.metrics.runs,
+            "moved": self.metrics.moved,
+            "nudges": self.metrics.nudges,
+            "errors": self.metrics.errors,
+            "next_due": self._next_due,
+            "schedule_lag_ms": self.schedule_lag.to_dict()
+        }
+
+    def reset_metrics(self):
+        self.metrics = DelayedSchedulerMetrics()
+        self.schedule_lag.reset()
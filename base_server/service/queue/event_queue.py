@@ -13,6 +13,7 @@ from abc import ABC, abstractmethod
 
 from service.core.logger import Logger
 from service.cache.redis_cache_client import RedisCacheClient
+from .queue_config import QueueConfig
 
 
 class EventType(Enum):
@@ -78,6 +79,37 @@ class Subscription:
     active: bool = True
 
 
+def serialize_event(evt: Event) -> str:
+    """이벤트 → 전송용 JSON"""
+    return json.dumps({
+        "event": {
+            "id": evt.id,
+            "event_type": evt.event_type.value,
+            "source": evt.source,
+            "data": evt.data,
+            "timestamp": evt.timestamp.isoformat(),
+            "correlation_id": evt.correlation_id,
+            "version": evt.version,
+            "metadata": evt.metadata
+        }
+    })
+
+
+def deserialize_event(event_json: str) -> Event:
+    """전송용 JSON → 이벤트"""
+    event_info = json.loads(event_json)["event"]
+    return Event(
+        id=event_info["id"],
+        event_type=EventType(event_info["event_type"]),
+        source=event_info["source"],
+        data=event_info["data"],
+        timestamp=datetime.fromisoformat(event_info["timestamp"]),
+        correlation_id=event_info.get("correlation_id"),
+        version=event_info.get("version", "1.0"),
+        metadata=event_info.get("metadata")
+    )
+
+
 class IEventQueue(ABC):
     """이벤트큐 인터페이스"""
     
@@ -139,20 +171,7 @@ class RedisCacheEventQueue(IEventQueue):
         """이벤트 발행"""
         async def _publish_operation(client, evt):
             # 이벤트를 JSON으로 직렬화
-            event_payload = {
-                "event": {
-                    "id": evt.id,
-                    "event_type": evt.event_type.value,
-                    "source": evt.source,
-                    "data": evt.data,
-                    "timestamp": evt.timestamp.isoformat(),
-                    "correlation_id": evt.correlation_id,
-                    "version": evt.version,
-                    "metadata": evt.metadata
-                }
-            }
-            
-            event_json = json.dumps(event_payload)
+            event_json = serialize_event(evt)
             
             # 이벤트 히스토리에 저장
             history_key = self.event_history_pattern.format(event_type=evt.event_type.value)
@@ -255,20 +274,8 @@ class RedisCacheEventQueue(IEventQueue):
                     await asyncio.sleep(1)
                     continue
                 
-                event_payload = json.loads(event_data)
-                event_info = event_payload["event"]
-                
                 # Event 객체 재구성
-                event = Event(
-                    id=event_info["id"],
-                    event_type=EventType(event_info["event_type"]),
-                    source=event_info["source"],
-                    data=event_info["data"],
-                    timestamp=datetime.fromisoformat(event_info["timestamp"]),
-                    correlation_id=event_info.get("correlation_id"),
-                    version=event_info.get("version", "1.0"),
-                    metadata=event_info.get("metadata")
-                )
+                event = deserialize_event(event_data)
                 
                 # 콜백 실행
                 try:
@@ -300,20 +307,7 @@ class RedisCacheEventQueue(IEventQueue):
             events = []
             for event_data in reversed(event_data_list):
                 try:
-                    event_payload = json.loads(event_data)
-                    event_info = event_payload["event"]
-                    
-                    event = Event(
-                        id=event_info["id"],
-                        event_type=EventType(event_info["event_type"]),
-                        source=event_info["source"],
-                        data=event_info["data"],
-                        timestamp=datetime.fromisoformat(event_info["timestamp"]),
-                        correlation_id=event_info.get("correlation_id"),
-                        version=event_info.get("version", "1.0"),
-                        metadata=event_info.get("metadata")
-                    )
-                    events.append(event)
+                    events.append(deserialize_event(event_data))
                 except Exception as e:
                     Logger.error(f"이벤트 히스토리 파싱 오류: {e}")
             
@@ -351,9 +345,17 @@ class RedisCacheEventQueue(IEventQueue):
 class EventQueueManager:
     """이벤트큐 매니저"""
     
-    def __init__(self, cache_service):
+    def __init__(self, cache_service, config: Optional[QueueConfig] = None):
         self.cache_service = cache_service
-        self.event_queue = RedisCacheEventQueue(cache_service)
+        self.config = config or QueueConfig()
+        
+        # 이벤트큐 구현 선택 (queueConfig.event_queue_backend)
+        if self.config.event_queue_backend == "stream":
+            from .stream_event_queue import RedisStreamEventQueue
+            self.event_queue: IEventQueue = RedisStreamEventQueue(cache_service, self.config)
+        else:
+            self.event_queue: IEventQueue = RedisCacheEventQueue(cache_service)
+        Logger.info(f"이벤트큐 백엔드: {self.config.event_queue_backend}")
         
         # 이벤트 핸들러 레지스트리
         self.event_handlers: Dict[EventType, List[Callable[[Event], bool]]] = {}
@@ -3,9 +3,11 @@
 """
 
 import json
+import time
 import uuid
+import zlib
 import asyncio
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Set, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 from dataclasses import dataclass
@@ -13,6 +15,8 @@ from abc import ABC, abstractmethod
 
 from service.core.logger import Logger
 from service.cache.redis_cache_client import RedisCacheClient
+from .queue_config import QueueConfig
+from .delayed_scheduler import DelayedMessageScheduler
 
 
 class MessageStatus(Enum):
@@ -57,11 +61,71 @@ class IMessageQueue(ABC):
         """메시지 큐에 추가"""
         pass
     
+    async def enqueue_batch(self, messages: List[QueueMessage]) -> bool:
+        """여러 메시지 큐에 추가 (기본 구현: 개별 enqueue)"""
+        results = [await self.enqueue(message) for message in messages]
+        return all(results)
+    
     @abstractmethod
     async def dequeue(self, queue_name: str, consumer_id: str) -> Optional[QueueMessage]:
         """메시지 큐에서 가져오기"""
         pass
     
+    async def dequeue_batch(self, queue_name: str, consumer_id: str, max_count: int,
+                            block_timeout: float = 0.0) -> Optional[List[QueueMessage]]:
+        """최대 max_count개 메시지 가져오기 (기본 구현: 개별 dequeue, 대기 없음)"""
+        messages = []
+        for _ in range(max_count):
+            message = await self.dequeue(queue_name, consumer_id)
+            if not message:
+                break
+            messages.append(message)
+        return messages
+    
+    async def ack_batch(self, messages: List[QueueMessage], consumer_id: str) -> bool:
+        """여러 메시지 처리 완료 (기본 구현: 개별 ack)"""
+        results = [await self.ack(message, consumer_id) for message in messages]
+        return all(results)
+    
+    async def nack_batch(self, messages: List[QueueMessage], consumer_id: str, requeue: bool = True) -> bool:
+        """여러 메시지 처리 실패 (기본 구현: 개별 nack)"""
+        results = [await self.nack(message, consumer_id, requeue) for message in messages]
+        return all(results)
+    
+    # 파티션 소비 (partition_key 메시지) - 기본 구현: 파티션 미지원
+    async def get_ready_partitions(self, queue_name: str) -> List[int]:
+        """메시지가 있고 소유자가 없는 파티션 목록"""
+        return []
+    
+    async def acquire_partition(self, queue_name: str, partition: int, owner: str, lease_seconds: int) -> bool:
+        """파티션 리스 획득"""
+        return False
+    
+    async def renew_partitions(self, queue_name: str, partitions: List[int], owner: str, lease_seconds: int) -> List[int]:
+        """파티션 리스 연장 - 연장된 파티션 반환"""
+        return []
+    
+    async def release_partition(self, queue_name: str, partition: int, owner: str) -> int:
+        """파티션 리스 반납 - 남은 메시지 수 반환"""
+        return 0
+    
+    async def peek_partition(self, queue_name: str, partition: int, owner: str,
+                             max_count: int) -> Optional[List[QueueMessage]]:
+        """파티션 앞쪽 메시지 조회 (제거하지 않음) - 리스를 잃었으면 None"""
+        return None
+    
+    async def ack_partition(self, messages: List[QueueMessage], partition: int) -> bool:
+        """파티션 메시지 처리 완료"""
+        return False
+    
+    async def retry_partition(self, message: QueueMessage, partition: int, consumer_id: str) -> bool:
+        """파티션 메시지 처리 실패 - 재시도 대기면 True, DLQ로 이동했으면 False"""
+        return False
+    
+    async def wait_partition_notify(self, queue_name: str, timeout: float):
+        """파티션 메시지 도착 대기"""
+        await asyncio.sleep(timeout)
+    
     @abstractmethod
     async def ack(self, message_id: str, consumer_id: str) -> bool:
         """메시지 처리 완료 확인"""
@@ -76,8 +140,10 @@ class IMessageQueue(ABC):
 class RedisCacheMessageQueue(IMessageQueue):
     """CacheService를 사용하는 Redis 메시지큐"""
     
-    def __init__(self, cache_service):
+    def __init__(self, cache_service, config: Optional[QueueConfig] = None):
         self.cache_service = cache_service
+        self.config = config or QueueConfig()
+        self.partition_count = max(1, self.config.partition_count)
         
         # Redis 키 패턴들
         self.message_key_pattern = "mq:message:{message_id}"
@@ -85,6 +151,11 @@ class RedisCacheMessageQueue(IMessageQueue):
         self.delayed_key_pattern = "mq:delayed:messages"
         self.processing_key_pattern = "mq:processing:{queue_name}"
         self.dlq_key_pattern = "mq:dlq:{queue_name}"
+        self.notify_key_pattern = "mq:notify:{queue_name}"  # 블로킹 컨슈머 깨우기용 토큰 리스트
+        self.partition_queue_pattern = "mq:partition:{queue_name}:{partition}"
+        self.partition_lease_pattern = "mq:partition_lease:{queue_name}:{partition}"
+        self.partition_notify_pattern = "mq:pnotify:{queue_name}"  # 파티션 코디네이터 깨우기용 토큰 리스트
+        self.delayed_nudge_channel = "mq:delayed:nudge"  # 지연 메시지 등록 알림 (pub/sub, 값: 실행 시각)
         
         # Lua 스크립트들 (네임스페이스 고려)
         self._dequeue_lua_script = """
@@ -112,69 +183,236 @@ class RedisCacheMessageQueue(IMessageQueue):
         return nil
         """
         
+        self._dequeue_batch_lua_script = """
+        -- 원자적 배치 dequeue: 우선순위 순으로 최대 ARGV[6]개를 꺼내 처리 중 마킹 후 본문과 함께 반환
+        -- KEYS[1~4]: 우선순위별 큐 (높은 순)
+        -- ARGV: message_key_base, processing_key_base, consumer_id, started_at, visibility_timeout, max_count
+        -- 반환: {message_id1, {field, value, ...}, message_id2, {...}, ...}
+        local result = {}
+        local remaining = tonumber(ARGV[6])
+        for i = 1, #KEYS do
+            while remaining > 0 do
+                local message_id = redis.call('LPOP', KEYS[i])
+                if not message_id then
+                    break
+                end
+                local fields = redis.call('HGETALL', ARGV[1] .. ':' .. message_id)
+                if #fields > 0 then
+                    local processing_key = ARGV[2] .. ':' .. message_id
+                    redis.call('HSET', processing_key, 'message_id', message_id, 'consumer_id', ARGV[3],
+                               'started_at', ARGV[4], 'visibility_timeout', ARGV[5])
+                    redis.call('EXPIRE', processing_key, tonumber(ARGV[5]))
+                    table.insert(result, message_id)
+                    table.insert(result, fields)
+                    remaining = remaining - 1
+                end
+            end
+            if remaining <= 0 then
+                break
+            end
+        end
+        return result
+        """
+        
+        self._partition_peek_lua_script = """
+        -- 파티션 앞쪽 메시지 조회 (제거하지 않음) - 리스 소유자만 가능
+        -- KEYS[1]: 파티션 리스트, KEYS[2]: 리스 키
+        -- ARGV: owner, max_count, message_key_base
+        -- 반환: 리스 없음 → false, 그 외 {message_id1, {field, value, ...}, ...}
+        if redis.call('GET', KEYS[2]) ~= ARGV[1] then
+            return false
+        end
+        local result = {}
+        local ids = redis.call('LRANGE', KEYS[1], 0, tonumber(ARGV[2]) - 1)
+        for _, message_id in ipairs(ids) do
+            local fields = redis.call('HGETALL', ARGV[3] .. ':' .. message_id)
+            if #fields > 0 then
+                table.insert(result, message_id)
+                table.insert(result, fields)
+            else
+                -- 본문이 없는 ID는 제거
+                redis.call('LREM', KEYS[1], 1, message_id)
+            end
+        end
+        return result
+        """
+        
+        self._move_due_lua_script = """
+        -- 실행 시각이 된 지연 메시지를 목적지 리스트로 원자적 이동 (최대 ARGV[2]개)
+        -- KEYS[1]: 지연 ZSET
+        -- ARGV: now, max_count, key_prefix(네임스페이스), message_key_base, notify_max_tokens
+        -- 반환: {다음 실행 시각 또는 '', {이동한 메시지의 예정 시각...}, {route_key 없는 메시지 ID...}}
+        local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'WITHSCORES', 'LIMIT', 0, tonumber(ARGV[2]))
+        local moved = {}
+        local legacy = {}
+        for i = 1, #due, 2 do
+            local message_id = due[i]
+            local message_key = ARGV[4] .. ':' .. message_id
+            local route = redis.call('HGET', message_key, 'route_key')
+            if route then
+                redis.call('ZREM', KEYS[1], message_id)
+                redis.call('RPUSH', ARGV[3] .. route, message_id)
+                local notify = redis.call('HGET', message_key, 'notify_key')
+                if notify then
+                    redis.call('RPUSH', ARGV[3] .. notify, '1')
+                    redis.call('LTRIM', ARGV[3] .. notify, -tonumber(ARGV[5]), -1)
+                end
+                table.insert(moved, due[i + 1])
+            elseif redis.call('EXISTS', message_key) == 1 then
+                -- 목적지 정보 없이 등록된 이전 메시지 - 호출자가 이동
+                table.insert(legacy, message_id)
+            else
+                redis.call('ZREM', KEYS[1], message_id)
+            end
+        end
+        local head = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+        return {head[2] or '', moved, legacy}
+        """
+        
+        self._partition_renew_lua_script = """
+        -- 소유 중인 리스만 연장, KEYS: 리스 키들, ARGV: owner, lease_seconds
+        local result = {}
+        for i = 1, #KEYS do
+            if redis.call('GET', KEYS[i]) == ARGV[1] then
+                redis.call('EXPIRE', KEYS[i], tonumber(ARGV[2]))
+                result[i] = 1
+            else
+                result[i] = 0
+            end
+        end
+        return result
+        """
+        
+        self._partition_release_lua_script = """
+        -- 소유 중인 리스 반납 후 파티션 잔여 메시지 수 반환
+        -- KEYS[1]: 리스 키, KEYS[2]: 파티션 리스트, ARGV[1]: owner
+        if redis.call('GET', KEYS[1]) == ARGV[1] then
+            redis.call('DEL', KEYS[1])
+        end
+        return redis.call('LLEN', KEYS[2])
+        """
     
-    async def _execute_redis_operation(self, operation_name: str, operation_func, *args, **kwargs):
-        """Redis 작업을 CacheService를 통해 안전하게 실행"""
+    async def _execute_redis_operation(self, operation_name: str, operation_func, *args, blocking: bool = False, **kwargs):
+        """Redis 작업을 CacheService를 통해 안전하게 실행 (blocking=True면 블로킹 전용 풀 사용)"""
         try:
             # CacheService 초기화 상태 확인
             if not self.cache_service.is_initialized():
                 Logger.warn(f"Redis operation {operation_name} failed: CacheService is not initialized")
                 return None
             
-            async with self.cache_service.get_client() as client:
+            get_client = self.cache_service.get_blocking_client if blocking else self.cache_service.get_client
+            async with get_client() as client:
                 return await operation_func(client, *args, **kwargs)
         except Exception as e:
             # Error인 경우는 무조건 출력
             Logger.error(f"Redis operation {operation_name} failed: {e}")
             return None
     
+    def _stage_enqueue(self, pipe, msg: QueueMessage):
+        """메시지 저장 + 큐 등록 명령을 파이프라인에 추가"""
+        # 메시지 ID 생성 (아직 없는 경우)
+        if not msg.id:
+            msg.id = str(uuid.uuid4())
+        
+        # 메시지 직렬화 및 저장 (모든 값을 문자열로 변환)
+        message_data = {
+            "id": str(msg.id),
+            "queue_name": str(msg.queue_name),
+            "payload": json.dumps(msg.payload),
+            "message_type": str(msg.message_type),
+            "priority": str(msg.priority.value),
+            "created_at": str(msg.created_at.isoformat() if msg.created_at else datetime.now().isoformat()),
+            "retry_count": str(msg.retry_count),
+            "max_retries": str(msg.max_retries),
+            "partition_key": str(msg.partition_key or "")
+        }
+        
+        message_key = self.message_key_pattern.format(message_id=msg.id)
+        pipe.set_hash_all(message_key, message_data)
+        
+        # 지연 실행 메시지인 경우 - 목적지를 함께 저장하여 스케줄러가 Lua 1회로 이동
+        if msg.scheduled_at and msg.scheduled_at > datetime.now():
+            timestamp = msg.scheduled_at.timestamp()
+            route_key, notify_key = self._route_of(msg)
+            pipe.set_hash_all(message_key, {"route_key": route_key, "notify_key": notify_key})
+            pipe.sorted_set_add(self.delayed_key_pattern, timestamp, msg.id)
+            pipe.publish(self.delayed_nudge_channel, repr(timestamp))
+        elif msg.partition_key:
+            # 파티션별 큐에 추가
+            self._stage_partition_push(pipe, msg)
+        else:
+            # 우선순위별 큐에 추가
+            priority_queue_key = self.priority_queue_pattern.format(
+                queue_name=msg.queue_name,
+                priority=msg.priority.value
+            )
+            pipe.list_push_right(priority_queue_key, msg.id)
+            self._stage_notify(pipe, msg.queue_name)
+    
+    # 깨우기 토큰 최대 보관 수 (대기 컨슈머 수보다 충분히 크면 됨)
+    NOTIFY_MAX_TOKENS = 256
+    
+    def _stage_notify(self, pipe, queue_name: str):
+        """블로킹 컨슈머 깨우기 토큰 추가 (길이 제한)"""
+        notify_key = self.notify_key_pattern.format(queue_name=queue_name)
+        pipe.list_push_right(notify_key, "1")
+        pipe.list_trim(notify_key, -self.NOTIFY_MAX_TOKENS, -1)
+    
+    def partition_of(self, partition_key: str) -> int:
+        """
+        partition_key → 파티션 번호 (CRC32 기반 - 프로세스/서버가 달라도 동일)
+        partition_count 변경 시 기존 메시지와 라우팅이 달라지므로 큐를 비운 뒤 변경해야 함
+        """
+        return zlib.crc32(str(partition_key).encode("utf-8")) % self.partition_count
+    
+    def _partition_queue_key(self, queue_name: str, partition: int) -> str:
+        return self.partition_queue_pattern.format(queue_name=queue_name, partition=partition)
+    
+    def _partition_lease_key(self, queue_name: str, partition: int) -> str:
+        return self.partition_lease_pattern.format(queue_name=queue_name, partition=partition)
+    
+    def _route_of(self, msg: QueueMessage) -> Tuple[str, str]:
+        """메시지 목적지 리스트와 깨우기 토큰 리스트 (네임스페이스 미적용)"""
+        if msg.partition_key:
+            return (self._partition_queue_key(msg.queue_name, self.partition_of(msg.partition_key)),
+                    self.partition_notify_pattern.format(queue_name=msg.queue_name))
+        return (self.priority_queue_pattern.format(queue_name=msg.queue_name, priority=msg.priority.value),
+                self.notify_key_pattern.format(queue_name=msg.queue_name))
+    
+    def _stage_partition_push(self, pipe, msg: QueueMessage):
+        """파티션 큐 등록 + 코디네이터 깨우기 토큰 추가"""
+        pipe.list_push_right(self._partition_queue_key(msg.queue_name, self.partition_of(msg.partition_key)), msg.id)
+        notify_key = self.partition_notify_pattern.format(queue_name=msg.queue_name)
+        pipe.list_push_right(notify_key, "1")
+        pipe.list_trim(notify_key, -self.NOTIFY_MAX_TOKENS, -1)
+    
     async def enqueue(self, message: QueueMessage) -> bool:
         """메시지 큐에 추가"""
         async def _enqueue_operation(client, msg):
-            # 메시지 ID 생성 (아직 없는 경우)
-            if not msg.id:
-                msg.id = str(uuid.uuid4())
-            
-            # 메시지 직렬화 및 저장 (모든 값을 문자열로 변환)
-            message_data = {
-                "id": str(msg.id),
-                "queue_name": str(msg.queue_name),
-                "payload": json.dumps(msg.payload),
-                "message_type": str(msg.message_type),
-                "priority": str(msg.priority.value),
-                "created_at": str(msg.created_at.isoformat() if msg.created_at else datetime.now().isoformat()),
-                "retry_count": str(msg.retry_count),
-                "max_retries": str(msg.max_retries),
-                "partition_key": str(msg.partition_key or "")
-            }
-            
-            message_key = self.message_key_pattern.format(message_id=msg.id)
-            if message_data:  # 빈 딕셔너리가 아닌지 확인
-                await client.set_hash_all(message_key, message_data)
-            
-            # 지연 실행 메시지인 경우
-            if msg.scheduled_at and msg.scheduled_at > datetime.now():
-                timestamp = msg.scheduled_at.timestamp()
-                await client.sorted_set_add(self.delayed_key_pattern, timestamp, msg.id)
-                return True
-            
-            # 파티션별 큐에 추가
-            if msg.partition_key:
-                partition_queue_key = f"mq:partition:{msg.queue_name}:{hash(msg.partition_key) % 16}"
-                await client.list_push_right(partition_queue_key, msg.id)
-            else:
-                # 우선순위별 큐에 추가
-                priority_queue_key = self.priority_queue_pattern.format(
-                    queue_name=msg.queue_name,
-                    priority=msg.priority.value
-                )
-                await client.list_push_right(priority_queue_key, msg.id)
-            
+            # 메시지 저장과 큐 등록을 하나의 트랜잭션 파이프라인으로 전송 (1회 왕복)
+            pipe = client.pipeline(transaction=True)
+            self._stage_enqueue(pipe, msg)
+            await pipe.execute()
             return True
         
         result = await self._execute_redis_operation("enqueue", _enqueue_operation, message)
         return result if result is not None else False
     
+    async def enqueue_batch(self, messages: List[QueueMessage]) -> bool:
+        """여러 메시지를 하나의 트랜잭션 파이프라인으로 큐에 추가 (1회 왕복)"""
+        if not messages:
+            return True
+        
+        async def _enqueue_batch_operation(client, msgs):
+            pipe = client.pipeline(transaction=True)
+            for msg in msgs:
+                self._stage_enqueue(pipe, msg)
+            await pipe.execute()
+            return True
+        
+        result = await self._execute_redis_operation("enqueue_batch", _enqueue_batch_operation, messages)
+        return result if result is not None else False
+    
     async def dequeue(self, queue_name: str, consumer_id: str, 
                      visibility_timeout: int = 300) -> Optional[QueueMessage]:
         """메시지 큐에서 원자적으로 제거하여 반환 (네임스페이스 고려)"""
@@ -225,17 +463,7 @@ class RedisCacheMessageQueue(IMessageQueue):
             
             # QueueMessage 객체로 변환
             try:
-                return QueueMessage(
-                    id=message_data["id"],
-                    queue_name=message_data["queue_name"],
-                    payload=json.loads(message_data["payload"]),
-                    message_type=message_data["message_type"],
-                    priority=MessagePriority(int(message_data["priority"])),
-                    created_at=datetime.fromisoformat(message_data["created_at"]),
-                    retry_count=int(message_data.get("retry_count", 0)),
-                    max_retries=int(message_data.get("max_retries", 3)),
-                    partition_key=message_data.get("partition_key") or None
-                )
+                return self._parse_message(message_data)
             except (KeyError, ValueError, json.JSONDecodeError) as e:
                 Logger.error(f"Failed to parse message data {message_id}: {e}")
                 # 파싱 실패 시 처리 중 상태에서 제거
@@ -245,60 +473,313 @@ class RedisCacheMessageQueue(IMessageQueue):
         
         return await self._execute_redis_operation("dequeue", _dequeue_operation, queue_name, consumer_id, visibility_timeout)
     
+    @staticmethod
+    def _parse_message(message_data: Dict[str, str]) -> QueueMessage:
+        """Redis 해시 → QueueMessage"""
+        return QueueMessage(
+            id=message_data["id"],
+            queue_name=message_data["queue_name"],
+            payload=json.loads(message_data["payload"]),
+            message_type=message_data["message_type"],
+            priority=MessagePriority(int(message_data["priority"])),
+            created_at=datetime.fromisoformat(message_data["created_at"]),
+            retry_count=int(message_data.get("retry_count", 0)),
+            max_retries=int(message_data.get("max_retries", 3)),
+            partition_key=message_data.get("partition_key") or None
+        )
+    
+    async def dequeue_batch(self, queue_name: str, consumer_id: str, max_count: int,
+                            block_timeout: float = 0.0, visibility_timeout: int = 300) -> Optional[List[QueueMessage]]:
+        """
+        최대 max_count개 메시지를 1회 왕복으로 원자적으로 가져오기 (본문 포함)
+        - 큐가 비어 있으면 block_timeout(초) 동안 깨우기 토큰을 BLPOP으로 서버 측 대기 후 재시도
+        - 반환: 메시지 리스트 (없으면 빈 리스트), Redis 오류 시 None
+        """
+        async def _claim(client) -> List[QueueMessage]:
+            queue_keys = [
+                client._get_key(self.priority_queue_pattern.format(queue_name=queue_name, priority=priority))
+                for priority in [4, 3, 2, 1]  # CRITICAL -> LOW
+            ]
+            message_key_base = client._get_key(self.message_key_pattern.format(message_id="").rstrip(":"))
+            processing_key_base = client._get_key(self.processing_key_pattern.format(queue_name=queue_name))
+            
+            raw = await client.eval(
+                self._dequeue_batch_lua_script,
+                len(queue_keys),
+                *queue_keys,
+                message_key_base,
+                processing_key_base,
+                consumer_id,
+                datetime.now().isoformat(),
+                str(visibility_timeout),
+                str(max_count)
+            )
+            
+            messages = []
+            broken = []
+            for i in range(0, len(raw or []), 2):
+                message_id, fields = raw[i], raw[i + 1]
+                try:
+                    messages.append(self._parse_message(dict(zip(fields[0::2], fields[1::2]))))
+                except (KeyError, ValueError, json.JSONDecodeError) as e:
+                    Logger.error(f"Failed to parse message data {message_id}: {e}")
+                    broken.append(f"{self.processing_key_pattern.format(queue_name=queue_name)}:{message_id}")
+            if broken:
+                # 파싱 실패 시 처리 중 상태에서 제거
+                await client.pipeline().delete(*broken).execute()
+            return messages
+        
+        async def _dequeue_batch_operation(client):
+            messages = await _claim(client)
+            if messages or block_timeout <= 0:
+                return messages
+            
+            # 큐가 비어 있으면 서버 측 대기 - 토큰이 오거나 타임아웃이면 다시 꺼내기 시도
+            # (토큰 없이 들어온 메시지도 타임아웃 후 처리됨)
+            notify_key = self.notify_key_pattern.format(queue_name=queue_name)
+            await client.list_block_pop_left([notify_key], block_timeout)
+            return await _claim(client)
+        
+        return await self._execute_redis_operation("dequeue_batch", _dequeue_batch_operation, blocking=block_timeout > 0)
+    
+    async def ack_batch(self, messages: List[QueueMessage], consumer_id: str) -> bool:
+        """여러 메시지 처리 완료를 1회 왕복으로 확인"""
+        if not messages:
+            return True
+        
+        async def _ack_batch_operation(client, msgs):
+            keys = []
+            for msg in msgs:
+                keys.append(f"{self.processing_key_pattern.format(queue_name=msg.queue_name)}:{msg.id}")
+                keys.append(self.message_key_pattern.format(message_id=msg.id))
+            await client.pipeline().delete(*keys).execute()
+            return True
+        
+        result = await self._execute_redis_operation("ack_batch", _ack_batch_operation, messages)
+        return result if result is not None else False
+    
     async def ack(self, message: QueueMessage, consumer_id: str) -> bool:
         """메시지 처리 완료 확인"""
         async def _ack_operation(client, msg, c_id):
-            # 처리 중 상태에서 제거
+            # 처리 중 상태 제거와 메시지 데이터 삭제를 1회 왕복으로 처리
             processing_key = self.processing_key_pattern.format(queue_name=msg.queue_name)
-            await client.delete(f"{processing_key}:{msg.id}")
-            
-            # 메시지 데이터 삭제
             message_key = self.message_key_pattern.format(message_id=msg.id)
-            await client.delete(message_key)
+            await client.pipeline().delete(f"{processing_key}:{msg.id}", message_key).execute()
             
             return True
         
         return await self._execute_redis_operation("ack", _ack_operation, message, consumer_id)
     
+    def _stage_nack(self, pipe, msg: QueueMessage, c_id: str, should_requeue: bool) -> int:
+        """
+        처리 중 상태 제거 + 재큐잉/DLQ 이동 명령을 파이프라인에 추가
+        - msg는 변경하지 않고 반영할 retry_count를 반환 (전송 실패 후 재전송 시 중복 증가 방지)
+        - 호출부가 execute() 성공 후 msg.retry_count에 반영
+        """
+        processing_key = self.processing_key_pattern.format(queue_name=msg.queue_name)
+        message_key = self.message_key_pattern.format(message_id=msg.id)
+        pipe.delete(f"{processing_key}:{msg.id}")
+        
+        if should_requeue and msg.retry_count < msg.max_retries:
+            # 재시도 카운트 증가 후 재큐잉
+            retry_count = msg.retry_count + 1
+            pipe.set_hash_field(message_key, "retry_count", str(retry_count))
+            
+            # 우선순위 큐에 다시 추가
+            priority_queue_key = self.priority_queue_pattern.format(
+                queue_name=msg.queue_name,
+                priority=msg.priority.value
+            )
+            pipe.list_push_right(priority_queue_key, msg.id)
+            self._stage_notify(pipe, msg.queue_name)
+            return retry_count
+        else:
+            # DLQ로 이동
+            dlq_key = self.dlq_key_pattern.format(queue_name=msg.queue_name)
+            dlq_message = {
+                "message_id": msg.id,
+                "original_queue": msg.queue_name,
+                "failed_at": datetime.now().isoformat(),
+                "consumer_id": c_id,
+                "retry_count": str(msg.retry_count)
+            }
+            pipe.list_push_right(dlq_key, json.dumps(dlq_message))
+            
+            # 원본 메시지 삭제
+            pipe.delete(message_key)
+            return msg.retry_count
+    
     async def nack(self, message: QueueMessage, consumer_id: str, 
                   requeue: bool = True) -> bool:
         """메시지 처리 실패 처리"""
         async def _nack_operation(client, msg, c_id, should_requeue):
-            # 처리 중 상태에서 제거
-            processing_key = self.processing_key_pattern.format(queue_name=msg.queue_name)
-            await client.delete(f"{processing_key}:{msg.id}")
+            # 처리 중 상태 제거 + 재큐잉/DLQ 이동을 하나의 트랜잭션 파이프라인으로 전송
+            pipe = client.pipeline(transaction=True)
+            retry_count = self._stage_nack(pipe, msg, c_id, should_requeue)
+            await pipe.execute()
+            msg.retry_count = retry_count
+            return True
+        
+        return await self._execute_redis_operation("nack", _nack_operation, message, consumer_id, requeue)
+    
+    async def nack_batch(self, messages: List[QueueMessage], consumer_id: str, requeue: bool = True) -> bool:
+        """여러 메시지 처리 실패를 하나의 트랜잭션 파이프라인으로 처리"""
+        if not messages:
+            return True
+        
+        async def _nack_batch_operation(client, msgs, c_id, should_requeue):
+            pipe = client.pipeline(transaction=True)
+            retry_counts = [self._stage_nack(pipe, msg, c_id, should_requeue) for msg in msgs]
+            await pipe.execute()
+            for msg, retry_count in zip(msgs, retry_counts):
+                msg.retry_count = retry_count
+            return True
+        
+        result = await self._execute_redis_operation("nack_batch", _nack_batch_operation, messages, consumer_id, requeue)
+        return result if result is not None else False
+    
+    # ==================== 파티션 소비 ====================
+    # 파티션 리스트는 리스 소유자만 앞에서부터 조회(peek)하고, 처리 완료 시 제거
+    # - 실패한 메시지는 앞자리에 그대로 남아 재시도 (파티션 내 순서 보장)
+    # - 소유자가 죽으면 리스 만료 후 다른 워커가 이어받아 앞쪽부터 재처리 (at-least-once)
+    
+    async def get_ready_partitions(self, queue_name: str) -> List[int]:
+        """메시지가 있고 소유자가 없는 파티션 목록 (1회 왕복)"""
+        async def _ready_operation(client):
+            pipe = client.pipeline()
+            for partition in range(self.partition_count):
+                pipe.list_length(self._partition_queue_key(queue_name, partition))
+                pipe.exists(self._partition_lease_key(queue_name, partition))
+            results = await pipe.execute()
+            return [
+                partition for partition in range(self.partition_count)
+                if results[partition * 2] and not results[partition * 2 + 1]
+            ]
+        
+        result = await self._execute_redis_operation("get_ready_partitions", _ready_operation)
+        return result if result is not None else []
+    
+    async def acquire_partition(self, queue_name: str, partition: int, owner: str, lease_seconds: int) -> bool:
+        """파티션 리스 획득 (SET NX EX)"""
+        async def _acquire_operation(client):
+            return await client.set_string(self._partition_lease_key(queue_name, partition), owner,
+                                           expire=lease_seconds, nx=True)
+        
+        return bool(await self._execute_redis_operation("acquire_partition", _acquire_operation))
+    
+    async def renew_partitions(self, queue_name: str, partitions: List[int], owner: str, lease_seconds: int) -> List[int]:
+        """소유 중인 파티션 리스 일괄 연장 - 연장에 성공한 파티션 반환 (오류 시 빈 리스트)"""
+        if not partitions:
+            return []
+        
+        async def _renew_operation(client):
+            lease_keys = [client._get_key(self._partition_lease_key(queue_name, p)) for p in partitions]
+            return await client.eval(self._partition_renew_lua_script, len(lease_keys), *lease_keys,
+                                     owner, str(lease_seconds))
+        
+        result = await self._execute_redis_operation("renew_partitions", _renew_operation)
+        return [p for p, ok in zip(partitions, result or []) if ok]
+    
+    async def release_partition(self, queue_name: str, partition: int, owner: str) -> int:
+        """파티션 리스 반납 - 남은 메시지 수 반환"""
+        async def _release_operation(client):
+            return await client.eval(
+                self._partition_release_lua_script, 2,
+                client._get_key(self._partition_lease_key(queue_name, partition)),
+                client._get_key(self._partition_queue_key(queue_name, partition)),
+                owner
+            )
+        
+        result = await self._execute_redis_operation("release_partition", _release_operation)
+        return int(result or 0)
+    
+    async def peek_partition(self, queue_name: str, partition: int, owner: str,
+                             max_count: int) -> Optional[List[QueueMessage]]:
+        """파티션 앞쪽 최대 max_count개 메시지 조회 (제거하지 않음) - 리스를 잃었거나 오류면 None"""
+        async def _peek_operation(client):
+            raw = await client.eval(
+                self._partition_peek_lua_script, 2,
+                client._get_key(self._partition_queue_key(queue_name, partition)),
+                client._get_key(self._partition_lease_key(queue_name, partition)),
+                owner,
+                str(max_count),
+                client._get_key(self.message_key_pattern.format(message_id="").rstrip(":"))
+            )
+            if raw is None:
+                return None
             
-            if should_requeue and msg.retry_count < msg.max_retries:
-                # 재시도 카운트 증가 후 재큐잉
+            messages = []
+            for i in range(0, len(raw), 2):
+                message_id, fields = raw[i], raw[i + 1]
+                try:
+                    messages.append(self._parse_message(dict(zip(fields[0::2], fields[1::2]))))
+                except (KeyError, ValueError, json.JSONDecodeError) as e:
+                    # 파싱 불가 메시지는 제거 후 건너뜀 (뒤 메시지 순서 유지)
+                    Logger.error(f"Failed to parse message data {message_id}: {e}")
+                    await client.pipeline() \
+                        .list_remove(self._partition_queue_key(queue_name, partition), message_id) \
+                        .delete(self.message_key_pattern.format(message_id=message_id)) \
+                        .execute()
+            return messages
+        
+        return await self._execute_redis_operation("peek_partition", _peek_operation)
+    
+    async def ack_partition(self, messages: List[QueueMessage], partition: int) -> bool:
+        """파티션 메시지 처리 완료 - 리스트에서 제거 + 본문 삭제 (1회 왕복)"""
+        if not messages:
+            return True
+        
+        async def _ack_partition_operation(client):
+            pipe = client.pipeline()
+            for msg in messages:
+                pipe.list_remove(self._partition_queue_key(msg.queue_name, partition), msg.id)
+                pipe.delete(self.message_key_pattern.format(message_id=msg.id))
+            await pipe.execute()
+            return True
+        
+        result = await self._execute_redis_operation("ack_partition", _ack_partition_operation)
+        return result if result is not None else False
+    
+    async def retry_partition(self, message: QueueMessage, partition: int, consumer_id: str) -> bool:
+        """
+        파티션 메시지 처리 실패
+        - 재시도 한도 이내: retry_count 증가, 파티션 앞자리 유지 → True
+        - 한도 초과: DLQ로 이동 후 파티션에서 제거 → False
+        """
+        async def _retry_operation(client, msg):
+            message_key = self.message_key_pattern.format(message_id=msg.id)
+            if msg.retry_count < msg.max_retries:
                 msg.retry_count += 1
-                message_key = self.message_key_pattern.format(message_id=msg.id)
-                await client.set_hash_field(message_key, "retry_count", str(msg.retry_count))
-                
-                # 우선순위 큐에 다시 추가
-                priority_queue_key = self.priority_queue_pattern.format(
-                    queue_name=msg.queue_name,
-                    priority=msg.priority.value
-                )
-                await client.list_push_right(priority_queue_key, msg.id)
-            else:
-                # DLQ로 이동
-                dlq_key = self.dlq_key_pattern.format(queue_name=msg.queue_name)
-                dlq_message = {
-                    "message_id": msg.id,
-                    "original_queue": msg.queue_name,
-                    "failed_at": datetime.now().isoformat(),
-                    "consumer_id": c_id,
-                    "retry_count": str(msg.retry_count)
-                }
-                await client.list_push_right(dlq_key, json.dumps(dlq_message))
-                
-                # 원본 메시지 삭제
-                message_key = self.message_key_pattern.format(message_id=msg.id)
-                await client.delete(message_key)
+                await client.pipeline().set_hash_field(message_key, "retry_count", str(msg.retry_count)).execute()
+                return True
             
+            dlq_message = {
+                "message_id": msg.id,
+                "original_queue": msg.queue_name,
+                "partition": str(partition),
+                "failed_at": datetime.now().isoformat(),
+                "consumer_id": consumer_id,
+                "retry_count": str(msg.retry_count)
+            }
+            await client.pipeline(transaction=True) \
+                .list_push_right(self.dlq_key_pattern.format(queue_name=msg.queue_name), json.dumps(dlq_message)) \
+                .list_remove(self._partition_queue_key(msg.queue_name, partition), msg.id) \
+                .delete(message_key) \
+                .execute()
+            return False
+        
+        result = await self._execute_redis_operation("retry_partition", _retry_operation, message)
+        return bool(result)
+    
+    async def wait_partition_notify(self, queue_name: str, timeout: float):
+        """파티션 메시지 도착 토큰 대기 (BLPOP) - 토큰이 오거나 timeout이면 반환"""
+        async def _wait_operation(client):
+            await client.list_block_pop_left([self.partition_notify_pattern.format(queue_name=queue_name)], timeout)
             return True
         
-        return await self._execute_redis_operation("nack", _nack_operation, message, consumer_id, requeue)
+        if await self._execute_redis_operation("wait_partition_notify", _wait_operation, blocking=True) is None:
+            # Redis 오류 - 바쁜 루프 방지
+            await asyncio.sleep(timeout)
     
     async def cleanup_expired_processing_messages(self, queue_name: str) -> int:
         """만료된 처리 중 메시지들을 큐로 복원"""
@@ -340,63 +821,52 @@ class RedisCacheMessageQueue(IMessageQueue):
         result = await self._execute_redis_operation("cleanup_expired", _cleanup_operation, queue_name)
         return result if result is not None else 0
     
-    async def process_delayed_messages(self) -> int:
-        """지연 실행 시간이 된 메시지들을 큐로 이동"""
-        async def _process_delayed_operation(client):
-            now_timestamp = datetime.now().timestamp()
-            
-            # 현재 시간 이전의 메시지들 조회
-            delayed_messages = await client.sorted_set_range_by_score(
-                self.delayed_key_pattern, 0, now_timestamp, 0, 100
+    async def move_due_delayed(self, max_count: int = 100) -> Optional[Tuple[List[float], int, Optional[float]]]:
+        """
+        실행 시각이 된 지연 메시지를 최대 max_count개 이동 (Lua 1회)
+        반환: (Lua로 이동한 메시지들의 예정 시각, 파이썬 경로로 이동한 이전 형식 메시지 수,
+               남은 메시지 중 가장 이른 실행 시각 또는 None), Redis 오류 시 None
+        """
+        async def _move_operation(client):
+            next_score, moved, legacy = await client.eval(
+                self._move_due_lua_script, 1,
+                client._get_key(self.delayed_key_pattern),
+                repr(time.time()),
+                str(max_count),
+                client._get_key(""),
+                client._get_key(self.message_key_pattern.format(message_id="").rstrip(":")),
+                str(self.NOTIFY_MAX_TOKENS)
             )
+            scores = [float(score) for score in moved]
             
-            processed_count = 0
-            
-            for message_id in delayed_messages:
+            # route_key 없이 등록된 메시지는 파이썬에서 목적지 계산 후 이동
+            for message_id in legacy:
                 try:
-                    # 메시지 상세 정보 조회
-                    message_key = self.message_key_pattern.format(message_id=message_id)
-                    message_data = await client.get_hash_all(message_key)
-                    
-                    if not message_data:
-                        # 메시지가 없으면 delayed set에서 제거
-                        await client.sorted_set_remove(self.delayed_key_pattern, message_id)
-                        continue
-                    
-                    # 메시지를 적절한 큐로 이동
-                    message = QueueMessage(
-                        id=message_data["id"],
-                        queue_name=message_data["queue_name"],
-                        payload=json.loads(message_data["payload"]),
-                        message_type=message_data["message_type"],
-                        priority=MessagePriority(int(message_data["priority"])),
-                        retry_count=int(message_data.get("retry_count", 0)),
-                        max_retries=int(message_data.get("max_retries", 3)),
-                        partition_key=message_data.get("partition_key")
-                    )
-                    
-                    # 우선순위/파티션 큐에 추가
-                    if message.partition_key:
-                        partition_queue_key = f"mq:partition:{message.queue_name}:{hash(message.partition_key) % 16}"
-                        await client.list_push_right(partition_queue_key, message.id)
-                    else:
-                        priority_queue_key = self.priority_queue_pattern.format(
-                            queue_name=message.queue_name,
-                            priority=message.priority.value
-                        )
-                        await client.list_push_right(priority_queue_key, message.id)
-                    
-                    # delayed sorted set에서 제거
-                    await client.sorted_set_remove(self.delayed_key_pattern, message_id)
-                    processed_count += 1
-                    
-                except Exception as e:
+                    message = self._parse_message(await client.get_hash_all(
+                        self.message_key_pattern.format(message_id=message_id)
+                    ))
+                    route_key, notify_key = self._route_of(message)
+                    await client.pipeline(transaction=True) \
+                        .list_push_right(route_key, message_id) \
+                        .list_push_right(notify_key, "1") \
+                        .list_trim(notify_key, -self.NOTIFY_MAX_TOKENS, -1) \
+                        .sorted_set_remove(self.delayed_key_pattern, message_id) \
+                        .execute()
+                except (KeyError, ValueError, json.JSONDecodeError) as e:
                     Logger.error(f"지연 메시지 처리 실패: {message_id} - {e}")
+                    await client.pipeline().sorted_set_remove(self.delayed_key_pattern, message_id).execute()
             
-            return processed_count
+            if legacy:
+                # 이동 전 기준의 다음 시각이므로 즉시 다시 확인
+                next_score = repr(time.time())
+            return scores, len(legacy), float(next_score) if next_score else None
         
-        result = await self._execute_redis_operation("process_delayed_messages", _process_delayed_operation)
-        return result if result is not None else 0
+        return await self._execute_redis_operation("move_due_delayed", _move_operation)
+    
+    async def process_delayed_messages(self) -> int:
+        """지연 실행 시간이 된 메시지들을 큐로 이동 (1회)"""
+        result = await self.move_due_delayed()
+        return len(result[0]) + result[1] if result else 0
     
     async def get_queue_stats(self, queue_name: str) -> Dict[str, Any]:
         """큐 통계 조회"""
@@ -424,20 +894,65 @@ class RedisCacheMessageQueue(IMessageQueue):
             delayed_count = await client.sorted_set_length(self.delayed_key_pattern)
             stats["delayed_count"] = delayed_count
             
+            # 파티션별 깊이/지연(맨 앞 메시지 대기 시간)/소유자
+            stats["partition_count"] = self.partition_count
+            stats["partitions"] = await self._get_partition_stats(client, q_name)
+            stats["partitioned_total"] = sum(p["depth"] for p in stats["partitions"].values())
+            
             return stats
         
         result = await self._execute_redis_operation("get_queue_stats", _get_stats_operation, queue_name)
         return result if result is not None else {}
+    
+    async def _get_partition_stats(self, client, queue_name: str) -> Dict[int, Dict[str, Any]]:
+        """파티션별 depth, lag_ms(맨 앞 메시지 생성 후 경과), owner - 2회 왕복"""
+        pipe = client.pipeline()
+        for partition in range(self.partition_count):
+            pipe.list_length(self._partition_queue_key(queue_name, partition))
+            pipe.list_index(self._partition_queue_key(queue_name, partition), 0)
+            pipe.get_string(self._partition_lease_key(queue_name, partition))
+        results = await pipe.execute()
+        
+        heads = {}
+        pipe = client.pipeline()
+        for partition in range(self.partition_count):
+            head_id = results[partition * 3 + 1]
+            if head_id:
+                heads[partition] = head_id
+                pipe.hash_get(self.message_key_pattern.format(message_id=head_id), "created_at")
+        created = dict(zip(heads.keys(), await pipe.execute())) if heads else {}
+        
+        now = datetime.now()
+        partitions = {}
+        for partition in range(self.partition_count):
+            lag_ms = 0.0
+            if created.get(partition):
+                try:
+                    lag_ms = max((now - datetime.fromisoformat(created[partition])).total_seconds() * 1000.0, 0.0)
+                except ValueError:
+                    pass
+            partitions[partition] = {
+                "depth": int(results[partition * 3] or 0),
+                "lag_ms": lag_ms,
+                "owner": results[partition * 3 + 2]
+            }
+        return partitions
 
 
 class MessageQueueManager:
     """메시지큐 매니저"""
     
-    def __init__(self, cache_service):
+    def __init__(self, cache_service, config: Optional[QueueConfig] = None):
         self.cache_service = cache_service
+        self.config = config or QueueConfig()
         # MessageQueue를 CacheService 사용하도록 수정
-        self.message_queue = RedisCacheMessageQueue(cache_service)
+        self.message_queue = RedisCacheMessageQueue(cache_service, self.config)
         self.consumers: Dict[str, 'MessageConsumer'] = {}
+        self.delayed_scheduler = DelayedMessageScheduler(
+            self.message_queue,
+            batch_size=self.config.delayed_batch_size,
+            max_idle_seconds=self.config.delayed_max_idle_seconds
+        )
     
     async def create_queue(self, queue_name: str, config: Optional[Dict[str, Any]] = None):
         """큐 생성 및 설정"""
@@ -462,13 +977,21 @@ class MessageQueueManager:
             Logger.error(f"메시지큐 생성 실패: {queue_name} - {e}")
     
     async def register_consumer(self, queue_name: str, consumer_id: str, 
-                             handler: Callable[[QueueMessage], bool]) -> 'MessageConsumer':
-        """소비자 등록"""
+                             handler: Callable[[QueueMessage], bool],
+                             batch_size: int = 1, concurrency: int = 1,
+                             block_timeout: float = 0.0, partition_workers: int = 0) -> 'MessageConsumer':
+        """소비자 등록 (batch_size/concurrency/block_timeout 지정 시 배치 모드, partition_workers > 0이면 파티션 소비 병행)"""
         consumer = MessageConsumer(
             queue_name=queue_name,
             consumer_id=consumer_id,
             message_queue=self.message_queue,
-            handler=handler
+            handler=handler,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            block_timeout=block_timeout,
+            partition_workers=partition_workers,
+            partition_lease_seconds=self.config.partition_lease_seconds,
+            partition_poll_interval=self.config.partition_poll_interval
         )
         
         self.consumers[f"{queue_name}:{consumer_id}"] = consumer
@@ -497,6 +1020,9 @@ class MessageQueueManager:
         Logger.info(f"MessageQueueManager graceful shutdown 시작 (timeout: {timeout_seconds}초)")
         
         try:
+            # 0. 지연 메시지 이동 중단
+            await self.stop_delayed_message_processor()
+            
             # 1. 모든 컨슈머에게 새로운 메시지 수신 중단 신호
             shutdown_tasks = []
             for consumer_key, consumer in self.consumers.items():
@@ -554,18 +1080,12 @@ class MessageQueueManager:
             return 0
     
     async def start_delayed_message_processor(self):
-        """지연 메시지 처리기 시작"""
-        async def process_delayed():
-            while True:
-                try:
-                    await self.message_queue.process_delayed_messages()
-                    await asyncio.sleep(10)  # 10초마다 확인
-                except Exception as e:
-                    Logger.error(f"지연 메시지 처리기 오류: {e}")
-                    await asyncio.sleep(30)
-        
-        asyncio.create_task(process_delayed())
-        Logger.info("지연 메시지 처리기 시작")
+        """지연 메시지 처리기 시작 (다음 실행 시각까지 대기 + 등록 알림으로 조기 기상)"""
+        await self.delayed_scheduler.start()
+    
+    async def stop_delayed_message_processor(self):
+        """지연 메시지 처리기 중지"""
+        await self.delayed_scheduler.stop()
     
     async def start_expired_message_cleanup(self):
         """만료된 처리 중 메시지 정리기 시작"""
@@ -596,16 +1116,55 @@ class MessageQueueManager:
 
 
 class MessageConsumer:
-    """메시지 소비자"""
+    """
+    메시지 소비자
+    - 기본 모드: 1건씩 dequeue → 처리 → ack/nack, 큐가 비면 1초 대기
+    - 배치 모드 (batch_size > 1, concurrency > 1 또는 block_timeout > 0):
+      1회 왕복으로 최대 batch_size건 확보, 큐가 비면 서버 측 블로킹 대기,
+      핸들러는 최대 concurrency개 태스크로 동시 실행, ack/nack는 모아서 일괄 전송
+    - 파티션 소비 (partition_workers > 0, 위 모드와 병행):
+      partition_key 메시지의 파티션을 리스로 점유하여 파티션당 워커 1개가 순서대로 처리,
+      서로 다른 파티션은 최대 partition_workers개까지 동시 처리
+    """
+    
+    # 블로킹 대기 상한 (Redis socket_timeout 30초보다 작아야 함)
+    MAX_BLOCK_TIMEOUT = 25.0
+    # ack/nack 일괄 전송 실패 시 재전송 대기 (초)
+    FLUSH_RETRY_DELAY = 1.0
     
     def __init__(self, queue_name: str, consumer_id: str, 
-                 message_queue: IMessageQueue, handler: Callable[[QueueMessage], bool]):
+                 message_queue: IMessageQueue, handler: Callable[[QueueMessage], bool],
+                 batch_size: int = 1, concurrency: int = 1, block_timeout: float = 0.0,
+                 partition_workers: int = 0, partition_lease_seconds: int = 30,
+                 partition_poll_interval: float = 1.0):
         self.queue_name = queue_name
         self.consumer_id = consumer_id
         self.message_queue = message_queue
         self.handler = handler
+        self.batch_size = max(1, batch_size)
+        self.concurrency = max(1, concurrency)
+        self.block_timeout = min(max(0.0, block_timeout), self.MAX_BLOCK_TIMEOUT)
+        self.partition_workers = max(0, partition_workers)
+        self.partition_lease_seconds = max(3, partition_lease_seconds)
+        self.partition_poll_interval = min(max(0.1, partition_poll_interval), self.MAX_BLOCK_TIMEOUT)
         self.running = False
         self.task: Optional[asyncio.Task] = None
+        self.partition_task: Optional[asyncio.Task] = None
+        
+        # 파티션 소비 상태 (파티션 번호 → 워커 태스크)
+        self._partition_owner = f"{consumer_id}:{uuid.uuid4().hex[:8]}"
+        self._partition_tasks: Dict[int, asyncio.Task] = {}
+        
+        # 배치 모드 상태
+        self._pending_acks: List[QueueMessage] = []
+        self._pending_nacks: List[QueueMessage] = []
+        self._flush_event = asyncio.Event()
+        self.stats = {"received": 0, "acked": 0, "nacked": 0, "batches": 0,
+                      "partition_acquired": 0, "partition_lost": 0}
+    
+    @property
+    def batch_mode(self) -> bool:
+        return self.batch_size > 1 or self.concurrency > 1 or self.block_timeout > 0
     
     async def start(self):
         """소비자 시작"""
@@ -614,17 +1173,20 @@ class MessageConsumer:
         
         self.running = True
         self.task = asyncio.create_task(self._consume_loop())
+        if self.partition_workers > 0:
+            self.partition_task = asyncio.create_task(self._partition_loop())
         Logger.info(f"메시지 소비자 시작: {self.queue_name}:{self.consumer_id}")
     
     async def stop(self):
         """소비자 중지"""
         self.running = False
-        if self.task:
-            self.task.cancel()
-            try:
-                await self.task
-            except asyncio.CancelledError:
-                pass
+        for task in (self.task, self.partition_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         
         Logger.info(f"메시지 소비자 중지: {self.queue_name}:{self.consumer_id}")
     
@@ -637,15 +1199,17 @@ class MessageConsumer:
             self.running = False
             
             # 2. 현재 처리 중인 메시지 완료까지 대기 (timeout 설정)
-            if self.task and not self.task.done():
+            for task in (self.task, self.partition_task):
+                if not task or task.done():
+                    continue
                 try:
-                    await asyncio.wait_for(self.task, timeout=timeout_seconds)
+                    await asyncio.wait_for(asyncio.shield(task), timeout=timeout_seconds)
                     Logger.info(f"소비자 {self.consumer_id} 정상 종료 완료")
                 except asyncio.TimeoutError:
                     Logger.warn(f"소비자 {self.consumer_id} timeout ({timeout_seconds}초) - 강제 종료")
-                    self.task.cancel()
+                    task.cancel()
                     try:
-                        await self.task
+                        await task
                     except asyncio.CancelledError:
                         pass
                 except Exception as e:
@@ -660,6 +1224,10 @@ class MessageConsumer:
     
     async def _consume_loop(self):
         """메시지 소비 루프"""
+        if self.batch_mode:
+            await self._consume_batch_loop()
+            return
+        
         Logger.info(f"메시지 소비 루프 시작: {self.queue_name}:{self.consumer_id}")
         loop_count = 0
         
@@ -699,4 +1267,241 @@ class MessageConsumer:
                 Logger.error(f"메시지 소비 루프 오류: {self.queue_name}:{self.consumer_id} - {e}")
                 await asyncio.sleep(5)
         
-        Logger.info(f"메시지 소비 루프 종료: {self.queue_name}:{self.consumer_id}")
\ No newline at end of file
+        Logger.info(f"메시지 소비 루프 종료: {self.queue_name}:{self.consumer_id}")
+    
+    async def _consume_batch_loop(self):
+        """배치 모드 소비 루프 - 빈 슬롯만큼 확보하여 태스크로 실행"""
+        Logger.info(f"메시지 배치 소비 루프 시작: {self.queue_name}:{self.consumer_id} "
+                    f"(batch={self.batch_size}, concurrency={self.concurrency}, block={self.block_timeout}s)")
+        in_flight: Set[asyncio.Task] = set()
+        self._flush_event = asyncio.Event()
+        flusher = asyncio.create_task(self._flush_loop())
+        
+        try:
+            while self.running:
+                try:
+                    capacity = self.concurrency - len(in_flight)
+                    if capacity <= 0:
+                        await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                        continue
+                    
+                    messages = await self.message_queue.dequeue_batch(
+                        self.queue_name, self.consumer_id, min(self.batch_size, capacity), self.block_timeout
+                    )
+                    if messages is None:
+                        # Redis 오류 - 재시도 전 대기
+                        await asyncio.sleep(1)
+                        continue
+                    if not messages:
+                        if self.block_timeout <= 0:
+                            await asyncio.sleep(1)
+                        continue
+                    
+                    self.stats["received"] += len(messages)
+                    self.stats["batches"] += 1
+                    Logger.debug("메시지 %d건 수신: %s", len(messages), self.queue_name)
+                    for message in messages:
+                        task = asyncio.create_task(self._handle_message(message))
+                        in_flight.add(task)
+                        task.add_done_callback(in_flight.discard)
+                
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    Logger.error(f"메시지 소비 루프 오류: {self.queue_name}:{self.consumer_id} - {e}")
+                    await asyncio.sleep(5)
+            
+            # 정상 종료: 처리 중인 메시지 완료 대기
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+        
+        except asyncio.CancelledError:
+            # 강제 종료: 처리 중 메시지는 visibility timeout 후 복원됨
+            for task in in_flight:
+                task.cancel()
+            raise
+        
+        finally:
+            flusher.cancel()
+            try:
+                await flusher
+            except asyncio.CancelledError:
+                pass
+            if not await self._flush_results():
+                # 남은 처리 중 메시지는 visibility timeout 후 재전달됨
+                Logger.warn(f"종료 시 ack/nack 전송 실패: {self.queue_name}:{self.consumer_id} "
+                            f"(ack {len(self._pending_acks)}건, nack {len(self._pending_nacks)}건)")
+            Logger.info(f"메시지 배치 소비 루프 종료: {self.queue_name}:{self.consumer_id}")
+    
+    async def _invoke_handler(self, message: QueueMessage) -> bool:
+        try:
+            if asyncio.iscoroutinefunction(self.handler):
+                return bool(await self.handler(message))
+            return bool(self.handler(message))
+        except Exception as e:
+            Logger.error(f"메시지 처리 중 오류: {message.id} - {e}")
+            return False
+    
+    async def _handle_message(self, message: QueueMessage):
+        """핸들러 실행 후 결과를 ack/nack 버퍼에 적재"""
+        success = await self._invoke_handler(message)
+        
+        if success:
+            self._pending_acks.append(message)
+        else:
+            Logger.warn(f"메시지 처리 실패: {message.id}")
+            self._pending_nacks.append(message)
+        self._flush_event.set()
+    
+    async def _flush_loop(self):
+        """ack/nack 버퍼를 모아서 전송 (전송 중 쌓인 결과는 다음 회차에 함께 전송, 실패분은 잠시 후 재전송)"""
+        while True:
+            await self._flush_event.wait()
+            self._flush_event.clear()
+            if not await self._flush_results():
+                await asyncio.sleep(self.FLUSH_RETRY_DELAY)
+                self._flush_event.set()
+    
+    async def _flush_results(self) -> bool:
+        """ack/nack 버퍼 전송 - 둘은 독립적으로 전송하고 실패한 쪽은 버퍼에 되돌림 (모두 성공 시 True)"""
+        acks_ok = await self._flush_buffer("_pending_acks", self.message_queue.ack_batch, "acked")
+        nacks_ok = await self._flush_buffer("_pending_nacks", self.message_queue.nack_batch, "nacked")
+        return acks_ok and nacks_ok
+    
+    async def _flush_buffer(self, buffer_name: str, send, stat_name: str) -> bool:
+        items = getattr(self, buffer_name)
+        if not items:
+            return True
+        setattr(self, buffer_name, [])
+        try:
+            sent = await send(items, self.consumer_id)
+        except Exception as e:
+            Logger.error(f"{stat_name} 일괄 전송 오류: {self.queue_name}:{self.consumer_id} - {e}")
+            sent = False
+        if not sent:
+            # 전송 중 새로 쌓인 결과 앞에 되돌려 다음 회차에 재전송
+            setattr(self, buffer_name, items + getattr(self, buffer_name))
+            return False
+        self.stats[stat_name] += len(items)
+        return True
+    
+    async def _partition_loop(self):
+        """
+        파티션 코디네이터
+        - 소유 파티션 리스 연장 (lease/3 주기), 연장 실패 파티션의 워커는 중지
+        - 빈 슬롯만큼 대기 메시지가 있는 무소유 파티션의 리스를 획득하여 워커 시작
+        - 파티션 메시지 도착 토큰(BLPOP) 또는 poll_interval까지 대기
+        """
+        Logger.info(f"파티션 소비 루프 시작: {self.queue_name}:{self.consumer_id} (workers={self.partition_workers})")
+        renew_interval = self.partition_lease_seconds / 3.0
+        last_renew = time.monotonic()
+        
+        try:
+            while self.running:
+                try:
+                    if self._partition_tasks and time.monotonic() - last_renew >= renew_interval:
+                        last_renew = time.monotonic()
+                        owned = list(self._partition_tasks.keys())
+                        renewed = set(await self.message_queue.renew_partitions(
+                            self.queue_name, owned, self._partition_owner, self.partition_lease_seconds
+                        ))
+                        for partition in owned:
+                            if partition not in renewed and partition in self._partition_tasks:
+                                Logger.warn(f"파티션 리스 상실: {self.queue_name}:{partition}")
+                                self.stats["partition_lost"] += 1
+                                self._partition_tasks.pop(partition).cancel()
+                    
+                    free = self.partition_workers - len(self._partition_tasks)
+                    if free > 0:
+                        for partition in await self.message_queue.get_ready_partitions(self.queue_name):
+                            if free <= 0:
+                                break
+                            if partition in self._partition_tasks:
+                                continue
+                            if await self.message_queue.acquire_partition(
+                                self.queue_name, partition, self._partition_owner, self.partition_lease_seconds
+                            ):
+                                self.stats["partition_acquired"] += 1
+                                self._partition_tasks[partition] = asyncio.create_task(self._run_partition(partition))
+                                free -= 1
+                    
+                    await self.message_queue.wait_partition_notify(
+                        self.queue_name, min(self.partition_poll_interval, renew_interval)
+                    )
+                
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    Logger.error(f"파티션 소비 루프 오류: {self.queue_name}:{self.consumer_id} - {e}")
+                    await asyncio.sleep(5)
+            
+            # 정상 종료: 처리 중인 파티션 워커 완료 대기 (워커가 리스 반납)
+            if self._partition_tasks:
+                await asyncio.gather(*self._partition_tasks.values(), return_exceptions=True)
+        
+        finally:
+            for task in self._partition_tasks.values():
+                task.cancel()
+            for partition in list(self._partition_tasks.keys()):
+                await self.message_queue.release_partition(self.queue_name, partition, self._partition_owner)
+            self._partition_tasks.clear()
+            Logger.info(f"파티션 소비 루프 종료: {self.queue_name}:{self.consumer_id}")
+    
+    async def _run_partition(self, partition: int):
+        """
+        파티션 워커 - 앞쪽부터 batch_size개씩 조회하여 순서대로 처리
+        - 성공한 메시지는 모아서 제거, 실패 시 해당 메시지에서 멈추고 backoff 후 재시도 (뒤 메시지 대기)
+        - 파티션이 비면 리스 반납 후 종료 (반납 직후 들어온 메시지가 있으면 재획득)
+        """
+        try:
+            while self.running:
+                messages = await self.message_queue.peek_partition(
+                    self.queue_name, partition, self._partition_owner, self.batch_size
+                )
+                if messages is None:
+                    # 리스 상실 또는 Redis 오류
+                    self.stats["partition_lost"] += 1
+                    return
+                
+                if not messages:
+                    remaining = await self.message_queue.release_partition(
+                        self.queue_name, partition, self._partition_owner
+                    )
+                    if remaining and self.running and await self.message_queue.acquire_partition(
+                        self.queue_name, partition, self._partition_owner, self.partition_lease_seconds
+                    ):
+                        continue
+                    return
+                
+                self.stats["received"] += len(messages)
+                self.stats["batches"] += 1
+                done: List[QueueMessage] = []
+                failed: Optional[QueueMessage] = None
+                for message in messages:
+                    if not self.running:
+                        break
+                    if await self._invoke_handler(message):
+                        done.append(message)
+                    else:
+                        failed = message
+                        break
+                
+                if done:
+                    await self.message_queue.ack_partition(done, partition)
+                    self.stats["acked"] += len(done)
+                
+                if failed is not None:
+                    self.stats["nacked"] += 1
+                    Logger.warn(f"파티션 메시지 처리 실패: {failed.id} ({self.queue_name}:{partition})")
+                    if await self.message_queue.retry_partition(failed, partition, self.consumer_id):
+                        await asyncio.sleep(min(2 ** failed.retry_count, 30))
+        
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            Logger.error(f"파티션 워커 오류: {self.queue_name}:{partition} - {e}")
+        
+        finally:
+            if self._partition_tasks.get(partition) is asyncio.current_task():
+                self._partition_tasks.pop(partition, None)
+                await self.message_queue.release_partition(self.queue_name, partition, self._partition_owner)
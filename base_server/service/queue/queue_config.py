@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+
+class QueueConfig(BaseModel):
+    event_queue_backend: str = "list"             # 이벤트큐 구현: "list"(구독자별 리스트) | "stream"(Redis Streams + Consumer Group)
+    stream_maxlen: int = 100000                   # 이벤트 타입별 스트림 최대 길이 (XADD MAXLEN ~)
+    stream_block_ms: int = 5000                   # XREADGROUP 블로킹 대기 (socket_timeout 30초보다 작게)
+    stream_read_count: int = 100                  # 1회 읽기 최대 엔트리 수
+    stream_reclaim_idle_ms: int = 60000           # 이 시간 이상 미확인된 엔트리는 재처리 대상
+    stream_reclaim_interval_seconds: float = 30.0 # pending 엔트리 회수 주기
+    stream_max_deliveries: int = 5                # 최대 전달 횟수 (초과 시 DLQ 스트림으로 이동)
+    stream_consumer_prune_idle_ms: int = 3600000  # pending 없이 이 시간 이상 유휴인 다른 인스턴스 컨슈머는 그룹에서 삭제
+    partition_count: int = 16                     # partition_key 메시지 파티션 수 (변경 시 큐를 비운 뒤 적용)
+    partition_lease_seconds: int = 30             # 파티션 소유 리스 (lease/3 주기로 연장)
+    partition_poll_interval: float = 1.0          # 파티션 코디네이터 최대 대기 (도착 토큰이 오면 즉시 깨어남)
+    delayed_batch_size: int = 100                 # 지연 메시지 Lua 1회 이동 최대 수
+    delayed_max_idle_seconds: float = 60.0        # 지연 메시지가 없을 때 확인 주기 (등록 알림 유실 대비)
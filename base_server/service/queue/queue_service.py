@@ -3,7 +3,7 @@
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from datetime import datetime
 
 from service.core.logger import Logger
@@ -14,6 +14,7 @@ from service.scheduler.base_scheduler import ScheduleJob, ScheduleType
 
 from .message_queue import MessageQueueManager, QueueMessage, MessagePriority
 from .event_queue import EventQueueManager, EventType, Event
+from .queue_config import QueueConfig
 
 
 class QueueService:
@@ -46,8 +47,8 @@ class QueueService:
         return cls._instance
     
     @classmethod
-    async def initialize(cls, db_service) -> bool:
-        """큐 서비스 초기화"""
+    async def initialize(cls, db_service, config: Optional[QueueConfig] = None) -> bool:
+        """큐 서비스 초기화 (config 미지정 시 기본값 - 리스트 기반 이벤트큐)"""
         try:
             if cls._initialized:
                 Logger.warn("QueueService가 이미 초기화되었습니다")
@@ -63,8 +64,8 @@ class QueueService:
                 return False
             
             # 각 컴포넌트 초기화 (CacheService를 통해 클라이언트 사용)
-            instance.message_queue_manager = MessageQueueManager(cache_service)
-            instance.event_queue_manager = EventQueueManager(cache_service)
+            instance.message_queue_manager = MessageQueueManager(cache_service, config)
+            instance.event_queue_manager = EventQueueManager(cache_service, config)
             instance.outbox_service = OutboxService(db_service)
             
             # 이벤트큐 매니저 초기화
@@ -120,8 +121,9 @@ class QueueService:
             # 인스턴스가 있으면 소비자들 중지
             if cls._instance:
                 try:
-                    # 모든 메시지 소비자 중지
+                    # 지연 메시지 스케줄러 및 모든 메시지 소비자 중지
                     if hasattr(cls._instance, 'message_queue_manager') and cls._instance.message_queue_manager:
+                        await cls._instance.message_queue_manager.stop_delayed_message_processor()
                         await cls._instance.message_queue_manager.stop_all_consumers()
                         Logger.info("모든 메시지 소비자 중지 완료")
                     
@@ -145,35 +147,12 @@ class QueueService:
             Logger.error(f"QueueService 종료 중 오류: {e}")
     
     async def _start_delayed_message_processor_with_check(self):
-        """CacheService 연결 체크를 포함한 지연 메시지 처리기 시작"""
-        async def process_delayed_with_cache_check():
-            while self.__class__._initialized:  # 서비스 초기화 상태 확인
-                try:
-                    # CacheService 연결 상태 확인
-                    cache_service = CacheService.get_instance()
-                    if not cache_service.is_initialized():
-                        Logger.debug("CacheService가 초기화되지 않음. 지연 메시지 처리 건너뜀")
-                        await asyncio.sleep(30)
-                        continue
-                    
-                    # 연결 상태 테스트
-                    health_check = await cache_service.health_check()
-                    if not health_check.get("healthy", False):
-                        Logger.debug(f"Redis 연결 불안정: {health_check.get('error', 'Unknown')}. 지연 메시지 처리 건너뜀")
-                        await asyncio.sleep(30)
-                        continue
-                    
-                    # 정상 처리
-                    await self.message_queue_manager.message_queue.process_delayed_messages()
-                    await asyncio.sleep(10)  # 10초마다 확인
-                    
-                except Exception as e:
-                    Logger.error(f"지연 메시지 처리기 오류: {e}")
-                    await asyncio.sleep(30)
-            
-            Logger.debug("지연 메시지 처리기 종료")
-        
-        asyncio.create_task(process_delayed_with_cache_check())
+        """지연 메시지 스케줄러 시작 (Redis 연결 오류 시 스케줄러가 백오프 재연결)"""
+        cache_service = CacheService.get_instance()
+        if not cache_service.is_initialized():
+            Logger.warn("CacheService가 초기화되지 않음. 지연 메시지 스케줄러 시작 건너뜀")
+            return
+        await self.message_queue_manager.start_delayed_message_processor()
     
     async def _setup_outbox_event_integration(self):
         """아웃박스 패턴과 이벤트큐 통합 설정"""
@@ -271,12 +250,51 @@ class QueueService:
             self.stats["errors"] += 1
             return False
     
+    async def send_messages(self, queue_name: str, items: List[Tuple[Dict[str, Any], str, MessagePriority]]) -> bool:
+        """메시지 일괄 전송 - items: (payload, message_type, priority), Redis 1회 왕복"""
+        if not items:
+            return True
+        try:
+            messages = [
+                QueueMessage(
+                    id=None,  # 자동 생성
+                    queue_name=queue_name,
+                    payload=payload,
+                    message_type=message_type,
+                    priority=priority
+                )
+                for payload, message_type, priority in items
+            ]
+            
+            success = await self.message_queue_manager.message_queue.enqueue_batch(messages)
+            
+            if success:
+                self.stats["messages_processed"] += len(messages)
+                Logger.debug("메시지 일괄 전송 완료: %s (%d건)", queue_name, len(messages))
+            
+            return success
+            
+        except Exception as e:
+            Logger.error(f"메시지 일괄 전송 실패: {queue_name} - {e}")
+            self.stats["errors"] += 1
+            return False
+    
     async def register_message_consumer(self, queue_name: str, consumer_id: str,
-                                       handler: Callable[[QueueMessage], bool]) -> bool:
-        """메시지 소비자 등록"""
+                                       handler: Callable[[QueueMessage], bool],
+                                       batch_size: int = 1, concurrency: int = 1,
+                                       block_timeout: float = 0.0, partition_workers: int = 0) -> bool:
+        """
+        메시지 소비자 등록
+        - batch_size: 1회 왕복으로 가져올 최대 메시지 수
+        - concurrency: 동시에 실행할 핸들러 수
+        - block_timeout: 큐가 비었을 때 서버 측 블로킹 대기 시간 (초, 0이면 1초 폴링)
+        - partition_workers: partition_key 메시지를 동시에 처리할 파티션 수 (0이면 파티션 메시지 미소비)
+        """
         try:
             consumer = await self.message_queue_manager.register_consumer(
-                queue_name, consumer_id, handler
+                queue_name, consumer_id, handler,
+                batch_size=batch_size, concurrency=concurrency, block_timeout=block_timeout,
+                partition_workers=partition_workers
             )
             
             await consumer.start()
@@ -523,9 +541,12 @@ class QueueService:
         return self.stats.copy()
     
     async def get_queue_stats(self, queue_name: str) -> Dict[str, Any]:
-        """특정 큐 통계 조회"""
+        """특정 큐 통계 조회 (지연 메시지 스케줄러 지표 포함)"""
         try:
-            return await self.message_queue_manager.message_queue.get_queue_stats(queue_name)
+            stats = await self.message_queue_manager.message_queue.get_queue_stats(queue_name)
+            if stats:
+                stats["delayed_scheduler"] = self.message_queue_manager.delayed_scheduler.get_metrics()
+            return stats
         except Exception as e:
             Logger.error(f"큐 통계 조회 실패: {queue_name} - {e}")
             return {}
@@ -617,6 +638,6 @@ def get_queue_service() -> QueueService:
     return QueueService.get_instance()
 
 
-async def initialize_queue_service(db_service) -> bool:
+async def initialize_queue_service(db_service, config: Optional[QueueConfig] = None) -> bool:
     """QueueService 초기화"""
-    return await QueueService.initialize(db_service)
\ No newline at end of file
+    return await QueueService.initialize(db_service, config)
\ No newline at end of file
@@ -0,0 +1,411 @@
+"""
+Redis Streams 기반 이벤트큐
+- 이벤트 타입별 Stream 1개 (XADD MAXLEN ~ 트리밍)
+- 구독자(subscriber_id)별 Consumer Group - 여러 인스턴스의 같은 구독자는 부하 분산
+- 블로킹 XREADGROUP으로 대기 (폴링 없음)
+- 처리 실패/인스턴스 종료로 남은 pending 엔트리는 XCLAIM으로 회수, 한도 초과 시 DLQ Stream으로 이동
+- 컨슈머 이름은 프로세스마다 새로 생성 - 구독 해제 시 자기 컨슈머를, 회수 주기마다 종료된 인스턴스의 컨슈머를 삭제
+"""
+
+import os
+import time
+import uuid
+import socket
+import asyncio
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from service.core.logger import Logger
+from service.core.latency_histogram import LatencyHistogram
+from .queue_config import QueueConfig
+from .event_queue import IEventQueue, Event, EventType, Subscription, serialize_event, deserialize_event
+
+
+class RedisStreamEventQueue(IEventQueue):
+    """CacheService를 사용하는 Redis Streams 이벤트큐"""
+
+    def __init__(self, cache_service, config: Optional[QueueConfig] = None):
+        self.cache_service = cache_service
+        self.config = config or QueueConfig()
+
+        # Redis 키 패턴
+        self.event_stream_pattern = "eq:stream:{event_type}"
+        self.dead_letter_pattern = "eq:dlq:{event_type}"
+
+        # 인스턴스 내 컨슈머 이름 (Consumer Group 안에서 유일)
+        self.consumer_name = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        # 구독자 정보
+        self.subscriptions: Dict[str, Subscription] = {}
+        self.active_subscribers: Set[str] = set()
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+        # 이벤트 처리 통계
+        self.event_stats = {
+            "published": 0,
+            "delivered": 0,
+            "failed": 0,
+            "reclaimed": 0,
+            "dead_lettered": 0,
+            "consumers_pruned": 0
+        }
+        # 구독자별 전달 지연 (발행 → 콜백 완료, ms)
+        self._delivery_lag: Dict[str, LatencyHistogram] = {}
+
+    async def _execute_redis_operation(self, operation_name: str, operation_func, *args, blocking: bool = False, **kwargs):
+        """Redis 작업을 CacheService를 통해 안전하게 실행 (blocking=True면 블로킹 전용 풀 사용)"""
+        try:
+            if not self.cache_service.is_initialized():
+                Logger.warn(f"Redis operation {operation_name} failed: CacheService is not initialized")
+                return None
+
+            get_client = self.cache_service.get_blocking_client if blocking else self.cache_service.get_client
+            async with get_client() as client:
+                return await operation_func(client, *args, **kwargs)
+        except Exception as e:
+            Logger.error(f"Redis operation {operation_name} failed: {e}")
+            return None
+
+    def _stream_key(self, event_type: EventType) -> str:
+        return self.event_stream_pattern.format(event_type=event_type.value)
+
+    async def publish(self, event: Event) -> bool:
+        """이벤트 발행 - 타입별 Stream에 1회 XADD (구독자 수와 무관)"""
+        async def _publish_operation(client, evt):
+            return await client.stream_add(
+                self._stream_key(evt.event_type),
+                {"event": serialize_event(evt)},
+                maxlen=self.config.stream_maxlen
+            )
+
+        entry_id = await self._execute_redis_operation("publish", _publish_operation, event)
+        if not entry_id:
+            return False
+
+        self.event_stats["published"] += 1
+        Logger.debug("이벤트 발행: %s (%s)", event.event_type.value, entry_id)
+        return True
+
+    async def _ensure_groups(self, subscription: Subscription) -> bool:
+        """구독 타입별 Consumer Group 생성 (이미 있으면 유지 - 재시작 시 이어서 소비)"""
+        async def _create_operation(client):
+            for event_type in subscription.event_types:
+                await client.stream_create_group(
+                    self._stream_key(event_type), subscription.subscriber_id, start_id="$", mkstream=True
+                )
+            return True
+
+        return bool(await self._execute_redis_operation("stream_create_group", _create_operation))
+
+    async def subscribe(self, subscription: Subscription) -> bool:
+        """이벤트 구독"""
+        try:
+            if not await self._ensure_groups(subscription):
+                return False
+
+            self.subscriptions[subscription.id] = subscription
+            self.active_subscribers.add(subscription.subscriber_id)
+            self._delivery_lag.setdefault(subscription.subscriber_id, LatencyHistogram())
+
+            # 구독자 이벤트 처리 태스크 시작
+            self._tasks[subscription.id] = asyncio.create_task(self._process_subscriber_events(subscription))
+
+            Logger.info(f"이벤트 구독 등록(stream): {subscription.subscriber_id} ({len(subscription.event_types)}개 타입)")
+            return True
+
+        except Exception as e:
+            Logger.error(f"이벤트 구독 실패: {subscription.subscriber_id} - {e}")
+            return False
+
+    async def unsubscribe(self, subscription_id: str) -> bool:
+        """구독 해제 - Consumer Group은 남겨두어 재구독 시 이어서 소비"""
+        try:
+            subscription = self.subscriptions.pop(subscription_id, None)
+            if subscription is None:
+                return False
+
+            subscription.active = False
+            task = self._tasks.pop(subscription_id, None)
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+            if not any(sub.subscriber_id == subscription.subscriber_id for sub in self.subscriptions.values()):
+                self.active_subscribers.discard(subscription.subscriber_id)
+
+            await self._remove_consumer(subscription)
+
+            Logger.info(f"이벤트 구독 해제: {subscription.subscriber_id}")
+            return True
+
+        except Exception as e:
+            Logger.error(f"이벤트 구독 해제 실패: {subscription_id} - {e}")
+            return False
+
+    async def unsubscribe_all(self):
+        """모든 구독 해제"""
+        try:
+            for subscription_id in list(self.subscriptions.keys()):
+                await self.unsubscribe(subscription_id)
+            self.active_subscribers.clear()
+            Logger.info("모든 구독 해제 완료")
+        except Exception as e:
+            Logger.error(f"모든 구독 해제 중 오류: {e}")
+
+    async def _remove_consumer(self, subscription: Subscription):
+        """
+        해제된 구독의 그룹에서 이 인스턴스 컨슈머 삭제
+        - 같은 그룹/스트림을 읽는 다른 구독이 남아 있으면 유지
+        - pending이 남은 경우 삭제하지 않음 (다른 인스턴스가 XCLAIM으로 회수한 뒤 정리)
+        """
+        group = subscription.subscriber_id
+        in_use = set()
+        for sub in self.subscriptions.values():
+            if sub.subscriber_id == group:
+                in_use.update(sub.event_types)
+
+        for event_type in subscription.event_types - in_use:
+            stream_key = self._stream_key(event_type)
+
+            async def _delete_operation(client):
+                return await client.stream_delete_consumer(stream_key, group, self.consumer_name)
+
+            if not await self._execute_redis_operation("stream_delete_consumer", _delete_operation):
+                Logger.warn(f"컨슈머 삭제 보류 (pending 남음): {group}/{event_type.value} {self.consumer_name}")
+
+    async def _prune_consumers(self, stream_key: str, group: str):
+        """종료된 인스턴스가 남긴 컨슈머 삭제 (pending 없음 + stream_consumer_prune_idle_ms 이상 유휴)"""
+        async def _prune_operation(client):
+            removed = []
+            for consumer in await client.stream_consumer_info(stream_key, group):
+                name = consumer.get("name")
+                # inactive(Redis 7.2+)는 마지막 읽기 시도 기준, 이전 버전은 마지막 전달 기준 idle 사용
+                idle_ms = consumer.get("inactive", consumer.get("idle", 0))
+                if (name == self.consumer_name or consumer.get("pending", 0) > 0
+                        or idle_ms is None or idle_ms < self.config.stream_consumer_prune_idle_ms):
+                    continue
+                # 살아 있는 컨슈머가 삭제되더라도 pending이 없으므로 유실 없이 다음 XREADGROUP에서 다시 생성됨
+                if await client.stream_delete_consumer(stream_key, group, name):
+                    removed.append(name)
+            return removed
+
+        removed = await self._execute_redis_operation("stream_prune_consumers", _prune_operation)
+        if removed:
+            self.event_stats["consumers_pruned"] += len(removed)
+            Logger.info(f"유휴 컨슈머 삭제: {group} {removed}")
+
+    async def _invoke_callback(self, subscription: Subscription, event: Event) -> bool:
+        try:
+            if asyncio.iscoroutinefunction(subscription.callback):
+                return bool(await subscription.callback(event))
+            return bool(subscription.callback(event))
+        except Exception as e:
+            Logger.error(f"구독자 이벤트 처리 오류: {subscription.subscriber_id} - {e}")
+            return False
+
+    async def _deliver_entries(self, subscription: Subscription, stream_key: str,
+                               entries: List[Tuple[str, Dict[str, str]]]) -> List[str]:
+        """
+        엔트리 순서대로 콜백 실행 - ACK할 엔트리 ID 반환
+        - 성공: ACK
+        - 실패: pending 유지 (reclaim 주기에 재전달)
+        - 파싱 불가: 재시도해도 실패하므로 ACK 후 버림
+        """
+        ack_ids = []
+        lag = self._delivery_lag.setdefault(subscription.subscriber_id, LatencyHistogram())
+        for entry_id, fields in entries:
+            if not fields:
+                # XCLAIM 시 이미 트리밍된 엔트리
+                ack_ids.append(entry_id)
+                continue
+            try:
+                event = deserialize_event(fields["event"])
+            except Exception as e:
+                Logger.error(f"이벤트 파싱 오류: {stream_key}/{entry_id} - {e}")
+                ack_ids.append(entry_id)
+                continue
+
+            if await self._invoke_callback(subscription, event):
+                self.event_stats["delivered"] += 1
+                ack_ids.append(entry_id)
+                # 엔트리 ID의 ms 부분 = 발행 시각
+                lag.record(max(time.time() * 1000.0 - int(entry_id.split("-", 1)[0]), 0.0))
+            else:
+                self.event_stats["failed"] += 1
+        return ack_ids
+
+    async def _ack(self, subscription: Subscription, stream_key: str, ack_ids: List[str]):
+        if not ack_ids:
+            return
+
+        async def _ack_operation(client):
+            return await client.stream_ack(stream_key, subscription.subscriber_id, *ack_ids)
+
+        await self._execute_redis_operation("stream_ack", _ack_operation)
+
+    async def _reclaim_pending(self, subscription: Subscription):
+        """
+        오래된 pending 엔트리 회수
+        - 전달 횟수가 stream_max_deliveries 이상이면 DLQ Stream에 남기고 ACK
+        - 나머지는 현재 컨슈머로 XCLAIM 후 재전달
+        - 회수 후 종료된 인스턴스의 컨슈머 정리
+        """
+        group = subscription.subscriber_id
+        min_idle_ms = self.config.stream_reclaim_idle_ms
+
+        for event_type in subscription.event_types:
+            stream_key = self._stream_key(event_type)
+
+            async def _pending_operation(client):
+                return await client.stream_pending(stream_key, group, self.config.stream_read_count, min_idle_ms)
+
+            pending = await self._execute_redis_operation("stream_pending", _pending_operation)
+            if not pending:
+                await self._prune_consumers(stream_key, group)
+                continue
+
+            dead_ids = [p["message_id"] for p in pending if p["times_delivered"] >= self.config.stream_max_deliveries]
+            retry_ids = [p["message_id"] for p in pending if p["times_delivered"] < self.config.stream_max_deliveries]
+
+            if dead_ids:
+                await self._dead_letter(subscription, event_type, dead_ids)
+
+            if retry_ids:
+                async def _claim_operation(client):
+                    return await client.stream_claim(stream_key, group, self.consumer_name, min_idle_ms, retry_ids)
+
+                claimed = await self._execute_redis_operation("stream_claim", _claim_operation)
+                if claimed:
+                    self.event_stats["reclaimed"] += len(claimed)
+                    ack_ids = await self._deliver_entries(subscription, stream_key, claimed)
+                    await self._ack(subscription, stream_key, ack_ids)
+
+            await self._prune_consumers(stream_key, group)
+
+    async def _dead_letter(self, subscription: Subscription, event_type: EventType, entry_ids: List[str]):
+        """재전달 한도 초과 엔트리를 DLQ Stream으로 이동"""
+        stream_key = self._stream_key(event_type)
+        dlq_key = self.dead_letter_pattern.format(event_type=event_type.value)
+        group = subscription.subscriber_id
+
+        async def _dead_letter_operation(client):
+            # 원본 내용은 XCLAIM(min_idle 0)으로 가져옴 - 트리밍된 엔트리는 빈 필드
+            entries = await client.stream_claim(stream_key, group, self.consumer_name, 0, entry_ids)
+            for entry_id, fields in entries:
+                if fields:
+                    await client.stream_add(dlq_key, {
+                        **fields,
+                        "source_id": entry_id,
+                        "group": group,
+                        "dead_at": str(int(time.time() * 1000))
+                    }, maxlen=self.config.stream_maxlen)
+            return await client.stream_ack(stream_key, group, *entry_ids)
+
+        result = await self._execute_redis_operation("dead_letter", _dead_letter_operation)
+        if result is not None:
+            self.event_stats["dead_lettered"] += len(entry_ids)
+            Logger.warn(f"이벤트 DLQ 이동: {group}/{event_type.value} {len(entry_ids)}건")
+
+    async def _process_subscriber_events(self, subscription: Subscription):
+        """구독자별 이벤트 처리 - XREADGROUP 블로킹 대기"""
+        streams = {self._stream_key(event_type): ">" for event_type in subscription.event_types}
+        last_reclaim = time.monotonic()
+
+        async def _read_operation(client):
+            return await client.stream_read_group(
+                subscription.subscriber_id, self.consumer_name, streams,
+                count=self.config.stream_read_count, block_ms=self.config.stream_block_ms
+            )
+
+        while subscription.active and subscription.id in self.subscriptions:
+            try:
+                if time.monotonic() - last_reclaim >= self.config.stream_reclaim_interval_seconds:
+                    last_reclaim = time.monotonic()
+                    await self._reclaim_pending(subscription)
+
+                batches = await self._execute_redis_operation("stream_read_group", _read_operation, blocking=True)
+                if batches is None:
+                    # 연결 오류 또는 Stream/Group 삭제(NOGROUP) - 그룹 재생성 후 재시도
+                    await asyncio.sleep(1)
+                    await self._ensure_groups(subscription)
+                    continue
+
+                for stream_key, entries in batches:
+                    ack_ids = await self._deliver_entries(subscription, stream_key, entries)
+                    await self._ack(subscription, stream_key, ack_ids)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                Logger.error(f"구독자 이벤트 처리 오류: {subscription.subscriber_id} - {e}")
+                await asyncio.sleep(5)
+
+    async def replay(self, subscriber_id: str, event_type: EventType, from_id: str = "0") -> bool:
+        """구독자 읽기 위치를 from_id로 되돌림 (Stream에 남아있는 범위 내 재처리)"""
+        async def _replay_operation(client):
+            return await client.stream_set_group_id(self._stream_key(event_type), subscriber_id, from_id)
+
+        return bool(await self._execute_redis_operation("replay", _replay_operation))
+
+    async def get_event_history(self, event_type: EventType, limit: int = 100) -> List[Event]:
+        """이벤트 히스토리 조회 (최신순)"""
+        async def _get_history_operation(client):
+            entries = await client.stream_range_desc(self._stream_key(event_type), limit)
+            events = []
+            for _, fields in entries:
+                try:
+                    events.append(deserialize_event(fields["event"]))
+                except Exception as e:
+                    Logger.error(f"이벤트 히스토리 파싱 오류: {e}")
+            return events
+
+        result = await self._execute_redis_operation("get_event_history", _get_history_operation)
+        return result if result is not None else []
+
+    async def get_subscription_stats(self) -> Dict[str, Any]:
+        """구독 통계 조회 - Stream 길이, 그룹별 pending/lag, 구독자별 전달 지연"""
+        try:
+            stats = {
+                "backend": "stream",
+                "consumer_name": self.consumer_name,
+                "total_subscriptions": len(self.subscriptions),
+                "active_subscribers": len(self.active_subscribers),
+                "event_stats": self.event_stats.copy(),
+                "subscriptions_by_type": {},
+                "streams": {},
+                "delivery_lag_ms": {sid: h.to_dict() for sid, h in self._delivery_lag.items()}
+            }
+
+            event_types: Set[EventType] = set()
+            for subscription in self.subscriptions.values():
+                for event_type in subscription.event_types:
+                    type_name = event_type.value
+                    stats["subscriptions_by_type"][type_name] = stats["subscriptions_by_type"].get(type_name, 0) + 1
+                    event_types.add(event_type)
+
+            async def _stream_info_operation(client):
+                info = {}
+                for event_type in event_types:
+                    stream_key = self._stream_key(event_type)
+                    groups = await client.stream_group_info(stream_key)
+                    info[event_type.value] = {
+                        "length": await client.stream_length(stream_key),
+                        "groups": {
+                            g.get("name"): {
+                                "consumers": g.get("consumers", 0),
+                                "pending": g.get("pending", 0),
+                                "lag": g.get("lag"),
+                                "last_delivered_id": g.get("last-delivered-id")
+                            } for g in groups
+                        }
+                    }
+                return info
+
+            stats["streams"] = await self._execute_redis_operation("stream_info", _stream_info_operation) or {}
+            return stats
+
+        except Exception as e:
+            Logger.error(f"구독 통계 조회 실패: {e}")
+            return {}
@@ -1,11 +1,14 @@
 import asyncio
+import heapq
+import itertools
 import threading
 from datetime import datetime, timedelta
-from typing import Callable, Dict, Optional, Any, List
+from typing import Callable, Dict, Optional, Any, List, Tuple
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from service.core.logger import Logger
+from service.core.latency_histogram import LatencyHistogram
 
 class ScheduleType(Enum):
     """스케줄 타입"""
@@ -32,6 +35,15 @@ class ScheduleJob:
     error_count: int = 0
     max_retries: int = 3
 
+@dataclass
+class JobTiming:
+    """작업별 실행 시각 통계"""
+    lateness: LatencyHistogram = field(default_factory=LatencyHistogram)  # 예정 시각 대비 지연 (ms)
+    jitter: LatencyHistogram = field(default_factory=LatencyHistogram)    # 연속 실행 간 지연 변화량 (ms)
+    last_lateness_ms: Optional[float] = None
+    fired: int = 0
+    overlaps_skipped: int = 0  # 이전 실행이 끝나지 않아 건너뛴 횟수
+
 class IScheduler(ABC):
     """스케줄러 인터페이스"""
     
@@ -61,21 +73,61 @@ class IScheduler(ABC):
         pass
 
 class BaseScheduler(IScheduler):
-    """기본 스케줄러 구현"""
+    """
+    기본 스케줄러 구현 (다음 실행 시각 min-heap)
+    - 루프는 가장 이른 next_run까지 sleep, 작업 추가/제거 시 깨워서 재계산 (전체 작업 스캔 없음)
+    - 힙 항목은 (실행 시각, 순번, job_id) - 제거/변경된 작업의 항목은 꺼낼 때 버림 (lazy deletion)
+    - 실행 중인 작업은 힙에 없으므로 중복 실행되지 않고, 완료 후 다음 실행 시각으로 재등록
+    """
     
-    def __init__(self, lock_service=None):
+    def __init__(self, lock_service=None, max_sleep_seconds: float = 60.0,
+                 retry_backoff_seconds: float = 1.0, max_retry_backoff_seconds: float = 60.0):
         self.jobs: Dict[str, ScheduleJob] = {}
         self.running = False
         self.scheduler_task: Optional[asyncio.Task] = None
         self.lock_service = lock_service
+        # 벽시계 변경(DAILY 작업) 대비 최대 sleep
+        self.max_sleep_seconds = max_sleep_seconds
+        # 실패한 ONCE 작업 재시도 간격 (retry_backoff_seconds * 2^(실패 횟수-1), 최대 max_retry_backoff_seconds)
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.max_retry_backoff_seconds = max_retry_backoff_seconds
+        
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._running_jobs: Dict[str, asyncio.Task] = {}
+        self.job_timings: Dict[str, JobTiming] = {}
+    
+    def _push(self, job: ScheduleJob):
+        """다음 실행 시각을 힙에 등록하고 루프를 깨움"""
+        if job.next_run is None:
+            return
+        heapq.heappush(self._heap, (job.next_run.timestamp(), next(self._seq), job.job_id))
+        # 제거된 작업 항목이 쌓이면 재구성
+        if len(self._heap) > 2 * len(self.jobs) + 16:
+            self._rebuild_heap()
+        self._wakeup.set()
+    
+    def _rebuild_heap(self):
+        self._heap = [
+            (job.next_run.timestamp(), next(self._seq), job.job_id)
+            for job in self.jobs.values()
+            if job.next_run and job.job_id not in self._running_jobs
+        ]
+        heapq.heapify(self._heap)
         
     async def add_job(self, job: ScheduleJob):
         """작업 추가"""
         try:
+            if job.schedule_type == ScheduleType.INTERVAL and not float(job.schedule_value) > 0:
+                raise ValueError(f"INTERVAL 주기는 0보다 커야 합니다: {job.schedule_value}")
+            
             # 다음 실행 시간 계산
             job.next_run = self._calculate_next_run(job)
             
             self.jobs[job.job_id] = job
+            self.job_timings.setdefault(job.job_id, JobTiming())
+            self._push(job)
             Logger.info(f"스케줄 작업 추가: {job.name} ({job.job_id})")
             
         except Exception as e:
@@ -85,6 +137,8 @@ class BaseScheduler(IScheduler):
         """작업 제거"""
         if job_id in self.jobs:
             job = self.jobs.pop(job_id)
+            self.job_timings.pop(job_id, None)
+            self._wakeup.set()
             Logger.info(f"스케줄 작업 제거: {job.name} ({job_id})")
         else:
             Logger.warn(f"존재하지 않는 작업 ID: {job_id}")
@@ -96,6 +150,8 @@ class BaseScheduler(IScheduler):
             return
         
         self.running = True
+        self._wakeup = asyncio.Event()
+        self._rebuild_heap()
         self.scheduler_task = asyncio.create_task(self._scheduler_loop())
         Logger.info("스케줄러 시작")
     
@@ -106,6 +162,7 @@ class BaseScheduler(IScheduler):
             return
         
         self.running = False
+        self._wakeup.set()
         
         if self.scheduler_task:
             self.scheduler_task.cancel()
@@ -131,37 +188,89 @@ class BaseScheduler(IScheduler):
             "next_run": job.next_run.isoformat() if job.next_run else None,
             "run_count": job.run_count,
             "error_count": job.error_count,
-            "use_distributed_lock": job.use_distributed_lock
+            "use_distributed_lock": job.use_distributed_lock,
+            "running": job_id in self._running_jobs
         }
     
     def get_all_jobs_status(self) -> List[Dict[str, Any]]:
         """모든 작업 상태 조회"""
         return [self.get_job_status(job_id) for job_id in self.jobs.keys()]
     
+    def get_timing_stats(self) -> Dict[str, Dict[str, Any]]:
+        """작업별 지연(lateness)/지터(jitter) 히스토그램"""
+        return {
+            job_id: {
+                "fired": timing.fired,
+                "overlaps_skipped": timing.overlaps_skipped,
+                "lateness_ms": timing.lateness.to_dict(),
+                "jitter_ms": timing.jitter.to_dict()
+            }
+            for job_id, timing in self.job_timings.items()
+        }
+    
     async def _scheduler_loop(self):
-        """스케줄러 메인 루프"""
+        """스케줄러 메인 루프 - 가장 이른 실행 시각까지 대기"""
         try:
             while self.running:
-                now = datetime.now()
+                if not self._heap:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+                
+                due_ts, _, job_id = self._heap[0]
+                delay = due_ts - datetime.now().timestamp()
+                if delay > 0:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=min(delay, self.max_sleep_seconds))
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                
+                heapq.heappop(self._heap)
+                job = self.jobs.get(job_id)
+                if job is None or job.next_run is None or job.next_run.timestamp() != due_ts:
+                    continue  # 제거되었거나 다시 등록된 작업의 이전 항목
+                
+                timing = self.job_timings.setdefault(job_id, JobTiming())
+                if job_id in self._running_jobs:
+                    timing.overlaps_skipped += 1
+                    continue  # 완료 시 재등록됨
                 
-                # 실행 가능한 작업들 찾기
-                ready_jobs = [
-                    job for job in self.jobs.values()
-                    if job.enabled and job.next_run and job.next_run <= now
-                ]
+                if not job.enabled:
+                    job.next_run = self._calculate_next_run(job)
+                    self._push(job)
+                    continue
                 
-                # 작업 실행
-                for job in ready_jobs:
-                    asyncio.create_task(self._execute_job(job))
+                lateness_ms = max(datetime.now().timestamp() - due_ts, 0.0) * 1000.0
+                timing.lateness.record(lateness_ms)
+                if timing.last_lateness_ms is not None:
+                    timing.jitter.record(abs(lateness_ms - timing.last_lateness_ms))
+                timing.last_lateness_ms = lateness_ms
+                timing.fired += 1
                 
-                # 1초 대기
-                await asyncio.sleep(1)
+                self._running_jobs[job_id] = asyncio.create_task(self._run_job(job, job.next_run))
                 
         except asyncio.CancelledError:
             Logger.info("스케줄러 루프 취소됨")
         except Exception as e:
             Logger.error(f"스케줄러 루프 오류: {e}")
     
+    async def _run_job(self, job: ScheduleJob, due: datetime):
+        """작업 1회 실행 후 다음 실행 시각으로 힙에 재등록"""
+        try:
+            await self._execute_job(job)
+        except Exception:
+            pass  # _execute_job에서 로깅
+        finally:
+            self._running_jobs.pop(job.job_id, None)
+            # 락 획득 실패 등으로 next_run이 갱신되지 않은 경우 (ONCE 작업은 재실행하지 않음)
+            if job.next_run is not None and job.next_run <= due:
+                next_run = self._calculate_next_run(job)
+                job.next_run = next_run if next_run and next_run > due else None
+            if self.jobs.get(job.job_id) is job:
+                self._push(job)
+    
     async def _execute_job(self, job: ScheduleJob):
         """작업 실행"""
         try:
@@ -226,8 +335,11 @@ class BaseScheduler(IScheduler):
         
         try:
             if job.schedule_type == ScheduleType.INTERVAL:
-                # 주기적 실행 (초 단위)
-                interval_seconds = int(job.schedule_value)
+                # 주기적 실행 (초 단위, 1초 미만 가능)
+                interval_seconds = float(job.schedule_value)
+                if not interval_seconds > 0:
+                    Logger.error(f"잘못된 INTERVAL 주기: {job.job_id} ({job.schedule_value})")
+                    return None
                 return now + timedelta(seconds=interval_seconds)
             
             elif job.schedule_type == ScheduleType.DAILY:
@@ -248,6 +360,14 @@ class BaseScheduler(IScheduler):
                 if job.run_count > 0:
                     return None  # 이미 실행됨
                 
+                if job.error_count > 0:
+                    # 실패 시 max_retries까지 지수 백오프로 재시도
+                    if job.error_count > job.max_retries:
+                        Logger.error(f"일회성 작업 재시도 한도 초과: {job.name} ({job.error_count}회 실패)")
+                        return None
+                    backoff = self.retry_backoff_seconds * (2 ** (job.error_count - 1))
+                    return now + timedelta(seconds=min(backoff, self.max_retry_backoff_seconds))
+                
                 if isinstance(job.schedule_value, datetime):
                     return job.schedule_value
                 else:
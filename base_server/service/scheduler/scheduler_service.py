@@ -108,4 +108,12 @@ class SchedulerService:
         if not cls._initialized or cls._scheduler is None:
             raise RuntimeError("SchedulerService가 초기화되지 않았습니다")
         
-        return cls._scheduler.get_all_jobs_status()
\ No newline at end of file
+        return cls._scheduler.get_all_jobs_status()
+    
+    @classmethod
+    def get_timing_stats(cls) -> Dict[str, Dict[str, Any]]:
+        """작업별 실행 지연/지터 히스토그램"""
+        if not cls._initialized or cls._scheduler is None:
+            raise RuntimeError("SchedulerService가 초기화되지 않았습니다")
+        
+        return cls._scheduler.get_timing_stats()
@@ -0,0 +1,248 @@
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+@dataclass
+class BollingerBatchResult:
+    """배치 평가 결과 (입력 순서가 아닌 심볼별로 중복 제거된 순서)"""
+    symbols: List[str]
+    prices: np.ndarray
+    avg_price: np.ndarray
+    std_dev: np.ndarray
+    upper_band: np.ndarray
+    lower_band: np.ndarray
+    ready: np.ndarray        # 윈도우가 가득 찬 심볼만 True
+    rolled: np.ndarray       # 이번 배치에서 날짜가 넘어간 심볼
+
+class BollingerEngine:
+    """
+    심볼별 롤링 윈도우 볼린저 밴드 엔진 (NumPy 링 버퍼)
+    - 심볼마다 하루 1슬롯(해당일 마지막 가격)을 가진 window 크기 링 버퍼
+    - 누적합/제곱합을 유지하여 같은 날 틱은 O(1)로 밴드 갱신
+    - 날짜가 넘어갈 때(window roll)만 링 버퍼에서 합계를 재계산하여 부동소수 오차 누적 방지
+    - update_batch()는 여러 심볼의 틱을 한 번의 벡터 연산으로 반영
+    """
+    def __init__(self, window: int = 5, num_std: float = 2.0, initial_capacity: int = 64):
+        self._window = window
+        self._num_std = num_std
+        self._capacity = 0
+        self._rows: Dict[str, int] = {}
+        self._free_rows: List[int] = []
+
+        self._prices = np.zeros((0, window), dtype=np.float64)
+        self._dates = np.zeros((0, window), dtype=np.int64)
+        self._head = np.zeros(0, dtype=np.int64)        # 오늘(최신) 슬롯 인덱스
+        self._count = np.zeros(0, dtype=np.int64)       # 채워진 슬롯 수
+        self._sum = np.zeros(0, dtype=np.float64)
+        self._sumsq = np.zeros(0, dtype=np.float64)
+        self._last_persist = np.zeros(0, dtype=np.float64)
+        self._dirty = np.zeros(0, dtype=bool)
+
+        # 영속화용 일별 원본 레코드 (슬롯과 1:1)
+        self._days: List[List[Optional[Dict]]] = []
+        self._grow(initial_capacity)
+
+    @property
+    def window(self) -> int:
+        return self._window
+
+    def _grow(self, capacity: int):
+        extra = capacity - self._capacity
+        if extra <= 0:
+            return
+        w = self._window
+        self._prices = np.vstack([self._prices, np.zeros((extra, w), dtype=np.float64)])
+        self._dates = np.vstack([self._dates, np.zeros((extra, w), dtype=np.int64)])
+        self._head = np.concatenate([self._head, np.zeros(extra, dtype=np.int64)])
+        self._count = np.concatenate([self._count, np.zeros(extra, dtype=np.int64)])
+        self._sum = np.concatenate([self._sum, np.zeros(extra, dtype=np.float64)])
+        self._sumsq = np.concatenate([self._sumsq, np.zeros(extra, dtype=np.float64)])
+        self._last_persist = np.concatenate([self._last_persist, np.zeros(extra, dtype=np.float64)])
+        self._dirty = np.concatenate([self._dirty, np.zeros(extra, dtype=bool)])
+        self._days.extend([None] * w for _ in range(extra))
+        self._free_rows.extend(range(capacity - 1, self._capacity - 1, -1))
+        self._capacity = capacity
+
+    def _row(self, symbol: str) -> int:
+        row = self._rows.get(symbol)
+        if row is None:
+            if not self._free_rows:
+                self._grow(max(self._capacity * 2, 1))
+            row = self._free_rows.pop()
+            self._rows[symbol] = row
+        return row
+
+    def has_symbol(self, symbol: str) -> bool:
+        return symbol in self._rows
+
+    def symbols(self) -> List[str]:
+        return list(self._rows.keys())
+
+    def remove(self, symbol: str):
+        """구독 해제된 심볼 정리 (슬롯 재사용)"""
+        row = self._rows.pop(symbol, None)
+        if row is None:
+            return
+        self._reset_row(row)
+        self._free_rows.append(row)
+
+    def _reset_row(self, row: int):
+        self._prices[row] = 0.0
+        self._dates[row] = 0
+        self._head[row] = 0
+        self._count[row] = 0
+        self._sum[row] = 0.0
+        self._sumsq[row] = 0.0
+        self._last_persist[row] = 0.0
+        self._dirty[row] = False
+        self._days[row] = [None] * self._window
+
+    def _recompute(self, row: int):
+        n = int(self._count[row])
+        if n == 0:
+            self._sum[row] = 0.0
+            self._sumsq[row] = 0.0
+            return
+        idx = (int(self._head[row]) - np.arange(n)) % self._window
+        values = self._prices[row, idx]
+        self._sum[row] = values.sum()
+        self._sumsq[row] = np.dot(values, values)
+
+    def load(self, symbol: str, days_data: Sequence[Dict]):
+        """
+        Redis 5일치 blob으로 심볼 윈도우 초기화
+        days_data: [{'date': 'YYYYMMDD', 'price': float, ...}, ...] (순서 무관)
+        """
+        row = self._row(symbol)
+        self._reset_row(row)
+        latest = sorted(days_data, key=lambda x: x['date'])[-self._window:]
+        for i, day in enumerate(latest):
+            self._prices[row, i] = float(day['price'])
+            self._dates[row, i] = int(day['date'])
+            self._days[row][i] = day
+        self._count[row] = len(latest)
+        self._head[row] = max(len(latest) - 1, 0)
+        self._recompute(row)
+        self._last_persist[row] = time.monotonic()
+
+    def _roll(self, row: int, date: int, price: float, record: Optional[Dict]):
+        """새 날짜 슬롯으로 이동 (가장 오래된 슬롯 덮어쓰기)"""
+        if self._count[row] == 0:
+            head = 0
+        else:
+            head = (int(self._head[row]) + 1) % self._window
+        self._head[row] = head
+        self._prices[row, head] = price
+        self._dates[row, head] = date
+        self._days[row][head] = record
+        self._count[row] = min(int(self._count[row]) + 1, self._window)
+        self._recompute(row)
+
+    def update_batch(self, symbols: Sequence[str], dates: Sequence[int], prices: Sequence[float],
+                     records: Optional[Sequence[Dict]] = None) -> BollingerBatchResult:
+        """
+        틱 배치 반영 후 해당 심볼들의 밴드를 한 번에 계산
+        - 같은 심볼 틱이 여러 개면 마지막 틱만 반영 (하루 1슬롯이므로 결과 동일)
+        - 같은 날 틱: 누적합/제곱합 델타 갱신 (벡터 연산)
+        - 날짜가 바뀐 틱: 슬롯 이동 후 재계산 (심볼당 하루 1회)
+        """
+        latest: Dict[str, int] = {}
+        for i, symbol in enumerate(symbols):
+            latest[symbol] = i
+        order = list(latest.values())
+        uniq_symbols = [symbols[i] for i in order]
+
+        rows = np.fromiter((self._row(s) for s in uniq_symbols), dtype=np.int64, count=len(order))
+        new_dates = np.asarray(dates, dtype=np.int64)[order]
+        new_prices = np.asarray(prices, dtype=np.float64)[order]
+
+        heads = self._head[rows]
+        cur_dates = self._dates[rows, heads]
+        same_day = (self._count[rows] > 0) & (cur_dates == new_dates)
+        stale = (self._count[rows] > 0) & (new_dates < cur_dates)
+        rolled = ~same_day & ~stale
+
+        # 같은 날 틱 - O(1) 델타 갱신
+        s_rows = rows[same_day]
+        if s_rows.size:
+            s_heads = heads[same_day]
+            old = self._prices[s_rows, s_heads]
+            new = new_prices[same_day]
+            self._sum[s_rows] += new - old
+            self._sumsq[s_rows] += new * new - old * old
+            self._prices[s_rows, s_heads] = new
+
+        # 날짜 이동 - 심볼당 하루 1회
+        for k in np.flatnonzero(rolled):
+            self._roll(int(rows[k]), int(new_dates[k]), float(new_prices[k]), None)
+
+        if records is not None:
+            for k, i in enumerate(order):
+                if not stale[k]:
+                    row = int(rows[k])
+                    self._days[row][int(self._head[row])] = records[i]
+
+        self._dirty[rows[~stale]] = True
+
+        n = self._count[rows].astype(np.float64)
+        safe_n = np.where(n > 0, n, 1.0)
+        avg = self._sum[rows] / safe_n
+        var = np.maximum(self._sumsq[rows] / safe_n - avg * avg, 0.0)
+        std = np.sqrt(var)
+        return BollingerBatchResult(
+            symbols=uniq_symbols,
+            prices=new_prices,
+            avg_price=avg,
+            std_dev=std,
+            upper_band=avg + self._num_std * std,
+            lower_band=avg - self._num_std * std,
+            ready=self._count[rows] >= self._window,
+            rolled=rolled
+        )
+
+    def update(self, symbol: str, date: int, price: float, record: Optional[Dict] = None) -> BollingerBatchResult:
+        """단일 틱 반영 (update_batch 래퍼)"""
+        return self.update_batch([symbol], [date], [price], [record] if record is not None else None)
+
+    def take_persist_candidates(self, symbols: Sequence[str], rolled: np.ndarray, interval_seconds: float) -> List[str]:
+        """
+        Redis에 저장할 심볼 선택 후 저장 시각 갱신
+        - 날짜가 넘어간 심볼은 즉시, 나머지는 interval_seconds 경과 시에만
+        """
+        now = time.monotonic()
+        result = []
+        for symbol, is_rolled in zip(symbols, rolled):
+            row = self._rows.get(symbol)
+            if row is None or not self._dirty[row]:
+                continue
+            if is_rolled or now - self._last_persist[row] >= interval_seconds:
+                self._last_persist[row] = now
+                self._dirty[row] = False
+                result.append(symbol)
+        return result
+
+    def snapshot(self, symbol: str) -> List[Dict]:
+        """Redis 5일치 blob 형식으로 변환 (최신 날짜 먼저)"""
+        row = self._rows.get(symbol)
+        if row is None:
+            return []
+        result = []
+        for k in range(int(self._count[row])):
+            idx = (int(self._head[row]) - k) % self._window
+            day = self._days[row][idx]
+            if day is None:
+                day = {'date': str(int(self._dates[row, idx])), 'price': float(self._prices[row, idx])}
+            result.append(day)
+        return result
+
+    def bands(self, symbol: str) -> Optional[Tuple[float, float, float, float]]:
+        """(avg, std, upper, lower) - 윈도우 미충족 시 None"""
+        row = self._rows.get(symbol)
+        if row is None or self._count[row] < self._window:
+            return None
+        n = float(self._count[row])
+        avg = self._sum[row] / n
+        std = float(np.sqrt(max(self._sumsq[row] / n - avg * avg, 0.0)))
+        return float(avg), std, float(avg + self._num_std * std), float(avg - self._num_std * std)
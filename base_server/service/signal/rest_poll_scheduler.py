@@ -0,0 +1,157 @@
+import asyncio
+import heapq
+import random
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from service.core.logger import Logger
+from service.core.latency_histogram import LatencyHistogram
+
+PollBatchHandler = Callable[[List[str]], Awaitable[None]]
+
+@dataclass
+class RestPollMetrics:
+    polls: int = 0         # 슬롯 실행(배치 조회) 수
+    symbols: int = 0       # 조회한 심볼 수 누계
+    errors: int = 0        # 배치 핸들러 예외 수
+
+class RestPollScheduler:
+    """
+    REST 폴백 심볼 공유 폴링 스케줄러 (루프 1개)
+    - 주기(interval)를 slot_count개 슬롯으로 나누고 심볼은 crc32로 슬롯에 고정 배정
+    - 슬롯 실행 시각 = 슬롯 기준 시각 + [0, jitter) 랜덤 → 인스턴스/주기 간 요청 몰림 방지
+    - 슬롯마다 해당 심볼 전체를 배치 핸들러 1회로 전달 (심볼별 태스크/sleep 없음)
+    - 심볼 추가 시 빈 슬롯이면 깨워서 스케줄 재계산
+    """
+    def __init__(self, handler: PollBatchHandler, interval_seconds: float = 30.0,
+                 slot_count: int = 10, jitter_seconds: float = 1.0):
+        self._handler = handler
+        self._interval = max(interval_seconds, 1.0)
+        self._slot_count = max(1, slot_count)
+        self._slot_width = self._interval / self._slot_count
+        self._jitter = max(0.0, min(jitter_seconds, self._slot_width))
+
+        self._slots: Dict[int, Set[str]] = {}
+        self._heap: List[Tuple[float, float, int]] = []  # (실행 시각, 슬롯 기준 시각, 슬롯)
+        self._scheduled: Set[int] = set()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+        self.metrics = RestPollMetrics()
+        self.slot_lag = LatencyHistogram()
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._wakeup = asyncio.Event()
+        now = time.monotonic()
+        for slot, symbols in self._slots.items():
+            if symbols and slot not in self._scheduled:
+                self._schedule_slot(slot, now)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self._running = False
+        self._wakeup.set()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._heap.clear()
+        self._scheduled.clear()
+
+    def slot_of(self, symbol: str) -> int:
+        return zlib.crc32(symbol.encode('utf-8')) % self._slot_count
+
+    def add(self, symbol: str):
+        """폴링 심볼 추가 (이미 있으면 무시)"""
+        slot = self.slot_of(symbol)
+        self._slots.setdefault(slot, set()).add(symbol)
+        if slot not in self._scheduled:
+            self._schedule_slot(slot, time.monotonic())
+            self._wakeup.set()
+
+    def remove(self, symbol: str):
+        symbols = self._slots.get(self.slot_of(symbol))
+        if symbols is not None:
+            symbols.discard(symbol)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._slots.get(self.slot_of(symbol), ())
+
+    def symbols(self) -> List[str]:
+        return [symbol for symbols in self._slots.values() for symbol in symbols]
+
+    def _schedule_slot(self, slot: int, now: float, base: Optional[float] = None):
+        """슬롯 다음 기준 시각 계산 (처음이면 현재 주기에서 슬롯 위치)"""
+        if base is None:
+            cycle_start = now - (now % self._interval)
+            base = cycle_start + slot * self._slot_width
+            if base < now:
+                base += self._interval
+        due = base + random.uniform(0.0, self._jitter)
+        heapq.heappush(self._heap, (due, base, slot))
+        self._scheduled.add(slot)
+
+    async def _run(self):
+        while self._running:
+            try:
+                if not self._heap:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+
+                due, base, slot = self._heap[0]
+                delay = due - time.monotonic()
+                if delay > 0:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                heapq.heappop(self._heap)
+                self._scheduled.discard(slot)
+                symbols = list(self._slots.get(slot, ()))
+                if not symbols:
+                    self._slots.pop(slot, None)
+                    continue  # 빈 슬롯은 스케줄에서 제외 (add 시 재등록)
+
+                now = time.monotonic()
+                self.slot_lag.record(max(now - due, 0.0) * 1000.0)
+                self._schedule_slot(slot, now, base + self._interval * (int((now - base) // self._interval) + 1))
+
+                try:
+                    await self._handler(symbols)
+                    self.metrics.polls += 1
+                    self.metrics.symbols += len(symbols)
+                except Exception as e:
+                    self.metrics.errors += 1
+                    Logger.error(f"REST 폴링 슬롯 {slot} 처리 에러: {e}")
+
+            except asyncio.CancelledError:
+                break
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "running": self._running,
+            "symbols": sum(len(symbols) for symbols in self._slots.values()),
+            "slots": {slot: len(symbols) for slot, symbols in self._slots.items() if symbols},
+            "interval_seconds": self._interval,
+            "polls": self.metrics.polls,
+            "polled_symbols": self.metrics.symbols,
+            "errors": self.metrics.errors,
+            "slot_lag_ms": self.slot_lag.to_dict()
+        }
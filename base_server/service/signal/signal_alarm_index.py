@@ -0,0 +1,168 @@
+import json
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from service.core.logger import Logger
+from service.cache.cache_service import CacheService
+from service.cache.local_cache import LocalCache
+
+@dataclass(frozen=True)
+class AlarmSubscription:
+    alarm_id: str
+    shard_id: int
+    account_db_key: int
+
+class SignalAlarmIndex:
+    """
+    심볼 → 활성 알림 구독자 역색인 (Redis 기반 + 프로세스 L1)
+    - Redis: 심볼별 해시(alarm_id → shard_id/account_db_key), 알림 역참조 해시, 준비 플래그
+    - L1: LocalCache (CacheService 무효화 채널로 인스턴스 간 동기화)
+    - 전체 재구성은 _sync_active_alarms, 증분 반영은 알림 등록/토글/삭제 시 호출
+    - lookup()이 None이면 색인 미구성 상태 (호출자가 샤드 조회로 폴백)
+    """
+    CACHE_NAME = "signal_alarm_index"
+    KEY_SYMBOL = "signal:alarm_index:symbol:{symbol}"
+    KEY_ALARMS = "signal:alarm_index:alarms"
+    KEY_SYMBOLS = "signal:alarm_index:symbols"
+    KEY_READY = "signal:alarm_index:ready"
+
+    _local = LocalCache(max_size=5000, ttl_seconds=300)
+    _registered = False
+
+    @classmethod
+    def _ensure_registered(cls):
+        if not cls._registered and CacheService.is_initialized():
+            CacheService.register_local_cache(cls.CACHE_NAME, cls._local)
+            CacheService.ensure_invalidation_listener()
+            cls._registered = True
+
+    @staticmethod
+    def _encode(symbol: str, shard_id: int, account_db_key: int) -> str:
+        return json.dumps({"symbol": symbol, "shard_id": shard_id, "account_db_key": account_db_key})
+
+    @classmethod
+    async def lookup(cls, symbol: str) -> Optional[Tuple[AlarmSubscription, ...]]:
+        """심볼의 활성 구독자 조회 (L1 → Redis)"""
+        cls._ensure_registered()
+        cached = cls._local.get(symbol)
+        if cached is not None:
+            return cached
+
+        async with CacheService.get_client() as client:
+            entries, ready = await client.pipeline() \
+                .get_hash_all(cls.KEY_SYMBOL.format(symbol=symbol)) \
+                .exists(cls.KEY_READY) \
+                .execute()
+        if not ready:
+            return None
+
+        subscriptions = []
+        for alarm_id, raw in (entries or {}).items():
+            try:
+                data = json.loads(raw)
+                subscriptions.append(AlarmSubscription(alarm_id, int(data["shard_id"]), int(data["account_db_key"])))
+            except (ValueError, KeyError, TypeError):
+                Logger.warn(f"잘못된 알림 색인 항목: {symbol}/{alarm_id}")
+        result = tuple(subscriptions)
+        cls._local.set(symbol, result)
+        return result
+
+    @classmethod
+    async def rebuild(cls, rows_by_shard: Dict[int, Iterable[Dict]]) -> Set[str]:
+        """
+        샤드별 활성 알림 행(fp_signal_alarms_get_active)으로 색인 전체 재구성
+        반환: 활성 알림이 있는 심볼 집합
+        """
+        cls._ensure_registered()
+        by_symbol: Dict[str, Dict[str, str]] = {}
+        alarms: Dict[str, str] = {}
+        for shard_id, rows in rows_by_shard.items():
+            for row in rows:
+                alarm_id = row.get('alarm_id')
+                symbol = row.get('symbol')
+                account_db_key = row.get('account_db_key')
+                if not alarm_id or not symbol or account_db_key is None:
+                    continue
+                encoded = cls._encode(symbol, shard_id, int(account_db_key))
+                by_symbol.setdefault(symbol, {})[alarm_id] = encoded
+                alarms[alarm_id] = encoded
+
+        async with CacheService.get_client() as client:
+            old_symbols, = await client.pipeline().set_members(cls.KEY_SYMBOLS).execute()
+
+            pipe = client.pipeline(transaction=True)
+            stale_keys = [cls.KEY_SYMBOL.format(symbol=symbol) for symbol in (old_symbols or [])]
+            pipe.delete(cls.KEY_ALARMS, cls.KEY_SYMBOLS, *stale_keys)
+            for symbol, mapping in by_symbol.items():
+                pipe.set_hash_all(cls.KEY_SYMBOL.format(symbol=symbol), mapping)
+            pipe.set_hash_all(cls.KEY_ALARMS, alarms)
+            pipe.set_add(cls.KEY_SYMBOLS, *by_symbol.keys())
+            pipe.set_string(cls.KEY_READY, "1")
+            await pipe.execute()
+
+        await CacheService.publish_invalidation(cls.CACHE_NAME, CacheService.INVALIDATE_ALL)
+        Logger.info(f"알림 색인 재구성: {len(by_symbol)}개 심볼, {len(alarms)}개 알림")
+        return set(by_symbol.keys())
+
+    @classmethod
+    async def add(cls, symbol: str, alarm_id: str, shard_id: int, account_db_key: int):
+        """알림 등록/활성화 반영"""
+        encoded = cls._encode(symbol, shard_id, account_db_key)
+        async with CacheService.get_client() as client:
+            await client.pipeline(transaction=True) \
+                .set_hash_field(cls.KEY_SYMBOL.format(symbol=symbol), alarm_id, encoded) \
+                .set_hash_field(cls.KEY_ALARMS, alarm_id, encoded) \
+                .set_add(cls.KEY_SYMBOLS, symbol) \
+                .execute()
+        await CacheService.publish_invalidation(cls.CACHE_NAME, symbol)
+
+    @classmethod
+    async def _get_alarm(cls, alarm_id: str) -> Optional[Dict]:
+        async with CacheService.get_client() as client:
+            raw, = await client.pipeline().hash_get(cls.KEY_ALARMS, alarm_id).execute()
+        return json.loads(raw) if raw else None
+
+    @classmethod
+    async def activate(cls, alarm_id: str) -> bool:
+        """비활성 알림 재활성화 - 역참조에 없으면 False (호출자가 심볼 확인 후 add)"""
+        alarm = await cls._get_alarm(alarm_id)
+        if not alarm:
+            return False
+        await cls.add(alarm["symbol"], alarm_id, int(alarm["shard_id"]), int(alarm["account_db_key"]))
+        return True
+
+    @classmethod
+    async def deactivate(cls, alarm_id: str):
+        """알림 비활성화 반영 (역참조는 유지하여 재활성화 시 사용)"""
+        alarm = await cls._get_alarm(alarm_id)
+        if not alarm:
+            return
+        symbol = alarm["symbol"]
+        async with CacheService.get_client() as client:
+            await client.pipeline().hash_delete(cls.KEY_SYMBOL.format(symbol=symbol), alarm_id).execute()
+        await CacheService.publish_invalidation(cls.CACHE_NAME, symbol)
+
+    @classmethod
+    async def remove(cls, alarm_id: str):
+        """알림 삭제 반영"""
+        alarm = await cls._get_alarm(alarm_id)
+        if not alarm:
+            return
+        symbol = alarm["symbol"]
+        async with CacheService.get_client() as client:
+            await client.pipeline(transaction=True) \
+                .hash_delete(cls.KEY_SYMBOL.format(symbol=symbol), alarm_id) \
+                .hash_delete(cls.KEY_ALARMS, alarm_id) \
+                .execute()
+        await CacheService.publish_invalidation(cls.CACHE_NAME, symbol)
+
+    @classmethod
+    def get_metrics(cls) -> Dict:
+        return cls._local.get_metrics()
+
+    @staticmethod
+    def group_by_shard(subscriptions: Iterable[AlarmSubscription]) -> Dict[int, List[AlarmSubscription]]:
+        grouped: Dict[int, List[AlarmSubscription]] = {}
+        for subscription in subscriptions:
+            grouped.setdefault(subscription.shard_id, []).append(subscription)
+        return grouped
@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+class SignalConfig(BaseModel):
+    bollinger_window: int = 5                       # 볼린저 밴드 윈도우 (일)
+    bollinger_num_std: float = 2.0                  # 밴드 폭 (표준편차 배수)
+    bollinger_persist_interval_seconds: float = 60  # 같은 날 틱의 Redis 저장 주기 (날짜 변경 시 즉시 저장)
+    tick_workers: int = 4                           # 틱 메일박스 워커 수
+    tick_batch_size: int = 64                       # 워커 1회 처리 최대 심볼 수
+    tick_max_pending_symbols: int = 10000           # 대기 심볼 상한 (초과 시 신규 심볼 틱 버림)
+    rest_poll_interval_seconds: float = 30.0        # WebSocket 폴백 시 REST 폴링 주기
+    rest_poll_slots: int = 10                       # 폴링 주기 분할 슬롯 수 (심볼은 crc32로 슬롯 고정)
+    rest_poll_jitter_seconds: float = 1.0           # 슬롯 실행 시각 랜덤 지연 상한
@@ -2,7 +2,7 @@ import asyncio
 import json
 from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
-from service.core.logger import Logger
+from service.core.logger import Logger, LogLevel
 from service.service_container import ServiceContainer
 from service.external.korea_investment_websocket_iocp import KoreaInvestmentWebSocketIOCP
 from service.external.yahoo_finance_client import YahooFinanceClient
@@ -16,6 +16,13 @@ from service.scheduler.scheduler_service import SchedulerService
 from service.notification.notification_service import NotificationService, NotificationChannel
 from service.scheduler.base_scheduler import ScheduleJob, ScheduleType
 import uuid
+import numpy as np
+from service.signal.signal_config import SignalConfig
+from service.signal.bollinger_engine import BollingerEngine
+from service.signal.tick_mailbox import TickMailbox
+from service.signal.rest_poll_scheduler import RestPollScheduler
+from service.external.kis_tick_decoder import TickRecord
+from service.signal.signal_alarm_index import SignalAlarmIndex, AlarmSubscription
 
 class SignalMonitoringService:
     """시그널 모니터링 서비스 - 실시간 주가 감시 및 볼린저 밴드 기반 시그널 발생 (마스터 서버 전용)"""
@@ -32,13 +39,26 @@ class SignalMonitoringService:
     CACHE_KEY_BOLLINGER = "signal:bollinger:{symbol}"  # 볼린저 밴드 데이터
     CACHE_TTL = 86400  # 24시간
     
+    # 심볼별 인메모리 볼린저 밴드 엔진 (Redis는 날짜 변경/저장 주기마다만 기록)
+    _config: SignalConfig = SignalConfig()
+    _bollinger_engine: BollingerEngine = BollingerEngine()
+    
+    # 심볼별 최신 틱 메일박스 (처리 중 도착한 틱은 병합)
+    _tick_mailbox: Optional[TickMailbox] = None
+    
+    # WebSocket 폴백 심볼 공유 REST 폴링 (심볼별 태스크 대신 슬롯 기반 루프 1개)
+    _rest_poller: Optional[RestPollScheduler] = None
+    
     @classmethod
-    async def init(cls):
+    async def init(cls, config: Optional[SignalConfig] = None):
         """서비스 초기화 - 마스터 서버만 한투증권 로직 실행"""
         if cls._initialized:
             Logger.warn("SignalMonitoringService 이미 초기화됨")
             return
         
+        cls._config = config or SignalConfig()
+        cls._bollinger_engine = BollingerEngine(window=cls._config.bollinger_window, num_std=cls._config.bollinger_num_std)
+        
         try:
             from service.service_container import ServiceContainer
             
@@ -62,6 +82,23 @@ class SignalMonitoringService:
             Logger.info("🏆 마스터 서버 - Korea Investment 로직 활성화")
             cls._is_master_server = True
             
+            # 실시간 틱 처리 워커 시작
+            cls._tick_mailbox = TickMailbox(
+                cls._handle_us_stock_batch,
+                max_workers=cls._config.tick_workers,
+                batch_size=cls._config.tick_batch_size,
+                max_pending=cls._config.tick_max_pending_symbols
+            )
+            cls._tick_mailbox.start()
+            
+            cls._rest_poller = RestPollScheduler(
+                cls._poll_rest_quotes,
+                interval_seconds=cls._config.rest_poll_interval_seconds,
+                slot_count=cls._config.rest_poll_slots,
+                jitter_seconds=cls._config.rest_poll_jitter_seconds
+            )
+            cls._rest_poller.start()
+            
             # ServiceContainer에서 검증된 한투증권 서비스 인스턴스 획득
             cls._korea_websocket = None
             
@@ -218,24 +255,27 @@ class SignalMonitoringService:
             
             Logger.info(f"활성 샤드 조회: {len(active_shards)}개 샤드 [{', '.join(map(str, active_shards))}]")
             
-            # 활성 샤드에서만 심볼 조회 (병렬 처리)
-            shard_tasks = []
-            for shard_id in active_shards:
-                task = cls._get_active_symbols_from_shard(db_service, shard_id)
-                shard_tasks.append(task)
+            # 모든 활성 샤드에서 활성 알림 동시 조회 (샤드별 타임아웃/동시성 제한)
+            gathered = await db_service.scatter_gather(
+                lambda shard_id: cls._get_active_alarms_from_shard(db_service, shard_id),
+                active_shards
+            )
+            for shard_id, error in gathered.errors.items():
+                Logger.error(f"샤드 {shard_id} 알림 조회 실패: {error}")
             
-            # 모든 활성 샤드를 동시에 쿼리
-            shard_results = await asyncio.gather(*shard_tasks, return_exceptions=True)
+            rows_by_shard = gathered.results
+            for shard_id, rows in rows_by_shard.items():
+                Logger.debug("샤드 %s: %d개 알림 조회 (%.1fms)", shard_id, len(rows), gathered.elapsed_ms[shard_id])
             
-            # 결과 통합
-            for shard_id, result in zip(active_shards, shard_results):
-                if isinstance(result, Exception):
-                    Logger.error(f"샤드 {shard_id} 심볼 조회 실패: {result}")
-                    continue
-                
-                if result:
-                    new_symbols.update(result)
-                    Logger.debug(f"샤드 {shard_id}: {len(result)}개 심볼 조회")
+            # 심볼 → 구독자 색인 재구성 (시그널 발생 시 샤드 조회 대신 사용)
+            if gathered.ok:
+                new_symbols = await SignalAlarmIndex.rebuild(rows_by_shard)
+            else:
+                # 일부 샤드 실패 시 불완전한 색인으로 덮어쓰지 않음 (구독 목록만 갱신)
+                for rows in rows_by_shard.values():
+                    new_symbols.update(row.get('symbol') for row in rows if row.get('symbol'))
+                # 조회 실패 샤드의 종목은 구독 해제하지 않음
+                new_symbols.update(cls._monitoring_symbols)
             
             # 새로운 종목 구독 (배치 처리)
             new_subscriptions = new_symbols - cls._monitoring_symbols
@@ -298,26 +338,45 @@ class SignalMonitoringService:
             return []
     
     @classmethod
-    async def _get_active_symbols_from_shard(cls, db_service, shard_id: int) -> set:
-        """개별 샤드에서 활성 심볼 조회 (병렬 처리용)"""
-        symbols = set()
-        try:
-            result = await db_service.call_shard_procedure(
-                shard_id,
-                "fp_signal_symbols_get_active",  # 최적화된 프로시저
-                ()  # 빈 튜플
-            )
-            
-            if result and len(result) > 1:  # 첫 번째는 상태
-                for symbol_data in result[1:]:
-                    symbol = symbol_data.get('symbol', '')
-                    if symbol:
-                        symbols.add(symbol)
-                        
-        except Exception as e:
-            Logger.error(f"샤드 {shard_id} 심볼 조회 실패: {e}")
-            
-        return symbols
+    async def _get_active_alarms_from_shard(cls, db_service, shard_id: int) -> List[Dict]:
+        """개별 샤드에서 활성 알림 조회 (병렬 처리용, 실패 시 예외 전파)"""
+        result = await db_service.call_shard_procedure(
+            shard_id,
+            "fp_signal_alarms_get_active",
+            ()
+        )
+        
+        if not result or result[0].get('ErrorCode', 0) != 0:
+            raise RuntimeError(f"fp_signal_alarms_get_active 실패: {result[0] if result else 'empty'}")
+        
+        # 첫 번째는 상태
+        return [row for row in result[1:] if row.get('alarm_id')]
+    
+    @classmethod
+    async def _get_alarm_subscriptions(cls, symbol: str) -> List[AlarmSubscription]:
+        """심볼 구독자 조회 - 색인 우선, 색인 미구성 시 활성 샤드 병렬 조회"""
+        subscriptions = await SignalAlarmIndex.lookup(symbol)
+        if subscriptions is not None:
+            return list(subscriptions)
+        
+        db_service = ServiceContainer.get_database_service()
+        active_shards = await cls._get_active_shard_ids(db_service)
+        if not active_shards:
+            Logger.warn("활성 샤드가 없어 구독자 조회 건너뜀")
+            return []
+        
+        gathered = await db_service.gather_shard_procedure("fp_signal_alarms_get_by_symbol", (symbol,), active_shards)
+        for shard_id, error in gathered.errors.items():
+            Logger.error(f"샤드 {shard_id} 구독자 조회 실패: {error}")
+        
+        subscriptions = []
+        for shard_id, result in gathered.results.items():
+            if result and len(result) > 1:
+                for alarm_data in result[1:]:
+                    subscriptions.append(AlarmSubscription(
+                        alarm_data.get('alarm_id'), shard_id, int(alarm_data.get('account_db_key'))
+                    ))
+        return subscriptions
     
     @classmethod
     async def subscribe_symbol(cls, symbol: str):
@@ -362,8 +421,8 @@ class SignalMonitoringService:
             # 콜백 함수 정의 (동기 함수로 처리 - IOCP 호환)
             def data_callback(data):
                 try:
-                    # 비동기 처리를 위해 task 생성
-                    asyncio.create_task(cls._handle_us_stock_data(symbol, data))
+                    # 메일박스에 최신 틱 등록 (처리 중이면 대기 틱을 덮어씀)
+                    cls._post_tick(symbol, data)
                 except Exception as callback_e:
                     Logger.error(f"❌ {symbol} 데이터 처리 콜백 에러: {callback_e}")
             
@@ -407,6 +466,11 @@ class SignalMonitoringService:
             # 스케줄러 작업도 사용하지 않으므로 제거할 것 없음
             
             cls._monitoring_symbols.remove(symbol)
+            cls._bollinger_engine.remove(symbol)
+            if cls._tick_mailbox:
+                cls._tick_mailbox.forget(symbol)
+            if cls._rest_poller:
+                cls._rest_poller.remove(symbol)
             Logger.info(f"종목 구독 중지: {symbol}")
             
         except Exception as e:
@@ -542,173 +606,256 @@ class SignalMonitoringService:
     
     @classmethod
     async def _start_rest_api_polling(cls, symbol: str):
-        """REST API 폴링 모드 시작 (PINGPONG 대응)"""
+        """REST API 폴링 모드 시작 (PINGPONG 대응) - 공유 폴링 스케줄러에 심볼 등록"""
         try:
-            Logger.info(f"🔄 {symbol} REST API 폴링 모드 시작 (30초 간격)")
-            
-            # 폴링 태스크 이름
-            task_name = f"rest_polling_{symbol}"
-            
-            # 기존 폴링 태스크가 있으면 제거
-            if hasattr(cls, '_polling_tasks') and task_name in cls._polling_tasks:
-                cls._polling_tasks[task_name].cancel()
-                
-            # 폴링 태스크 생성
-            if not hasattr(cls, '_polling_tasks'):
-                cls._polling_tasks = {}
-                
-            cls._polling_tasks[task_name] = asyncio.create_task(
-                cls._rest_api_polling_loop(symbol)
-            )
-            
-            Logger.info(f"✅ {symbol} REST API 폴링 태스크 시작됨")
+            if not cls._rest_poller:
+                Logger.warn(f"REST 폴링 스케줄러 미초기화 - {symbol} 폴링 생략")
+                return
+            cls._rest_poller.add(symbol)
+            Logger.info(f"✅ {symbol} REST API 폴링 등록 (슬롯 {cls._rest_poller.slot_of(symbol)}, {cls._config.rest_poll_interval_seconds:.0f}초 간격)")
             
         except Exception as e:
             Logger.error(f"❌ REST API 폴링 시작 실패 ({symbol}): {e}")
     
     @classmethod
-    async def _rest_api_polling_loop(cls, symbol: str):
-        """REST API 주기적 폴링 루프"""
-        try:
-            while True:
-                try:
-                    # KoreaInvestmentService를 통한 REST API 호출
-                    from service.service_container import ServiceContainer
-                    korea_service = ServiceContainer.get_korea_investment_service()
-                    
-                    if korea_service:
-                        # 거래소 결정 (미국 주식은 대부분 NASDAQ/NYSE)
-                        exchange = cls._determine_exchange(symbol)
-                        
-                        # 해외 주식 가격 조회 (REST API)
-                        price_data = await korea_service.get_overseas_stock_price(exchange, symbol)
-                        
-                        if price_data:
-                            # 빈 문자열이나 None을 0으로 처리
-                            last_price = price_data.get('last', '')
-                            
-                            # 데이터가 빈 문자열이면 Yahoo Finance 사용
-                            if last_price == '' or last_price == '0':
-                                Logger.warn(f"⚠️ {symbol} 한투 API 빈 응답 - Yahoo Finance 사용")
-                                try:
-                                    import yfinance as yf
-                                    ticker = yf.Ticker(symbol)
-                                    info = ticker.info
-                                    
-                                    converted_data = {
-                                        'current_price': float(info.get('currentPrice', info.get('regularMarketPrice', 0))),
-                                        'high_price': float(info.get('dayHigh', 0)),
-                                        'low_price': float(info.get('dayLow', 0)),
-                                        'open_price': float(info.get('open', info.get('regularMarketOpen', 0))),
-                                        'volume': int(info.get('volume', info.get('regularMarketVolume', 0)))
-                                    }
-                                    Logger.info(f"✅ Yahoo Finance 데이터 사용: ${converted_data['current_price']}")
-                                except Exception as yf_e:
-                                    Logger.error(f"❌ Yahoo Finance 실패: {yf_e}")
-                                    converted_data = {'current_price': 0, 'high_price': 0, 'low_price': 0, 'open_price': 0, 'volume': 0}
-                            else:
-                                # 한투 API 데이터 사용
-                                converted_data = {
-                                    'current_price': float(last_price) if last_price else 0,
-                                    'high_price': float(price_data.get('high', 0)) if price_data.get('high') else 0,
-                                    'low_price': float(price_data.get('low', 0)) if price_data.get('low') else 0,
-                                    'open_price': float(price_data.get('open', 0)) if price_data.get('open') else 0,
-                                    'volume': int(price_data.get('tvol', 0)) if price_data.get('tvol') else 0
-                                }
-                            
-                            Logger.info(f"📊 {symbol} REST API 데이터: ${converted_data['current_price']}")
-                            
-                            # 기존 처리 로직 재사용
-                            await cls._handle_us_stock_data(symbol, converted_data)
-                        else:
-                            Logger.warn(f"⚠️ {symbol} REST API 데이터 없음")
-                    
-                    # 30초 대기
-                    await asyncio.sleep(30)
-                    
-                except Exception as loop_e:
-                    Logger.error(f"❌ REST API 폴링 루프 에러 ({symbol}): {loop_e}")
-                    await asyncio.sleep(30)  # 에러 시에도 대기
-                    
-        except asyncio.CancelledError:
-            Logger.info(f"🔄 {symbol} REST API 폴링 태스크 종료됨")
-        except Exception as e:
-            Logger.error(f"❌ REST API 폴링 루프 예외 ({symbol}): {e}")
+    async def _poll_rest_quotes(cls, symbols: List[str]):
+        """
+        폴링 슬롯 1회 처리 - 슬롯의 심볼 전체를 한투 다종목 조회로 가져와 틱으로 등록
+        - 한투 API가 빈 응답을 준 심볼은 Yahoo Finance 일괄 조회(공유 캐시)로 보충
+        - 변환/처리 실패는 심볼 단위로 로깅 후 건너뜀 (같은 슬롯의 다른 심볼은 계속 처리)
+        """
+        korea_service = ServiceContainer.get_korea_investment_service()
+        if not korea_service:
+            return
+        
+        # 거래소 결정 (미국 주식은 대부분 NASDAQ/NYSE)
+        items = [(cls._determine_exchange(symbol), symbol) for symbol in symbols]
+        prices = await korea_service.get_overseas_stock_prices(items)
+        
+        converted: Dict[str, Dict] = {}
+        empty_symbols: List[str] = []
+        for (exchange, symbol), price_data in prices.items():
+            if not price_data:
+                Logger.warn(f"⚠️ {symbol} REST API 데이터 없음")
+                continue
+            
+            try:
+                # 빈 문자열이나 '0'이면 Yahoo Finance 사용
+                last_price = price_data.get('last', '')
+                if last_price == '' or last_price == '0':
+                    empty_symbols.append(symbol)
+                    continue
+                
+                # 한투 API 데이터 사용
+                converted[symbol] = {
+                    'current_price': float(last_price) if last_price else 0,
+                    'high_price': float(price_data.get('high', 0)) if price_data.get('high') else 0,
+                    'low_price': float(price_data.get('low', 0)) if price_data.get('low') else 0,
+                    'open_price': float(price_data.get('open', 0)) if price_data.get('open') else 0,
+                    'volume': int(price_data.get('tvol', 0)) if price_data.get('tvol') else 0
+                }
+            except Exception as convert_e:
+                Logger.error(f"❌ {symbol} REST API 데이터 변환 실패: {convert_e}")
+        
+        if empty_symbols:
+            Logger.warn(f"⚠️ 한투 API 빈 응답 {len(empty_symbols)}건 - Yahoo Finance 사용: {empty_symbols}")
+            try:
+                async with YahooFinanceClient(ServiceContainer.get_cache_service()) as client:
+                    quotes = await client.get_stock_quotes(empty_symbols)
+                for symbol, quote in quotes.items():
+                    converted[symbol] = {
+                        'current_price': quote.current_price,
+                        'high_price': quote.high_price or 0,
+                        'low_price': quote.low_price or 0,
+                        'open_price': quote.open_price or 0,
+                        'volume': quote.volume
+                    }
+            except Exception as yf_e:
+                Logger.error(f"❌ Yahoo Finance 실패: {yf_e}")
+        
+        for symbol, data in converted.items():
+            try:
+                Logger.debug("📊 %s REST API 데이터: $%s", symbol, data['current_price'])
+                # 기존 처리 로직 재사용
+                await cls._handle_us_stock_data(symbol, data)
+            except Exception as handle_e:
+                Logger.error(f"❌ {symbol} REST API 데이터 처리 실패: {handle_e}")
+    
+    @classmethod
+    def get_rest_poll_metrics(cls) -> Dict:
+        """REST 폴링 스케줄러 메트릭 (슬롯별 심볼 수, 슬롯 실행 지연)"""
+        if not cls._rest_poller:
+            return {}
+        return cls._rest_poller.get_metrics()
+    
+    @classmethod
+    def _post_tick(cls, symbol: str, data: Dict):
+        """틱을 메일박스에 등록 (메일박스 미사용 시 즉시 처리 태스크 생성)"""
+        if cls._tick_mailbox and cls._tick_mailbox.is_running:
+            cls._tick_mailbox.post(symbol, data)
+        else:
+            asyncio.create_task(cls._handle_us_stock_batch([(symbol, data)]))
     
     @classmethod
     async def _handle_us_stock_data(cls, symbol: str, data: Dict):
-        """미국 주식 실시간 데이터 처리 (한국투자증권 WebSocket)"""
-        try:
-            # 원본 데이터 로깅 (디버깅용)
-            Logger.info(f"🍎 {symbol} 원본 데이터 수신:")
-            Logger.info(f"   📄 Raw Data: {data}")
-            
-            processed_data = {
-                'symbol': symbol,
-                'current_price': float(data.get('current_price', 0)),
-                'high_price': float(data.get('high_price', 0)),
-                'low_price': float(data.get('low_price', 0)),
-                'open_price': float(data.get('open_price', 0)),
-                'volume': int(data.get('volume', 0)),
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            # 가공된 데이터 로깅
-            Logger.info(f"🍎 {symbol} 가공된 데이터:")
-            Logger.info(f"   💰 현재가: ${processed_data['current_price']}")
-            Logger.info(f"   📈 고가: ${processed_data['high_price']}")
-            Logger.info(f"   📉 저가: ${processed_data['low_price']}")
-            Logger.info(f"   🚀 시가: ${processed_data['open_price']}")
-            Logger.info(f"   📊 거래량: {processed_data['volume']:,}")
-            Logger.info(f"   ⏰ 시간: {processed_data['timestamp']}")
-            
-            # 데이터 유효성 검사
-            if processed_data['current_price'] > 0:
-                Logger.info(f"✅ {symbol} 유효한 데이터 - 가격 처리 진행")
-                await cls._process_price_data(symbol, processed_data)
-            else:
-                Logger.warn(f"⚠️ {symbol} 유효하지 않은 가격 데이터: {processed_data['current_price']}")
-            
-        except Exception as e:
-            Logger.error(f"❌ 미국 주식 데이터 처리 에러 ({symbol}): {e}")
-            import traceback
-            Logger.error(f"Traceback: {traceback.format_exc()}")
+        """미국 주식 실시간 데이터 처리 (한국투자증권 WebSocket / REST 폴링)"""
+        cls._post_tick(symbol, data)
+    
+    @classmethod
+    async def _handle_us_stock_batch(cls, items: List[Tuple[str, Dict]]):
+        """메일박스 워커가 전달한 틱 배치 가공 후 가격 처리"""
+        processed_items = []
+        for symbol, data in items:
+            try:
+                # 원본 데이터 로깅 (디버깅용 - TRACE에서만 직렬화)
+                Logger.event(LogLevel.TRACE, "us_stock_tick_raw", symbol=symbol, raw=data)
+                
+                if isinstance(data, TickRecord):
+                    # WebSocket 디코더가 타입 변환을 마친 틱 - 재파싱 없이 사용
+                    processed_data = {
+                        'symbol': symbol,
+                        'current_price': data.price,
+                        'high_price': data.high,
+                        'low_price': data.low,
+                        'open_price': data.open,
+                        'volume': data.volume,
+                        'timestamp': datetime.now().isoformat()
+                    }
+                else:
+                    processed_data = {
+                        'symbol': symbol,
+                        'current_price': float(data.get('current_price', 0)),
+                        'high_price': float(data.get('high_price', 0)),
+                        'low_price': float(data.get('low_price', 0)),
+                        'open_price': float(data.get('open_price', 0)),
+                        'volume': int(data.get('volume', 0)),
+                        'timestamp': datetime.now().isoformat()
+                    }
+                
+                # 가공된 데이터 로깅 (틱마다 호출되므로 DEBUG 구조화 로그 1건)
+                Logger.event(LogLevel.DEBUG, "us_stock_tick", **processed_data)
+                
+                # 데이터 유효성 검사
+                if processed_data['current_price'] > 0:
+                    processed_items.append((symbol, processed_data))
+                else:
+                    Logger.warn("⚠️ %s 유효하지 않은 가격 데이터: %s", symbol, processed_data['current_price'])
+                
+            except Exception as e:
+                Logger.error("❌ 미국 주식 데이터 처리 에러 (%s): %s", symbol, e)
+        
+        if processed_items:
+            await cls._process_price_batch(processed_items)
+    
+    @classmethod
+    def get_tick_metrics(cls) -> Dict:
+        """틱 메일박스 메트릭 (수신/병합/버림 카운터 + 심볼별 처리 지연 히스토그램)"""
+        if not cls._tick_mailbox:
+            return {}
+        return cls._tick_mailbox.get_metrics()
     
     @classmethod
     async def _process_price_data(cls, symbol: str, data: Dict):
         """가격 데이터 처리 및 시그널 체크"""
+        await cls._process_price_batch([(symbol, data)])
+    
+    @classmethod
+    async def _process_price_batch(cls, items: List[Tuple[str, Dict]]):
+        """
+        틱 배치 처리
+        - 볼린저 밴드 엔진에 전체 틱을 한 번에 반영하고 밴드/시그널을 벡터 연산으로 판정
+        - Redis 저장은 날짜 변경 또는 저장 주기 경과 심볼만 파이프라인 1회로 처리
+        """
         try:
-            current_price = float(data.get('current_price', 0))
-            if current_price <= 0:
-                return
-            
-            cache_service = ServiceContainer.get_cache_service()
-            
-            # 오늘 데이터 캐싱
+            engine = cls._bollinger_engine
             today = datetime.now().strftime('%Y%m%d')
-            cache_key = cls.CACHE_KEY_PATTERN.format(symbol=symbol, date=today)
-            
-            price_data = {
-                'date': today,
-                'price': current_price,
-                'high': float(data.get('high_price', current_price)),
-                'low': float(data.get('low_price', current_price)),
-                'open': float(data.get('open_price', current_price)),
-                'volume': int(data.get('volume', 0)),
-                'timestamp': data.get('timestamp')
-            }
             
-            async with cache_service.get_client() as client:
-                await client.set_string(cache_key, json.dumps(price_data), expire=cls.CACHE_TTL)
+            symbols, prices, records = [], [], []
+            for symbol, data in items:
+                current_price = float(data.get('current_price', 0))
+                if current_price <= 0:
+                    continue
+                symbols.append(symbol)
+                prices.append(current_price)
+                records.append({
+                    'date': today,
+                    'price': current_price,
+                    'high': float(data.get('high_price', current_price)),
+                    'low': float(data.get('low_price', current_price)),
+                    'open': float(data.get('open_price', current_price)),
+                    'volume': int(data.get('volume', 0)),
+                    'timestamp': data.get('timestamp')
+                })
+            if not symbols:
+                return
             
-            # 5일치 캐시 업데이트
-            await cls._update_5days_cache(symbol, price_data)
+            # 처음 보는 심볼은 Redis 5일치 데이터로 윈도우 초기화 (심볼당 1회)
+            missing = [symbol for symbol in dict.fromkeys(symbols) if not engine.has_symbol(symbol)]
+            if missing:
+                await cls._load_bollinger_windows(missing)
             
-            # 볼린저 밴드 계산 및 시그널 체크
-            await cls._check_bollinger_signal(symbol, current_price)
+            result = engine.update_batch(symbols, [int(today)] * len(symbols), prices, records)
+            
+            persist_symbols = engine.take_persist_candidates(
+                result.symbols, result.rolled, cls._config.bollinger_persist_interval_seconds
+            )
+            if persist_symbols:
+                await cls._persist_bollinger_windows(persist_symbols)
+            
+            # 밴드 이탈 심볼만 시그널 체크
+            breached = result.ready & ((result.prices <= result.lower_band) | (result.prices >= result.upper_band))
+            for k in np.flatnonzero(breached):
+                bollinger_data = {
+                    'avg_price': float(result.avg_price[k]),
+                    'upper_band': float(result.upper_band[k]),
+                    'lower_band': float(result.lower_band[k]),
+                    'std_dev': float(result.std_dev[k]),
+                    'timestamp': datetime.now().isoformat()
+                }
+                await cls._check_bollinger_signal(result.symbols[k], float(result.prices[k]), bollinger_data)
             
         except Exception as e:
-            Logger.error(f"가격 데이터 처리 에러 ({symbol}): {e}")
+            Logger.error("가격 데이터 처리 에러 (%s): %s", ",".join(symbol for symbol, _ in items), e)
+    
+    @classmethod
+    async def _load_bollinger_windows(cls, symbols: List[str]):
+        """Redis 5일치 데이터로 엔진 윈도우 초기화 (파이프라인 1회)"""
+        cache_service = ServiceContainer.get_cache_service()
+        async with cache_service.get_client() as client:
+            pipe = client.pipeline()
+            for symbol in symbols:
+                pipe.get_string(cls.CACHE_KEY_5DAYS.format(symbol=symbol))
+            blobs = await pipe.execute()
+        
+        for symbol, blob in zip(symbols, blobs):
+            cls._bollinger_engine.load(symbol, json.loads(blob) if blob else [])
+    
+    @classmethod
+    async def _persist_bollinger_windows(cls, symbols: List[str]):
+        """엔진 상태를 Redis에 저장 (일별 가격 + 5일치 + 볼린저 밴드, 파이프라인 1회)"""
+        engine = cls._bollinger_engine
+        cache_service = ServiceContainer.get_cache_service()
+        async with cache_service.get_client() as client:
+            pipe = client.pipeline()
+            for symbol in symbols:
+                days_data = engine.snapshot(symbol)
+                if not days_data:
+                    continue
+                latest = days_data[0]
+                pipe.set_string(cls.CACHE_KEY_PATTERN.format(symbol=symbol, date=latest['date']), json.dumps(latest), expire=cls.CACHE_TTL)
+                pipe.set_string(cls.CACHE_KEY_5DAYS.format(symbol=symbol), json.dumps(days_data), expire=cls.CACHE_TTL)
+                bands = engine.bands(symbol)
+                if bands:
+                    avg_price, std_dev, upper_band, lower_band = bands
+                    bollinger_data = {
+                        'avg_price': avg_price,
+                        'upper_band': upper_band,
+                        'lower_band': lower_band,
+                        'std_dev': std_dev,
+                        'timestamp': datetime.now().isoformat()
+                    }
+                    pipe.set_string(cls.CACHE_KEY_BOLLINGER.format(symbol=symbol), json.dumps(bollinger_data), expire=3600)  # 1시간
+            await pipe.execute()
     
     @classmethod
     async def _cache_historical_data(cls, symbol: str):
@@ -795,6 +942,7 @@ class SignalMonitoringService:
             if days_data:
                 async with cache_service.get_client() as client:
                     await client.set_string(cache_key, json.dumps(days_data), expire=cls.CACHE_TTL)
+                cls._bollinger_engine.load(symbol, days_data)
                 Logger.info(f"5일치 데이터 캐싱 완료: {symbol}")
                 
         except Exception as e:
@@ -945,239 +1093,123 @@ class SignalMonitoringService:
     async def _process_model_server_signal(cls, symbol: str, signal_data: Dict):
         """Model Server에서 생성된 시그널 처리 및 알림 발송"""
         try:
-            db_service = ServiceContainer.get_database_service()
-            
-            # 활성 샤드 목록 조회
-            active_shards = await cls._get_active_shard_ids(db_service)
-            if not active_shards:
-                Logger.warn("활성 샤드가 없어 Model Server 시그널 처리 건너뜀")
+            subscriptions = await cls._get_alarm_subscriptions(symbol)
+            if not subscriptions:
                 return
             
             signal_type = signal_data['signal_type']
             current_price = signal_data['current_price']
             confidence = signal_data['confidence_score']
             
-            # 시그널 히스토리 저장 및 알림 발송 (모든 구독자)
-            for shard_id in active_shards:
-                try:
-                    # 해당 종목을 구독하는 사용자 조회
-                    result = await db_service.call_shard_procedure(
-                        shard_id,
-                        "fp_signal_alarms_get_by_symbol",
-                        (symbol,)
-                    )
-                    
-                    if result and len(result) > 1:
-                        for alarm_data in result[1:]:
-                            alarm_id = alarm_data.get('alarm_id')
-                            account_db_key = alarm_data.get('account_db_key')
-                            
-                            # 시그널 히스토리 저장
-                            signal_id = signal_data['signal_id']
-                            save_result = await db_service.execute_shard_procedure(
-                                account_db_key,
-                                "fp_signal_history_save",
-                                (signal_id, alarm_id, signal_type, current_price)
-                            )
-                            
-                            if save_result and save_result[0].get('ErrorCode') == 0:
-                                Logger.info(f"✅ Model Server 시그널 저장: {alarm_id} - {signal_type} @ {current_price} (신뢰도: {confidence:.2f})")
-                                
-                                # 볼린저 밴드 데이터 생성 (Model Server 기반)
-                                band_data = {
-                                    'upper_band': current_price * (1 + signal_data['bollinger_position'] * 0.05),
-                                    'avg_price': current_price,
-                                    'lower_band': current_price * (1 - signal_data['bollinger_position'] * 0.05),
-                                    'std_dev': current_price * 0.02,
-                                    'timestamp': signal_data['created_at']
-                                }
-                                
-                                # NotificationService를 통한 알림 전송
-                                await cls._send_signal_notification(
-                                    account_db_key,
-                                    shard_id,
-                                    symbol,
-                                    signal_type,
-                                    current_price,
-                                    band_data,
-                                    confidence
-                                )
-                            else:
-                                Logger.error(f"Model Server 시그널 저장 실패: {alarm_id}")
-                                
-                except Exception as e:
-                    Logger.error(f"샤드 {shard_id} Model Server 시그널 처리 실패: {e}")
-                    continue
+            # 볼린저 밴드 데이터 생성 (Model Server 기반)
+            band_data = {
+                'upper_band': current_price * (1 + signal_data['bollinger_position'] * 0.05),
+                'avg_price': current_price,
+                'lower_band': current_price * (1 - signal_data['bollinger_position'] * 0.05),
+                'std_dev': current_price * 0.02,
+                'timestamp': signal_data['created_at']
+            }
+            
+            # 시그널 히스토리 저장 및 알림 발송 (샤드별 병렬)
+            grouped = SignalAlarmIndex.group_by_shard(subscriptions)
+            await asyncio.gather(*[
+                cls._save_shard_signals(shard_id, shard_subscriptions, symbol, signal_type, current_price, band_data, confidence)
+                for shard_id, shard_subscriptions in grouped.items()
+            ])
                     
         except Exception as e:
             Logger.error(f"Model Server 시그널 처리 실패: {e}")
     
     @classmethod
-    async def _update_5days_cache(cls, symbol: str, new_data: Dict):
-        """5일치 캐시 업데이트"""
-        try:
-            cache_service = ServiceContainer.get_cache_service()
-            cache_key = cls.CACHE_KEY_5DAYS.format(symbol=symbol)
-            
-            async with cache_service.get_client() as client:
-                cached = await client.get_string(cache_key)
-                
-            if cached:
-                days_data = json.loads(cached)
-            else:
-                days_data = []
-            
-            # 오늘 데이터 업데이트
-            today = new_data['date']
-            found = False
-            
-            for i, day_data in enumerate(days_data):
-                if day_data['date'] == today:
-                    days_data[i] = new_data
-                    found = True
-                    break
-            
-            if not found:
-                days_data.insert(0, new_data)
-            
-            # 최근 5일만 유지
-            days_data = sorted(days_data, key=lambda x: x['date'], reverse=True)[:5]
-            
-            async with cache_service.get_client() as client:
-                await client.set_string(cache_key, json.dumps(days_data), expire=cls.CACHE_TTL)
-            
-        except Exception as e:
-            Logger.error(f"5일치 캐시 업데이트 실패 ({symbol}): {e}")
-    
-    @classmethod
-    async def _check_bollinger_signal(cls, symbol: str, current_price: float):
+    async def _check_bollinger_signal(cls, symbol: str, current_price: float, bollinger_data: Dict):
         """볼린저 밴드 기반 시그널 체크"""
         try:
-            cache_service = ServiceContainer.get_cache_service()
-            
-            # 5일치 데이터 가져오기
-            cache_key = cls.CACHE_KEY_5DAYS.format(symbol=symbol)
-            async with cache_service.get_client() as client:
-                cached = await client.get_string(cache_key)
-            
-            if not cached:
-                return
-            
-            days_data = json.loads(cached)
-            if len(days_data) < 5:
-                return
-            
-            # 가격 리스트 추출
-            prices = [d['price'] for d in days_data]
-            
-            # 볼린저 밴드 계산 (5일 이동평균)
-            avg_price = sum(prices) / len(prices)
-            variance = sum((p - avg_price) ** 2 for p in prices) / len(prices)
-            std_dev = variance ** 0.5
-            
-            # 볼린저 밴드 (2 표준편차)
-            upper_band = avg_price + (2 * std_dev)
-            lower_band = avg_price - (2 * std_dev)
-            
-            # 볼린저 밴드 데이터 캐싱
-            bollinger_data = {
-                'avg_price': avg_price,
-                'upper_band': upper_band,
-                'lower_band': lower_band,
-                'std_dev': std_dev,
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            bollinger_key = cls.CACHE_KEY_BOLLINGER.format(symbol=symbol)
-            async with cache_service.get_client() as client:
-                await client.set_string(bollinger_key, json.dumps(bollinger_data), expire=3600)  # 1시간
+            upper_band = bollinger_data['upper_band']
+            lower_band = bollinger_data['lower_band']
             
             # 시그널 판단
             signal_type = None
             if current_price <= lower_band:
                 signal_type = "BUY"
-                Logger.info(f"📈 BUY 시그널 발생: {symbol} @ {current_price} (하단: {lower_band})")
+                Logger.debug("📈 BUY 시그널 발생: %s @ %s (하단: %s)", symbol, current_price, lower_band)
             elif current_price >= upper_band:
                 signal_type = "SELL"
-                Logger.info(f"📉 SELL 시그널 발생: {symbol} @ {current_price} (상단: {upper_band})")
+                Logger.debug("📉 SELL 시그널 발생: %s @ %s (상단: %s)", symbol, current_price, upper_band)
             
             if signal_type:
                 await cls._save_signal(symbol, current_price, signal_type, bollinger_data)
                 
         except Exception as e:
-            Logger.error(f"볼린저 밴드 시그널 체크 실패 ({symbol}): {e}")
+            Logger.error("볼린저 밴드 시그널 체크 실패 (%s): %s", symbol, e)
     
     @classmethod
     async def _save_signal(cls, symbol: str, price: float, signal_type: str, band_data: Dict):
-        """시그널 저장 및 Model Server 연동"""
+        """시그널 저장 및 Model Server 연동 (색인 1회 조회 + 시그널당 추론 1회)"""
         try:
-            # Model Server 연동으로 시그널 검증 후 확정된 시그널만 DB 저장
-            
-            db_service = ServiceContainer.get_database_service()
-            
-            # 활성 샤드 목록 조회
-            active_shards = await cls._get_active_shard_ids(db_service)
-            if not active_shards:
-                Logger.warn("활성 샤드가 없어 시그널 저장 건너뜀")
+            subscriptions = await cls._get_alarm_subscriptions(symbol)
+            if not subscriptions:
                 return
             
-            # 해당 종목의 활성 알림만 조회 (활성 샤드에서만)
-            for shard_id in active_shards:
-                try:
-                    result = await db_service.call_shard_procedure(
-                        shard_id,
-                        "fp_signal_alarms_get_by_symbol",  # 최적화된 프로시저
-                        (symbol,)  # 심볼 파라미터
-                    )
-                    
-                    if result and len(result) > 1:
-                        for alarm_data in result[1:]:
-                                alarm_id = alarm_data.get('alarm_id')
-                                account_db_key = alarm_data.get('account_db_key')
-                                
-                                # Model Server 시그널 검증 요청
-                                model_decision = await cls._request_model_inference(
-                                    symbol, price, signal_type, band_data
-                                )
-                                
-                                # Model Server 응답이 있으면 해당 결과 사용
-                                if model_decision:
-                                    final_signal_type = model_decision.get('signal_type', signal_type)
-                                    confidence = model_decision.get('confidence', 0.5)
-                                else:
-                                    # Model Server 없으면 볼린저 밴드 결과 사용
-                                    final_signal_type = signal_type
-                                    confidence = 0.7  # 기본 신뢰도
-                                
-                                # 시그널 히스토리 저장
-                                signal_id = str(uuid.uuid4())
-                                save_result = await db_service.execute_shard_procedure(
-                                    account_db_key,
-                                    "fp_signal_history_save",
-                                    (signal_id, alarm_id, final_signal_type, price)
-                                )
-                                
-                                if save_result and save_result[0].get('ErrorCode') == 0:
-                                    Logger.info(f"✅ 시그널 저장 완료: {alarm_id} - {final_signal_type} @ {price} (신뢰도: {confidence})")
-                                    
-                                    # NotificationService를 통한 알림 전송
-                                    await cls._send_signal_notification(
-                                        account_db_key,
-                                        shard_id,  # 이미 알고 있는 shard_id 전달
-                                        symbol, 
-                                        final_signal_type, 
-                                        price,
-                                        band_data,
-                                        confidence
-                                    )
-                                
-                except Exception as e:
-                    Logger.error(f"샤드 {shard_id} 시그널 저장 실패: {e}")
-                    continue
+            # Model Server 시그널 검증 요청 (입력이 같으므로 구독자 수와 무관하게 1회)
+            model_decision = await cls._request_model_inference(symbol, price, signal_type, band_data)
+            
+            # Model Server 응답이 있으면 해당 결과 사용
+            if model_decision:
+                final_signal_type = model_decision.get('signal_type', signal_type)
+                confidence = model_decision.get('confidence', 0.5)
+            else:
+                # Model Server 없으면 볼린저 밴드 결과 사용
+                final_signal_type = signal_type
+                confidence = 0.7  # 기본 신뢰도
+            
+            # 샤드별 병렬 저장 및 알림
+            grouped = SignalAlarmIndex.group_by_shard(subscriptions)
+            await asyncio.gather(*[
+                cls._save_shard_signals(shard_id, shard_subscriptions, symbol, final_signal_type, price, band_data, confidence)
+                for shard_id, shard_subscriptions in grouped.items()
+            ])
                     
         except Exception as e:
             Logger.error(f"시그널 저장 실패: {e}")
     
+    # 시그널 히스토리 multi-row INSERT 컬럼 (fp_signal_history_save와 동일한 값 구성)
+    SIGNAL_HISTORY_COLUMNS = (
+        "signal_id", "alarm_id", "account_db_key", "symbol", "signal_type",
+        "signal_price", "volume", "triggered_at", "is_deleted"
+    )
+    
+    @classmethod
+    async def _save_shard_signals(cls, shard_id: int, subscriptions: List[AlarmSubscription], symbol: str,
+                                  signal_type: str, price: float, band_data: Dict, confidence: float):
+        """한 샤드의 구독자들에 대해 시그널 히스토리 일괄 저장 후 알림 일괄 발송"""
+        try:
+            db_service = ServiceContainer.get_database_service()
+            triggered_at = datetime.now()
+            rows = [
+                (str(uuid.uuid4()), subscription.alarm_id, subscription.account_db_key, symbol,
+                 signal_type, price, 0, triggered_at, 0)
+                for subscription in subscriptions
+            ]
+            
+            # 샤드당 커넥션 1개, multi-row INSERT 1회 (단일 트랜잭션)
+            await db_service.bulk_insert_shard(shard_id, "table_signal_history", cls.SIGNAL_HISTORY_COLUMNS, rows)
+            Logger.info(f"✅ 시그널 저장 완료: shard={shard_id}, {symbol} {signal_type} @ {price} "
+                        f"({len(rows)}건, 신뢰도: {confidence})")
+            
+        except Exception as e:
+            Logger.error(f"샤드 {shard_id} 시그널 저장 실패: {e}")
+            return
+        
+        await cls._send_signal_notifications(
+            shard_id,
+            [subscription.account_db_key for subscription in subscriptions],
+            symbol,
+            signal_type,
+            price,
+            band_data,
+            confidence
+        )
+    
     @classmethod
     async def _request_model_inference(cls, symbol: str, price: float, signal_type: str, band_data: Dict) -> Optional[Dict]:
         """Model Server에 추론 요청 - TODO: ExternalService 사용"""
@@ -1240,46 +1272,47 @@ class SignalMonitoringService:
             Logger.error(f"Model Server 추론 요청 실패: {e}")
             return None
     
-    @classmethod  
-    async def _send_signal_notification(cls, account_db_key: int, shard_id: int, symbol: str, 
-                                       signal_type: str, price: float, band_data: Dict, confidence: float = 0.7):
-        """NotificationService 큐를 통한 시그널 알림 전송"""
+    @classmethod
+    async def _get_notification_settings(cls, account_db_keys: List[int]) -> Dict[int, Dict[str, int]]:
+        """사용자 알림 설정 일괄 조회 (글로벌 DB 1회) - 프로필이 없는 사용자는 결과에 없음 (기본값: 모두 OFF)"""
+        if not account_db_keys:
+            return {}
+        database_service = ServiceContainer.get_database_service()
+        placeholders = ", ".join(["%s"] * len(account_db_keys))
+        rows = await database_service.execute_global_query(
+            f"""
+            SELECT account_db_key,
+                   COALESCE(email_notifications_enabled, 0) AS email_notifications_enabled,
+                   COALESCE(sms_notifications_enabled, 0) AS sms_notifications_enabled,
+                   COALESCE(push_notifications_enabled, 0) AS push_notifications_enabled,
+                   COALESCE(trade_alert_enabled, 0) AS trade_alert_enabled
+            FROM table_user_profiles
+            WHERE account_db_key IN ({placeholders})
+            """,
+            tuple(account_db_keys)
+        )
+        return {
+            int(row['account_db_key']): {
+                'email_notifications_enabled': int(row.get('email_notifications_enabled', 0)),
+                'sms_notifications_enabled': int(row.get('sms_notifications_enabled', 0)),
+                'push_notifications_enabled': int(row.get('push_notifications_enabled', 0)),
+                'trade_alert_enabled': int(row.get('trade_alert_enabled', 0))
+            }
+            for row in rows
+        }
+    
+    @classmethod
+    async def _send_signal_notifications(cls, shard_id: int, account_db_keys: List[int], symbol: str,
+                                         signal_type: str, price: float, band_data: Dict, confidence: float = 0.7):
+        """NotificationService 큐를 통한 시그널 알림 일괄 전송 (설정 조회 1회 + 큐 등록 1회)"""
         try:
-            from service.notification.notification_service import NotificationService
+            from service.notification.notification_service import Notification
             from service.notification.notification_config import NotificationType, NotificationChannel
-            from datetime import datetime, timedelta
             
-            # 1. 사용자 알림 설정 조회 (SQL 프로시저 사용)
-            database_service = ServiceContainer.get_database_service()
-            settings_result = await database_service.call_global_procedure(
-                "fp_get_user_notification_settings",
-                (account_db_key,)
-            )
-            
-            if not settings_result or len(settings_result) < 2:
-                Logger.warn(f"사용자 알림 설정 조회 실패, 기본값 사용: account_db_key={account_db_key}")
-                user_settings = {
-                    'email_notifications_enabled': 0,
-                    'sms_notifications_enabled': 0,
-                    'push_notifications_enabled': 0,
-                    'trade_alert_enabled': 0
-                }
-            else:
-                # 두 번째 행이 실제 설정 데이터 (첫 번째는 상태)
-                settings_data = settings_result[1]
-                user_settings = {
-                    'email_notifications_enabled': int(settings_data.get('email_notifications_enabled', 0)),
-                    'sms_notifications_enabled': int(settings_data.get('sms_notifications_enabled', 0)),
-                    'push_notifications_enabled': int(settings_data.get('push_notifications_enabled', 0)),
-                    'trade_alert_enabled': int(settings_data.get('trade_alert_enabled', 0))
-                }
-            
-            # 2. 거래 알림이 비활성화되어 있으면 전송하지 않음
-            if not user_settings['trade_alert_enabled']:
-                Logger.info(f"거래 알림 비활성화됨, 전송 건너뜀: user={account_db_key}, {symbol} {signal_type}")
-                return
+            # 1. 사용자 알림 설정 일괄 조회
+            settings_by_user = await cls._get_notification_settings(list(dict.fromkeys(account_db_keys)))
             
-            # 3. 시그널 타입에 따른 메시지 생성
+            # 2. 시그널 타입에 따른 메시지 생성 (구독자 공통)
             if signal_type == "BUY":
                 title = f"📈 {symbol} 매수 시그널"
                 message = f"{symbol} 종목에서 매수 신호가 발생했습니다. 현재가: ${price:.2f}"
@@ -1287,7 +1320,7 @@ class SignalMonitoringService:
                 title = f"📉 {symbol} 매도 시그널"
                 message = f"{symbol} 종목에서 매도 신호가 발생했습니다. 현재가: ${price:.2f}"
             
-            # 4. 알림 데이터 구성
+            # 3. 알림 데이터 구성
             notification_data = {
                 'symbol': symbol,
                 'signal_type': signal_type,
@@ -1301,7 +1334,7 @@ class SignalMonitoringService:
                 'timestamp': datetime.now().isoformat()
             }
             
-            # 5. 우선순위 결정 (신뢰도 기반)
+            # 4. 우선순위 결정 (신뢰도 기반)
             if confidence >= 0.8:
                 priority = 2  # HIGH
             elif confidence >= 0.6:
@@ -1309,33 +1342,43 @@ class SignalMonitoringService:
             else:
                 priority = 4  # LOW
             
-            # 6. 사용자 설정에 따라 전송할 채널 결정
-            channels = [NotificationChannel.IN_APP]  # 인앱 알림은 항상 포함
-            
-            if user_settings['email_notifications_enabled']:
-                channels.append(NotificationChannel.EMAIL)
-            if user_settings['sms_notifications_enabled']:
-                channels.append(NotificationChannel.SMS)  
-            if user_settings['push_notifications_enabled']:
-                channels.append(NotificationChannel.PUSH)
-            
-            # 7. NotificationService를 통한 멀티채널 알림 발송 (큐 사용)
-            success = await NotificationService.send_notification(
-                user_id=str(account_db_key),
-                shard_id=shard_id,
-                notification_type=NotificationType.PREDICTION_ALERT,
-                title=title,
-                message=message,
-                data=notification_data,
-                priority=priority,
-                channels=channels
-            )
+            # 5. 사용자별 채널 결정 (거래 알림 비활성 사용자는 제외)
+            items = []
+            for account_db_key in dict.fromkeys(account_db_keys):
+                user_settings = settings_by_user.get(account_db_key)
+                if not user_settings or not user_settings['trade_alert_enabled']:
+                    Logger.debug("거래 알림 비활성화됨, 전송 건너뜀: user=%s, %s %s", account_db_key, symbol, signal_type)
+                    continue
+                
+                channels = [NotificationChannel.IN_APP]  # 인앱 알림은 항상 포함
+                if user_settings['email_notifications_enabled']:
+                    channels.append(NotificationChannel.EMAIL)
+                if user_settings['sms_notifications_enabled']:
+                    channels.append(NotificationChannel.SMS)  
+                if user_settings['push_notifications_enabled']:
+                    channels.append(NotificationChannel.PUSH)
+                
+                items.append((
+                    Notification(
+                        id=str(uuid.uuid4()),
+                        user_id=str(account_db_key),
+                        shard_id=shard_id,
+                        type=NotificationType.PREDICTION_ALERT,
+                        title=title,
+                        message=message,
+                        data=notification_data,
+                        priority=priority
+                    ),
+                    channels
+                ))
+            
+            if not items:
+                return
             
-            if success:
-                channel_names = [ch.value for ch in channels]
-                Logger.info(f"📢 시그널 알림 큐 발송 성공: user={account_db_key}, {symbol} {signal_type}, 채널={channel_names}, 신뢰도={confidence}")
-            else:
-                Logger.error(f"시그널 알림 큐 발송 실패: user={account_db_key}, {symbol} {signal_type}")
+            # 6. NotificationService를 통한 일괄 큐 발송
+            sent = await NotificationService.send_notifications(items)
+            Logger.info(f"📢 시그널 알림 큐 발송: shard={shard_id}, {symbol} {signal_type}, "
+                        f"{sent}/{len(items)}건, 신뢰도={confidence}")
                 
         except Exception as e:
             Logger.error(f"시그널 알림 전송 에러: {e}")
@@ -1361,73 +1404,81 @@ class SignalMonitoringService:
             
             # 어제 날짜 (1일 경과한 시그널 평가)
             yesterday = (datetime.now() - timedelta(days=1)).date()
-            total_updated = 0
             
-            # 각 샤드에서 미평가 시그널 조회 및 처리
-            for shard_id in active_shards:
-                try:
-                    # 어제 발생한 미평가 시그널 조회
-                    result = await db_service.call_shard_procedure(
-                        shard_id,
-                        "fp_signal_get_pending_evaluation",
-                        (yesterday,)
-                    )
-                    
-                    if not result or result[0].get('ErrorCode') != 0:
-                        Logger.warn(f"샤드 {shard_id}: 미평가 시그널 조회 실패")
-                        continue
-                    
-                    # 시그널 데이터가 있으면 처리 (첫 번째 행은 상태, 두 번째 행부터 데이터)
-                    if len(result) > 1:
-                        Logger.info(f"샤드 {shard_id}: {len(result)-1}개 미평가 시그널 발견")
-                        
-                        for signal_row in result[1:]:  # 첫 번째 행은 상태, 나머지가 시그널 데이터
-                            signal_id = signal_row.get('signal_id')
-                            account_db_key = signal_row.get('account_db_key')
-                            symbol = signal_row.get('symbol')
-                            signal_type = signal_row.get('signal_type')
-                            signal_price = float(signal_row.get('signal_price', 0))
-                            
-                            if signal_price <= 0:
-                                Logger.warn(f"잘못된 시그널 가격: {signal_id}")
-                                continue
-                            
-                            # Yahoo Finance에서 현재 가격 조회
-                            current_price = await cls._get_current_price_for_evaluation(symbol)
-                            if current_price <= 0:
-                                Logger.warn(f"현재 가격 조회 실패: {symbol}")
-                                continue
-                            
-                            # 수익률 계산
-                            profit_rate = (current_price - signal_price) / signal_price * 100
-                            
-                            # 성공 판정 (1% 이상 움직임)
-                            is_win = 1 if abs(profit_rate) >= 1.0 else 0
-                            
-                            # DB 업데이트
-                            update_result = await db_service.execute_shard_procedure(
-                                account_db_key,
-                                "fp_signal_performance_update",
-                                (signal_id, current_price, profit_rate, is_win)
-                            )
-                            
-                            if update_result and update_result[0].get('ErrorCode') == 0:
-                                total_updated += 1
-                                Logger.info(f"✅ 시그널 성과 업데이트: {symbol} {signal_type} "
-                                          f"${signal_price:.2f} → ${current_price:.2f} "
-                                          f"({profit_rate:+.2f}%, {'성공' if is_win else '실패'})")
-                            else:
-                                Logger.error(f"시그널 성과 업데이트 실패: {signal_id}")
-                    
-                except Exception as e:
-                    Logger.error(f"샤드 {shard_id} 성과 업데이트 실패: {e}")
-                    continue
+            # 샤드별 조회/평가를 동시에 진행 (전체 소요시간 ≈ 가장 느린 샤드)
+            gathered = await db_service.scatter_gather(
+                lambda shard_id: cls._update_shard_signal_performance(db_service, shard_id, yesterday),
+                active_shards,
+                timeout=0  # 샤드당 시그널 수에 비례하므로 타임아웃 없음
+            )
+            for shard_id, error in gathered.errors.items():
+                Logger.error(f"샤드 {shard_id} 성과 업데이트 실패: {error}")
             
+            total_updated = sum(gathered.results.values())
             Logger.info(f"✅ 시그널 성과 업데이트 완료: 총 {total_updated}개 시그널 처리")
             
         except Exception as e:
             Logger.error(f"시그널 성과 업데이트 실패: {e}")
     
+    @classmethod
+    async def _update_shard_signal_performance(cls, db_service, shard_id: int, yesterday) -> int:
+        """한 샤드의 미평가 시그널 성과 업데이트 - 반환: 업데이트 건수"""
+        # 어제 발생한 미평가 시그널 조회
+        result = await db_service.call_shard_procedure(
+            shard_id,
+            "fp_signal_get_pending_evaluation",
+            (yesterday,)
+        )
+        
+        if not result or result[0].get('ErrorCode') != 0:
+            Logger.warn(f"샤드 {shard_id}: 미평가 시그널 조회 실패")
+            return 0
+        
+        # 첫 번째 행은 상태, 두 번째 행부터 시그널 데이터
+        if len(result) <= 1:
+            return 0
+        Logger.info(f"샤드 {shard_id}: {len(result)-1}개 미평가 시그널 발견")
+        
+        updated = 0
+        for signal_row in result[1:]:
+            signal_id = signal_row.get('signal_id')
+            symbol = signal_row.get('symbol')
+            signal_type = signal_row.get('signal_type')
+            signal_price = float(signal_row.get('signal_price', 0))
+            
+            if signal_price <= 0:
+                Logger.warn(f"잘못된 시그널 가격: {signal_id}")
+                continue
+            
+            # Yahoo Finance에서 현재 가격 조회
+            current_price = await cls._get_current_price_for_evaluation(symbol)
+            if current_price <= 0:
+                Logger.warn(f"현재 가격 조회 실패: {symbol}")
+                continue
+            
+            # 수익률 계산
+            profit_rate = (current_price - signal_price) / signal_price * 100
+            
+            # 성공 판정 (1% 이상 움직임)
+            is_win = 1 if abs(profit_rate) >= 1.0 else 0
+            
+            # DB 업데이트 (시그널이 저장된 샤드)
+            update_result = await db_service.call_shard_procedure(
+                shard_id,
+                "fp_signal_performance_update",
+                (signal_id, current_price, profit_rate, is_win)
+            )
+            
+            if update_result and update_result[0].get('ErrorCode') == 0:
+                updated += 1
+                Logger.info(f"✅ 시그널 성과 업데이트: {symbol} {signal_type} "
+                          f"${signal_price:.2f} → ${current_price:.2f} "
+                          f"({profit_rate:+.2f}%, {'성공' if is_win else '실패'})")
+            else:
+                Logger.error(f"시그널 성과 업데이트 실패: {signal_id}")
+        
+        return updated
+    
     @classmethod
     async def _get_current_price_for_evaluation(cls, symbol: str) -> float:
         """성과 평가용 현재 가격 조회 (Yahoo Finance 사용)"""
@@ -1450,8 +1501,19 @@ class SignalMonitoringService:
     
     @classmethod
     async def get_bollinger_data(cls, symbol: str) -> Optional[Dict]:
-        """캐시된 볼린저 밴드 데이터 조회"""
+        """볼린저 밴드 데이터 조회 (엔진 메모리 우선, 없으면 Redis)"""
         try:
+            bands = cls._bollinger_engine.bands(symbol)
+            if bands:
+                avg_price, std_dev, upper_band, lower_band = bands
+                return {
+                    'avg_price': avg_price,
+                    'upper_band': upper_band,
+                    'lower_band': lower_band,
+                    'std_dev': std_dev,
+                    'timestamp': datetime.now().isoformat()
+                }
+            
             cache_service = ServiceContainer.get_cache_service()
             bollinger_key = cls.CACHE_KEY_BOLLINGER.format(symbol=symbol)
             
@@ -1468,8 +1530,12 @@ class SignalMonitoringService:
     
     @classmethod
     async def get_5days_data(cls, symbol: str) -> Optional[List[Dict]]:
-        """캐시된 5일치 데이터 조회"""
+        """5일치 데이터 조회 (엔진 메모리 우선, 없으면 Redis)"""
         try:
+            days_data = cls._bollinger_engine.snapshot(symbol)
+            if days_data:
+                return days_data
+            
             cache_service = ServiceContainer.get_cache_service()
             cache_key = cls.CACHE_KEY_5DAYS.format(symbol=symbol)
             
@@ -1498,6 +1564,26 @@ class SignalMonitoringService:
                     pass
             cls._scheduler_job_ids.clear()
             
+            # REST 폴링 스케줄러 종료
+            if cls._rest_poller:
+                await cls._rest_poller.stop()
+                cls._rest_poller = None
+            
+            # 틱 처리 워커 종료
+            if cls._tick_mailbox:
+                await cls._tick_mailbox.stop()
+                cls._tick_mailbox = None
+            
+            # 아직 저장되지 않은 볼린저 윈도우 저장
+            try:
+                engine = cls._bollinger_engine
+                symbols = engine.symbols()
+                pending = engine.take_persist_candidates(symbols, np.zeros(len(symbols), dtype=bool), 0)
+                if pending:
+                    await cls._persist_bollinger_windows(pending)
+            except Exception as e:
+                Logger.error(f"볼린저 윈도우 저장 실패: {e}")
+            
             # WebSocket 연결 해제
             if cls._korea_websocket:
                 await cls._korea_websocket.disconnect()
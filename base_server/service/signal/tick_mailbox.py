@@ -0,0 +1,165 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from service.core.logger import Logger
+from service.core.latency_histogram import LatencyHistogram
+
+TickBatchHandler = Callable[[List[Tuple[str, Dict]]], Awaitable[None]]
+
+@dataclass
+class TickMailboxMetrics:
+    received: int = 0      # post() 호출 수
+    merged: int = 0        # 대기 중 틱을 덮어쓴 수 (처리 생략)
+    dropped: int = 0       # 용량 초과/중지 상태로 버린 수
+    processed: int = 0     # 핸들러로 전달된 틱 수
+    batches: int = 0       # 핸들러 호출 수
+    errors: int = 0        # 핸들러 예외 수
+
+class TickMailbox:
+    """
+    심볼별 최신값 메일박스 (틱 병합 + 백프레셔)
+    - 심볼마다 대기 슬롯 1개: 처리 중/대기 중에 들어온 틱은 기존 대기 틱을 덮어씀
+    - 같은 심볼은 동시에 하나의 워커만 처리
+    - max_workers 개의 워커가 최대 batch_size 심볼씩 묶어 핸들러 호출
+    - 대기 심볼 수가 max_pending을 넘으면 신규 심볼 틱은 버림
+    """
+    def __init__(self, handler: TickBatchHandler, max_workers: int = 4, batch_size: int = 64, max_pending: int = 10000):
+        self._handler = handler
+        self._max_workers = max_workers
+        self._batch_size = batch_size
+        self._max_pending = max_pending
+
+        self._pending: Dict[str, Tuple[Dict, float]] = {}
+        self._ready: Deque[str] = deque()
+        self._in_flight: Set[str] = set()
+        self._wakeup = asyncio.Event()
+        self._workers: List[asyncio.Task] = []
+        self._running = False
+
+        self.metrics = TickMailboxMetrics()
+        self._latency: Dict[str, LatencyHistogram] = {}
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._wakeup = asyncio.Event()
+        self._workers = [asyncio.create_task(self._worker_loop(i)) for i in range(self._max_workers)]
+        if self._ready:
+            self._wakeup.set()
+
+    async def stop(self):
+        """워커 종료 - 남은 대기 틱은 버림"""
+        self._running = False
+        self._wakeup.set()
+        for task in self._workers:
+            task.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self.metrics.dropped += len(self._pending)
+        self._pending.clear()
+        self._ready.clear()
+        self._in_flight.clear()
+
+    def post(self, symbol: str, data: Dict) -> bool:
+        """
+        틱 등록 (이벤트 루프 스레드에서 동기 호출)
+        반환: 수락 여부 (병합 포함 True, 버림 False)
+        """
+        self.metrics.received += 1
+        if not self._running:
+            self.metrics.dropped += 1
+            return False
+
+        if symbol in self._pending:
+            # 아직 처리되지 않은 이전 틱을 최신 틱으로 교체 (최초 도착 시각 유지 → 지연시간에 대기 포함)
+            self._pending[symbol] = (data, self._pending[symbol][1])
+            self.metrics.merged += 1
+            return True
+
+        if len(self._pending) >= self._max_pending:
+            self.metrics.dropped += 1
+            return False
+
+        self._pending[symbol] = (data, time.perf_counter())
+        if symbol not in self._in_flight:
+            self._ready.append(symbol)
+            self._wakeup.set()
+        return True
+
+    def _take_batch(self) -> List[Tuple[str, Dict, float]]:
+        batch = []
+        while self._ready and len(batch) < self._batch_size:
+            symbol = self._ready.popleft()
+            entry = self._pending.pop(symbol, None)
+            if entry is None:
+                continue
+            self._in_flight.add(symbol)
+            batch.append((symbol, entry[0], entry[1]))
+        if not self._ready:
+            self._wakeup.clear()
+        return batch
+
+    def _complete(self, batch: List[Tuple[str, Dict, float]]):
+        now = time.perf_counter()
+        for symbol, _, posted_at in batch:
+            self._in_flight.discard(symbol)
+            histogram = self._latency.get(symbol)
+            if histogram is None:
+                histogram = self._latency[symbol] = LatencyHistogram()
+            histogram.record((now - posted_at) * 1000.0)
+            # 처리 중에 새 틱이 들어왔으면 다시 준비 큐로
+            if symbol in self._pending:
+                self._ready.append(symbol)
+                self._wakeup.set()
+
+    async def _worker_loop(self, worker_id: int):
+        while self._running:
+            try:
+                await self._wakeup.wait()
+                batch = self._take_batch()
+                if not batch:
+                    continue
+                try:
+                    await self._handler([(symbol, data) for symbol, data, _ in batch])
+                    self.metrics.processed += len(batch)
+                    self.metrics.batches += 1
+                except Exception as e:
+                    self.metrics.errors += 1
+                    Logger.error(f"TickMailbox 워커 {worker_id} 처리 에러: {e}")
+                finally:
+                    self._complete(batch)
+            except asyncio.CancelledError:
+                break
+
+    def forget(self, symbol: str):
+        """구독 해제된 심볼의 대기 틱/지연시간 통계 제거"""
+        self._pending.pop(symbol, None)
+        self._latency.pop(symbol, None)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "received": self.metrics.received,
+            "merged": self.metrics.merged,
+            "dropped": self.metrics.dropped,
+            "processed": self.metrics.processed,
+            "batches": self.metrics.batches,
+            "errors": self.metrics.errors,
+            "pending_symbols": len(self._pending),
+            "in_flight_symbols": len(self._in_flight),
+            "workers": len(self._workers),
+            "latency_ms": {symbol: h.to_dict() for symbol, h in self._latency.items()}
+        }
+
+    def reset_metrics(self):
+        self.metrics = TickMailboxMetrics()
+        for histogram in self._latency.values():
+            histogram.reset()
@@ -2,6 +2,7 @@
 
 from .websocket_config import WebSocketConfig
 from .websocket_client import WebSocketClientManager, WebSocketClient, WebSocketMessage, ConnectionState
+from .websocket_redis_bridge import WebSocketRedisBridge
 from .websocket_service import WebSocketService
 
 __all__ = [
@@ -10,5 +11,6 @@ __all__ = [
     "WebSocketClient",
     "WebSocketMessage",
     "ConnectionState",
+    "WebSocketRedisBridge",
     "WebSocketService"
 ]
\ No newline at end of file
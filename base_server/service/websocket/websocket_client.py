@@ -3,13 +3,22 @@ WebSocket 클라이언트 관리
 """
 import asyncio
 import json
+import time
 from datetime import datetime
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple
 from fastapi import WebSocket, WebSocketDisconnect
 from dataclasses import dataclass
 from enum import Enum
 
 from service.core.logger import Logger
+from service.core.latency_histogram import LatencyHistogram
+
+# 송신 큐 항목: (직렬화된 메시지, 적재 시각(monotonic), 지연시간 집계 키)
+OutboundItem = Tuple[str, float, Optional[str]]
+
+# 송신 큐 초과 시 정책
+SLOW_CLIENT_DISCONNECT = "disconnect"     # 느린 클라이언트 연결 해제
+SLOW_CLIENT_DROP_OLDEST = "drop_oldest"   # 가장 오래된 메시지 버리고 적재
 
 
 class ConnectionState(Enum):
@@ -41,6 +50,9 @@ class WebSocketClient:
     last_pong: Optional[datetime] = None
     state: ConnectionState = ConnectionState.CONNECTING
     metadata: Dict[str, Any] = None
+    outbound: Optional[asyncio.Queue] = None        # 송신 큐 (writer 태스크가 소비)
+    writer_task: Optional[asyncio.Task] = None
+    dropped_messages: int = 0
     
     def __post_init__(self):
         if self.channels is None:
@@ -50,9 +62,19 @@ class WebSocketClient:
 
 
 class WebSocketClientManager:
-    """WebSocket 클라이언트 관리자"""
+    """
+    WebSocket 클라이언트 관리자
+    - 메시지는 수신자 수와 무관하게 1회만 직렬화
+    - 클라이언트별 송신 큐 + writer 태스크로 전송 (느린 클라이언트가 브로드캐스트를 막지 않음)
+    - 송신 큐가 가득 차면 slow_client_policy에 따라 연결 해제 또는 오래된 메시지 폐기
+    """
     
-    def __init__(self):
+    def __init__(self, outbound_queue_size: int = 100, slow_client_policy: str = SLOW_CLIENT_DISCONNECT,
+                 send_timeout: float = 5.0):
+        self._outbound_queue_size = max(1, outbound_queue_size)
+        self._slow_client_policy = slow_client_policy
+        self._send_timeout = send_timeout
+        
         # 연결된 클라이언트들
         self.active_connections: Dict[str, WebSocketClient] = {}
         
@@ -71,8 +93,14 @@ class WebSocketClientManager:
             "active_connections": 0,
             "messages_sent": 0,
             "messages_received": 0,
-            "errors": 0
+            "errors": 0,
+            "messages_dropped": 0,
+            "slow_client_disconnects": 0,
+            "send_timeouts": 0
         }
+        
+        # 채널별 fan-out 지연시간 (적재 → 전송 완료, 수신자 단위)
+        self.fanout_latency: Dict[str, LatencyHistogram] = {}
     
     async def connect(self, client_id: str, websocket: WebSocket, user_id: Optional[str] = None) -> bool:
         """클라이언트 연결"""
@@ -83,8 +111,10 @@ class WebSocketClientManager:
                 client_id=client_id,
                 websocket=websocket,
                 user_id=user_id,
-                state=ConnectionState.CONNECTED
+                state=ConnectionState.CONNECTED,
+                outbound=asyncio.Queue(maxsize=self._outbound_queue_size)
             )
+            client.writer_task = asyncio.create_task(self._writer_loop(client))
             
             self.active_connections[client_id] = client
             
@@ -122,8 +152,12 @@ class WebSocketClientManager:
             client = self.active_connections[client_id]
             client.state = ConnectionState.DISCONNECTING
             
+            # 송신 writer 중지 (writer 자신이 호출한 경우 루프가 스스로 종료)
+            if client.writer_task and client.writer_task is not asyncio.current_task():
+                client.writer_task.cancel()
+            
             # 채널에서 제거
-            for channel in client.channels:
+            for channel in list(client.channels):
                 await self.unsubscribe_from_channel(client_id, channel)
             
             # 사용자 매핑에서 제거
@@ -143,28 +177,132 @@ class WebSocketClientManager:
             Logger.error(f"WebSocket 연결 해제 오류: {client_id} - {e}")
             self.stats["errors"] += 1
     
-    async def send_to_client(self, client_id: str, message: Dict[str, Any]) -> bool:
-        """특정 클라이언트에게 메시지 전송"""
+    @staticmethod
+    def serialize(message: Dict[str, Any]) -> str:
+        """메시지 1회 직렬화 (원본 dict는 변경하지 않고 타임스탬프 추가)"""
+        if "timestamp" not in message:
+            message = {**message, "timestamp": datetime.now().isoformat()}
+        return json.dumps(message)
+    
+    def _enqueue(self, client: WebSocketClient, text: str, enqueued_at: float,
+                 latency_key: Optional[str] = None) -> bool:
+        """
+        송신 큐에 적재 (대기 없음)
+        반환: 적재 여부 - False이면서 정책이 disconnect이면 호출자가 연결 해제
+        """
+        if client.state != ConnectionState.CONNECTED:
+            return False
+        
+        item: OutboundItem = (text, enqueued_at, latency_key)
         try:
-            if client_id not in self.active_connections:
-                return False
-            
-            client = self.active_connections[client_id]
-            if client.state != ConnectionState.CONNECTED:
-                return False
-            
-            # 메시지에 타임스탬프 추가
-            if "timestamp" not in message:
-                message["timestamp"] = datetime.now().isoformat()
-            
-            await client.websocket.send_text(json.dumps(message))
-            self.stats["messages_sent"] += 1
-            
+            client.outbound.put_nowait(item)
             return True
+        except asyncio.QueueFull:
+            pass
+        
+        client.dropped_messages += 1
+        self.stats["messages_dropped"] += 1
+        if self._slow_client_policy == SLOW_CLIENT_DROP_OLDEST:
+            client.outbound.get_nowait()
+            client.outbound.put_nowait(item)
+            return True
+        return False
+    
+    async def _fan_out(self, client_ids: List[str], message: Dict[str, Any],
+                       latency_key: Optional[str] = None) -> int:
+        """직렬화 1회 후 대상 클라이언트 송신 큐에 적재"""
+        return await self._fan_out_text(client_ids, self.serialize(message), latency_key)
+    
+    async def _fan_out_text(self, client_ids: List[str], text: str, latency_key: Optional[str] = None) -> int:
+        """직렬화된 메시지를 대상 클라이언트 송신 큐에 적재, 큐가 넘친 클라이언트는 연결 해제"""
+        enqueued_at = time.monotonic()
+        sent_count = 0
+        slow_clients = []
+        
+        for client_id in client_ids:
+            client = self.active_connections.get(client_id)
+            if client is None:
+                continue
+            if self._enqueue(client, text, enqueued_at, latency_key):
+                sent_count += 1
+            elif client.state == ConnectionState.CONNECTED:
+                slow_clients.append(client_id)
+        
+        for client_id in slow_clients:
+            await self._disconnect_slow_client(client_id)
+        
+        # 연속 브로드캐스트 중에도 writer 태스크가 큐를 비울 기회를 줌
+        await asyncio.sleep(0)
+        return sent_count
+    
+    async def _disconnect_slow_client(self, client_id: str):
+        client = self.active_connections.get(client_id)
+        if client is None:
+            return
+        self.stats["slow_client_disconnects"] += 1
+        Logger.warn(f"송신 큐 초과로 WebSocket 연결 해제: {client_id} (대기 {client.outbound.qsize()}건)")
+        await self.disconnect(client_id, "slow_consumer")
+        # close 프레임 전송도 느릴 수 있으므로 백그라운드에서 처리
+        asyncio.create_task(self._close_quietly(client.websocket, 1013))
+    
+    async def _close_quietly(self, websocket: WebSocket, code: int):
+        try:
+            await asyncio.wait_for(websocket.close(code=code), timeout=self._send_timeout)
+        except Exception:
+            pass
+    
+    async def _send_batch(self, client: WebSocketClient, batch: List[OutboundItem]):
+        for text, enqueued_at, latency_key in batch:
+            await client.websocket.send_text(text)
+            self.stats["messages_sent"] += 1
             
+            if latency_key is not None:
+                histogram = self.fanout_latency.get(latency_key)
+                if histogram is not None:
+                    histogram.record((time.monotonic() - enqueued_at) * 1000.0)
+    
+    async def _writer_loop(self, client: WebSocketClient):
+        """
+        클라이언트 송신 큐 소비 - 쌓인 메시지를 한 번에 꺼내 연속 전송
+        전송 실패/타임아웃(한 번에 꺼낸 배치 전체에 send_timeout) 시 연결 해제 후 소켓 close (best effort)
+        (프레임마다 wait_for를 걸면 전송마다 태스크가 생겨 빠른 클라이언트도 큐를 못 비움)
+        """
+        client_id = client.client_id
+        queue = client.outbound
+        try:
+            while client.state == ConnectionState.CONNECTED:
+                batch = [await queue.get()]
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+                await asyncio.wait_for(self._send_batch(client, batch), timeout=self._send_timeout)
+        
+        except asyncio.CancelledError:
+            pass
+        except asyncio.TimeoutError:
+            self.stats["send_timeouts"] += 1
+            Logger.warn(f"WebSocket 전송 타임아웃: {client_id}")
+            await self.disconnect(client_id, "send_timeout")
+            await self._close_quietly(client.websocket, 1013)
         except WebSocketDisconnect:
             await self.disconnect(client_id, "websocket_disconnect")
-            return False
+        except Exception as e:
+            Logger.error(f"메시지 전송 실패: {client_id} - {e}")
+            self.stats["errors"] += 1
+            await self.disconnect(client_id, "send_error")
+            await self._close_quietly(client.websocket, 1011)
+    
+    async def send_to_client(self, client_id: str, message: Dict[str, Any]) -> bool:
+        """
+        특정 클라이언트에게 메시지 전송 요청 - 송신 큐에 적재하고 바로 반환 (실제 전송은 writer 태스크)
+        반환: 적재 여부 (True여도 전달 보장 아님, 전송 실패 시 연결이 해제됨)
+        """
+        try:
+            client = self.active_connections.get(client_id)
+            if client is None:
+                return False
+            
+            return await self._fan_out([client_id], message) > 0
+            
         except Exception as e:
             Logger.error(f"메시지 전송 실패: {client_id} - {e}")
             self.stats["errors"] += 1
@@ -172,42 +310,28 @@ class WebSocketClientManager:
     
     async def send_to_user(self, user_id: str, message: Dict[str, Any]) -> int:
         """특정 사용자의 모든 클라이언트에게 메시지 전송"""
-        sent_count = 0
-        
         if user_id not in self.user_clients:
-            return sent_count
-        
-        client_ids = self.user_clients[user_id].copy()
-        for client_id in client_ids:
-            if await self.send_to_client(client_id, message):
-                sent_count += 1
+            return 0
         
-        return sent_count
+        return await self._fan_out(self.user_clients[user_id].copy(), message)
     
     async def broadcast_to_channel(self, channel: str, message: Dict[str, Any]) -> int:
         """채널의 모든 구독자에게 메시지 브로드캐스트"""
-        sent_count = 0
-        
         if channel not in self.channel_subscribers:
-            return sent_count
+            return 0
         
-        client_ids = self.channel_subscribers[channel].copy()
-        for client_id in client_ids:
-            if await self.send_to_client(client_id, message):
-                sent_count += 1
+        return await self._fan_out(self.channel_subscribers[channel].copy(), message, latency_key=channel)
+    
+    async def broadcast_text_to_channel(self, channel: str, text: str) -> int:
+        """이미 직렬화된 메시지를 채널 구독자에게 전송 (Redis 브리지 수신 경로 - 재직렬화 없음)"""
+        if channel not in self.channel_subscribers:
+            return 0
         
-        return sent_count
+        return await self._fan_out_text(self.channel_subscribers[channel].copy(), text, latency_key=channel)
     
     async def broadcast_to_all(self, message: Dict[str, Any]) -> int:
         """모든 연결된 클라이언트에게 메시지 브로드캐스트"""
-        sent_count = 0
-        
-        client_ids = list(self.active_connections.keys())
-        for client_id in client_ids:
-            if await self.send_to_client(client_id, message):
-                sent_count += 1
-        
-        return sent_count
+        return await self._fan_out(list(self.active_connections.keys()), message)
     
     async def subscribe_to_channel(self, client_id: str, channel: str) -> bool:
         """클라이언트를 채널에 구독"""
@@ -228,6 +352,9 @@ class WebSocketClientManager:
             if client_id not in self.channel_subscribers[channel]:
                 self.channel_subscribers[channel].append(client_id)
             
+            if channel not in self.fanout_latency:
+                self.fanout_latency[channel] = LatencyHistogram()
+            
             Logger.info(f"채널 구독: {client_id} -> {channel}")
             return True
             
@@ -255,6 +382,7 @@ class WebSocketClientManager:
                 # 구독자가 없으면 채널 제거
                 if not self.channel_subscribers[channel]:
                     del self.channel_subscribers[channel]
+                    self.fanout_latency.pop(channel, None)
             
             Logger.info(f"채널 구독 해제: {client_id} -> {channel}")
             return True
@@ -363,7 +491,9 @@ class WebSocketClientManager:
             "state": client.state.value,
             "last_ping": client.last_ping.isoformat() if client.last_ping else None,
             "last_pong": client.last_pong.isoformat() if client.last_pong else None,
-            "metadata": client.metadata
+            "metadata": client.metadata,
+            "outbound_queued": client.outbound.qsize() if client.outbound else 0,
+            "dropped_messages": client.dropped_messages
         }
     
     def get_stats(self) -> Dict[str, Any]:
@@ -371,16 +501,23 @@ class WebSocketClientManager:
         return {
             **self.stats,
             "channels": len(self.channel_subscribers),
-            "users_with_connections": len(self.user_clients)
+            "users_with_connections": len(self.user_clients),
+            "outbound_queued": sum(c.outbound.qsize() for c in self.active_connections.values() if c.outbound),
+            "slow_client_policy": self._slow_client_policy
         }
     
+    def get_fanout_stats(self) -> Dict[str, Dict[str, Any]]:
+        """채널별 fan-out 지연시간 (ms)"""
+        return {channel: histogram.to_dict() for channel, histogram in self.fanout_latency.items()}
+    
     def get_channel_info(self, channel: str) -> Dict[str, Any]:
         """채널 정보 조회"""
         subscriber_count = len(self.channel_subscribers.get(channel, []))
         return {
             "channel": channel,
             "subscriber_count": subscriber_count,
-            "subscribers": self.channel_subscribers.get(channel, [])
+            "subscribers": self.channel_subscribers.get(channel, []),
+            "fanout_latency_ms": self.fanout_latency[channel].to_dict() if channel in self.fanout_latency else None
         }
     
     async def cleanup_inactive_connections(self, timeout_seconds: int = 300):
@@ -16,7 +16,9 @@ class WebSocketConfig(BaseModel):
     connection_timeout: int = 60  # 60초 비활성 시 연결 종료
     
     # 메시지 관련 설정
-    message_queue_size: int = 100  # 클라이언트별 메시지 큐 크기
+    message_queue_size: int = 100  # 클라이언트별 송신 큐 크기
+    slow_client_policy: str = "disconnect"  # 송신 큐 초과 시: disconnect(연결 해제) | drop_oldest(오래된 메시지 폐기)
+    send_timeout_seconds: float = 5.0  # 송신 배치(writer가 한 번에 꺼낸 큐 적재분, 최대 message_queue_size건) 전송 타임아웃 (초과 시 연결 해제 + close)
     broadcast_buffer_size: int = 1000  # 브로드캐스트 버퍼 크기
     
     # 보안 설정
@@ -26,6 +28,7 @@ class WebSocketConfig(BaseModel):
     # Redis 설정 (선택사항 - 다중 서버 환경에서 사용)
     use_redis_pubsub: bool = False
     redis_channel_prefix: str = "websocket"
+    node_id: Optional[str] = None  # 인스턴스 식별자 (자기 발행 메시지 에코 무시용, 미설정 시 자동 생성)
     
     # 재시도 설정
     max_retries: int = 3
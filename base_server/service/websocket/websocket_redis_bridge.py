@@ -0,0 +1,158 @@
+"""
+WebSocket Redis Pub/Sub 브리지 - 다중 인스턴스 채널 fan-out
+"""
+import asyncio
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from service.core.logger import Logger
+from service.cache.cache_service import CacheService
+from .websocket_client import WebSocketClientManager
+
+
+@dataclass
+class RedisBridgeMetrics:
+    published: int = 0        # Redis로 발행한 메시지 수
+    received: int = 0         # 다른 노드에서 수신한 메시지 수
+    delivered: int = 0        # 수신 메시지를 로컬 송신 큐에 적재한 클라이언트 수 누계
+    echoes_skipped: int = 0   # 자기 노드가 발행한 메시지 (이미 로컬 전송함)
+    no_subscribers: int = 0   # 로컬 구독자가 없어 버린 메시지 수
+    reconnects: int = 0       # 구독 재연결 수
+    errors: int = 0
+
+
+class WebSocketRedisBridge:
+    """
+    프로세스당 1개의 Redis 패턴 구독으로 인스턴스 간 채널 메시지 전달
+    - 구독: PSUBSCRIBE "{prefix}:*" 1회, 리더 태스크 1개 (연결 끊김 시 백오프 재연결)
+    - 발행 형식: "{node_id}|{직렬화된 메시지}" - 수신 측은 node_id만 비교해 자기 에코를 파싱 없이 건너뜀
+    - 발행 노드는 로컬 구독자에게 직접 전송하고, 다른 노드는 수신 텍스트를 재직렬화 없이 채널 구독자에게 전달
+    - 로컬 구독자가 없는 채널 메시지는 즉시 버림
+    """
+
+    def __init__(self, client_manager: WebSocketClientManager, channel_prefix: str = "websocket",
+                 node_id: Optional[str] = None):
+        self._client_manager = client_manager
+        self._channel_prefix = channel_prefix
+        self.node_id = node_id or uuid.uuid4().hex[:12]
+        self.running = False
+        self.task: Optional[asyncio.Task] = None
+        self._subscribed = asyncio.Event()
+        self.metrics = RedisBridgeMetrics()
+
+    def _redis_channel(self, channel: str) -> str:
+        return f"{self._channel_prefix}:{channel}"
+
+    async def start(self, wait_subscribed: float = 0.0):
+        """리더 태스크 시작 - wait_subscribed > 0이면 최초 구독 완료까지 최대 해당 시간(초) 대기"""
+        if self.running:
+            return
+        self.running = True
+        self._subscribed = asyncio.Event()
+        self.task = asyncio.create_task(self._run())
+        Logger.info(f"WebSocket Redis 브리지 시작 (node_id={self.node_id})")
+        if wait_subscribed > 0:
+            try:
+                await asyncio.wait_for(self._subscribed.wait(), timeout=wait_subscribed)
+            except asyncio.TimeoutError:
+                Logger.warn("WebSocket Redis 브리지 구독 대기 시간 초과 - 백그라운드에서 재시도")
+
+    async def stop(self):
+        self.running = False
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+        Logger.info("WebSocket Redis 브리지 중지")
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> int:
+        """
+        모든 인스턴스의 채널 구독자에게 전송
+        - 직렬화 1회, 로컬 구독자에게는 즉시 전송 (Redis 장애 시에도 로컬 전달은 유지)
+        반환: 로컬 송신 큐에 적재한 클라이언트 수
+        """
+        text = self._client_manager.serialize(message)
+        local_count = await self._client_manager.broadcast_text_to_channel(channel, text)
+        try:
+            async with CacheService.get_client() as client:
+                await client.publish(self._redis_channel(channel), f"{self.node_id}|{text}")
+            self.metrics.published += 1
+        except Exception as e:
+            self.metrics.errors += 1
+            Logger.error(f"WebSocket Redis 발행 실패: {channel} - {e}")
+        return local_count
+
+    async def _run(self):
+        """패턴 구독을 유지하며 수신 메시지 디스패치 (연결 끊김 시 백오프 재연결)"""
+        retry_delay = 1.0
+        first = True
+        while self.running:
+            pubsub = None
+            try:
+                async with CacheService.get_blocking_client() as client:
+                    pubsub = await client.psubscribe(self._redis_channel("*"))
+                    channel_head = len(client.cache_key) + len(self._channel_prefix) + 2
+                    if not first:
+                        self.metrics.reconnects += 1
+                        Logger.info("WebSocket Redis 브리지 재구독 완료")
+                    first = False
+                    retry_delay = 1.0
+                    self._subscribed.set()
+
+                    while self.running:
+                        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                        if not message:
+                            continue
+                        try:
+                            await self._dispatch(message["channel"][channel_head:], message["data"])
+                        except Exception as e:
+                            self.metrics.errors += 1
+                            Logger.error(f"WebSocket Redis 메시지 처리 오류: {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._subscribed.clear()
+                self.metrics.errors += 1
+                Logger.warn(f"WebSocket Redis 브리지 구독 오류 (retry in {retry_delay:.0f}s): {e}")
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, 30.0)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
+
+    async def _dispatch(self, channel: str, data: str):
+        node_id, sep, text = data.partition("|")
+        if not sep:
+            self.metrics.errors += 1
+            Logger.warn(f"잘못된 WebSocket Redis 메시지 형식: {channel}")
+            return
+        if node_id == self.node_id:
+            self.metrics.echoes_skipped += 1
+            return
+
+        self.metrics.received += 1
+        if channel not in self._client_manager.channel_subscribers:
+            self.metrics.no_subscribers += 1
+            return
+        self.metrics.delivered += await self._client_manager.broadcast_text_to_channel(channel, text)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "node_id": self.node_id,
+            "running": self.running,
+            "subscribed": self._subscribed.is_set(),
+            "published": self.metrics.published,
+            "received": self.metrics.received,
+            "delivered": self.metrics.delivered,
+            "echoes_skipped": self.metrics.echoes_skipped,
+            "no_subscribers": self.metrics.no_subscribers,
+            "reconnects": self.metrics.reconnects,
+            "errors": self.metrics.errors
+        }
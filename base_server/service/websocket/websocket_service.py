@@ -11,6 +11,7 @@ from service.core.logger import Logger
 from service.cache.cache_service import CacheService
 from .websocket_config import WebSocketConfig
 from .websocket_client import WebSocketClientManager, WebSocketClient
+from .websocket_redis_bridge import WebSocketRedisBridge
 
 
 class WebSocketService:
@@ -21,13 +22,18 @@ class WebSocketService:
     _initialized: bool = False
     _heartbeat_task: Optional[asyncio.Task] = None
     _cleanup_task: Optional[asyncio.Task] = None
+    _redis_bridge: Optional[WebSocketRedisBridge] = None
     
     @classmethod
     def init(cls, config: WebSocketConfig) -> bool:
         """WebSocket 서비스 초기화"""
         try:
             cls._config = config
-            cls._client_manager = WebSocketClientManager()
+            cls._client_manager = WebSocketClientManager(
+                outbound_queue_size=config.message_queue_size,
+                slow_client_policy=config.slow_client_policy,
+                send_timeout=config.send_timeout_seconds
+            )
             cls._initialized = True
             
             Logger.info("WebSocket 서비스 초기화 완료")
@@ -49,11 +55,18 @@ class WebSocketService:
         # 정리 태스크 시작
         cls._cleanup_task = asyncio.create_task(cls._cleanup_loop())
         
+        # 다중 서버 환경 - Redis Pub/Sub 브리지
+        await cls.setup_redis_pubsub()
+        
         Logger.info("WebSocket 백그라운드 태스크 시작")
     
     @classmethod
     async def stop_background_tasks(cls):
         """백그라운드 태스크 중지"""
+        if cls._redis_bridge:
+            await cls._redis_bridge.stop()
+            cls._redis_bridge = None
+        
         if cls._heartbeat_task:
             cls._heartbeat_task.cancel()
             try:
@@ -141,7 +154,7 @@ class WebSocketService:
     
     @classmethod
     async def send_to_client(cls, client_id: str, message: Dict[str, Any]) -> bool:
-        """특정 클라이언트에게 메시지 전송"""
+        """특정 클라이언트에게 메시지 전송 요청 - 반환: 송신 큐 적재 여부 (전달 보장 아님)"""
         if not cls._initialized or not cls._client_manager:
             raise RuntimeError("WebSocket service not initialized")
         
@@ -211,6 +224,14 @@ class WebSocketService:
         
         return cls._client_manager.get_stats()
     
+    @classmethod
+    def get_fanout_stats(cls) -> Dict[str, Any]:
+        """채널별 fan-out 지연시간 반환"""
+        if not cls._initialized or not cls._client_manager:
+            return {"error": "service_not_initialized"}
+        
+        return cls._client_manager.get_fanout_stats()
+    
     @classmethod
     def get_channel_info(cls, channel: str) -> Dict[str, Any]:
         """채널 정보 조회"""
@@ -308,36 +329,42 @@ class WebSocketService:
     # Redis Pub/Sub 연동 메서드들 (선택사항)
     @classmethod
     async def setup_redis_pubsub(cls):
-        """Redis Pub/Sub 설정 (다중 서버 환경용)"""
+        """Redis Pub/Sub 브리지 시작 (다중 서버 환경용) - 프로세스당 패턴 구독 1개"""
         if not cls._config.use_redis_pubsub or not CacheService.is_initialized():
             return
+        if cls._redis_bridge and cls._redis_bridge.running:
+            return
         
         try:
-            # Redis Pub/Sub 구독 설정
-            redis_client = CacheService.get_redis_client()
-            
-            # 채널별 메시지 구독
-            async def message_handler(channel, message):
-                channel_name = channel.decode('utf-8').replace(f"{cls._config.redis_channel_prefix}:", "")
-                await cls.broadcast_to_channel(channel_name, message)
-            
-            Logger.info("Redis Pub/Sub WebSocket 연동 설정 완료")
+            cls._redis_bridge = WebSocketRedisBridge(
+                cls._client_manager,
+                channel_prefix=cls._config.redis_channel_prefix,
+                node_id=cls._config.node_id
+            )
+            await cls._redis_bridge.start(wait_subscribed=cls._config.connection_timeout_seconds)
+            Logger.info(f"Redis Pub/Sub WebSocket 연동 설정 완료 (node_id={cls._redis_bridge.node_id})")
             
         except Exception as e:
             Logger.error(f"Redis Pub/Sub 설정 실패: {e}")
     
     @classmethod
-    async def publish_to_redis_channel(cls, channel: str, message: Dict[str, Any]):
-        """Redis 채널에 메시지 발행 (다중 서버 환경용)"""
-        if not cls._config.use_redis_pubsub or not CacheService.is_initialized():
-            return
+    async def publish_to_redis_channel(cls, channel: str, message: Dict[str, Any]) -> int:
+        """
+        모든 서버의 채널 구독자에게 메시지 전송 (다중 서버 환경용)
+        - 로컬 구독자는 즉시 전송, 다른 서버는 Redis 경유
+        - Redis 연동이 비활성이면 로컬 브로드캐스트만 수행
+        반환: 로컬 전송 수
+        """
+        if not cls._initialized or not cls._client_manager:
+            raise RuntimeError("WebSocket service not initialized")
         
-        try:
-            redis_client = CacheService.get_redis_client()
-            redis_channel = f"{cls._config.redis_channel_prefix}:{channel}"
-            
-            import json
-            await redis_client.publish(redis_channel, json.dumps(message))
-            
-        except Exception as e:
-            Logger.error(f"Redis 채널 발행 실패: {e}")
\ No newline at end of file
+        if cls._redis_bridge is None:
+            return await cls._client_manager.broadcast_to_channel(channel, message)
+        return await cls._redis_bridge.publish(channel, message)
+    
+    @classmethod
+    def get_redis_bridge_stats(cls) -> Dict[str, Any]:
+        """Redis 브리지 통계 반환"""
+        if cls._redis_bridge is None:
+            return {"enabled": False}
+        return {"enabled": True, **cls._redis_bridge.get_metrics()}
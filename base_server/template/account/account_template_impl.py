@@ -202,6 +202,11 @@ class AccountTemplateImpl(AccountTemplate):
                         (account_db_key,)
                     )
                     Logger.info(f"Account {account_db_key} logged out")
+                
+                # Redis 세션 삭제 및 모든 인스턴스의 L1 세션 캐시 무효화
+                if client_session.session_key:
+                    from template.base.template_service import TemplateService
+                    await TemplateService.remove_session_info(client_session.session_key)
             
             response.errorCode = 0
             response.message = "로그아웃 성공"
@@ -16,6 +16,7 @@ from dataclasses import asdict
 import uuid
 from datetime import datetime
 from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional
 
 class AutoTradeTemplateImpl(BaseTemplate):
     def __init__(self):
@@ -201,6 +202,7 @@ class AutoTradeTemplateImpl(BaseTemplate):
                 )
                 
                 Logger.info(f"Signal alarm created: user={account_db_key}, symbol={request.symbol}, alarm_id={alarm_id}")
+                await self._update_alarm_index("add", alarm_id, str(request.symbol), shard_id, account_db_key)
             else:
                 response.message = error_message
                 Logger.warn(f"Signal alarm creation failed: {error_message}")
@@ -330,6 +332,7 @@ class AutoTradeTemplateImpl(BaseTemplate):
                 status_text = "활성화" if new_status else "비활성화"
                 response.message = f"알림이 {status_text}되었습니다"
                 Logger.info(f"Signal alarm toggled: user={account_db_key}, alarm_id={request.alarm_id}, active={new_status}")
+                await self._update_alarm_index("activate" if new_status else "deactivate", request.alarm_id, None, shard_id, account_db_key)
             else:
                 response.message = error_message
                 Logger.warn(f"Signal alarm toggle failed: {error_message}")
@@ -379,6 +382,7 @@ class AutoTradeTemplateImpl(BaseTemplate):
             if error_code == 0:
                 response.message = "알림이 성공적으로 삭제되었습니다"
                 Logger.info(f"Signal alarm deleted: user={account_db_key}, alarm_id={request.alarm_id}")
+                await self._update_alarm_index("remove", request.alarm_id, None, shard_id, account_db_key)
             else:
                 response.message = error_message
                 Logger.warn(f"Signal alarm deletion failed: {error_message}")
@@ -390,6 +394,28 @@ class AutoTradeTemplateImpl(BaseTemplate):
         
         return response
 
+    async def _update_alarm_index(self, action: str, alarm_id: str, symbol: Optional[str], shard_id: int, account_db_key: int):
+        """시그널 알림 색인 증분 반영 (실패해도 요청은 성공 처리 - 다음 동기화에서 재구성)"""
+        try:
+            from service.signal.signal_alarm_index import SignalAlarmIndex
+            if action == "add":
+                await SignalAlarmIndex.add(symbol, alarm_id, shard_id, account_db_key)
+            elif action == "activate":
+                if not await SignalAlarmIndex.activate(alarm_id):
+                    # 색인에 없는 알림이면 사용자 알림 목록에서 심볼 확인
+                    db_service = ServiceContainer.get_database_service()
+                    result = await db_service.call_shard_procedure(shard_id, "fp_signal_alarms_get_with_stats", (account_db_key,))
+                    for alarm_data in result or []:
+                        if alarm_data.get('alarm_id') == alarm_id:
+                            await SignalAlarmIndex.add(alarm_data.get('symbol'), alarm_id, shard_id, account_db_key)
+                            break
+            elif action == "deactivate":
+                await SignalAlarmIndex.deactivate(alarm_id)
+            elif action == "remove":
+                await SignalAlarmIndex.remove(alarm_id)
+        except Exception as e:
+            Logger.warn(f"Signal alarm index update failed: action={action}, alarm_id={alarm_id}, error={e}")
+
     async def on_signal_history_req(self, client_session, request: SignalHistoryRequest):
         """시그널 히스토리 조회"""
         response = SignalHistoryResponse()
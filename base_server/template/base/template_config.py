@@ -14,6 +14,8 @@ from service.email.email_config import EmailConfig
 from service.sms.sms_config import SmsConfig
 from service.rag.rag_config import RagConfig
 from service.notification.notification_config import NotificationConfig
+from service.signal.signal_config import SignalConfig
+from service.queue.queue_config import QueueConfig
 
 class TemplateConfig(BaseModel):
     appId: str
@@ -40,4 +42,6 @@ class AppConfig(BaseModel):
     emailConfig: EmailConfig
     smsConfig: SmsConfig
     ragConfig: RagConfig
-    notificationConfig: NotificationConfig
\ No newline at end of file
+    notificationConfig: NotificationConfig
+    signalConfig: SignalConfig = SignalConfig()
+    queueConfig: QueueConfig = QueueConfig()
\ No newline at end of file
@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import Callable, Any
 import json
 import asyncio
+import dataclasses
 import traceback
 import uuid
 from .template_context import TemplateContext
@@ -12,6 +13,7 @@ from .client_session import ClientSession
 from service.net.protocol_base import BaseResponse
 from service.net.net_error_code import ENetErrorCode
 from service.core.logger import Logger
+from service.cache.local_cache import LocalCache
 
 class EServerStatus(Enum):
     None_ = 0  # 'None'은 파이썬 예약어이므로 'None_'으로 변경
@@ -42,19 +44,38 @@ class ServerStatus:
 class TemplateService:
     _config = None
     SessionContextCallback: Callable[[Any, bytes, int], Any] = None  # 타입 힌트
+    
+    # 파싱된 SessionInfo의 프로세스 내 L1 캐시 (Redis는 L2)
+    SESSION_CACHE_NAME = "session"
+    _session_cache = LocalCache()
 
     @classmethod
     def init(cls, config):
         cls._config = config
         TemplateContext.load_data_table(config)
         TemplateContext.init_template(config)
+        cls._init_session_cache(config)
+
+    @classmethod
+    def _init_session_cache(cls, config):
+        """세션 L1 캐시 설정 및 무효화 채널 등록"""
+        from service.cache.cache_service import CacheService
+        
+        local_config = config.cacheConfig.session_local_cache
+        if not local_config.enabled:
+            cls._session_cache.configure(max_size=0, ttl_seconds=0)
+            return
+        
+        cls._session_cache.configure(max_size=local_config.max_size, ttl_seconds=local_config.ttl_seconds)
+        if CacheService.is_initialized():
+            CacheService.register_local_cache(cls.SESSION_CACHE_NAME, cls._session_cache)
     
     @classmethod
     async def run_anonymous(cls, method: str, path: str, ip_address: str, req_json: str, callback: Callable[[Any, bytes, int], Any]) -> str:
         """익명 컨트롤러 함수 실행 (서버 인증 이전)"""
         client_session = None
         try:
-            Logger.info(f"REQ[{method}:{path}, IP:{ip_address} - UID: ]: {req_json}")
+            Logger.debug("REQ[%s:%s, IP:%s - UID: ]: %s", method, path, ip_address, req_json)
             cls.check_allowed_request(ip_address, EProtocolType.ANONYMOUS)
             
             # 익명 요청은 세션 없이 콜백 호출
@@ -100,10 +121,10 @@ class TemplateService:
                 res_json = json.dumps(j_obj, ensure_ascii=False)
                 
                 account_db_key = getattr(client_session.session, 'account_db_key', 0) if client_session else 0
-                Logger.info(f"RES[{method}:{path}, IP:{ip_address} - ACCOUNT_KEY: {account_db_key}]: {res_json}")
+                Logger.debug("RES[%s:%s, IP:%s - ACCOUNT_KEY: %s]: %s", method, path, ip_address, account_db_key, res_json)
                 # TODO: 시퀀스 검증 구현 필요
             else:
-                Logger.info(f"RES[{method}:{path}, IP:{ip_address} - ACCOUNT_KEY: ]: {res_json}")
+                Logger.debug("RES[%s:%s, IP:%s - ACCOUNT_KEY: ]: %s", method, path, ip_address, res_json)
             
             return res_json
             
@@ -117,7 +138,7 @@ class TemplateService:
         """유저 컨트롤러 함수 실행 (서버 인증 이후)"""
         client_session = None
         try:
-            Logger.info(f"REQ[{method}:{path}, IP:{ip_address} - UID: ]: {req_json}")
+            Logger.debug("REQ[%s:%s, IP:%s - UID: ]: %s", method, path, ip_address, req_json)
             cls.check_allowed_request(ip_address, EProtocolType.USER)
             
             # 요청에서 세션 생성 및 검증
@@ -138,7 +159,7 @@ class TemplateService:
             res_json = cls._serialize_response(res)
             
             account_db_key = getattr(client_session.session, 'account_db_key', 0) if client_session and client_session.session else 0
-            Logger.info(f"RES[{method}:{path}, IP:{ip_address} - ACCOUNT_KEY: {account_db_key}]: {res_json}")
+            Logger.debug("RES[%s:%s, IP:%s - ACCOUNT_KEY: %s]: %s", method, path, ip_address, account_db_key, res_json)
             
             # TODO: API 경로를 사용자 캐시에 저장
             
@@ -154,7 +175,7 @@ class TemplateService:
         """운영자 컨트롤러 함수 실행"""
         client_session = None
         try:
-            Logger.info(f"REQ[{method}:{path}, IP:{ip_address} - UID: ]: {req_json}")
+            Logger.debug("REQ[%s:%s, IP:%s - UID: ]: %s", method, path, ip_address, req_json)
             
             # 테스트용: 세션 검증 임시 제거
             # client_session = await cls.create_client_session(req_json)
@@ -174,7 +195,7 @@ class TemplateService:
             res_json = cls._serialize_response(res)
             
             account_db_key = getattr(client_session.session, 'account_db_key', 0) if client_session and client_session.session else 0
-            Logger.info(f"RES[{method}:{path}, IP:{ip_address} - ACCOUNT_KEY: {account_db_key}]: {res_json}")
+            Logger.debug("RES[%s:%s, IP:%s - ACCOUNT_KEY: %s]: %s", method, path, ip_address, account_db_key, res_json)
             
             return res_json
             
@@ -187,7 +208,7 @@ class TemplateService:
     async def run_administrator(cls, method: str, path: str, ip_address: str, req_json: str, callback: Callable[[Any, bytes, int], Any]) -> str:
         """관리자 컨트롤러 함수 실행"""
         try:
-            Logger.info(f"REQ[{method}:{path}, IP:{ip_address} - UID: ]: {req_json}")
+            Logger.debug("REQ[%s:%s, IP:%s - UID: ]: %s", method, path, ip_address, req_json)
             cls.check_allowed_request(ip_address, EProtocolType.ADMINISTRATOR)
             
             # 관리자는 세션 없이 콜백 호출
@@ -195,7 +216,7 @@ class TemplateService:
             res = await callback(None, msg, len(msg))
             res_json = cls._serialize_response(res)
             
-            Logger.info(f"RES[{method}:{path}, IP:{ip_address} - UID: ]: {res_json}")
+            Logger.debug("RES[%s:%s, IP:%s - UID: ]: %s", method, path, ip_address, res_json)
             return res_json
             
         except TemplateException as ex:
@@ -230,22 +251,23 @@ class TemplateService:
                 # 기존 세션이 있다면 중복 로그인 처리
                 if last_access_token:
                     redis_key = f"accessToken:{last_access_token}"
-                    redis_value = await client.get_string(redis_key)
+                    session_key = f"sessionInfo:{last_access_token}"
+                    redis_value, session_value = await client.pipeline() \
+                        .get_string(redis_key) \
+                        .get_string(session_key) \
+                        .execute()
                     if redis_value:
-                        session_key = f"sessionInfo:{last_access_token}"
-                        session_value = await client.get_string(session_key)
                         if session_value:
                             last_session_info = json.loads(session_value)
                             # 중복 로그인 상태로 설정
                             last_session_info["session_state"] = "Duplicated"
                             await client.set_string(session_key, json.dumps(last_session_info))
                             Logger.info(f"Logout duplicated account. account_db_key: {last_session_info.get('account_db_key')}")
+                    
+                    # 모든 인스턴스의 L1에서 이전 세션 제거
+                    await CacheService.publish_invalidation(TemplateService.SESSION_CACHE_NAME, last_access_token)
 
-                # 새로운 액세스 토큰 설정 (토큰 자체를 값으로 저장)
-                token_key = f"accessToken:{access_token}"
-                await client.set_string(token_key, access_token, expire=client.session_expire_time)
-                
-                # 세션 정보 설정
+                # 세션 정보 구성
                 session_dict = {
                     "account_db_key": session_info.account_db_key,
                     "platform_id": session_info.platform_id,
@@ -258,10 +280,19 @@ class TemplateService:
                     "session_state": session_info.session_state.value if hasattr(session_info.session_state, 'value') else str(session_info.session_state),
                     "shard_id": session_info.shard_id
                 }
+                
+                # 새로운 액세스 토큰(토큰 자체를 값으로 저장)과 세션 정보를 1회 왕복으로 설정
+                token_key = f"accessToken:{access_token}"
                 session_key = f"sessionInfo:{access_token}"
-                await client.set_string(session_key, json.dumps(session_dict, ensure_ascii=False), expire=client.session_expire_time)
+                await client.pipeline() \
+                    .set_string(token_key, access_token, expire=client.session_expire_time) \
+                    .set_string(session_key, json.dumps(session_dict, ensure_ascii=False), expire=client.session_expire_time) \
+                    .execute()
+                
+                # 새 세션은 L1에 바로 적재
+                TemplateService._session_cache.set(access_token, dataclasses.replace(session_info))
                 
-                Logger.info(f"Session created: account_db_key={session_info.account_db_key}, shard_id={session_info.shard_id}")
+                Logger.debug("Session created: account_db_key=%s, shard_id=%s", session_info.account_db_key, session_info.shard_id)
                 return ClientSession(access_token, session_info)
         except Exception as e:
             Logger.error(f"SetSessionInfo error: {e}")
@@ -269,32 +300,44 @@ class TemplateService:
 
     @staticmethod
     async def check_session_info(access_token: str):
-        """세션 정보를 읽어오고 만료시간 갱신"""
+        """세션 정보를 읽어오고 만료시간 갱신 (L1 적중 시 Redis 접근 없음)"""
         from service.cache.cache_service import CacheService
         from .session_info import SessionInfo, ClientSessionState
         
+        # L1 조회 - TTL이 짧으므로 만료 후 Redis 조회 시점에 만료시간이 갱신됨
+        cached_session = TemplateService._session_cache.get(access_token)
+        if cached_session is not None:
+            return dataclasses.replace(cached_session)
+        
         try:
+            CacheService.ensure_invalidation_listener()
+            
             async with CacheService.get_client() as client:
                 redis_key = f"accessToken:{access_token}"
-                redis_value = await client.get_string(redis_key)
+                session_key = f"sessionInfo:{access_token}"
+                
+                # 토큰/세션 조회와 만료 시간 갱신을 1회 왕복으로 처리
+                # (존재하지 않는 키의 EXPIRE는 0을 반환하므로 부작용 없음)
+                redis_value, session_value, token_renewed, _ = await client.pipeline() \
+                    .get_string(redis_key) \
+                    .get_string(session_key) \
+                    .expire(redis_key, client.session_expire_time) \
+                    .expire(session_key, client.session_expire_time) \
+                    .execute()
+                
                 if not redis_value:
                     Logger.error(f"failed to get accessToken. key: {redis_key}")
                     return None
 
-                session_key = f"sessionInfo:{access_token}"
-                session_value = await client.get_string(session_key)
                 if not session_value:
                     await client.delete(redis_key)
                     Logger.error(f"not found session info. key: {session_key}")
                     return None
 
-                # 액세스 토큰이 유효하다면 만료 시간을 갱신
-                if not await client.expire(redis_key, client.session_expire_time):
+                # 액세스 토큰이 유효하다면 만료 시간이 갱신되어 있어야 함
+                if not token_renewed:
                     Logger.error(f"failed to expire key. key: {redis_key}")
                     return None
-                    
-                # 세션 정보도 만료 시간 갱신
-                await client.expire(session_key, client.session_expire_time)
 
                 # SessionInfo 객체로 변환
                 session_dict = json.loads(session_value)
@@ -317,7 +360,8 @@ class TemplateService:
                     
                 session_info.shard_id = session_dict.get("shard_id", -1)
                 
-                return session_info
+                TemplateService._session_cache.set(access_token, session_info)
+                return dataclasses.replace(session_info)
         except Exception as e:
             Logger.error(f"CheckSessionInfo error: {e}")
             return None
@@ -335,16 +379,28 @@ class TemplateService:
         
         try:
             async with CacheService.get_client() as client:
-                # 액세스 토큰과 세션 정보 모두 삭제
-                token_deleted = await client.delete(f"accessToken:{access_token}")
-                session_deleted = await client.delete(f"sessionInfo:{access_token}")
-                
-                Logger.info(f"Session removed: {access_token}, token_deleted={token_deleted}, session_deleted={session_deleted}")
-                return token_deleted or session_deleted
+                # 액세스 토큰과 세션 정보 모두 삭제 (1회 왕복)
+                token_deleted, session_deleted = await client.pipeline() \
+                    .delete(f"accessToken:{access_token}") \
+                    .delete(f"sessionInfo:{access_token}") \
+                    .execute()
+                token_deleted, session_deleted = token_deleted > 0, session_deleted > 0
+            
+            # Redis 삭제 후 모든 인스턴스의 L1에서 세션 제거 (먼저 무효화하면 피어가 삭제 전 값을 다시 캐시할 수 있음)
+            await CacheService.publish_invalidation(TemplateService.SESSION_CACHE_NAME, access_token)
+            
+            Logger.info(f"Session removed: {access_token}, token_deleted={token_deleted}, session_deleted={session_deleted}")
+            return token_deleted or session_deleted
         except Exception as e:
             Logger.error(f"RemoveSessionInfo error: {e}")
             return False
 
+    @staticmethod
+    async def invalidate_session(access_token: str):
+        """세션 상태 변경(차단 등) 후 모든 인스턴스의 L1 세션 캐시 무효화 - 반드시 Redis 갱신이 끝난 뒤 호출"""
+        from service.cache.cache_service import CacheService
+        await CacheService.publish_invalidation(TemplateService.SESSION_CACHE_NAME, access_token)
+
     @staticmethod
     def check_allowed_request(ip_address: str, protocol_type: EProtocolType, client_session: 'ClientSession' = None):
         """허용 요청 여부 체크"""
@@ -466,7 +522,7 @@ class TemplateService:
     def _handle_template_exception(cls, ex: 'TemplateException', method: str, path: str, ip_address: str) -> str:
         """TemplateException 처리"""
         Logger.error(f"TemplateException: errorCode: {ex.error_code}, message: {ex}")
-        Logger.error(f"StackTrace: {getattr(ex, 'stack_trace', '')}")
+        Logger.error("StackTrace: %s", getattr(ex, 'stack_trace', ''))
         
         if hasattr(ex, 'response') and ex.response is not None:
             res_json = json.dumps(ex.response)
@@ -475,20 +531,20 @@ class TemplateService:
             response.errorCode = ex.error_code
             res_json = json.dumps(response.__dict__, ensure_ascii=False)
         
-        Logger.info(f"RES[{method}:{path}, IP:{ip_address}]: {res_json}")
+        Logger.debug("RES[%s:%s, IP:%s]: %s", method, path, ip_address, res_json)
         return res_json
     
     @classmethod
     def _handle_general_exception(cls, ex: Exception, method: str, path: str, ip_address: str) -> str:
         """일반 Exception 처리"""
         Logger.error(f"Exception: message: {ex}")
-        Logger.error(f"StackTrace: {traceback.format_exc()}")
+        Logger.error(lambda: f"StackTrace: {traceback.format_exc()}")
         
         response = BaseResponse()
         response.errorCode = getattr(ENetErrorCode, 'FATAL', -1)
         res_json = json.dumps(response.__dict__, ensure_ascii=False)
         
-        Logger.info(f"RES[{method}:{path}, IP:{ip_address}]: {res_json}")
+        Logger.debug("RES[%s:%s, IP:%s]: %s", method, path, ip_address, res_json)
         return res_json
 
     @classmethod
@@ -13,12 +13,15 @@ MessageQueue → Scheduler → DB 아키텍처 구현
 
 import asyncio
 import json
+import time
 import uuid
 import os
-from typing import Dict, Any, Optional, List
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 
 from service.core.logger import Logger
+from service.core.latency_histogram import LatencyHistogram
 from service.queue.message_queue import QueueMessage, MessagePriority
 from service.scheduler.scheduler_service import SchedulerService
 from service.scheduler.base_scheduler import ScheduleJob, ScheduleType
@@ -28,6 +31,33 @@ from service.service_container import ServiceContainer
 from template.chat.chat_state_machine import get_chat_state_machine, MessageState, RoomState
 
 
+# 방 단위 일괄 저장 SQL (fp_chat_message_batch_save 프로시저의 3단계를 배치로 수행)
+INSERT_MESSAGES_SQL = (
+    "INSERT INTO table_chat_messages "
+    "(message_id, room_id, account_db_key, message_type, content, metadata, parent_message_id) "
+    "VALUES (%s, %s, %s, %s, %s, %s, %s)"
+)
+UPDATE_ROOM_SQL = (
+    "UPDATE table_chat_rooms SET last_message_id = %s, last_message_at = NOW(), "
+    "message_count = message_count + %s, updated_at = NOW() WHERE room_id = %s"
+)
+UPSERT_STATISTICS_SQL = (
+    "INSERT INTO table_chat_statistics (account_db_key, date, total_messages, user_messages, ai_messages) "
+    "VALUES (%s, CURDATE(), %s, %s, %s) "
+    "ON DUPLICATE KEY UPDATE total_messages = total_messages + VALUES(total_messages), "
+    "user_messages = user_messages + VALUES(user_messages), "
+    "ai_messages = ai_messages + VALUES(ai_messages), updated_at = NOW()"
+)
+
+
+@dataclass
+class ChatPersistenceMetrics:
+    room_batches: int = 0        # 방 단위 일괄 저장 수
+    saved_messages: int = 0      # DB 저장 완료 메시지 수
+    failed_messages: int = 0     # 저장 실패 메시지 수
+    fallback_batches: int = 0    # 일괄 저장 실패로 건별 프로시저 저장으로 전환한 수
+
+
 class ChatPersistenceConsumer:
     """채팅 메시지 DB 저장 컨슈머
     
@@ -55,6 +85,9 @@ class ChatPersistenceConsumer:
         self.batch_job_id = f"chat_batch_save_{uuid.uuid4().hex[:8]}"
         self.cleanup_job_id = f"chat_buffer_cleanup_{uuid.uuid4().hex[:8]}"
         
+        self.metrics = ChatPersistenceMetrics()
+        self.room_batch_latency = LatencyHistogram()  # 방 단위 저장 + 상태 전이 시간
+        
         Logger.info(f"ChatPersistenceConsumer 생성: consumer_id={self.consumer_id}")
         
     async def start(self):
@@ -479,7 +512,12 @@ class ChatPersistenceConsumer:
         Logger.info(f"샤드 {shard_id} 배치 처리 완료: {success_count}/{total_count} 성공 (consumer: {self.consumer_id})")
     
     async def _process_room_messages(self, shard_id: int, room_id: str, messages: List[Dict]) -> int:
-        """특정 채팅방의 메시지들을 Lock으로 순서 보장하며 처리"""
+        """
+        특정 채팅방의 메시지들을 Lock으로 순서 보장하며 처리
+        - 샤드 트랜잭션 1개에서 multi-row INSERT + 방 정보/일일 통계 갱신
+        - SENT 상태 전이는 파이프라인 1회로 일괄 처리
+        - 일괄 저장이 실패하면 건별 프로시저 저장으로 전환해 문제 메시지만 실패 처리
+        """
         # 멀티 프로세스 환경에서 room별 순서 보장을 위한 Lock
         lock_key = f"chat_db_save:{room_id}"
         success_count = 0
@@ -500,52 +538,27 @@ class ChatPersistenceConsumer:
                 return 0  # 전체 실패
             
             try:
-                # 메시지들을 sequence 순서대로 DB 저장
-                for msg_payload in messages:
-                    try:
-                        # account_template_impl.py 패턴 사용
-                        # metadata를 JSON 객체로 변환 (문자열에서)
-                        metadata_str = msg_payload.get('metadata', '{}')
-                        try:
-                            metadata_obj = json.loads(metadata_str) if isinstance(metadata_str, str) else metadata_str
-                        except json.JSONDecodeError:
-                            metadata_obj = {}
-                        
-                        result = await database_service.call_shard_procedure(
-                            shard_id,  # 매핑 테이블 기반 shard_id 사용
-                            'fp_chat_message_batch_save',
-                            (
-                                msg_payload.get('message_id', ''),  # p_message_id (추가)
-                                msg_payload['room_id'],             # p_room_id
-                                msg_payload['account_db_key'],      # p_account_db_key  
-                                msg_payload['message_type'],        # p_message_type
-                                msg_payload['content'],             # p_content
-                                json.dumps(metadata_obj),          # p_metadata
-                                msg_payload.get('parent_message_id', None)  # p_parent_message_id
-                            )
-                        )
-                        
-                        if result and result[0].get('result') == 'SUCCESS':
-                            # DB 저장 성공 시 SENT 상태로 전이
-                            state_machine = get_chat_state_machine()
-                            await state_machine.transition_message(
-                                msg_payload.get('message_id'), 
-                                MessageState.SENT, 
-                                MessageState.PROCESSING
-                            )
-                            success_count += 1
-                            Logger.debug(f"메시지 저장 성공: {msg_payload.get('message_id')}, shard_id={shard_id}, consumer={self.consumer_id}")
-                        else:
-                            # DB 저장 실패 시 Redis 데이터도 함께 정리
-                            message_id = msg_payload.get('message_id')
-                            room_id = msg_payload['room_id']
-                            await self._cleanup_failed_message_save(message_id, room_id)
-                            state_machine = get_chat_state_machine()
-                            await state_machine.transition_message(message_id, MessageState.DELETED, MessageState.PROCESSING)
-                            Logger.warn(f"메시지 저장 실패로 Redis 데이터 정리: {message_id}, result={result}, consumer={self.consumer_id}")
-                            
-                    except Exception as e:
-                        Logger.error(f"메시지 저장 중 오류: {e}, message_id={msg_payload.get('message_id')}, consumer={self.consumer_id}")
+                started = time.perf_counter()
+                rows = [self._to_message_row(msg_payload) for msg_payload in messages]
+                
+                try:
+                    await self._save_room_batch(database_service, shard_id, room_id, rows)
+                    saved_ids = [row[0] for row in rows]
+                except Exception as e:
+                    self.metrics.fallback_batches += 1
+                    Logger.warn(f"채팅방 일괄 저장 실패, 건별 저장으로 전환: room_id={room_id}, {len(rows)}건 - {e} (consumer: {self.consumer_id})")
+                    saved_ids = await self._save_messages_one_by_one(database_service, shard_id, rows)
+                
+                # DB 저장 성공 메시지 SENT 상태로 일괄 전이
+                if saved_ids:
+                    state_machine = get_chat_state_machine()
+                    await state_machine.transition_messages(saved_ids, MessageState.SENT, MessageState.PROCESSING)
+                
+                success_count = len(saved_ids)
+                self.metrics.room_batches += 1
+                self.metrics.saved_messages += success_count
+                self.room_batch_latency.record((time.perf_counter() - started) * 1000.0)
+                Logger.debug(f"채팅방 메시지 저장: room_id={room_id}, {success_count}/{len(rows)}건, shard_id={shard_id}, consumer={self.consumer_id}")
                 
             finally:
                 # Lock 해제
@@ -556,6 +569,85 @@ class ChatPersistenceConsumer:
         
         return success_count
     
+    @staticmethod
+    def _to_message_row(msg_payload: Dict) -> Tuple:
+        """버퍼 항목 → table_chat_messages 행 (INSERT_MESSAGES_SQL / fp_chat_message_batch_save 인자 순서)"""
+        # metadata를 JSON 객체로 변환 (문자열에서)
+        metadata_str = msg_payload.get('metadata', '{}')
+        try:
+            metadata_obj = json.loads(metadata_str) if isinstance(metadata_str, str) else metadata_str
+        except json.JSONDecodeError:
+            metadata_obj = {}
+        
+        return (
+            msg_payload.get('message_id', ''),          # message_id
+            msg_payload['room_id'],                     # room_id
+            msg_payload['account_db_key'],              # account_db_key
+            msg_payload['message_type'],                # message_type
+            msg_payload['content'],                     # content
+            json.dumps(metadata_obj),                   # metadata
+            msg_payload.get('parent_message_id', None)  # parent_message_id
+        )
+    
+    @staticmethod
+    async def _save_room_batch(database_service, shard_id: int, room_id: str, rows: List[Tuple]):
+        """샤드 트랜잭션 1개로 방 메시지 일괄 저장 (예외 시 전체 롤백)"""
+        statistics: Dict[Any, List[int]] = {}
+        for row in rows:
+            counts = statistics.setdefault(row[2], [0, 0, 0])
+            counts[0] += 1
+            counts[1] += 1 if row[3] == 'USER' else 0
+            counts[2] += 1 if row[3] == 'AI' else 0
+        
+        async with database_service.shard_transaction(shard_id) as tx:
+            # executemany는 INSERT ... VALUES를 multi-row INSERT 1개로 재작성
+            await tx.execute_many(INSERT_MESSAGES_SQL, rows)
+            await tx.execute(UPDATE_ROOM_SQL, (rows[-1][0], len(rows), room_id))
+            await tx.execute_many(UPSERT_STATISTICS_SQL, [
+                (account_db_key, *counts) for account_db_key, counts in statistics.items()
+            ])
+    
+    async def _save_messages_one_by_one(self, database_service, shard_id: int, rows: List[Tuple]) -> List[str]:
+        """건별 프로시저 저장 (일괄 저장 실패 시) - 저장 성공한 message_id 목록 반환"""
+        saved_ids = []
+        state_machine = get_chat_state_machine()
+        
+        for row in rows:
+            message_id, room_id = row[0], row[1]
+            try:
+                result = await database_service.call_shard_procedure(
+                    shard_id,  # 매핑 테이블 기반 shard_id 사용
+                    'fp_chat_message_batch_save',
+                    row
+                )
+                
+                if result and result[0].get('result') == 'SUCCESS':
+                    saved_ids.append(message_id)
+                else:
+                    # DB 저장 실패 시 Redis 데이터도 함께 정리
+                    self.metrics.failed_messages += 1
+                    await self._cleanup_failed_message_save(message_id, room_id)
+                    await state_machine.transition_message(message_id, MessageState.DELETED, MessageState.PROCESSING)
+                    Logger.warn(f"메시지 저장 실패로 Redis 데이터 정리: {message_id}, result={result}, consumer={self.consumer_id}")
+                    
+            except Exception as e:
+                self.metrics.failed_messages += 1
+                Logger.error(f"메시지 저장 중 오류: {e}, message_id={message_id}, consumer={self.consumer_id}")
+        
+        return saved_ids
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """컨슈머 저장 통계"""
+        return {
+            "consumer_id": self.consumer_id,
+            "buffered_messages": sum(len(messages) for messages in self.message_buffer.values()),
+            "room_batches": self.metrics.room_batches,
+            "saved_messages": self.metrics.saved_messages,
+            "failed_messages": self.metrics.failed_messages,
+            "fallback_batches": self.metrics.fallback_batches,
+            "room_batch_latency_ms": self.room_batch_latency.to_dict()
+        }
+    
     async def _flush_all_buffers(self):
         """모든 버퍼의 메시지 처리 (종료 시 호출)"""
         try:
@@ -666,7 +758,8 @@ async def register_chat_persistence_consumer():
         await queue_service.register_message_consumer(
             queue_name="chat_persistence",
             consumer_id=consumer.consumer_id,  # 고유한 컨슈머 ID 사용
-            handler=consumer.handle_message
+            handler=consumer.handle_message,
+            partition_workers=4  # 파티션(채팅방/사용자)별 순서 보장, 서로 다른 파티션은 병렬 처리
         )
         
         # 컨슈머 시작
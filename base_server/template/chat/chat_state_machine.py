@@ -9,11 +9,14 @@
 """
 
 import asyncio
+import time
+from dataclasses import dataclass
 from enum import Enum
 from typing import Optional, Dict, Any, Tuple, List
 from datetime import datetime, timedelta
 
 from service.core.logger import Logger
+from service.core.latency_histogram import LatencyHistogram
 from service.cache.cache_service import CacheService
 
 
@@ -42,6 +45,87 @@ class StateTransitionError(Exception):
     pass
 
 
+# Lua 전이 스크립트 결과 코드
+TRANSITION_OK = 1           # 전이 성공
+TRANSITION_MISMATCH = 0     # 현재 상태가 예상과 다름
+TRANSITION_REJECTED = -1    # 전이 규칙상 불가능
+TRANSITION_SKIPPED = 2      # all_or_nothing 일괄 전이에서 다른 키 실패로 미적용
+
+# ARGV[1] 예상 상태 특수값 (빈 문자열은 "상태 없음"만 허용)
+EXPECT_ANY = "*"    # 현재 상태 기준 (없으면 첫 상태 설정)
+
+# 상태 전이 Lua 스크립트 - 허용 전이 표는 전이 규칙 dict에서 생성해 스크립트에 포함
+# KEYS[1..N]: state_key (네임스페이스 적용됨)
+# ARGV[1]: 예상 상태 (''=상태 없음, '*'=현재 상태 기준, 그 외=정확히 일치)
+# ARGV[2]: 새 상태, ARGV[3]: ttl_seconds, ARGV[4]: transition_log ('' 이면 로그 생략)
+# ARGV[5]: '1'이면 all_or_nothing (하나라도 실패하면 전체 미적용)
+# 반환: 키별 {결과 코드, 현재(또는 새) 상태}
+_TRANSITION_SCRIPT_TEMPLATE = """
+local allowed = {%s}
+local expected, to_state, ttl, log = ARGV[1], ARGV[2], tonumber(ARGV[3]), ARGV[4]
+local results = {}
+local all_ok = true
+
+for i, key in ipairs(KEYS) do
+    local current = redis.call('GET', key)
+    local code = 1
+    if current == false then
+        current = ''
+        if expected ~= '' and expected ~= '*' then
+            code = 0
+        end
+    elseif expected == '' or (expected ~= '*' and current ~= expected) then
+        code = 0
+    elseif not (allowed[current] and allowed[current][to_state]) then
+        code = -1
+    end
+    results[i] = {code, current}
+    if code ~= 1 then
+        all_ok = false
+    end
+end
+
+local apply = all_ok or ARGV[5] ~= '1'
+for i, key in ipairs(KEYS) do
+    if results[i][1] == 1 then
+        if apply then
+            redis.call('SET', key, to_state)
+            if ttl > 0 then
+                redis.call('EXPIRE', key, ttl)
+            end
+            if log ~= '' then
+                local log_key = key .. ':log'
+                redis.call('LPUSH', log_key, log)
+                redis.call('LTRIM', log_key, 0, 9)
+                redis.call('EXPIRE', log_key, 86400)
+            end
+            results[i][2] = to_state
+        else
+            results[i][1] = 2
+        end
+    end
+end
+
+return results
+"""
+
+
+def build_transition_script(transitions: Dict[Enum, List[Enum]]) -> str:
+    """전이 규칙 dict → 허용 전이 표가 포함된 Lua 스크립트"""
+    rows = []
+    for from_state, to_states in transitions.items():
+        targets = ", ".join(f"['{state.value}'] = true" for state in to_states)
+        rows.append(f"['{from_state.value}'] = {{{targets}}}")
+    return _TRANSITION_SCRIPT_TEMPLATE % ", ".join(rows)
+
+
+@dataclass
+class TransitionCounter:
+    success: int = 0
+    failed: int = 0     # 상태 불일치/규칙 위반
+    errors: int = 0     # Redis 오류
+
+
 class ChatStateMachine:
     """채팅 상태 머신 - CacheService와 동일한 정적 클래스 싱글톤 패턴"""
     
@@ -75,49 +159,13 @@ class ChatStateMachine:
         self.message_state_key_pattern = "msg_state:{message_id}"
         self.room_state_key_pattern = "room_state:{room_id}"
         
-        # Lua Scripts - Redis 네임스페이스 고려
-        self._atomic_transition_script = """
-        -- 원자적 상태 전이 스크립트
-        -- KEYS[1]: state_key (네임스페이스 적용됨)
-        -- ARGV[1]: current_state (빈 문자열이면 첫 상태 설정)
-        -- ARGV[2]: new_state  
-        -- ARGV[3]: ttl_seconds
-        -- ARGV[4]: transition_log
-        
-        local current = redis.call('GET', KEYS[1])
-        if current == false then
-            current = nil
-        end
-        
-        -- 첫 상태 설정인 경우 (ARGV[1]이 빈 문자열)
-        if ARGV[1] == '' then
-            -- 현재 상태가 없어야 함 (중복 설정 방지)
-            if current ~= nil then
-                return {0, current}  -- 이미 상태가 있음
-            end
-        else
-            -- 기존 상태 전이인 경우 - 현재 상태가 예상과 다르면 실패
-            if current ~= ARGV[1] then
-                return {0, current}  -- 실패, 현재 상태 반환
-            end
-        end
-        
-        -- 상태 전이 실행
-        redis.call('SET', KEYS[1], ARGV[2])
-        if tonumber(ARGV[3]) > 0 then
-            redis.call('EXPIRE', KEYS[1], tonumber(ARGV[3]))
-        end
-        
-        -- 전이 로그 저장 (선택적)
-        if ARGV[4] ~= '' then
-            local log_key = KEYS[1] .. ':log'
-            redis.call('LPUSH', log_key, ARGV[4])
-            redis.call('LTRIM', log_key, 0, 9)  -- 최근 10개만 유지
-            redis.call('EXPIRE', log_key, 86400)  -- 24시간 TTL
-        end
+        # 허용 전이 표를 포함한 Lua 스크립트 (EVALSHA 1회로 검증 + 전이)
+        self._message_transition_script = build_transition_script(self.message_transitions)
+        self._room_transition_script = build_transition_script(self.room_transitions)
         
-        return {1, ARGV[2]}  -- 성공, 새 상태 반환
-        """
+        # 전이별 지연시간/결과 카운터 ("message:PENDING->PROCESSING" 형태 키)
+        self.transition_latency: Dict[str, LatencyHistogram] = {}
+        self.transition_counters: Dict[str, TransitionCounter] = {}
     
     @classmethod
     def get_instance(cls) -> 'ChatStateMachine':
@@ -204,66 +252,89 @@ class ChatStateMachine:
     async def transition_message(self, message_id: str, to_state: MessageState, 
                                from_state: Optional[MessageState] = None,
                                ttl_seconds: int = 3600) -> bool:
-        """메시지 상태 전이 (원자적)"""
+        """
+        메시지 상태 전이 (원자적, EVALSHA 1회)
+        - from_state가 None이면 현재 상태 기준으로 전이 (상태가 없으면 첫 상태 설정)
+        """
+        results = await self._transition("message", self._message_transition_script,
+                                         self.message_state_key_pattern, "message_id", [message_id],
+                                         to_state, from_state, ttl_seconds, False)
+        return results[message_id]
+    
+    async def transition_messages(self, message_ids: List[str], to_state: MessageState,
+                                  from_state: MessageState, ttl_seconds: int = 3600,
+                                  all_or_nothing: bool = False) -> Dict[str, bool]:
+        """
+        여러 메시지를 같은 상태 전이로 일괄 처리 (Lua 스크립트 1회 - 전체가 원자적으로 실행)
+        - all_or_nothing=True면 하나라도 전이할 수 없을 때 전체 미적용
+        반환: {message_id: 성공 여부}
+        """
+        return await self._transition("message", self._message_transition_script,
+                                      self.message_state_key_pattern, "message_id", message_ids,
+                                      to_state, from_state, ttl_seconds, all_or_nothing)
+    
+    async def _transition(self, entity: str, script: str, key_pattern: str, id_field: str, entity_ids: List[str],
+                          to_state: Enum, from_state: Optional[Enum], ttl_seconds: int,
+                          all_or_nothing: bool) -> Dict[str, bool]:
+        """메시지/방 공통 전이 실행 - 허용 전이 검증과 전이를 Lua에서 함께 수행"""
+        results = {entity_id: False for entity_id in entity_ids}
+        if not entity_ids:
+            return results
+        if not self.__class__._initialized:
+            Logger.warn("ChatStateMachine이 초기화되지 않음")
+            return results
+        
+        transitions = self.message_transitions if entity == "message" else self.room_transitions
+        from_label = from_state.value if from_state else "*"
+        metric_key = f"{entity}:{from_label}->{to_state.value}"
+        counter = self.transition_counters.get(metric_key)
+        if counter is None:
+            counter = self.transition_counters[metric_key] = TransitionCounter()
+            self.transition_latency[metric_key] = LatencyHistogram()
+        
+        # 명시적 from_state는 Redis 왕복 없이 먼저 규칙 확인
+        if from_state is not None and to_state not in transitions.get(from_state, []):
+            counter.failed += len(entity_ids)
+            Logger.warn(f"불가능한 {entity} 상태 전이: {from_state.value} → {to_state.value}")
+            return results
+        
+        # DELETED 상태일 때 TTL 설정 (7일 후 자동 삭제)
+        if to_state.value == "DELETED":
+            ttl_seconds = 7 * 24 * 3600
+        
+        started = time.perf_counter()
         try:
-            if not self.__class__._initialized:
-                Logger.warn("ChatStateMachine이 초기화되지 않음")
-                return False
-            
-            # DELETED 상태일 때 TTL 설정 (7일 후 자동 삭제)
-            if to_state == MessageState.DELETED:
-                ttl_seconds = 7 * 24 * 3600  # 7일 = 604800초
-                Logger.debug(f"DELETED 상태 TTL 설정: {message_id}, TTL={ttl_seconds}초 (7일)")
-            
-            # 현재 상태 확인
-            is_initial_state = False
-            if from_state is None:
-                current_state = await self.get_message_state(message_id)
-                if current_state is None:
-                    # 첫 상태 설정 - 전이 규칙 검증 건너뛰기
-                    is_initial_state = True
-                    from_state = None  # Lua script에서 nil 처리
-                else:
-                    from_state = current_state
-            
-            # 전이 가능성 검증 (첫 상태 설정이 아닌 경우만)
-            if not is_initial_state and to_state not in self.message_transitions.get(from_state, []):
-                from_state_str = from_state.value if from_state else "None"
-                Logger.warn(f"불가능한 메시지 상태 전이: {from_state_str} → {to_state.value}")
-                return False
-            
-            # 원자적 상태 전이 실행
-            state_key = self.message_state_key_pattern.format(message_id=message_id)
-            from_state_str = from_state.value if from_state else ""  # 첫 상태 설정 시 빈 문자열
-            transition_log = f"{datetime.now().isoformat()}:{from_state_str}→{to_state.value}"
-            
+            transition_log = f"{datetime.now().isoformat()}:{from_label}→{to_state.value}"
             async with CacheService.get_client() as redis:
-                result = await redis.eval(
-                    self._atomic_transition_script,
-                    1,  # numkeys
-                    redis._get_key(state_key),  # 네임스페이스 적용된 키
-                    from_state_str,     # ARGV[1]: 현재 상태 (빈 문자열이면 첫 설정)
-                    to_state.value,      # ARGV[2]: 새 상태
-                    str(ttl_seconds),    # ARGV[3]: TTL
-                    transition_log       # ARGV[4]: 로그
+                keys = [redis._get_key(key_pattern.format(**{id_field: entity_id})) for entity_id in entity_ids]
+                replies = await redis.eval_sha(
+                    script,
+                    len(keys),
+                    *keys,
+                    from_state.value if from_state else EXPECT_ANY,  # ARGV[1]: 예상 상태
+                    to_state.value,                                  # ARGV[2]: 새 상태
+                    str(ttl_seconds),                                # ARGV[3]: TTL
+                    transition_log,                                  # ARGV[4]: 로그
+                    "1" if all_or_nothing else "0"                   # ARGV[5]: all_or_nothing
                 )
-                
-                # 디버깅: result 값 확인
-                Logger.info(f"메시지 Lua 스크립트 결과: {result}, type: {type(result)}, len: {len(result) if hasattr(result, '__len__') else 'N/A'}")
-                
-                success, final_state = result
-                if success:
-                    from_state_str = from_state.value if from_state else ""
-                    Logger.debug(f"메시지 상태 전이 성공: {message_id} {from_state_str}→{to_state.value}")
-                    return True
-                else:
-                    from_state_str = from_state.value if from_state else ""
-                    Logger.warn(f"메시지 상태 전이 실패: {message_id} 예상={from_state_str} 실제={final_state}")
-                    return False
-        
         except Exception as e:
-            Logger.error(f"메시지 상태 전이 중 오류: {message_id} - {e}")
-            return False
+            counter.errors += len(entity_ids)
+            Logger.error(f"{entity} 상태 전이 중 오류: {entity_ids[:5]} - {e}")
+            return results
+        finally:
+            self.transition_latency[metric_key].record((time.perf_counter() - started) * 1000.0)
+        
+        for entity_id, (code, current) in zip(entity_ids, replies or []):
+            if code == TRANSITION_OK:
+                results[entity_id] = True
+                counter.success += 1
+                continue
+            counter.failed += 1
+            if code == TRANSITION_REJECTED:
+                Logger.warn(f"불가능한 {entity} 상태 전이: {entity_id} {current} → {to_state.value}")
+            elif code == TRANSITION_MISMATCH:
+                Logger.warn(f"{entity} 상태 전이 실패: {entity_id} 예상={from_label} 실제={current or 'None'}")
+        return results
     
     async def can_delete_message(self, message_id: str) -> Tuple[bool, Optional[str]]:
         """메시지 삭제 가능 여부 확인"""
@@ -345,63 +416,14 @@ class ChatStateMachine:
     async def transition_room(self, room_id: str, to_state: RoomState,
                             from_state: Optional[RoomState] = None,
                             ttl_seconds: int = 86400) -> bool:
-        """채팅방 상태 전이 (원자적)"""
-        try:
-            if not self.__class__._initialized:
-                Logger.warn("ChatStateMachine이 초기화되지 않음")
-                return False
-            
-            # DELETED 상태일 때 TTL 설정 (7일 후 자동 삭제)
-            if to_state == RoomState.DELETED:
-                ttl_seconds = 7 * 24 * 3600  # 7일 = 604800초
-                Logger.debug(f"DELETED 상태 TTL 설정: {room_id}, TTL={ttl_seconds}초 (7일)")
-            
-            # 현재 상태 확인
-            is_initial_state = False
-            if from_state is None:
-                current_state = await self.get_room_state(room_id)
-                if current_state is None:
-                    # 첫 상태 설정 - 전이 규칙 검증 건너뛰기
-                    is_initial_state = True
-                    from_state = None  # Lua script에서 nil 처리
-                else:
-                    from_state = current_state
-            
-            # 전이 가능성 검증 (첫 상태 설정이 아닌 경우만)
-            if not is_initial_state and to_state not in self.room_transitions.get(from_state, []):
-                from_state_str = from_state.value if from_state else "None"
-                Logger.warn(f"불가능한 방 상태 전이: {from_state_str} → {to_state.value}")
-                return False
-            
-            # 원자적 상태 전이 실행
-            state_key = self.room_state_key_pattern.format(room_id=room_id)
-            from_state_str = from_state.value if from_state else ""  # 첫 상태 설정 시 빈 문자열
-            transition_log = f"{datetime.now().isoformat()}:{from_state_str}→{to_state.value}"
-            
-            async with CacheService.get_client() as redis:
-                result = await redis.eval(
-                    self._atomic_transition_script,
-                    1,  # numkeys
-                    redis._get_key(state_key),  # 네임스페이스 적용된 키
-                    from_state_str,     # ARGV[1]: 현재 상태 (빈 문자열이면 첫 설정)
-                    to_state.value,      # ARGV[2]: 새 상태
-                    str(ttl_seconds),    # ARGV[3]: TTL
-                    transition_log       # ARGV[4]: 로그
-                )
-                
-                success, final_state = result
-                if success:
-                    from_state_str = from_state.value if from_state else ""
-                    Logger.debug(f"방 상태 전이 성공: {room_id} {from_state_str}→{to_state.value}")
-                    return True
-                else:
-                    from_state_str = from_state.value if from_state else ""
-                    Logger.warn(f"방 상태 전이 실패: {room_id} 예상={from_state_str} 실제={final_state}")
-                    return False
-        
-        except Exception as e:
-            Logger.error(f"방 상태 전이 중 오류: {room_id} - {e}")
-            return False
+        """
+        채팅방 상태 전이 (원자적, EVALSHA 1회)
+        - from_state가 None이면 현재 상태 기준으로 전이 (상태가 없으면 첫 상태 설정)
+        """
+        results = await self._transition("room", self._room_transition_script,
+                                         self.room_state_key_pattern, "room_id", [room_id],
+                                         to_state, from_state, ttl_seconds, False)
+        return results[room_id]
     
     async def can_delete_room(self, room_id: str) -> Tuple[bool, Optional[str]]:
         """채팅방 삭제 가능 여부 확인"""
@@ -473,6 +495,15 @@ class ChatStateMachine:
             "transitions_defined": {
                 "message": len(self.message_transitions),
                 "room": len(self.room_transitions)
+            },
+            "transitions": {
+                key: {
+                    "success": counter.success,
+                    "failed": counter.failed,
+                    "errors": counter.errors,
+                    "latency_ms": self.transition_latency[key].to_dict()
+                }
+                for key, counter in self.transition_counters.items()
             }
         }
 
@@ -241,7 +241,7 @@ class ChatTemplateImpl(BaseTemplate):
                         partition_key=room_id,  # 채팅방별 순서 보장
                         priority=MessagePriority.NORMAL
                     )
-                    await queue_service.send_message("chat_persistence", message.payload, message.message_type, message.priority)
+                    await queue_service.send_message("chat_persistence", message.payload, message.message_type, message.priority, partition_key=message.partition_key)
                     Logger.info(f"채팅방 생성 이벤트 큐에 발행: room_id={room_id}")
                 except Exception as queue_error:
                     Logger.error(f"MessageQueue 발행 실패 (채팅방 생성): {queue_error}")
@@ -324,7 +324,7 @@ class ChatTemplateImpl(BaseTemplate):
                         partition_key=request.room_id,  # 채팅방별 순서 보장
                         priority=MessagePriority.HIGH  # 채팅 메시지는 높은 우선순위
                     )
-                    await queue_service.send_message("chat_persistence", user_message.payload, user_message.message_type, user_message.priority)
+                    await queue_service.send_message("chat_persistence", user_message.payload, user_message.message_type, user_message.priority, partition_key=user_message.partition_key)
                     Logger.info(f"사용자 메시지 큐에 발행: message_id={user_message_id}")
                     
                     # 3.5) MessageQueue 발행 완료 후 COMPOSING → PENDING 전이
@@ -391,7 +391,7 @@ class ChatTemplateImpl(BaseTemplate):
                         partition_key=request.room_id,  # 채팅방별 순서 보장
                         priority=MessagePriority.HIGH
                     )
-                    await queue_service.send_message("chat_persistence", ai_message.payload, ai_message.message_type, ai_message.priority)
+                    await queue_service.send_message("chat_persistence", ai_message.payload, ai_message.message_type, ai_message.priority, partition_key=ai_message.partition_key)
                     Logger.info(f"AI 응답 메시지 큐에 발행: message_id={ai_message_id}")
                     
                     # 7.5) MessageQueue 발행 완료 후 COMPOSING → PENDING 전이
@@ -636,7 +636,7 @@ class ChatTemplateImpl(BaseTemplate):
                         partition_key=request.room_id,  # 채팅방별 순서 보장
                         priority=MessagePriority.HIGH
                     )
-                    await queue_service.send_message("chat_persistence", message.payload, message.message_type, message.priority)
+                    await queue_service.send_message("chat_persistence", message.payload, message.message_type, message.priority, partition_key=message.partition_key)
                     Logger.info(f"채팅방 삭제 이벤트 큐에 발행: room_id={request.room_id}")
                 except Exception as queue_error:
                     Logger.error(f"MessageQueue 발행 실패 (채팅방 삭제): {queue_error}")
@@ -693,7 +693,7 @@ class ChatTemplateImpl(BaseTemplate):
                         partition_key=request.room_id,  # 채팅방별 순서 보장
                         priority=MessagePriority.NORMAL
                     )
-                    await queue_service.send_message("chat_persistence", message.payload, message.message_type, message.priority)
+                    await queue_service.send_message("chat_persistence", message.payload, message.message_type, message.priority, partition_key=message.partition_key)
                     Logger.info(f"채팅방 제목 변경 이벤트 큐에 발행: room_id={request.room_id}")
                 except Exception as queue_error:
                     Logger.error(f"MessageQueue 발행 실패 (채팅방 제목 변경): {queue_error}")
@@ -752,7 +752,7 @@ class ChatTemplateImpl(BaseTemplate):
                             partition_key=request.room_id,  # 채팅방별 순서 보장
                             priority=MessagePriority.HIGH
                         )
-                        await queue_service.send_message("chat_persistence", message.payload, message.message_type, message.priority)
+                        await queue_service.send_message("chat_persistence", message.payload, message.message_type, message.priority, partition_key=message.partition_key)
                         Logger.info(f"메시지 삭제 이벤트 큐에 발행: message_id={request.message_id}")
                     else:
                         Logger.info(f"메시지 상태가 {current_state}이므로 DB 삭제 이벤트 발행 건너뜀: {request.message_id}")
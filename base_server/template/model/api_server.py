@@ -42,6 +42,7 @@ for _old, _new in MODULE_ALIASES.items():
 from .manual_data_collector import ManualStockDataCollector
 from .data_preprocessor import StockDataPreprocessor
 from .pytorch_lstm_model import PyTorchStockLSTM
+from .inference_batcher import InferenceBatcher
 from .config import get_model_paths
 
 # Common 규격 import 
@@ -64,6 +65,15 @@ logger = logging.getLogger(__name__)
 model = None
 preprocessor = None
 data_collector = None
+inference_batcher: Optional[InferenceBatcher] = None
+
+# 마이크로 배치 추론 설정 (동시 요청을 묶어 forward 1회로 처리)
+INFERENCE_MAX_BATCH_SIZE = int(os.getenv('INFERENCE_MAX_BATCH_SIZE', '32'))
+INFERENCE_MAX_WAIT_MS = float(os.getenv('INFERENCE_MAX_WAIT_MS', '5'))
+# 종목 데이터 수집/전처리 동시 실행 수 - Yahoo 요청 간격(2~4초)은 수집기의 프로세스 전역 제한기가 유지하므로
+# 동시 실행으로 겹치는 것은 전처리와 응답 대기뿐 (요청 속도는 늘지 않음)
+DATA_COLLECTION_CONCURRENCY = int(os.getenv('DATA_COLLECTION_CONCURRENCY', '5'))
+_collection_semaphore = asyncio.Semaphore(DATA_COLLECTION_CONCURRENCY)
 
 # Common 프로토콜 인스턴스
 model_protocol = ModelProtocol()
@@ -262,11 +272,22 @@ class HealthResponse(BaseModel):
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """앱 시작/종료 시 실행되는 컨텍스트 매니저"""
+    global inference_batcher
     # 시작 시 모델 로드
     await load_model_and_preprocessor()
+    if model is not None:
+        inference_batcher = InferenceBatcher(
+            model,
+            max_batch_size=INFERENCE_MAX_BATCH_SIZE,
+            max_wait_ms=INFERENCE_MAX_WAIT_MS
+        )
+        await inference_batcher.start()
     yield
     # 종료 시 정리 작업 (필요한 경우)
     logger.info("Shutting down API server...")
+    if inference_batcher is not None:
+        await inference_batcher.stop()
+        inference_batcher = None
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -402,18 +423,18 @@ async def handle_common_batch_predict(session, request: CommonBatchPredictReques
             response.message = "Model or preprocessor not loaded"
             return response
         
-        # 배치 예측 실행
+        # 배치 예측 실행 (종목별 동시 실행 → forward는 InferenceBatcher가 묶어서 처리)
         batch_results = []
         success_count = 0
         
-        for symbol in request.symbols:
-            try:
-                result = await predict_single_symbol(symbol, request.days)
-                batch_results.append(result)
-                if result.status == "success":
-                    success_count += 1
-            except Exception as e:
-                logger.warning(f"Failed to predict {symbol}: {str(e)}")
+        symbol_results = await asyncio.gather(
+            *[predict_single_symbol(symbol, request.days) for symbol in request.symbols],
+            return_exceptions=True
+        )
+        
+        for symbol, result in zip(request.symbols, symbol_results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to predict {symbol}: {str(result)}")
                 # 실패한 경우 에러 결과 생성
                 error_result = CommonPredictionResult(
                     symbol=symbol,
@@ -422,9 +443,13 @@ async def handle_common_batch_predict(session, request: CommonBatchPredictReques
                     predictions=[],
                     bollinger_bands=[],
                     confidence_score=0.0,
-                    status=f"failed: {str(e)}"
+                    status=f"failed: {str(result)}"
                 )
                 batch_results.append(error_result)
+            else:
+                batch_results.append(result)
+                if result.status == "success":
+                    success_count += 1
         
         # 응답 설정
         response.results = batch_results
@@ -469,6 +494,23 @@ async def handle_common_models_list(session, request: ModelsListRequest) -> Mode
     
     return response
 
+def _collect_and_preprocess_sync(symbol: str, days: int) -> tuple:
+    recent_data = data_collector.get_recent_data(symbol, days)
+    if recent_data is None or len(recent_data) < days:
+        return recent_data, None
+    return recent_data, preprocessor.preprocess_for_inference(recent_data, symbol)
+
+async def collect_and_preprocess(symbol: str, days: int) -> tuple:
+    """데이터 수집 + 전처리를 스레드에서 실행 (동시 실행 수 제한) - (recent_data, input_sequence)"""
+    async with _collection_semaphore:
+        return await asyncio.to_thread(_collect_and_preprocess_sync, symbol, days)
+
+async def run_model_inference(input_sequence: np.ndarray) -> np.ndarray:
+    """InferenceBatcher로 추론 (미시작 시 model.predict 직접 호출)"""
+    if inference_batcher is not None and inference_batcher.is_running:
+        return await inference_batcher.predict(input_sequence)
+    return model.predict(input_sequence)
+
 async def predict_single_stock_internal(request: PredictionRequest) -> CommonPredictionResult:
     """내부 예측 로직 (기존 코드 재사용)"""
     if model is None or preprocessor is None:
@@ -477,14 +519,13 @@ async def predict_single_stock_internal(request: PredictionRequest) -> CommonPre
     try:
         logger.info(f"Processing prediction request for {request.symbol}")
         
-        # 최근 데이터 수집
-        recent_data = data_collector.get_recent_data(request.symbol, request.days)
+        # 최근 데이터 수집 및 전처리
+        recent_data, input_sequence = await collect_and_preprocess(request.symbol, request.days)
         if recent_data is None or len(recent_data) < request.days:
             raise Exception(f"Insufficient data for symbol {request.symbol}")
         
-        # 전처리 및 추론
-        input_sequence = preprocessor.preprocess_for_inference(recent_data, request.symbol)
-        predictions_normalized = model.predict(input_sequence)
+        # 추론
+        predictions_normalized = await run_model_inference(input_sequence)
         
         # 정규화된 예측값을 실제 스케일로 역변환
         predictions = preprocessor.inverse_transform_predictions(predictions_normalized, request.symbol)
@@ -677,14 +718,13 @@ async def predict_batch_stocks(request: BatchPredictionRequest):
 async def predict_single_symbol(symbol: str, days: int) -> CommonPredictionResult:
     """단일 심볼 예측 (내부 함수)"""
     try:
-        # 최근 데이터 수집
-        recent_data = data_collector.get_recent_data(symbol, days)
+        # 최근 데이터 수집 및 전처리
+        recent_data, input_sequence = await collect_and_preprocess(symbol, days)
         if recent_data is None or len(recent_data) < days:
             raise ValueError(f"Insufficient data for symbol {symbol}")
         
-        # 전처리 및 추론
-        input_sequence = preprocessor.preprocess_for_inference(recent_data, symbol)
-        predictions_normalized = model.predict(input_sequence)
+        # 추론
+        predictions_normalized = await run_model_inference(input_sequence)
         
         # 정규화된 예측값을 실제 스케일로 역변환
         predictions = preprocessor.inverse_transform_predictions(predictions_normalized, symbol)
@@ -696,6 +736,13 @@ async def predict_single_symbol(symbol: str, days: int) -> CommonPredictionResul
     except Exception as e:
         raise Exception(f"Error predicting {symbol}: {str(e)}")
 
+@app.get("/inference/stats")
+async def get_inference_stats():
+    """마이크로 배치 추론 통계 (배치 크기/큐 대기/forward 시간 히스토그램)"""
+    if inference_batcher is None:
+        raise HTTPException(status_code=503, detail="Inference batcher not running")
+    return inference_batcher.get_metrics()
+
 @app.get("/models/info")
 async def get_model_info():
     """모델 정보 조회"""
@@ -0,0 +1,254 @@
+"""
+마이크로 배치 추론 엔진
+종목별로 들어오는 추론 요청을 큐에 모아 max_wait_ms 또는 max_batch_size까지 묶고,
+전처리된 시퀀스를 하나의 텐서로 쌓아 torch.no_grad() forward 1회로 처리한 뒤 요청별로 결과를 돌려줍니다.
+"""
+
+import asyncio
+import bisect
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import torch
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+class Histogram:
+    """고정 버킷 히스토그램 (percentile은 버킷 상한 기준 근사값)"""
+
+    def __init__(self, buckets: Sequence[float]):
+        self._bounds = tuple(buckets)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float):
+        self._counts[bisect.bisect_left(self._bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, p: float) -> float:
+        if self.count == 0:
+            return 0.0
+        target = max(1, int(round(self.count * p / 100.0)))
+        seen = 0
+        for i, c in enumerate(self._counts):
+            seen += c
+            if seen >= target:
+                return float(self._bounds[i]) if i < len(self._bounds) else self.max
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "avg": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "buckets": {
+                **{f"le_{b:g}": self._counts[i] for i, b in enumerate(self._bounds)},
+                "le_inf": self._counts[-1]
+            }
+        }
+
+
+@dataclass
+class BatcherMetrics:
+    requests: int = 0        # 처리 완료된 요청 수
+    batches: int = 0         # forward 실행 수
+    forward_errors: int = 0
+    rejected: int = 0        # 큐가 가득 차 거절된 요청 수
+    cancelled: int = 0       # forward 전에 취소된 요청 수
+
+
+@dataclass
+class _PendingRequest:
+    sequence: np.ndarray     # (n, sequence_length, num_features)
+    future: asyncio.Future
+    enqueued_at: float
+
+
+class InferenceBatcher:
+    """
+    추론 요청 마이크로 배치 처리기
+    - predict(sequence)는 큐에 넣고 결과 Future를 대기 (호출부는 model.predict와 같은 형태의 결과를 받음)
+    - 수집 루프 1개가 첫 요청 이후 max_wait_ms 동안 또는 max_batch_size개까지 모음
+    - 시퀀스 shape별로 np.concatenate 후 전용 스레드 1개에서 torch.no_grad() forward (이벤트 루프 블로킹 없음)
+    - forward 중 들어온 요청은 다음 배치로 묶이므로 부하가 클수록 배치가 커짐
+    """
+
+    def __init__(self, model, max_batch_size: int = 32, max_wait_ms: float = 5.0, max_queue_size: int = 1024):
+        self._model = model  # PyTorchStockLSTM (model.model, model.device 사용)
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_seconds = max(0.0, max_wait_ms) / 1000.0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        self._inflight: List[_PendingRequest] = []  # 큐에서 꺼내 forward 대기/실행 중인 요청
+
+        self.metrics = BatcherMetrics()
+        self.batch_size = Histogram(BATCH_SIZE_BUCKETS)
+        self.queue_wait = Histogram(LATENCY_BUCKETS_MS)
+        self.forward_time = Histogram(LATENCY_BUCKETS_MS)
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    async def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inference")
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"InferenceBatcher started (max_batch_size={self.max_batch_size}, "
+                    f"max_wait_ms={self.max_wait_seconds * 1000:.1f})")
+
+    async def stop(self):
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        # 수집/forward 중이던 요청과 큐에 남은 요청은 실패 처리
+        pending = self._inflight
+        self._inflight = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        self._fail_pending(pending, RuntimeError("InferenceBatcher stopped"))
+
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        logger.info("InferenceBatcher stopped")
+
+    async def predict(self, sequence: np.ndarray) -> np.ndarray:
+        """전처리된 시퀀스 (1, T, F) 또는 (T, F) 추론 - 결과는 (n, prediction_length, num_targets)"""
+        if not self._running:
+            raise RuntimeError("InferenceBatcher is not running")
+
+        sequence = np.asarray(sequence, dtype=np.float32)
+        if sequence.ndim == 2:
+            sequence = sequence[np.newaxis, ...]
+
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait(_PendingRequest(sequence, future, time.perf_counter()))
+        except asyncio.QueueFull:
+            self.metrics.rejected += 1
+            raise RuntimeError("Inference queue is full")
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while self._running:
+            try:
+                # stop()이 취소 시점에 남은 요청을 실패 처리할 수 있도록 수집 중인 배치를 인스턴스에 보관
+                batch = self._inflight = [await self._queue.get()]
+                deadline = loop.time() + self.max_wait_seconds
+                while len(batch) < self.max_batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                        continue
+                    except asyncio.QueueEmpty:
+                        pass
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout=timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                await self._dispatch(batch)
+                self._inflight = []
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"InferenceBatcher loop error: {e}")
+                batch, self._inflight = self._inflight, []
+                self._fail_pending(batch, e)
+
+    def _fail_pending(self, items: List[_PendingRequest], error: Exception):
+        """아직 결과가 없는 요청 Future에 예외 전달"""
+        for item in items:
+            if not item.future.done():
+                item.future.set_exception(error)
+
+    async def _dispatch(self, batch: List[_PendingRequest]):
+        """shape별로 묶어 forward 1회씩 실행하고 결과를 요청별로 분배"""
+        groups: Dict[tuple, List[_PendingRequest]] = {}
+        for item in batch:
+            if item.future.done():
+                self.metrics.cancelled += 1
+                continue
+            groups.setdefault(item.sequence.shape[1:], []).append(item)
+
+        loop = asyncio.get_running_loop()
+        for items in groups.values():
+            stacked = items[0].sequence if len(items) == 1 else np.concatenate([i.sequence for i in items], axis=0)
+            started = time.perf_counter()
+            for item in items:
+                self.queue_wait.record((started - item.enqueued_at) * 1000.0)
+
+            try:
+                outputs = await loop.run_in_executor(self._executor, self._forward, stacked)
+            except Exception as e:
+                self.metrics.forward_errors += 1
+                logger.error(f"Batched forward failed ({len(stacked)} sequences): {e}")
+                for item in items:
+                    if not item.future.done():
+                        item.future.set_exception(e)
+                continue
+
+            self.forward_time.record((time.perf_counter() - started) * 1000.0)
+            self.batch_size.record(len(stacked))
+            self.metrics.batches += 1
+
+            offset = 0
+            for item in items:
+                count = len(item.sequence)
+                if not item.future.done():
+                    item.future.set_result(outputs[offset:offset + count])
+                offset += count
+                self.metrics.requests += 1
+
+    def _forward(self, stacked: np.ndarray) -> np.ndarray:
+        """추론 스레드에서 실행"""
+        net = self._model.model
+        if net is None:
+            raise ValueError("Model not loaded")
+        net.eval()
+        with torch.no_grad():
+            inputs = torch.from_numpy(np.ascontiguousarray(stacked)).to(self._model.device)
+            return net(inputs).cpu().numpy()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            **asdict(self.metrics),
+            "running": self._running,
+            "queued": self._queue.qsize(),
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_seconds * 1000.0,
+            "batch_size": self.batch_size.to_dict(),
+            "queue_wait_ms": self.queue_wait.to_dict(),
+            "forward_ms": self.forward_time.to_dict()
+        }
@@ -13,8 +13,13 @@ import logging
 import time
 import random
 import json
+import threading
 
 class ManualStockDataCollector:
+    # 프로세스 전역 요청 간격 - 여러 스레드/인스턴스가 동시에 수집해도 Yahoo 요청은 request_delay 간격으로 나감
+    _throttle_lock = threading.Lock()
+    _next_request_at = 0.0
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
@@ -40,9 +45,13 @@ class ManualStockDataCollector:
         self.timeout = 30
         
     def _add_request_delay(self):
-        """요청 간 지연시간 추가"""
-        delay = random.uniform(*self.request_delay)
-        time.sleep(delay)
+        """요청 간 지연시간 추가 - 전역 슬롯을 예약하고 그 시각까지 대기 (직전 요청과 request_delay 간격 유지)"""
+        cls = ManualStockDataCollector
+        with cls._throttle_lock:
+            now = time.monotonic()
+            slot = max(now + random.uniform(*self.request_delay), cls._next_request_at)
+            cls._next_request_at = slot + random.uniform(*self.request_delay)
+        time.sleep(max(0.0, slot - time.monotonic()))
     
     def _convert_period_to_timestamps(self, period: str) -> Tuple[int, int]:
         """
@@ -96,8 +105,7 @@ class ManualStockDataCollector:
                 if attempt > 0:
                     self.logger.info(f"Retrying {symbol} (attempt {attempt + 1}/{self.retry_attempts})")
                     time.sleep(random.uniform(3, 7))
-                else:
-                    self._add_request_delay()
+                self._add_request_delay()
                 
                 # API URL 순환 사용
                 base_url = self.base_urls[attempt % len(self.base_urls)]
@@ -550,7 +550,8 @@ async def register_notification_persistence_consumer():
         # 컨슈머 생성 (고유한 ID 자동 생성)
         consumer = NotificationPersistenceConsumer()
         
-        # QueueService에 컨슈머 등록 (partition_key로 순서 보장)
+        # QueueService에 컨슈머 등록
+        # partition_key를 설정하는 생산자가 없으므로 파티션 워커는 두지 않음 (생기면 partition_workers 지정)
         await queue_service.register_message_consumer(
             queue_name="notification_persistence",
             consumer_id=consumer.consumer_id,  # 고유한 컨슈머 ID 사용
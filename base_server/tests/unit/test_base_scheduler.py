@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from service.scheduler.base_scheduler import BaseScheduler, ScheduleJob, ScheduleType
+
+
+def _job(job_id: str, schedule_type: ScheduleType, schedule_value, callback) -> ScheduleJob:
+	return ScheduleJob(job_id=job_id, name=job_id, schedule_type=schedule_type,
+	                   schedule_value=schedule_value, callback=callback)
+
+
+@pytest.mark.asyncio
+async def test_sub_second_interval_runs_at_interval():
+	scheduler = BaseScheduler()
+	calls = []
+
+	async def callback():
+		calls.append(asyncio.get_running_loop().time())
+
+	await scheduler.add_job(_job("half", ScheduleType.INTERVAL, 0.5, callback))
+	await scheduler.start()
+	await asyncio.sleep(1.8)
+	await scheduler.stop()
+
+	# 0.5초, 1.0초, 1.5초 부근 3회 (완료 후 재계산이므로 약간 늦어질 수 있음)
+	assert 2 <= len(calls) <= 4
+	gaps = [b - a for a, b in zip(calls, calls[1:])]
+	assert all(gap >= 0.45 for gap in gaps)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("interval", [0, 0.0, -1, "-0.5"])
+async def test_non_positive_interval_is_rejected(interval):
+	scheduler = BaseScheduler()
+
+	async def callback():
+		pass
+
+	await scheduler.add_job(_job("bad", ScheduleType.INTERVAL, interval, callback))
+	assert "bad" not in scheduler.jobs
+
+
+@pytest.mark.asyncio
+async def test_failing_once_job_backs_off_and_respects_max_retries():
+	scheduler = BaseScheduler(retry_backoff_seconds=0.05)
+	calls = []
+
+	async def callback():
+		calls.append(asyncio.get_running_loop().time())
+		raise RuntimeError("boom")
+
+	job = _job("once", ScheduleType.ONCE, None, callback)
+	await scheduler.add_job(job)
+	await scheduler.start()
+	# 백오프 0.05 + 0.1 + 0.2초 후 재시도 종료
+	await asyncio.sleep(1.0)
+	await scheduler.stop()
+
+	assert len(calls) == 1 + job.max_retries
+	assert job.error_count == 1 + job.max_retries
+	assert job.next_run is None
+	gaps = [b - a for a, b in zip(calls, calls[1:])]
+	assert gaps == sorted(gaps)
+	assert gaps[0] >= 0.04
@@ -0,0 +1,68 @@
+import uuid
+
+import pytest
+import pytest_asyncio
+
+fakeredis = pytest.importorskip("fakeredis")
+from fakeredis.aioredis import FakeAsyncRedisConnection
+
+from service.cache.cache_service import CacheService
+from service.cache.redis_cache_client import RedisCachePipeline
+from service.cache.redis_cache_client_pool import RedisCacheClientPool
+from service.queue.message_queue import MessageConsumer, QueueMessage, RedisCacheMessageQueue
+
+
+@pytest_asyncio.fixture
+async def message_queue():
+	pool = RedisCacheClientPool("localhost", 6379, 60, "test", "unit")
+	server = fakeredis.FakeServer()
+	for connection_pool in (pool._connection_pool, pool._blocking_connection_pool):
+		connection_pool.connection_class = FakeAsyncRedisConnection
+		connection_pool.connection_kwargs["server"] = server
+		connection_pool.connection_kwargs.pop("health_check_interval", None)
+	CacheService.Init(pool)
+	yield RedisCacheMessageQueue(CacheService)
+	await pool.close()
+	CacheService._client_pool = None
+
+
+@pytest.mark.asyncio
+async def test_nack_flush_failures_do_not_consume_retries(message_queue, monkeypatch):
+	queue_name = "flush_test"
+	await message_queue.enqueue(QueueMessage(id=str(uuid.uuid4()), queue_name=queue_name,
+	                                         payload={}, message_type="test", max_retries=3))
+	message = await message_queue.dequeue(queue_name, "c1")
+	assert message is not None and message.retry_count == 0
+
+	consumer = MessageConsumer(queue_name, "c1", message_queue, handler=lambda m: False)
+	consumer._pending_nacks.append(message)
+
+	# Redis 전송 3회 실패 후 성공
+	failures = {"left": 3}
+	original_execute = RedisCachePipeline.execute
+
+	async def flaky_execute(self):
+		if failures["left"] > 0:
+			failures["left"] -= 1
+			self._commands = []
+			raise ConnectionError("redis down")
+		return await original_execute(self)
+
+	monkeypatch.setattr(RedisCachePipeline, "execute", flaky_execute)
+
+	for _ in range(3):
+		assert await consumer._flush_results() is False
+		assert consumer._pending_nacks == [message]
+		assert message.retry_count == 0
+
+	assert await consumer._flush_results() is True
+	assert consumer._pending_nacks == []
+	assert consumer.stats["nacked"] == 1
+	assert message.retry_count == 1
+
+	# DLQ가 아니라 재큐잉되어 retry_count 1로 다시 꺼내짐
+	stats = await message_queue.get_queue_stats(queue_name)
+	assert stats["dlq_count"] == 0
+	requeued = await message_queue.dequeue(queue_name, "c1")
+	assert requeued is not None and requeued.id == message.id
+	assert requeued.retry_count == 1